@@ -38,18 +38,35 @@ from ambrosia.meshes import __all__ as _meshes_all
 from ambrosia.surfaces import __all__ as _surfaces_all
 from ambrosia.polyhedra import __all__ as _polyhedra_all
 # Synthesize an export list
+# scene files are read and written by ambrosia.archives, imported when first used
+_archiveNames = ('loadScene', 'saveScene')
 __all__ = ['bulb', 'camera', 'cube', 'cylinder', 'cone', 'image', 'scene', 'sphere','license']
-for x in [ _decorators_all,_basics_all,_objects_all,_cameras_all,_lights_all,_parts_all,_meshes_all,_surfaces_all,_polyhedra_all]:
+for x in [ _decorators_all,_basics_all,_objects_all,_cameras_all,_lights_all,_parts_all,_meshes_all,_surfaces_all,_polyhedra_all,_archiveNames]:
     __all__.extend(x)
 __all__.sort(key=lambda x: x.lower())
 
 ###############################################################################
-# Globals for scene setup
-sphere = Sphere()
-cube = Cube()
-cylinder = Cylinder()
-cone = Cone()
-bulb = Light().color(white)
-scene = Group().add(bulb,translate(0,300,-300))
-camera = Camera().subject(scene)
-image = camera.getImage()
+# Globals for scene setup, made when one of them is first used
+_setupNames = ('bulb', 'camera', 'cube', 'cylinder', 'cone', 'image', 'scene', 'sphere')
+
+def _setup():
+    """Make the globals for scene setup."""
+    global sphere, cube, cylinder, cone, bulb, scene, camera, image
+    sphere = Sphere()
+    cube = Cube()
+    cylinder = Cylinder()
+    cone = Cone()
+    bulb = Light().color(white)
+    scene = Group().add(bulb,translate(0,300,-300))
+    camera = Camera().subject(scene)
+    image = camera.getImage()
+
+def __getattr__(name):
+    if name in _setupNames:
+        _setup()
+        return globals()[name]
+    if name in _archiveNames:
+        from ambrosia import archives
+        globals().update([(n,getattr(archives,n)) for n in _archiveNames])
+        return globals()[name]
+    raise AttributeError("module 'ambrosia' has no attribute '{}'".format(name))
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# Project Ambrosia (c) 2013-19 duane a. bailey
+"""Saving built scenes, and loading them again.
+
+(c) 2013-19 duane a. bailey
+
+Scenes built from many parts (procedural groups, extrusions, meshes) can
+take far longer to build than to write.  saveScene writes an object (a
+scene, a part, or a camera and its subject) and everything it refers to
+to a scene file; loadScene reads it back, in another process or a later
+session, without building it again:
+    saveScene(scene,"scene.amb")
+    ...
+    scene = loadScene("scene.amb")
+
+Objects used in several places are saved once, and are shared again when
+loaded.  Mesh vertices are kept as arrays of doubles (as in Mesh.save),
+and their indices as arrays of integers.  The global objects of ambrosia
+(environment, the builtin materials, identity) are saved by name, so the
+objects loaded refer to the globals of the loading process.
+
+A scene file is ambrosia's magic number followed by a pickle stream: the
+object saved, then the state of each object it refers to, in turn.  Each
+ambrosia object in a state is replaced by a reference to it (its number
+and class), so no object is nested within another, however deep the
+scene.  Only ambrosia's classes (and arrays) are found by the
+loader, but scene files should only be loaded from trusted sources.
+"""
+import gc
+import pickle
+from contextlib import contextmanager
+from importlib import import_module
+from sys import modules
+from ambrosia.decorators import *
+from ambrosia.basics import *
+from ambrosia.objects import *
+
+__all__ = ('loadScene', 'saveScene')
+
+_sceneMagic = b'AMBSCEN1'
+# The names, other than ambrosia's, that a scene file may use.
+_arrayNames = frozenset([('array','array'),('array','_array_reconstructor')])
+
+# The globals of ambrosia's modules that are saved by name: id -> (module,name).
+_globalNames = None
+
+def _globals():
+    """Return the names of the global ambrosia objects, finding them if necessary."""
+    global _globalNames
+    if _globalNames is None:
+        _globalNames = dict()
+        for (name,module) in list(modules.items()):
+            if name.startswith('ambrosia.') and module is not None:
+                for g in getattr(module,'__all__',()):
+                    value = getattr(module,g,None)
+                    if isinstance(value,AmbrosiaObject):
+                        _globalNames.setdefault(id(value),(name,g))
+    return _globalNames
+
+def _object(n,cls):
+    """Stands, in a scene file, for the nth object saved, of class cls."""
+    raise pickle.UnpicklingError("Scene files must be read with loadScene.")
+
+def _global(module,name):
+    """Stands, in a scene file, for a global ambrosia object."""
+    raise pickle.UnpicklingError("Scene files must be read with loadScene.")
+
+class _SceneWriter(pickle.Pickler):
+    """A pickler that writes each ambrosia object as a reference; the
+    objects referred to are collected, so their states may be written."""
+    def __init__(self,f):
+        super().__init__(f,protocol=4)
+        self._globals = _globals()
+        self._objects = []
+
+    def reducer_override(self,obj):
+        # called once per object (the pickler remembers the result), and
+        # never for numbers, strings, or plain containers
+        if not isinstance(obj,AmbrosiaObject):
+            return NotImplemented
+        name = self._globals.get(id(obj))
+        if name is not None:
+            return (_global,name)
+        self._objects.append(obj)
+        return (_object,(len(self._objects)-1,type(obj)))
+
+class _SceneReader(pickle.Unpickler):
+    """An unpickler that rebuilds the objects written by a _SceneWriter."""
+    def __init__(self,f):
+        super().__init__(f)
+        self._objects = []
+        self._classes = set() # those known to be ambrosia's
+
+    def _object(self,n,cls):
+        """Make the (blank) nth object, of class cls."""
+        if n != len(self._objects) or not (cls in self._classes or issubclass(cls,AmbrosiaObject)):
+            raise pickle.UnpicklingError("Scene file objects are out of order.")
+        self._classes.add(cls)
+        obj = cls.__new__(cls)
+        obj._revive()
+        self._objects.append(obj)
+        return obj
+
+    def _global(self,module,name):
+        """Find a global ambrosia object."""
+        obj = getattr(import_module(module),name,None) if module.startswith('ambrosia.') else None
+        if not isinstance(obj,AmbrosiaObject):
+            raise pickle.UnpicklingError("{}.{} is not an ambrosia global.".format(module,name))
+        return obj
+
+    def find_class(self,module,name):
+        if module == __name__ and name in ('_object','_global'):
+            return getattr(self,name)
+        cls = super().find_class(module,name)
+        if (module,name) in _arrayNames:
+            return cls
+        if isinstance(cls,type) and cls.__module__.startswith('ambrosia.'):
+            return cls
+        raise pickle.UnpicklingError("{}.{} is not an ambrosia class.".format(module,name))
+
+@contextmanager
+def _uncollected():
+    """Suspend garbage collection, which would otherwise trace the growing
+    graph of objects, time and again, while it is written or read."""
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if collecting:
+            gc.enable()
+
+def saveScene(obj,filename):
+    """Write obj, and the objects it refers to, to a scene file."""
+    with open(filename,'wb') as f, _uncollected():
+        f.write(_sceneMagic)
+        writer = _SceneWriter(f)
+        writer.dump(obj)
+        objects = writer._objects
+        i = 0
+        while i < len(objects): # objects are found as states are written
+            writer.dump(objects[i].__getstate__())
+            i += 1
+        writer.dump(None)
+    return obj
+
+def loadScene(filename):
+    """Read the object saved in a scene file (see saveScene)."""
+    with open(filename,'rb') as f, _uncollected():
+        magic = f.read(len(_sceneMagic))
+        assert magic == _sceneMagic, "{} is not an ambrosia scene file.".format(filename)
+        reader = _SceneReader(f)
+        obj = reader.load()
+        objects = reader._objects
+        i = 0
+        while True:
+            state = reader.load()
+            if state is None:
+                break
+            objects[i].__setstate__(state)
+            i += 1
+        assert i == len(objects), "{} is incomplete.".format(filename)
+    return obj
@@ -28,6 +28,9 @@ Methods defined here fall into the following categories:
  distance-related operations:
     distance, near
 
+ bounding boxes:
+    boxOf, boxUnion, boxIntersection, boxCorners, boxIsEmpty, boxIsFinite
+
  polygon manipulation:
     closePoly, openPoly
     edges, innerEdges, triples, perimeter, area
@@ -49,6 +52,8 @@ The following constants are defined here:
    golden - the ideal aspect ratio
    e - Euler's constant; the base of logarithms
    fuzz - a smallish number; two values are fuzzy-equal when this close
+   emptyBox - a bounding box that contains nothing
+   infiniteBox - a bounding box that contains everything
 
 The definitions of the basic colors are also provided here:
    black, dkGray, gray, ltGray, and white
@@ -63,7 +68,7 @@ from collections import Iterable
 from random import random
 from random import seed as randseed
 
-__all__ = ( 'ambrosiaCopyright', 'ambrosiaHome', 'ambrosiaVersion', 'area', 'black', 'blend', 'blue', 'clamp', 'clampedType', 'closePoly', 'concave', 'concaves', 'convex', 'crossProduct', 'cyan', 'deg2rad', 'distance', 'dkGray', 'docmd', 'docmdWoutput', 'dotProduct', 'e', 'edges', 'fileExists', 'frac', 'fuzz', 'golden', 'gray', 'green', 'halfpi', 'hsv2rgb', 'innerEdges', 'last', 'lowerPoly', 'ltGray', 'magenta', 'morph', 'near', 'normalize', 'openPoly', 'origin', 'perimeter', 'phi', 'pi', 'pi2', 'poly2tri', 'polygon', 'purple', 'raisePoly', 'rad2deg', 'rand', 'red', 'rgb2hsv', 'scriptsHome', 'seed', 'semigon', 'splitBezier', 'sqr', 'sqrDiff', 'tempDir', 'triContains', 'triContainsAny', 'triList', 'triangulate', 'triangulateUV', 'triples', 'typeCheck', 'userName', 'userHome', 'vectorClamp', 'vectorDifference', 'vectorLength', 'vectorScale', 'vectorSum', 'white', 'yellow')
+__all__ = ( 'ambrosiaCopyright', 'ambrosiaHome', 'ambrosiaVersion', 'area', 'black', 'blend', 'blue', 'boxCorners', 'boxIntersection', 'boxIsEmpty', 'boxIsFinite', 'boxOf', 'boxUnion', 'clamp', 'clampedType', 'closePoly', 'concave', 'concaves', 'convex', 'crossProduct', 'cyan', 'deg2rad', 'distance', 'dkGray', 'docmd', 'docmdWoutput', 'dotProduct', 'e', 'edges', 'emptyBox', 'fileExists', 'frac', 'fuzz', 'golden', 'gray', 'green', 'halfpi', 'hsv2rgb', 'infiniteBox', 'innerEdges', 'last', 'lowerPoly', 'ltGray', 'magenta', 'morph', 'near', 'normalize', 'openPoly', 'origin', 'perimeter', 'phi', 'pi', 'pi2', 'poly2tri', 'polygon', 'purple', 'raisePoly', 'rad2deg', 'rand', 'red', 'rgb2hsv', 'scriptsHome', 'seed', 'semigon', 'splitBezier', 'sqr', 'sqrDiff', 'tempDir', 'triContains', 'triContainsAny', 'triList', 'triangulate', 'triangulateUV', 'triples', 'typeCheck', 'userName', 'userHome', 'vectorClamp', 'vectorDifference', 'vectorLength', 'vectorScale', 'vectorSum', 'white', 'yellow')
 
 ###############################################################################
 # BUILTINS:
@@ -76,6 +81,9 @@ phi = (1+math.sqrt(5))/2
 golden = 1/phi
 e = math.exp(1)
 fuzz = 0.000001
+# Bounding boxes are pairs of (x,y,z) corners: (low,high)
+emptyBox = ((math.inf,)*3,(-math.inf,)*3)
+infiniteBox = ((-math.inf,)*3,(math.inf,)*3)
 
 # Basic colors, rgb format
 black = (0,0,0)
@@ -238,6 +246,40 @@ def near(a,b):
     """Check that the distance between two numbers or vectors is less than fuzz."""
     return distance(a,b)<fuzz
 
+def boxOf(points):
+    """The smallest box, (low,high), that contains the 3d points."""
+    columns = list(zip(*points))
+    if not columns:
+        return emptyBox
+    return (tuple([min(c) for c in columns]),tuple([max(c) for c in columns]))
+
+def boxUnion(*boxes):
+    """The smallest box that contains each of the boxes."""
+    if not boxes:
+        return emptyBox
+    return (tuple([min(c) for c in zip(*[b[0] for b in boxes])]),
+            tuple([max(c) for c in zip(*[b[1] for b in boxes])]))
+
+def boxIntersection(*boxes):
+    """The largest box contained in each of the boxes."""
+    if not boxes:
+        return infiniteBox
+    return (tuple([max(c) for c in zip(*[b[0] for b in boxes])]),
+            tuple([min(c) for c in zip(*[b[1] for b in boxes])]))
+
+def boxCorners(box):
+    """The eight corners of a box."""
+    (low,high) = box
+    return [(x,y,z) for x in (low[0],high[0]) for y in (low[1],high[1]) for z in (low[2],high[2])]
+
+def boxIsEmpty(box):
+    """Check that a box contains no points."""
+    return any(l > h for (l,h) in zip(*box))
+
+def boxIsFinite(box):
+    """Check that a box is (nonempty and) bounded in every direction."""
+    return all(math.isfinite(x) for corner in box for x in corner) and not boxIsEmpty(box)
+
 def vectorDifference(v0,v1):
     """Compute the difference between numbers or vectors."""
     if isinstance(v0,Iterable):
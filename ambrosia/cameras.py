@@ -16,7 +16,6 @@ Classes defined here:
 import abc
 import os
 import math
-import ambrosia.scripting
 from collections import Iterable
 from ambrosia.decorators import *
 from ambrosia.basics import *
@@ -71,6 +70,7 @@ class Image(AmbrosiaObject):
     In cases where a single image is used to generate the frames of a movie,
     the frameNumber methods indicate the order of the images.
     """
+    _fields = ( 'image.antiAlias', 'image.aspectRatio', 'image.background', 'image.debug', 'image.fileName', 'image.fog', 'image.fogAttenuation', 'image.fogColor', 'image.frameNumber', 'image.height', 'image.keep', 'image.quality', 'image.viewResult', 'image.width' )
     def __init__(self,description="An image."):
         super().__init__(description=description)
         self.fileName("untitled.png")
@@ -312,6 +312,7 @@ the pinhole/cameratop direction vector, but is simply used to maximize the
 dot-product of the two vectors.  Typically, we set the up vector to (0,1,0).
 
 """
+    _fields = ( 'camera.angle', 'camera.coi', 'camera.cull', 'camera.image', 'camera.pos', 'camera.renderer', 'camera.subject', 'camera.type', 'camera.up' )
     def __init__(self,description="A camera."):
         super().__init__(description=description)
         self.perspective()
@@ -321,6 +322,7 @@ dot-product of the two vectors.  Typically, we set the up vector to (0,1,0).
         self.up([0,1,0])
         self.angle(53)
         self.subject(None)
+        self.cull(None)
         self.renderer("POV")  # should this be moved?
 
     def type(self,t):
@@ -418,6 +420,49 @@ dot-product of the two vectors.  Typically, we set the up vector to (0,1,0).
         """Get the image associated with this camera."""
         return self.get('camera.image')
 
+    def cull(self,margin=0.1):
+        """Leave out of each shot the objects that lie entirely outside the
+        view, widened by the fraction margin.  Unseen objects may still
+        cast shadows or be reflected into view; such objects should be
+        marked with cullable(False).  With margin None, nothing is culled."""
+        self.set('camera.cull',margin)
+        return self
+
+    def getCull(self):
+        """Return the culling margin (or None, if the camera does not cull)."""
+        return self.get('camera.cull')
+
+    def _frustum(self):
+        """Return the planes, (normal,offset), that bound the camera's
+        (widened) view: a point p is in view if, for every plane,
+        dotProduct(normal,p)+offset >= 0.  None if the view is unbounded."""
+        margin = self.getCull()
+        t = self.getType()
+        if margin is None or t not in ("perspective","orthographic"):
+            return None
+        pos = self.getPos()
+        d = self.getDirection()
+        dist = vectorLength(d)
+        d = normalize(d)
+        r = normalize(crossProduct(self.getUp(),d))
+        u = crossProduct(d,r)
+        # the angle spans the image's width; its height is 1/aspectRatio of that
+        w = math.tan(math.radians(self.getAngle())/2)*(1+margin)
+        h = w/self.getImage().getAspectRatio()
+        if t == "perspective":
+            # sides pass through the pinhole
+            normals = [vectorSum(vectorScale(d,w),r), vectorDifference(vectorScale(d,w),r),
+                       vectorSum(vectorScale(d,h),u), vectorDifference(vectorScale(d,h),u)]
+            planes = [(n,-dotProduct(n,pos)) for n in normals]
+        else:
+            # sides are parallel, at the extent of the view at the look_at point
+            planes = []
+            for (v,half) in [(r,w*dist),(u,h*dist)]:
+                for n in (v,vectorScale(v,-1)):
+                    planes.append((n,half-dotProduct(n,pos)))
+        planes.append((d,-dotProduct(d,pos)))
+        return planes
+
     def shoot(self,subject=None,*args):
         """Shoot an image."""
         oldSubject = None
@@ -452,12 +497,79 @@ dot-product of the two vectors.  Typically, we set the up vector to (0,1,0).
     def _paramBuilder(self,t,params):
         return [ (blend(t,*p) if isinstance(p,Iterable) else p) for p in params]
 
-    def film(self,n,setupFun,*params):
-        """Shoot several images to successive frames."""
-        for t in morph(n,0,1):
-            args = self._paramBuilder(t,params)
-            setupFun(*args)
-            self.shoot()
+    def film(self,n,setupFun,*params,workers=1,failFast=False,progress=False):
+        """Shoot several images to successive frames.
+        Frame f is rendered to <fileName>+fffff-<id>.png in the project
+        folder, where buildMovie finds it.  With workers > 1 (or None, one
+        per processor), each frame's scene is written as soon as it is set
+        up, and the frames are rendered in the background by up to workers
+        renderers at once.  failFast stops filming at the first frame that
+        fails to render; progress reports each frame as it is finished.
+        The list of frame images is returned (None for frames that failed,
+        or were not rendered).  Cameras that compose their images with a
+        script (stereo, picture-in-picture and isometric cameras) shoot
+        each frame in turn, as they always have, and return no images."""
+        results = [None]*(n+1)
+        if type(self)._POV_shoot is not Camera._POV_shoot:
+            for t in morph(n,0,1):
+                args = self._paramBuilder(t,params)
+                setupFun(*args)
+                self.shoot()
+            return results
+        i = self.getImage()
+        first = i.getFrameNumber() or 0
+        filebase = os.path.join(environment.getProjectFolder(),i.getFileName())
+        if workers == 1:
+            for (frame,t) in enumerate(morph(n,0,1),first):
+                (job,target) = self._filmFrame(setupFun,t,params,filebase,frame)
+                result = self._POV_renderFrame(job,target)
+                if self._filmed(result,frame,first,n,results,progress) and failFast:
+                    break
+            i.frameNumber(first+n+1)
+            return results
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        failed = False
+        with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as renderers:
+            jobs = dict() # future -> (frame,job)
+            for (frame,t) in enumerate(morph(n,0,1),first):
+                if failed:
+                    break
+                (job,target) = self._filmFrame(setupFun,t,params,filebase,frame)
+                jobs[renderers.submit(self._POV_renderFrame,job,target)] = (frame,job)
+                # collect any frames that have finished, without waiting
+                for future in [f for f in jobs if f.done()]:
+                    frame = jobs.pop(future)[0]
+                    if not future.cancelled() and self._filmed(future.result(),frame,first,n,results,progress):
+                        failed = failFast
+            if failed:
+                self._cancelFrames(jobs)
+            for future in as_completed(jobs):
+                if future.cancelled():
+                    continue
+                if self._filmed(future.result(),jobs[future][0],first,n,results,progress) and failFast:
+                    self._cancelFrames(jobs)
+        i.frameNumber(first+n+1)
+        return results
+
+    def _filmFrame(self,setupFun,t,params,filebase,frame):
+        """Set up and write a frame; return its job and the name of its image."""
+        setupFun(*self._paramBuilder(t,params))
+        job = self._POV_job()
+        self._POV_write(job.model)
+        return (job,"{}+{:05d}-{}.png".format(filebase,frame,job.id))
+
+    def _filmed(self,result,frame,first,n,results,progress):
+        """Record a finished frame's result; return True if it failed."""
+        results[frame-first] = result
+        if progress:
+            print("Frame {} of {}: {}".format(frame-first+1,n+1,result or "FAILED"))
+        return result is None
+
+    def _cancelFrames(self,jobs):
+        """Cancel the frames not yet rendering, removing their work directories."""
+        for (future,(frame,job)) in jobs.items():
+            if future.cancel():
+                job.close()
 
     def watch(self,n,setupFun,*params):
         """Shoot several images to successive frames."""
@@ -467,24 +579,54 @@ dot-product of the two vectors.  Typically, we set the up vector to (0,1,0).
             setupFun(*args)
             i.advanceFrame()
 
+    def _POV_job(self):
+        """Allocate a private work directory for a single shot."""
+        import ambrosia.scripting # (imported as needed)
+        return ambrosia.scripting.RenderJob(environment.getProjectFolder(),userName or "untitled",
+                                            keep=self.getImage().getKeep())
+
     def _POV_shoot(self,*args):
-        i = self.getImage()
-        fnsw = i.getFileNameSwitches()
+        """Render a shot, returning its image (or None)."""
+        self.getImage().advanceFrame() # (if filming)
+        with self._POV_job() as job:
+            self._POV_write(job.model,*args)
+            resultname = job.collect(self._POV_render(job.model))
+        if resultname:
+            self.present(resultname)
+        return resultname
+
+    def _POV_write(self,model,*args):
+        """Write the .ini and .pov files that describe this shot."""
         # Dump the .ini file
-        filebase = os.path.join(environment.getProjectFolder(),userName)
-        ids = ambrosia.scripting.uniqueIdString(filebase)
-        model = filebase + '-' + ids
         pov.open(model+".ini")
-        i._POV_()
+        self.getImage()._POV_()
         pov.close()
         # Dump the .pov file
         pov.open(model+".pov")
         self._POV_proof(*args)
         pov.close()
-        resultname = ambrosia.scripting.render(model)
+
+    def _POV_render(self,model):
+        """Render the model's files, returning the image name (or None)."""
+        import ambrosia.scripting
+        cache = environment.getRenderCache()
+        if cache:
+            resultname = ambrosia.scripting.cachedRender(model,cache,environment.getRenderCacheSize())
+        else:
+            resultname = ambrosia.scripting.render(model)
         if resultname:
             ambrosia.scripting.removeFiles(model+'.runlog')
-        self.present(resultname)
+        return resultname
+
+    def _POV_renderFrame(self,job,target):
+        """Render a movie frame to target, in the project folder; returns target, or None."""
+        with job:
+            return job.collect(self._POV_render(job.model),target)
+
+    def _POV_script(self,job,switches):
+        """Run the ambrosia-pov script, keeping its files within the job's work directory."""
+        docmd('TMP="{}" USER="{}" "{}" {}'.format(job.workDir,job.name,
+                                                 os.path.join(scriptsHome,"ambrosia-pov"),switches))
 
     def _POV_proof(self,*args):
         i = self.getImage()
@@ -504,6 +646,11 @@ dot-product of the two vectors.  Typically, we set the up vector to (0,1,0).
                 prt(' distance {} }}\n'.format(fa))
         theContext = Context()
         # selection predicate stuff removed, here
+        frustum = self._frustum()
+        if frustum is not None:
+            theContext.cull(self.getSubject(),frustum)
+        if environment.getDeclareShared():
+            theContext.share(self.getSubject())
         POV(self.getSubject(),theContext)
         POV(self,theContext)
 
@@ -536,6 +683,7 @@ dot-product of the two vectors.  Typically, we set the up vector to (0,1,0).
 @checkdoc
 class StereoCamera(Camera):
     """A camera that shoots red-bluegreen images."""
+    _fields = ( 'stereocamera.separation', )
     def __init__(self,description="A stereo camera."):
         """Initialize the camera."""
         super().__init__(description=description)
@@ -577,24 +725,22 @@ class StereoCamera(Camera):
         rightPos = self.getRightPos()
         i = self.getImage()
         fnsw = i.getFileNameSwitches()
-        # Dump the .ini file
-        filebase = os.path.join(environment.getProjectFolder(),userName)
-
-        pov.open(filebase+".ini")
-        i._POV_shoot(*args)
-        pov.close()
         vsw = "" if i.getViewResult() else " --batch"
-        i._POV_shoot(*args)
-        lf = pov.open(filebase+"-left.pov")
-        self.pos(leftPos)
-        self._POV_proof(*args)
-        pov.close()
-        rf = pov.open(filebase+"-right.pov")
-        self.pos(rightPos)
-        self._POV_proof(*args)
-        pov.close()
-        self.pos(nosePos)
-        docmd(os.path.join(scriptsHome,"ambrosia-pov") + " --stereo"+fnsw+vsw)
+        with self._POV_job() as job:
+            # Dump the .ini file
+            pov.open(job.model+".ini")
+            i._POV_()
+            pov.close()
+            pov.open(job.model+"-left.pov")
+            self.pos(leftPos)
+            self._POV_proof(*args)
+            pov.close()
+            pov.open(job.model+"-right.pov")
+            self.pos(rightPos)
+            self._POV_proof(*args)
+            pov.close()
+            self.pos(nosePos)
+            self._POV_script(job," --stereo"+fnsw+vsw)
 
 ###############################################################################
 # PIPCamera: a picture-in-picture mode; great for animations.
@@ -602,6 +748,7 @@ class StereoCamera(Camera):
 @checkdoc
 class PIPCamera(Camera):
     """Picture-in-picture cameras can help with getting two views."""
+    _fields = ( 'pipcamera.gravity', 'pipcamera.insetcamera' )
     def __init__(self,description="A picture-in-picture camera."):
         """Initialize the camera."""
         super().__init__(description=description)
@@ -633,17 +780,20 @@ class PIPCamera(Camera):
         ii = icam.getImage()
         fnsw = i.getFileNameSwitches()
         vsw = "" if i.getViewResult() else " --batch"
-        i._POV_shootSuffix("-large",*args)
-        ii._POV_shootSuffix("-small",*args)
-        # Are we missing an '.ini' file? DAB FIXME
-        filebase = os.path.join(environment.projectdFolder(),userName)
-        pov.open(filebase+"-large.pov")
-        self._POV_proof(*args)
-        pov.close()
-        pov.open(filebase+"-small.pov")
-        icam._POV_proof(*args)
-        pov.close()
-        docmd(os.path.join(scriptsHome,'ambrosia-pov')+' --pip --gravity "{}" {}{}'.format(self.getInsetPosition(),fnsw,vsw))
+        with self._POV_job() as job:
+            pov.open(job.model+"-large.ini")
+            i._POV_()
+            pov.close()
+            pov.open(job.model+"-small.ini")
+            ii._POV_()
+            pov.close()
+            pov.open(job.model+"-large.pov")
+            self._POV_proof(*args)
+            pov.close()
+            pov.open(job.model+"-small.pov")
+            icam._POV_proof(*args)
+            pov.close()
+            self._POV_script(job,' --pip --gravity "{}" {}{}'.format(self.getInsetPosition(),fnsw,vsw))
 
 ###############################################################################
 # IsometricCamera: shoot from three orthoganal locations & perspective
@@ -675,25 +825,27 @@ class IsometricCamera(Camera):
         i = self.getImage()
         fnsw = i.getFileNameSwitches()
         vsw = "" if i.getViewResult() else " --batch"
-        i._POV_shoot(*args)
-        filebase = os.path.join(environment.getProjectFolder(),userName)
-        pov.open(filebase+"-ortho.pov")
-        self.pos(orthoPos)
-        self._POV_proof(*args)
-        pov.close()
-        pov.open(filebase+"-right.pov")
-        self.pos(rightPos)
-        self._POV_proof(*args)
-        pov.close()
-        pov.open(filebase+"-top.pov")
-        self.pos(topPos)
-        self._POV_proof(*args)
-        pov.close()
-        pov.open(filebase+"-front.pov")
-        self.pos(frontPos)
-        self._POV_proof(*args)
-        pov.close()
-        # re-position camera where it was.
-        self.pos(frontPos)
-        # left in correct position
-        docmd(os.path.join(scriptsHome,"ambrosia-pov") + " --isometric "+fnsw+vsw)
+        with self._POV_job() as job:
+            pov.open(job.model+".ini")
+            i._POV_()
+            pov.close()
+            pov.open(job.model+"-ortho.pov")
+            self.pos(orthoPos)
+            self._POV_proof(*args)
+            pov.close()
+            pov.open(job.model+"-right.pov")
+            self.pos(rightPos)
+            self._POV_proof(*args)
+            pov.close()
+            pov.open(job.model+"-top.pov")
+            self.pos(topPos)
+            self._POV_proof(*args)
+            pov.close()
+            pov.open(job.model+"-front.pov")
+            self.pos(frontPos)
+            self._POV_proof(*args)
+            pov.close()
+            # re-position camera where it was.
+            self.pos(frontPos)
+            # left in correct position
+            self._POV_script(job," --isometric "+fnsw+vsw)
@@ -12,6 +12,10 @@ __all__ = ('Light', 'Spotlight', 'LightArray')
 @checkdoc
 class Light(Transformable):
     """This is base class for a variety of lights in ambrosia."""
+    _fields = ( 'light.color', 'light.intensity', 'light.pos', 'light.shadows', 'light.shape' )
+    _POV_shareable = False
+    _POV_cullable = False
+
     def __init__(self,description="A light."):
         """Construct a white light at the origin."""
         super().__init__(description=description)
@@ -24,6 +28,10 @@ class Light(Transformable):
         """Construct a copy of this light."""
         return super().copy()
 
+    def _extent(self,boxes):
+        # lights illuminate, but occupy no space
+        return emptyBox
+
     def color(self,c):
         """Set light color."""
         self.set('light.color',c)
@@ -103,6 +111,7 @@ class Light(Transformable):
 @checkdoc
 class Spotlight(Light):
     """This class defines lights that possibly shine in a specific direction."""
+    _fields = ( 'spotlight.coi', 'spotlight.falloff', 'spotlight.radius', 'spotlight.tightness' )
     def __init__(self,description="A spotlight."):
         """Initialize a spotlight (radius 10, falloff 5, tightness 0, coi origin)."""
         super().__init__(description=description)
@@ -173,6 +182,7 @@ class Spotlight(Light):
 @checkdoc
 class LightArray(Light):
     """LightArrays simulate large 2D arrays of lights."""
+    _fields = ( 'lightarray.cols', 'lightarray.height', 'lightarray.rows', 'lightarray.width' )
     def __init__(self,description="A light array."):
         super().__init__(description=description)
         self.rows(2).cols(2).width([100,0,0]).height([0,0,100]).pos(origin)
@@ -3,6 +3,13 @@
 #
 """This module contains all classes associated with meshes."""
 
+import math
+import mmap
+import os
+import struct
+import sys
+from array import array
+from itertools import product
 from ambrosia.decorators import *
 from ambrosia.basics import *
 from ambrosia.objects import *
@@ -10,14 +17,52 @@ from ambrosia.objects import *
 __all__ = ('extrude', 'sweep', 'loft', 'FuzzList', 'HeightField', 'Mesh', 'PatchMesh')
 ###############################################################################
 # FuzzList
+# Spatial hash cells are several fuzz wide; only points within fuzz of a
+# cell boundary need to consult the neighboring cell.
+_cellWidth = 64*fuzz
+_margin = fuzz/_cellWidth
+
+def _cellOf(v):
+    """Return the spatial hash cell that contains point v."""
+    return tuple(math.floor(x/_cellWidth) for x in v)
+
+def _cellsNear(v):
+    """Return the spatial hash cells that may hold points within fuzz of v."""
+    cells = []
+    edge = False
+    for x in v:
+        q = x/_cellWidth
+        c = math.floor(q)
+        f = q-c
+        if f < _margin:
+            cells.append((c,c-1))
+            edge = True
+        elif f > 1-_margin:
+            cells.append((c,c+1))
+            edge = True
+        else:
+            cells.append((c,))
+    if edge:
+        return list(product(*cells))
+    return [tuple(c[0] for c in cells)]
+
+def _close(a,b):
+    """Fast check that two points are within fuzz of each other."""
+    return sum((x-y)*(x-y) for (x,y) in zip(a,b)) < fuzz*fuzz
+
 @checkdoc
 class FuzzList(AmbrosiaObject):
-    """This class has some features of a list, but matching is fuzzy."""
-    __slots__ = ['_items','_near']
+    """This class has some features of a list, but matching is fuzzy.
+
+    Points are indexed by a spatial hash, so fuzzy matches are found by
+    checking only the cells near a point, rather than the entire list.  If a
+    special near function is provided, lookup falls back to a linear scan."""
+    __slots__ = ['_items','_near','_cells']
     def __init__(self,base=None,nearf=None,description="A fuzzy list."):
         super().__init__(description=description)
         self._items = base if base is not None else []
         self._near = nearf if nearf is not None else near
+        self._cells = None # built on first lookup
 
     def __getitem__(self,i):
         """Get the ith item."""
@@ -25,14 +70,12 @@ class FuzzList(AmbrosiaObject):
 
     def __setitem__(self,i,v):
         """Set the ith item to v."""
-        _items[i] = v
+        self._items[i] = v
+        self._cells = None
 
     def __contains__(self,v):
         """Determine if v is in items."""
-        for i in self._items:
-            if near(i,v):
-                return True
-        return False
+        return self.find(v) >= 0
 
     def __len__(self):
         """Return length of list."""
@@ -43,12 +86,50 @@ class FuzzList(AmbrosiaObject):
         for v in self._items:
             yield v
 
+    def _getCells(self):
+        """Return the spatial hash, building it, if necessary."""
+        if self._cells is None:
+            self._cells = dict()
+            for (i,v) in enumerate(self._items):
+                self._cells.setdefault(_cellOf(v),[]).append(i)
+        return self._cells
+
     def find(self,v):
-        """Return index of near item, or -1."""
-        for i in range(len(self)):
-            if near(self[i],v):
-                return i
-        return -1
+        """Return index of (earliest) near item, or -1."""
+        items = self._items
+        if self._near is not near:
+            for i in range(len(items)):
+                if self._near(items[i],v):
+                    return i
+            return -1
+        cells = self._getCells()
+        result = -1
+        for cell in _cellsNear(v):
+            bucket = cells.get(cell)
+            if bucket:
+                # buckets are in index order; first match is earliest
+                for i in bucket:
+                    if (result >= 0) and (i > result):
+                        break
+                    if _close(items[i],v):
+                        result = i
+                        break
+        return result
+
+    def __getstate__(self):
+        return (self._attrItems(),_packed(self._items,'d'),None if self._near is near else self._near)
+
+    def __setstate__(self,state):
+        (items,base,nearf) = state
+        super().__setstate__(items)
+        self._items = base
+        self._near = nearf if nearf is not None else near
+
+    def _revive(self):
+        super()._revive()
+        self._items = []
+        self._near = near
+        self._cells = None
 
     def intern(self,v):
         """Store v in list, if necessary, and return ultimate index."""
@@ -56,14 +137,210 @@ class FuzzList(AmbrosiaObject):
         if i < 0:
             i = len(self._items)
             self._items.append(v)
+            if self._cells is not None:
+                self._cells.setdefault(_cellOf(v),[]).append(i)
         return i
 
+###############################################################################
+# Points: a compact, array-backed list of points
+class _Points(object):
+    """A list-like sequence of fixed-size points, stored in a flat array."""
+    __slots__ = ['_data','_dim']
+    def __init__(self,data,dim):
+        self._data = data
+        self._dim = dim
+
+    def __len__(self):
+        return len(self._data)//self._dim
+
+    def __getitem__(self,i):
+        d = self._dim
+        if i < 0:
+            i += len(self)
+        return tuple(self._data[i*d:i*d+d])
+
+    def __setitem__(self,i,v):
+        d = self._dim
+        if i < 0:
+            i += len(self)
+        self._data[i*d:i*d+d] = array(self._data.typecode,v)
+
+    def __iter__(self):
+        return zip(*[iter(self._data)]*self._dim)
+
+    def append(self,p):
+        assert len(p) == self._dim
+        self._data.extend(p)
+
+    def tolist(self):
+        return list(self)
+
+    def __reduce__(self):
+        return (_Points,(self._data,self._dim))
+
+def _packed(points,type):
+    """Return a sequence of same-sized points as _Points, stored in an array
+    of the given type; points that do not fit are returned unchanged."""
+    if isinstance(points,_Points) or not len(points):
+        return points
+    dim = len(points[0])
+    try:
+        data = array(type,[x for p in points for x in p])
+    except (TypeError,OverflowError):
+        return points
+    return _Points(data,dim) if len(data) == dim*len(points) else points
+
+class _MappedPoints(_Points):
+    """Points held in a binary mesh file, memory-mapped on first use.
+    Mapped points are shared (read-only) by all users of the file; they
+    are copied into a private array only if modified."""
+    __slots__ = ['_file','_offset','_count','_type']
+    def __init__(self,filename,offset,count,type,dim):
+        self._file = filename
+        self._offset = offset
+        self._count = count
+        self._dim = dim
+        self._type = type
+
+    def __getattr__(self,name):
+        # the data slot is filled when first referenced
+        if name == '_data':
+            self._data = self._map()
+            return self._data
+        raise AttributeError(name)
+
+    def _map(self):
+        """Return a view of this part of the file, mapping it if necessary."""
+        nbytes = self._count*self._dim*array(self._type).itemsize
+        if sys.byteorder != 'little':
+            with open(self._file,'rb') as f:
+                f.seek(self._offset)
+                a = array(self._type)
+                a.frombytes(f.read(nbytes))
+                a.byteswap()
+                return a
+        if self._file not in _mappedFiles:
+            with open(self._file,'rb') as f:
+                _mappedFiles[self._file] = mmap.mmap(f.fileno(),0,access=mmap.ACCESS_READ)
+        view = memoryview(_mappedFiles[self._file])
+        return view[self._offset:self._offset+nbytes].cast(self._type)
+
+    def _unmap(self):
+        """Copy the points into a private, modifiable array."""
+        if self._count is not None:
+            self._data = array(self._type,self._data)
+            self._count = None
+
+    def __len__(self):
+        return super().__len__() if self._count is None else self._count
+
+    def __setitem__(self,i,v):
+        self._unmap()
+        super().__setitem__(i,v)
+
+    def append(self,p):
+        self._unmap()
+        super().append(p)
+
+    def __reduce__(self):
+        # the points themselves are kept, not the file they were read from
+        data = array(self._type)
+        data.frombytes(memoryview(self._data).cast('B'))
+        return (_Points,(data,self._dim))
+
+_mappedFiles = dict()
+
+# Binary mesh files: a header (magic, then the number of vertices, uv
+# vertices, triangles and uv triangles), followed by the vertices and uv
+# vertices (little-endian doubles), and the triangles and uv triangles
+# (little-endian 32-bit integers).
+_meshMagic = b'AMBMESH1'
+_meshHeader = struct.Struct('<8s4I')
+_meshLayout = [('mesh.vertices','d',3),('mesh.uvvertices','d',2),
+               ('mesh.triangles','i',3),('mesh.uvtriangles','i',3)]
+# The attributes of meshes that hold lists of vertex indices.
+_meshIndexKeys = frozenset(['mesh.triangles','mesh.uvtriangles','patchmesh.patches','patchmesh.uvpatches'])
+
+###############################################################################
+# Vertex normals
+def _asArray(points,type,dim):
+    """Return a sequence of points as an (N,dim) numpy array."""
+    import numpy
+    if isinstance(points,_Points):
+        return numpy.asarray(points._data,dtype=type).reshape(-1,dim)
+    return numpy.array(list(points),dtype=type).reshape(-1,dim)
+
+def _vertexNormals(vertices,triangles,crease):
+    """Compute the smooth normals of the corners of triangles, as numpy arrays
+    (normals,indices).  Each face adds its normal, weighted by the angle at
+    the corner, to the corners of the other faces at the vertex whose
+    normals are within crease degrees of its own."""
+    import numpy
+    v = _asArray(vertices,float,3)
+    t = _asArray(triangles,numpy.intp,3)
+    if not len(t):
+        return (numpy.zeros((0,3)),t)
+    p = v[t] # the corners of each triangle: (faces,3,3)
+    n = numpy.cross(p[:,1]-p[:,0],p[:,2]-p[:,0])
+    size = numpy.linalg.norm(n,axis=1)
+    flat = size <= fuzz*fuzz # degenerate faces have no direction
+    n[~flat] /= size[~flat,None]
+    # the angle of each corner, between the edges leaving it
+    a = numpy.roll(p,-1,axis=1)-p
+    b = numpy.roll(p,-2,axis=1)-p
+    angle = numpy.arctan2(numpy.linalg.norm(numpy.cross(a,b),axis=2),(a*b).sum(axis=2))
+    if crease >= 180:
+        # smooth everywhere: one normal per vertex
+        weighted = (angle[:,:,None]*n[:,None,:]).reshape(-1,3)
+        corner = t.ravel()
+        normals = numpy.stack([numpy.bincount(corner,weighted[:,k],len(v)) for k in range(3)],axis=1)
+        indices = t
+    else:
+        # pair each corner with every corner at its vertex (itself included)
+        corner = t.ravel()
+        order = numpy.argsort(corner,kind='stable') # corners, grouped by vertex
+        degree = numpy.bincount(corner,minlength=len(v))
+        count = degree[corner[order]]
+        first = (numpy.cumsum(degree)-degree)[corner[order]]
+        mine = numpy.repeat(order,count)
+        offset = numpy.arange(len(mine))-numpy.repeat(numpy.cumsum(count)-count,count)
+        theirs = order[numpy.repeat(first,count)+offset]
+        (f,g) = (mine//3,theirs//3)
+        columns = numpy.ascontiguousarray(n.T) # (gathered a coordinate at a time)
+        similar = sum([c[f]*c[g] for c in columns]) >= math.cos(math.radians(crease))
+        similar |= flat[f]
+        (mine,theirs) = (mine[similar],theirs[similar])
+        weight = angle.ravel()[theirs]
+        g = theirs//3
+        sums = numpy.stack([numpy.bincount(mine,weight*c[g],len(corner)) for c in columns],axis=1)
+        # corners smoothed over the same faces have identical sums, and share
+        # a normal; sums are matched by a hash of their bits (sorting rows is slow)
+        bits = sums.view(numpy.uint64)
+        key = bits[:,0]*numpy.uint64(0x9e3779b97f4a7c15)^bits[:,1]*numpy.uint64(0xc2b2ae3d27d4eb4f)^bits[:,2]
+        (_,rows,indices) = numpy.unique(key,return_index=True,return_inverse=True)
+        normals = sums[rows]
+        if not (normals[indices] == sums).all(): # a collision
+            (normals,indices) = numpy.unique(sums,axis=0,return_inverse=True)
+        indices = indices.reshape(-1,3)
+    size = numpy.linalg.norm(normals,axis=1)
+    normals[size == 0] = (0,1,0)
+    size[size == 0] = 1
+    return (normals/size[:,None],indices)
+
 ###############################################################################
 # Mesh: solids constructed from triangles
 @checkdoc
 class Mesh(Primitive):
-    """A Mesh is a possibly solid structure defined by a collection of triangles."""
+    """A Mesh is a possibly solid structure defined by a collection of triangles.
+
+    Meshes are flat-shaded unless smoothed: mesh.smooth(60) shades each
+    vertex with the average normal of the faces there that meet at no more
+    than 60 degrees, keeping sharper edges creased (smooth(True) smooths
+    every edge).  Smoothing needs numpy."""
+    _fields = ( 'mesh.smooth', 'mesh.triangles', 'mesh.uvtriangles', 'mesh.uvvertices', 'mesh.vertices' )
+    __slots__ = [ "_normals" ]
     def __init__(self,description="A triangle mesh."):
+        self._normals = None
         super().__init__(description=description)
         self.set('mesh.vertices',FuzzList())
         self.set('mesh.uvvertices',FuzzList())
@@ -117,42 +394,117 @@ class Mesh(Primitive):
     def registerTriangles(self,tl):
         """Directly set the triangle list for this mesh."""
         self.set('mesh.triangles',tl)
+        return self
 
     def registerUVTriangles(self,uvtl):
         """Directly set the uv-triangle list for this mesh."""
         self.set('mesh.uvtriangles',uvtl)
         return self
+
+    def smooth(self,v):
+        """Set the crease angle (in degrees) below which edges are smoothed;
+        True smooths all edges, and None (the default) none."""
+        self.set('mesh.smooth',v)
+        return self
+
+    def getSmooth(self):
+        """Get the crease angle below which edges are smoothed (or True or None)."""
+        return self.get('mesh.smooth')
+
+    def vertexNormals(self,crease=180):
+        """Return the normals of the mesh, smoothed across edges of less than
+        crease degrees, as numpy arrays (normals,indices): one unit normal
+        per row, and the indices of the normals of each triangle's corners.
+        The arrays are kept, and shared, until the vertices, triangles or
+        crease change (like bounds, changes to a vertex in place are not seen)."""
+        vl = self.get('mesh.vertices')
+        tl = self.get('mesh.triangles')
+        stamp = (len(vl),len(tl),crease)
+        cached = self._normals
+        if cached is None or cached[0] is not vl or cached[1] is not tl or cached[2] != stamp:
+            cached = self._normals = (vl,tl,stamp,_vertexNormals(vl,tl,crease))
+        return cached[3]
+
+    def _revive(self):
+        super()._revive()
+        self._normals = None
+
+    def _extent(self,boxes):
+        return boxOf(self.get('mesh.vertices'))
+
+    def __getstate__(self):
+        # index lists are kept as arrays of 32-bit integers
+        return [(k,_packed(v,'i') if k in _meshIndexKeys else v) for (k,v) in super().__getstate__()]
+
+    def _geometry(self):
+        return len(self.get('mesh.vertices'))
+
+    def save(self,filename):
+        """Write vertices and triangles to a binary mesh file."""
+        with open(filename,'wb') as f:
+            f.write(_meshHeader.pack(_meshMagic,*[len(self.get(k)) for (k,t,d) in _meshLayout]))
+            for (key,type,dim) in _meshLayout:
+                a = array(type,[x for p in self.get(key) for x in p])
+                if sys.byteorder != 'little':
+                    a.byteswap()
+                f.write(a.tobytes())
+        return self
+
+    def load(self,filename,mapped=False):
+        """Replace vertices and triangles with those of a binary mesh file.
+        If mapped is True, the file is memory-mapped (and shared with other
+        meshes mapping the same file) and read only when the data is used."""
+        filename = os.path.abspath(filename)
+        with open(filename,'rb') as f:
+            (magic,*counts) = _meshHeader.unpack(f.read(_meshHeader.size))
+            assert magic == _meshMagic, "{} is not an ambrosia mesh file.".format(filename)
+            lists = []
+            offset = _meshHeader.size
+            for ((key,type,dim),n) in zip(_meshLayout,counts):
+                if mapped:
+                    lists.append(_MappedPoints(filename,offset,n,type,dim))
+                else:
+                    a = array(type)
+                    a.frombytes(f.read(n*dim*a.itemsize))
+                    if sys.byteorder != 'little':
+                        a.byteswap()
+                    lists.append(_Points(a,dim))
+                offset += n*dim*array(type).itemsize
+        (vl,uvl,tl,uvtl) = lists
+        self.registerVertices(vl).registerUVVertices(uvl)
+        return self.registerTriangles(tl).registerUVTriangles(uvtl)
             
     def _POV_(self,context):
         if context.selects(self):
             vl = self.get('mesh.vertices')
-            t = self.getXform()
             m = self.getMaterial()
             prt('mesh2 {\n')
             prt('vertex_vectors {{ {}'.format(len(vl)))
-            for vtx in vl:
-                prt(',')
-                pov.writePoint(vtx)
+            pov.writePoints(vl)
             prt('}\n')
+            crease = self.getSmooth()
+            if crease:
+                (nl,nil) = self.vertexNormals(180 if crease is True else crease)
+                prt('normal_vectors {{ {}'.format(len(nl)))
+                pov.writePoints(nl)
+                prt('}\n')
             uvl = self.get('mesh.uvvertices')
             if len(uvl) > 0:
                 prt('uv_vectors {{ {}'.format(len(uvl)))
-                for vtx in uvl:
-                    prt(',')
-                    pov.writePoint(vtx)
+                pov.writePoints(uvl)
                 prt('}\n')
             tl = self.get('mesh.triangles')
             prt('face_indices {{ {}'.format(len(tl)))
-            for tri in tl:
-                prt(',')
-                pov.writePoint(tri)
+            pov.writePoints(tl)
             prt('}\n')
+            if crease:
+                prt('normal_indices {{ {}'.format(len(nil)))
+                pov.writePoints(nil)
+                prt('}\n')
             uvtl = self.get('mesh.uvtriangles')
             if len(uvtl) > 0:
                 prt('uv_indices {{ {}'.format(len(uvtl)))
-                for tri in uvtl:
-                    prt(',')
-                    pov.writePoint(tri)
+                pov.writePoints(uvtl)
                 prt('}\n')
             prt('inside_vector <0,0,1>\n')
             POV(super(),context)
@@ -163,6 +515,9 @@ class Mesh(Primitive):
 @checkdoc
 class PatchMesh(Primitive):
     """A PatchMesh is a possibly solid structure defined by a collection of Bezier patches."""
+    _fields = ( 'patchmesh.patches', 'patchmesh.refinement', 'patchmesh.uvpatches', 'patchmesh.uvvertices', 'patchmesh.vertices' )
+    _POV_compound = True
+
     def __init__(self,description="A Bezier patch mesh."):
         super().__init__(description=description)
         self.set('patchmesh.vertices',FuzzList())
@@ -218,6 +573,16 @@ class PatchMesh(Primitive):
         """Get the refinement level of the patches in this mesh."""
         return self.get('patchmesh.refinement')
 
+    def _extent(self,boxes):
+        # each patch lies within the hull of its control points
+        return boxOf(self.get('patchmesh.vertices'))
+
+    def __getstate__(self):
+        return [(k,_packed(v,'i') if k in _meshIndexKeys else v) for (k,v) in super().__getstate__()]
+
+    def _geometry(self):
+        return len(self.get('patchmesh.vertices'))
+
     def _POV_patch(self,p,v,r,context):
         prt('bicubic_patch {{ type 0 flatness 0.1 u_steps {} v_steps {}\n'.format(r,r))
         for i in range(16):
@@ -243,7 +608,6 @@ class PatchMesh(Primitive):
 
     def _POV_(self,context):
         if context.selects(self):
-            t = self.getXform()
             m = self.getMaterial()
             uvpl = self.get('patchmesh.uvpatches')
             pl = self.get('patchmesh.patches')
@@ -266,6 +630,7 @@ class PatchMesh(Primitive):
 class HeightField(Primitive):
     """HeightFields are surfaces that are constructed from image pixel
     intensitifges."""
+    _fields = ( 'heightfield.clipLevel', 'heightfield.image', 'heightfield.imageType', 'heightfield.smooth' )
     def __init__(self,description="A height field."):
         super().__init__(description=description)
         self.scale(100,100,100)
@@ -310,13 +675,15 @@ class HeightField(Primitive):
         """Get clipLevel attribute."""
         return self.get('heightfield.clipLevel')
 
+    def _extent(self,boxes):
+        return ((0,0,0),(1,1,1))
+
     def _POV_(self,context):
         if context.selects(self):
             s = self.getSmooth()
             cl = self.getClipLevel()
             it = self.getImageType()
             i = self.getImage()
-            t = self.getXform()
             m = self.getMaterial()
             #context.pushXform(t)
             #context.pushMaterial(m)
@@ -12,6 +12,8 @@ Classes defined here:
    Transform     - class describing 3-space transformations
    Environment   - communication between ambrosia and the operating system
    POVWriter     - writer for dumping objects to POV format
+   POVCache      - POV written for parts of earlier shots
+   POVProfile    - time and output of POV writing, by class and name
    Transformable - object that can be moved/rotated/scaled/tagged
     Material     - POV-based materials: solids, metals, surface maps, etc.
     Primitive    - basis for transformable objects with attached materials
@@ -43,10 +45,11 @@ import os
 from sys import stdout,setrecursionlimit,getrecursionlimit,modules
 from collections import Hashable
 from itertools import count
+from time import perf_counter
 from ambrosia.decorators import *
 from ambrosia.basics import *
 
-__all__ = ['AmbrosiaObject', 'blackPlaster', 'blackPlastic', 'bluePlaster', 'bluePlastic', 'Color', 'Context', 'CSG', 'cyanPlaster', 'cyanPlastic', 'defaultMaterial', 'describe', 'Difference', 'dkGrayPlaster', 'dkGrayPlastic', 'emptyMaterial', 'Environment', 'environment', 'grayPlaster', 'grayPlastic', 'greenGlass', 'greenPlaster', 'greenPlastic', 'Group', 'identity', 'Intersection', 'ltGrayPlaster', 'ltGrayPlastic', 'magentaPlaster', 'magentaPlastic', 'Material', 'mirrorMat', 'POV', 'pov', 'POVWriter', 'Primitive', 'prt', 'purplePlaster', 'purplePlastic', 'redPlaster', 'redPlastic', 'Reference', 'scale', 'Transform', 'Transformable', 'translate', 'whitePlaster', 'whitePlastic', 'xRot', 'xyMirror', 'xzMirror', 'yellowPlaster', 'yellowPlastic', 'yRot', 'yzMirror', 'zRot' ]
+__all__ = ['AmbrosiaObject', 'blackPlaster', 'blackPlastic', 'bluePlaster', 'bluePlastic', 'Color', 'Context', 'CSG', 'cyanPlaster', 'cyanPlastic', 'defaultMaterial', 'describe', 'Difference', 'dkGrayPlaster', 'dkGrayPlastic', 'emptyMaterial', 'Environment', 'environment', 'grayPlaster', 'grayPlastic', 'greenGlass', 'greenPlaster', 'greenPlastic', 'Group', 'identity', 'Intersection', 'ltGrayPlaster', 'ltGrayPlastic', 'magentaPlaster', 'magentaPlastic', 'Material', 'mirrorMat', 'POV', 'pov', 'POVCache', 'POVProfile', 'POVWriter', 'Primitive', 'prt', 'purplePlaster', 'purplePlastic', 'redPlaster', 'redPlastic', 'Reference', 'scale', 'Transform', 'Transformable', 'translate', 'whitePlaster', 'whitePlastic', 'xRot', 'xyMirror', 'xzMirror', 'yellowPlaster', 'yellowPlastic', 'yRot', 'yzMirror', 'zRot' ]
 
 def cleanpath(p = '~'):
     """Return a expanded path given a user file specification."""
@@ -56,8 +59,36 @@ def cleanpath(p = '~'):
 
 ###############################################################################
 # Ambrosia class tree root.
+def _slotName(key):
+    """The name of the slot that holds attribute key."""
+    return '_'+key.replace('.','_')
+
+# stands for the value of an attribute slot that has not been set
+_unset = object()
+
+def _blank(cls):
+    """Return an object of class cls, made without __init__, awaiting its state."""
+    obj = cls.__new__(cls)
+    obj._revive()
+    return obj
+
+class _AmbrosiaMeta(abc.ABCMeta):
+    """The metaclass of ambrosia objects.
+    The attribute keys listed in a class's _fields (none, if it lists
+    none) are stored in slots; _slotOf maps each key known to the class
+    to the name of its slot."""
+    def __new__(meta,name,bases,ns):
+        fields = ns.get('_fields',())
+        ns['__slots__'] = tuple(ns.get('__slots__',()))+tuple([_slotName(f) for f in fields])
+        cls = super().__new__(meta,name,bases,ns)
+        slotOf = dict()
+        for c in reversed(cls.__mro__):
+            slotOf.update([(f,_slotName(f)) for f in c.__dict__.get('_fields',())])
+        cls._slotOf = slotOf
+        return cls
+
 @checkdoc
-class AmbrosiaObject(metaclass=abc.ABCMeta):
+class AmbrosiaObject(metaclass=_AmbrosiaMeta):
     """This class is the root of the ambrosia object hierarchy.
 
     These objects are never explicitly constructed.  Instead, they
@@ -76,22 +107,55 @@ class AmbrosiaObject(metaclass=abc.ABCMeta):
         describe(cube)
     prints the attributes:
         ... ("top",(0,50,0)) ...
+
+    Attributes whose keys are listed in a class's _fields are kept in
+    slots; any others are kept in a dictionary, made when first needed.
     """
-    __slots__ = [ "_attrs" ]
+    __slots__ = [ "_attrs", "__dict__" ] # (scripts may add attributes of their own)
+    _fields = ( 'object.name', 'object.description' )
 
     def __init__(self,description="An ambroisia object."):
         """Initialize object."""
-        self._attrs = dict()
-        self._attrs['object.name'] = type(self).__name__
-        self._attrs['object.description'] = description
+        self._attrs = None
+        self._object_name = type(self).__name__
+        self._object_description = description
 
     def get(self,key):
         """Get attribute value."""
-        return self._attrs.get(key,None)
+        slot = self._slotOf.get(key)
+        if slot is not None:
+            return getattr(self,slot,None)
+        return self._attrs.get(key) if self._attrs else None
 
     def set(self,key,value):
         """Set attribute value."""
-        self._attrs[key] = value
+        slot = self._slotOf.get(key)
+        if slot is not None:
+            setattr(self,slot,value)
+        elif self._attrs is None:
+            self._attrs = { key: value }
+        else:
+            self._attrs[key] = value
+
+    def _attrItems(self):
+        """Return a list of the (key,value) attribute pairs of this object."""
+        result = []
+        for (key,slot) in self._slotOf.items():
+            value = getattr(self,slot,_unset)
+            if value is not _unset:
+                result.append((key,value))
+        if self._attrs:
+            result.extend(self._attrs.items())
+        return result
+
+    def _assign(self,items):
+        """Replace the attributes of this object with the (key,value) pairs of items."""
+        for slot in self._slotOf.values():
+            if hasattr(self,slot):
+                delattr(self,slot)
+        self._attrs = None
+        for (key,value) in items:
+            self.set(key,value)
 
     def description(self,d):
         """Provide a human readable description of object."""
@@ -115,14 +179,37 @@ class AmbrosiaObject(metaclass=abc.ABCMeta):
 
     def __str__(self):
         """Provide a human readable object state."""
-        return "\n".join(sorted([str((k,self._attrs[k])) for k in self._attrs]))
+        return "\n".join(sorted([str(kv) for kv in self._attrItems()]))
 
     def copy(self):
         """Copy basic structure.  Subclasses are responsible for other state."""
         c = type(self)()
-        c._attrs = self._attrs.copy()
+        c._assign(self._attrItems())
         return c
 
+    def __reduce__(self):
+        """Reduce to a blank object of this class and its state, for pickle."""
+        return (_blank,(type(self),),self.__getstate__())
+
+    def __getstate__(self):
+        """Return the state of this object: its (key,value) attributes."""
+        return self._attrItems()
+
+    def __setstate__(self,state):
+        """Restore the attributes of a blank object from state."""
+        slotOf = self._slotOf
+        for (key,value) in state:
+            slot = slotOf.get(key)
+            if slot is not None:
+                setattr(self,slot,value)
+            else:
+                AmbrosiaObject.set(self,key,value)
+
+    def _revive(self):
+        """Prepare a blank object (made without __init__) for __setstate__;
+        subclasses initialize the private state they keep outside attributes."""
+        self._attrs = None
+
     def __handle__(self,msg):
         """Handle message from subclass."""
         assert False,"Cannot handle msg: "+msg
@@ -130,6 +217,18 @@ class AmbrosiaObject(metaclass=abc.ABCMeta):
 
 ###############################################################################
 # The Transform class
+def _matrixProduct(a,b):
+    """Return the product of two 4x4 matrices, stored as 16-element lists."""
+    result = []
+    for r in (0,4,8,12):
+        (a0,a1,a2,a3) = a[r:r+4]
+        for c in (0,1,2,3):
+            result.append(a0*b[c]+a1*b[c+4]+a2*b[c+8]+a3*b[c+12])
+    return result
+
+# Every change to a transform's matrix draws a fresh stamp from here.
+_xformVersions = count(1)
+
 @checkdoc
 class Transform(AmbrosiaObject):
     """The encapsulation of a 3-space transform.
@@ -151,7 +250,9 @@ class Transform(AmbrosiaObject):
         t = Transform().xRot(90)
 
     The transform also keeps track of the history (a string) of the
-    construction of the transformation.
+    construction of the transformation.  In large scenes, this history can
+    be limited (or turned off) with historyLimit, either on a particular
+    transform or for all transforms with environment.historyLimit.
 
     Transforms are useful for mapping points in one space into the transformed
     space.  This is typically accomplished by using the transform as a
@@ -160,18 +261,54 @@ class Transform(AmbrosiaObject):
         >>> t((0,0,0))
         (1,0,1)
     Passing a polygon as the parameter will transform each of the points of
-    the polygon by the transformation; the result is a polygon.
+    the polygon by the transformation; the result is a polygon.  If numpy
+    is available, an (N,3) array of points may be passed instead; all the
+    points are mapped at once, and the result is an (N,3) array.
+
+    Each transform remembers its products with the transforms it has been
+    composed under (see Context.pushXform); these are reused until either
+    matrix is changed.  Changes made directly to the list returned by
+    getMatrix must be followed by a call to touch.
     """
+    _fields = ( 'xform.history', 'xform.historyLimit', 'xform.matrix' )
+    __slots__ = [ "_version", "_products" ]
+    productLimit = 64
+
     def __init__(self,description="An ambrosia transform."):
         """Initialize transformation as identity."""
         super().__init__(description=description)
+        self._products = dict()
         self.reset()
 
     def reset(self):
         """Initialize the transform to the identity."""
         self.set('xform.history',[])
         self.set('xform.matrix',[1,0,0,0, 0,1,0,0, 0,0,1,0, 0,0,0,1])
-        return self
+        self.touch()
+        return self
+
+    def _revive(self):
+        super()._revive()
+        self._products = dict()
+        self.touch()
+
+    def touch(self):
+        """Note that the matrix has changed; products that use it are stale."""
+        self._version = next(_xformVersions)
+        return self
+
+    def _composedWith(self,parent):
+        """Return self*parent, reused while neither transform has changed."""
+        entry = self._products.get(id(parent))
+        if entry is not None:
+            (p,pv,sv,result,rv) = entry
+            if (p is parent) and (pv == parent._version) and (sv == self._version) and (rv == result._version):
+                return result
+        elif len(self._products) >= self.productLimit:
+            self._products.clear()
+        result = self*parent
+        self._products[id(parent)] = (parent,parent._version,self._version,result,result._version)
+        return result
 
     def __eq__(self,other):
         """Quick check to see if two transforms are the same."""
@@ -187,15 +324,37 @@ class Transform(AmbrosiaObject):
         result = super().copy()
         result.set('xform.history',result.getHistory().copy())
         result.set('xform.matrix',result.getMatrix().copy())
-        return result
+        return result.touch()
 
     def isIdentity(self):
         """Return true if this transform is the identity."""
         return self == identity
 
-    def _appendHistory(self,t):
-        """Append string to evaluation history."""
-        self.get('xform.history').append(t)
+    def historyLimit(self,n=None):
+        """Keep at most n history entries (0: none); None defers to environment."""
+        self.set('xform.historyLimit',n)
+        return self
+
+    def getHistoryLimit(self):
+        """Get the number of history entries kept (None means unlimited)."""
+        n = self.get('xform.historyLimit')
+        return environment.getHistoryLimit() if n is None else n
+
+    def _appendHistory(self,fmt,*args):
+        """Append formatted string to evaluation history, if recorded."""
+        limit = self.getHistoryLimit()
+        if limit != 0:
+            h = self.get('xform.history')
+            h.append(fmt.format(*args))
+            if (limit is not None) and (len(h) > limit):
+                del h[:-limit]
+
+    def _setHistory(self,h):
+        """Install history list h, trimmed to the history limit."""
+        limit = self.getHistoryLimit()
+        if (limit is not None) and (len(h) > limit):
+            h = h[len(h)-limit:]
+        self.set('xform.history',h)
 
     def __call__(self,value):
         if isinstance(value,tuple):
@@ -208,19 +367,64 @@ class Transform(AmbrosiaObject):
         return self(value)
 
     def mapPoly(self,poly):
-        """Compute the action of the transformation on a polygon."""
-        return [ self.mapPoint(p) for p in poly ]
+        """Compute the action of the transformation on a polygon.
+        If poly is an (N,3) numpy array, it is mapped as an array."""
+        if hasattr(poly,'ndim'):
+            return self.mapArray(poly)
+        (t0,t1,t2,t3,t4,t5,t6,t7,t8,t9,t10,t11,t12,t13,t14,t15) = self.getMatrix()
+        result = []
+        for (x,y,z) in poly:
+            omega = t3*x+t7*y+t11*z+t15
+            if abs(omega) < fuzz:
+                print("omega is 0.  matrix={}, p1={}".format(self.getMatrix(),[x,y,z,1]))
+            result.append(((t0*x+t4*y+t8*z+t12)/omega,
+                           (t1*x+t5*y+t9*z+t13)/omega,
+                           (t2*x+t6*y+t10*z+t14)/omega))
+        return result
 
     def mapPoint(self,p):
         """Map a point, p, through this transformation."""
         typeCheck(p,({int,float},{int,float},{int,float}))
-        t = self.getMatrix()
-        p = list(p)
-        p1 = p+[1]
-        omega = dotProduct(t[3::4],p1)
-        if near(omega,0):
-            print("omega is 0.  matrix={}, p1={}".format(t,p1))
-        return tuple(dotProduct(t[i::4],p1)/omega for i in range(3))
+        return self.mapPoly((p,))[0]
+
+    def mapBox(self,box):
+        """Compute the box bounding the image of box, (low,high), under this transformation."""
+        if boxIsEmpty(box):
+            return emptyBox
+        if not boxIsFinite(box):
+            return infiniteBox
+        m = self.getMatrix()
+        if m[3] or m[7] or m[11] or m[15] != 1:
+            return boxOf(self.mapPoly(boxCorners(box)))
+        # affine: each output coordinate is extreme at some corner, axis by axis
+        (low,high) = box
+        result = ([m[12],m[13],m[14]],[m[12],m[13],m[14]])
+        for i in (0,1,2):
+            for j in (0,1,2):
+                a = m[4*i+j]*low[i]
+                b = m[4*i+j]*high[i]
+                if a < b:
+                    result[0][j] += a
+                    result[1][j] += b
+                else:
+                    result[0][j] += b
+                    result[1][j] += a
+        return (tuple(result[0]),tuple(result[1]))
+
+    def getArray(self):
+        """Return the transform as a 4x4 numpy array (row vectors map on the left)."""
+        import numpy
+        return numpy.array(self.getMatrix(),dtype=float).reshape(4,4)
+
+    def mapArray(self,a):
+        """Map an (N,3) numpy array of points in a single operation."""
+        import numpy
+        a = numpy.asarray(a,dtype=float)
+        if a.ndim == 1:
+            return self.mapArray(a.reshape(1,3))[0]
+        m = self.getArray()
+        r = a @ m[:3] + m[3]
+        return r[:,:3]/r[:,3:]
 
     def mapDirection(self,d):
         """Map a direction vector, d, using this transformation."""
@@ -231,6 +435,7 @@ class Transform(AmbrosiaObject):
         self._appendHistory('(yzMirror)')
         t = self.getMatrix()
         t[0::4] = [-v for v in t[0::4]]
+        self.touch()
         return self
 
     def xzMirror(self):
@@ -238,6 +443,7 @@ class Transform(AmbrosiaObject):
         self._appendHistory('(xzMirror)')
         t = self.getMatrix()
         t[1::4] = [-v for v in t[1::4]]
+        self.touch()
         return self
 
     def xyMirror(self):
@@ -245,11 +451,12 @@ class Transform(AmbrosiaObject):
         self._appendHistory('(xyMirror)')
         t = self.getMatrix()
         t[2::4] = [-v for v in t[2::4]]
+        self.touch()
         return self
 
     def xRot(self,angle):
         """Append an x-rotation through angle (degrees)."""
-        self._appendHistory("xRot({})".format(angle))
+        self._appendHistory("xRot({})",angle)
         a = deg2rad(angle)
         c = math.cos(a)
         s = math.sin(a)
@@ -266,11 +473,12 @@ class Transform(AmbrosiaObject):
         t[10] = s*t9+c*t[10]
         t[13] = c*t13-s*t[14]
         t[14] = s*t13+c*t[14]
+        self.touch()
         return self
 
     def yRot(self,angle):
         """Append a y-rotation through angle (degrees)."""
-        self._appendHistory("yRot({})".format(angle))
+        self._appendHistory("yRot({})",angle)
         a = deg2rad(angle)
         c = math.cos(a)
         s = math.sin(a)
@@ -287,11 +495,12 @@ class Transform(AmbrosiaObject):
         t[10] = c*t[10]-s*t8
         t[12] = c*t12+s*t[14]
         t[14] = c*t[14]-s*t12
+        self.touch()
         return self
 
     def zRot(self,angle):
         """Append a z-rotation through angle (degrees)."""
-        self._appendHistory("zRot({})".format(angle))
+        self._appendHistory("zRot({})",angle)
         a = deg2rad(angle)
         c = math.cos(a)
         s = math.sin(a)
@@ -308,6 +517,7 @@ class Transform(AmbrosiaObject):
         t[9] = s*t8+c*t[9]
         t[12] = c*t12-s*t[13]
         t[13] = s*t12+c*t[13]
+        self.touch()
         return self
 
     def scale(self,*args):
@@ -315,24 +525,25 @@ class Transform(AmbrosiaObject):
         if len(args) == 3:
             (x,y,z) = args
             assert x*y*z != 0, "Warning: scale({},{},{}) includes zero scale.".format(x,y,z)
-            self._appendHistory("scale({},{},{})".format(x,y,z))
+            self._appendHistory("scale({},{},{})",x,y,z)
         elif len(args) == 1:
             x = args[0]
             assert x != 0, "Warning: Scale by 0"
             y = x
             z = x
-            self._appendHistory("scale({})".format(x))
+            self._appendHistory("scale({})",x)
         else:
             assert False,"Scale must have 1 or 3 parameters."
         t = self.getMatrix()
         t[0::4] = [x*v for v in t[0::4]]
         t[1::4] = [y*v for v in t[1::4]]
         t[2::4] = [z*v for v in t[2::4]]
+        self.touch()
         return self
 
     def translate(self,x,y,z):
         """Append a translation, moving space by x, y, and z."""
-        self._appendHistory("translate({},{},{})".format(x,y,z))
+        self._appendHistory("translate({},{},{})",x,y,z)
         t = self.getMatrix()
         v3 = t[3]
         v7 = t[7]
@@ -350,6 +561,7 @@ class Transform(AmbrosiaObject):
         t[12] = v15*x+t[12]
         t[13] = v15*y+t[13]
         t[14] = v15*z+t[14]
+        self.touch()
         return self
 
     def getHistory(self):
@@ -361,21 +573,18 @@ class Transform(AmbrosiaObject):
         return self.get('xform.matrix')
 
     def __mul__(self,other):
-        """Compose transformation with another transform."""
-        ot = other.getMatrix()
-        t = self.getMatrix()
+        """Compose transformation with another transform (a matrix product)."""
         result = Transform()
-        rt = result.getMatrix()
-        for i in range(16):
-            rt[i] = dotProduct(t[i-i%4:i+4-i%4:1],ot[i%4::4])
+        result.set('xform.matrix',_matrixProduct(self.getMatrix(),other.getMatrix()))
         return result
 
     def __imul__(self,other):
         """Update this transform by following it with other."""
-        self.getHistory().extend(other.getHistory())
+        if self.getHistoryLimit() != 0:
+            self._setHistory(self.getHistory()+other.getHistory())
         new = self*other
         self.set('xform.matrix',new.getMatrix())
-        return self
+        return self.touch()
 
     def append(self,other):
         """Update this transform by following it with other."""
@@ -383,10 +592,11 @@ class Transform(AmbrosiaObject):
 
     def prepend(self,other):
         """Update this transform by preceding it with other."""
-        self.set('xform.history',other.getHistory()+self.getHistory())
+        if self.getHistoryLimit() != 0:
+            self._setHistory(other.getHistory()+self.getHistory())
         new = other*self
         self.set('xform.matrix',new.getMatrix())
-        return self
+        return self.touch()
 
     def normalize(self):
         """Normalize the transformation (forces t[3][3] to 1)."""
@@ -396,6 +606,7 @@ class Transform(AmbrosiaObject):
         if omega != 1:
             for i in range(16):
                 t[i] /= omega
+            self.touch()
         return self
 
     def _POV_(self,context):
@@ -421,6 +632,7 @@ class Environment(AmbrosiaObject):
     For example, the intermediate frames of a movie are stored in the
     project folder.
     """
+    _fields = ( 'environment.boundCSG', 'environment.declareShared', 'environment.historyLimit', 'environment.imageFolder', 'environment.libraryPath', 'environment.medium', 'environment.povCache', 'environment.povProfile', 'environment.projectFolder', 'environment.renderCache', 'environment.renderCacheSize', 'environment.writer' )
 
     def __init__(self,description="A rendering environment."):
         """Initialize the environment."""
@@ -432,6 +644,16 @@ class Environment(AmbrosiaObject):
         # the library path provides directories where POV can find source code
         self.set('environment.libraryPath',[])
         self.set('environment.medium','jupyter' if 'ipykernel' in modules else 'standalone')
+        # by default, every shot is rendered
+        self.renderCache(None)
+        # by default, objects used more than once are declared once
+        self.declareShared(True)
+        # by default, intersections and differences are written as they are
+        self.boundCSG(False)
+        # by default, every shot is written in full
+        self.povCache(None)
+        # by default, writing is not profiled
+        self.povProfile(False)
 
     def __copy__(self):
         """Create an identical copy of this environment."""
@@ -471,6 +693,72 @@ class Environment(AmbrosiaObject):
         """Get the name of the folder containing project files."""
         return self.get('environment.projectFolder')
 
+    def renderCache(self,f=None,size=1<<30):
+        """Keep rendered images in folder f, up to size bytes; None disables.
+        Shots whose POV and ini files are identical to an earlier shot's
+        are then taken from the cache rather than rendered again."""
+        self.set('environment.renderCache',cleanpath(f) if f else None)
+        self.set('environment.renderCacheSize',size)
+        return self
+
+    def getRenderCache(self):
+        """Get the folder holding cached images, or None if not caching."""
+        return self.get('environment.renderCache')
+
+    def getRenderCacheSize(self):
+        """Get the maximum size (in bytes) of the image cache."""
+        return self.get('environment.renderCacheSize')
+
+    def povCache(self,size=1<<26):
+        """Keep the POV written for parts of each shot, up to size characters;
+        None disables.  Parts that are unchanged, and seen in the same
+        setting, in a later shot are then copied rather than written again.
+        Objects changed other than through their methods (for example, a
+        list of points edited in place) may not be noticed."""
+        self.set('environment.povCache',POVCache(size) if size else None)
+        return self
+
+    def getPOVCache(self):
+        """Get the POVCache used when writing shots, or None if not caching."""
+        return self.get('environment.povCache')
+
+    def povProfile(self,on=True):
+        """Profile the writing of shots, by class and name, with a new
+        POVProfile iff on; see getPOVProfile."""
+        self.set('environment.povProfile',POVProfile() if on else None)
+        return self
+
+    def getPOVProfile(self):
+        """Get the POVProfile that collects figures for the shots written,
+        or None if not profiling.  For example,
+            environment.povProfile()
+            camera.shoot()
+            environment.getPOVProfile().report(limit=10)"""
+        return self.get('environment.povProfile')
+
+    def declareShared(self,on=True):
+        """Emit repeated objects and textures as POV #declares iff on."""
+        self.set('environment.declareShared',on)
+        return self
+
+    def getDeclareShared(self):
+        """Return True iff shared objects are emitted as POV #declares."""
+        return self.get('environment.declareShared')
+
+    def boundCSG(self,on=True):
+        """Bound each POV intersection and difference by a box, and leave
+        out subtracted objects that miss the object they're subtracted
+        from, iff on (it is off by default).  Bounds are cached: a mesh whose
+        vertices are changed in place must be set again, and a matrix
+        changed through getMatrix must be touched, or a subtraction may be
+        left out wrongly."""
+        self.set('environment.boundCSG',on)
+        return self
+
+    def getBoundCSG(self):
+        """Return True iff intersections and differences are bounded."""
+        return self.get('environment.boundCSG')
+
     def libraryFolder(self,f=None):
         """Add a folder to the library folder path; used internally."""
         if f:
@@ -494,6 +782,15 @@ class Environment(AmbrosiaObject):
             file = cleanpath(os.path.join(os.getcwd(),file))
         return file
 
+    def historyLimit(self,n=None):
+        """Keep at most n history entries per transform (0: none, None: all)."""
+        self.set('environment.historyLimit',n)
+        return self
+
+    def getHistoryLimit(self):
+        """Get the number of history entries kept per transform."""
+        return self.get('environment.historyLimit')
+
     def recursionLimit(self,n=1000):
         """Set the limit of recursion to n (or 1000)."""
         result = self.getRecursionLimit()
@@ -515,68 +812,424 @@ environment = Environment(description="Default ambrosia environment.")
 
 @checkdoc
 class POVWriter(AmbrosiaObject):
-    __slots__ = ["_outputFile"]
+    """A writer that collects POV output and sends it to a file.
+
+    By default, output written to an open file is buffered: text is
+    accumulated as a list of chunks and written in large pieces when the
+    buffer fills or the file is closed.  Output written when no file is
+    open goes directly to the standard output.  Output may also be
+    captured as a string, between calls to capture and release."""
+    __slots__ = ["_outputFile", "_chunks", "_count", "_flushed", "_bufferSize", "_captures"]
 
     def __init__(self,description="A POV writing assistant."):
         super().__init__(description=description)
         self._outputFile = None
+        self._chunks = []
+        self._count = 0
+        self._flushed = 0
+        self._captures = []
+        self.buffered(True)
+
+    def buffered(self,on=True,size=1<<20):
+        """Buffer output to files (in pieces of about size characters) iff on."""
+        self.flush()
+        self._bufferSize = size if on else 0
+        return self
+
+    def getBuffered(self):
+        """Return True iff output to files is buffered."""
+        return self._bufferSize > 0
 
     def open(self,filename):
         """Open file for output to hold POV model or init file."""
+        self.close()
         self._outputFile = open(filename,"wt")
+        self._flushed = self._count
 
     def close(self):
         """Close previously opened POV file."""
         if self._outputFile:
+            self.flush()
             self._outputFile.close()
         self._outputFile = None
 
+    def flush(self):
+        """Write any buffered output to the output file."""
+        if self._chunks:
+            self._outputFile.write("".join(self._chunks))
+            self._chunks = []
+        self._flushed = self._count
+
     def getOutputFile(self):
         """Return the output file used with POV."""
         return self._outputFile
 
+    def getCount(self):
+        """Return the number of characters written (not captured) so far."""
+        return self._count
+
+    def capture(self):
+        """Collect subsequent output, until release is called."""
+        self._captures.append([])
+        return self
+
+    def release(self):
+        """Stop the most recent capture; return the output it collected."""
+        return "".join(self._captures.pop())
+
+    def releaseItems(self):
+        """Stop the most recent capture; return what it collected, as a list
+        of strings (runs of output joined) and items added by mark."""
+        result = []
+        text = []
+        for item in self._captures.pop():
+            if isinstance(item,str):
+                text.append(item)
+            else:
+                if text:
+                    result.append("".join(text))
+                    text = []
+                result.append(item)
+        if text:
+            result.append("".join(text))
+        return result
+
+    def mark(self,item):
+        """Add item, which is not text, to the current capture."""
+        self._captures[-1].append(item)
+
+    def isCapturing(self):
+        """Return True iff output is currently being captured."""
+        return bool(self._captures)
+
+    def write(self,s):
+        """Write the string s to the POV output."""
+        if self._captures:
+            self._captures[-1].append(s)
+            return
+        self._count += len(s)
+        if self._outputFile is None:
+            stdout.write(s)
+        elif self._bufferSize:
+            self._chunks.append(s)
+            if self._count-self._flushed >= self._bufferSize:
+                self.flush()
+        else:
+            self._outputFile.write(s)
+
     def writePoint(self,p):
         """Write a (2 or 3d) point to POV output file."""
-        l = [str(x) for x in p]
-        prt("<{}>".format(",".join(l)))
+        self.write("<"+",".join([str(x) for x in p])+">")
+
+    def writePoints(self,points):
+        """Write a sequence of same-sized points, each preceded by a comma."""
+        if hasattr(points,'tolist'):
+            points = points.tolist() # arrays format faster as lists
+        if len(points):
+            template = ",<"+",".join(["{}"]*len(points[0]))+">"
+            self.write("".join([template.format(*p) for p in points]))
 
     def writeXform(self,x,prefix=None):
         """Print POV represenation of a transform."""
-        prt("{} <{}, {}, {}, {}, {}, {}, {}, {}, {}, {}, {}, {}> ".format(prefix if not None else "" ,*[x[i] for i in [0,1,2,4,5,6,8,9,10,12,13,14]]))
+        self.write("{} <{}, {}, {}, {}, {}, {}, {}, {}, {}, {}, {}, {}> ".format(prefix if not None else "" ,x[0],x[1],x[2],x[4],x[5],x[6],x[8],x[9],x[10],x[12],x[13],x[14]))
 
     def writeColor(self,c):
         """Write a color in a standard way to POV output file."""
         l = len(c)
         if l==0:
-            prt("color rgb <0.5,0.5,0.5>")
+            self.write("color rgb <0.5,0.5,0.5>")
         elif l < 3:
-            prt("color rgb <{},{},{}>".format(c[0],c[0],c[0]))
+            self.write("color rgb <{},{},{}>".format(c[0],c[0],c[0]))
         elif l == 3:
-            prt("color rgb <{},{},{}>".format(c[0],c[1],c[2]))
+            self.write("color rgb <{},{},{}>".format(c[0],c[1],c[2]))
         elif l == 4:
-            prt("color rgb <{},{},{},{}>".format(c[0],c[1],c[2],1-c[3]))
+            self.write("color rgb <{},{},{},{}>".format(c[0],c[1],c[2],1-c[3]))
         else:
-            prt("color rgb <{},{},{},{},{}>".format(c[0],c[1],c[2],1-c[3],c[4]))
+            self.write("color rgb <{},{},{},{},{}>".format(c[0],c[1],c[2],1-c[3],c[4]))
+
+
+###############################################################################
+# The POVCache class
+@checkdoc
+class POVCache(AmbrosiaObject):
+    """The POV written for parts of earlier shots.  Each fragment is the
+    output of one object (and those beneath it) in one setting: its
+    transform, materials, grouping, and view.  A fragment is a list of
+    strings, materials (written, as each shot requires, when the fragment
+    is copied), and fragments of the objects beneath.  The least recently
+    used fragments are dropped to keep the cache within its size, in
+    characters."""
+    __slots__ = ["_fragments", "_chains", "_size", "_limit", "_hits", "_misses"]
+    def __init__(self,size=1<<26,description="A POV fragment cache."):
+        super().__init__(description=description)
+        self._fragments = dict()
+        self._chains = dict()
+        self._size = 0
+        self._limit = size
+        self._hits = 0
+        self._misses = 0
+
+    def getStats(self):
+        """Return the number of fragments copied and written since created or cleared."""
+        return (self._hits,self._misses)
+
+    def getSize(self):
+        """Return the number of characters held."""
+        return self._size
+
+    def clear(self):
+        """Drop all fragments and statistics."""
+        self._fragments.clear()
+        self._chains.clear()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        return self
+
+    def _lookup(self,key,obj,total):
+        """Return the fragment written for obj, placed by total, under key (or None)."""
+        entry = self._fragments.pop(key,None)
+        if entry is None or entry[0] is not obj or entry[1] is not total:
+            if entry is not None:
+                self._size -= entry[3]
+            self._misses += 1
+            return None
+        self._fragments[key] = entry  # most recently used
+        self._hits += 1
+        return entry[2]
+
+    def _store(self,key,obj,total,fragment):
+        """Keep fragment, written for obj placed by total, under key."""
+        size = sum([len(item) for item in fragment if isinstance(item,str)])
+        old = self._fragments.pop(key,None)
+        if old is not None:
+            self._size -= old[3]
+        self._fragments[key] = (obj,total,fragment,size)
+        self._size += size
+        while self._size > self._limit and self._fragments:
+            oldest = next(iter(self._fragments))
+            self._size -= self._fragments.pop(oldest)[3]
 
+###############################################################################
+# The POVProfile class
+@checkdoc
+class POVProfile(AmbrosiaObject):
+    """The time taken, and the characters written, in writing POV.  Each
+    object written is counted by its class and, if it has been given a
+    name of its own, by its name.  The figures for a class are those of
+    its objects alone (objects beneath them count for their own classes);
+    those for a name include the objects beneath, as a subtree's do.
+    Output captured, for a #declare or for the POV cache, is counted
+    where it is finally written: for example, the body of a declared
+    object counts toward the reference that first writes it.
+    """
+    __slots__ = ["_classes", "_names", "_stack", "_open"]
+    def __init__(self,description="A POV writing profile."):
+        super().__init__(description=description)
+        self._classes = dict()
+        self._names = dict()
+        self._stack = []
+        self._open = dict()
+
+    def getStats(self):
+        """Return a dictionary with two entries, 'classes' and 'names', each
+        mapping a class (or object) name to (calls,seconds,characters)."""
+        return {'classes': {k: tuple(v) for (k,v) in self._classes.items()},
+                'names': {k: tuple(v) for (k,v) in self._names.items()}}
+
+    def report(self,key='seconds',limit=None,file=None):
+        """Print the figures for classes and names, largest first by key
+        ('calls', 'seconds', or 'characters'), at most limit of each."""
+        column = ['calls','seconds','characters'].index(key)
+        for (title,entries) in (('class',self._classes),('name',self._names)):
+            rows = sorted(entries.items(),key=lambda kv: kv[1][column],reverse=True)
+            print("{:<24} {:>10} {:>10} {:>12}".format(title,'calls','seconds','characters'),file=file)
+            for (k,(calls,seconds,characters)) in rows[:limit]:
+                print("{:<24} {:>10} {:>10.4f} {:>12}".format(k,calls,seconds,characters),file=file)
+        return self
+
+    def clear(self):
+        """Drop all figures."""
+        self._classes.clear()
+        self._names.clear()
+        self._stack = []
+        self._open.clear()
+        return self
+
+    def _enter(self,obj):
+        """Start timing the writing of obj; return the frame to hand to
+        _leave, or None if obj is already being timed (as when POV hands
+        a group to its walk)."""
+        stack = self._stack
+        if stack and stack[-1][0] is obj:
+            return None
+        name = obj.getName()
+        if name == type(obj).__name__ or name in self._open:
+            name = None
+        else:
+            self._open[name] = True
+        frame = [obj,name,perf_counter(),pov.getCount(),0,0]
+        stack.append(frame)
+        return frame
+
+    def _leave(self,frame):
+        """Finish timing the writing of the object of frame."""
+        (obj,name,start,count,innerSeconds,innerCount) = frame
+        seconds = perf_counter()-start
+        characters = pov.getCount()-count
+        stack = self._stack
+        stack.pop()
+        if stack:
+            stack[-1][4] += seconds
+            stack[-1][5] += characters
+        entry = self._classes.get(type(obj).__name__)
+        if entry is None:
+            entry = self._classes[type(obj).__name__] = [0,0,0]
+        entry[0] += 1
+        entry[1] += seconds-innerSeconds
+        entry[2] += characters-innerCount
+        if name is not None:
+            del self._open[name]
+            entry = self._names.get(name)
+            if entry is None:
+                entry = self._names[name] = [0,0,0]
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] += characters
 
 ###############################################################################
 # The Transformable class
 #
+# stand-ins for the tags and handle indexes of objects that have none
+_noTags = frozenset()
+_noHandles = dict()
+
+# Numbers for the chains of materials pushed on contexts (see Context._chain).
+_chainNumbers = count(1)
+
+# Every change to a transformable object, and every bounding box computed
+# for one, draws a fresh stamp from here.
+_versions = count(1)
+
+def _bounded(root):
+    """Bring the bounds cached by root, and by the objects beneath it, up
+    to date; return root's.  Each object caches (stamp,local,placed,version):
+    its boxes in its own and its parent's coordinates are recomputed when
+    the stamp (its version, its transform's, its geometry's, its
+    appearance's, and the versions of its children's boxes) changes; each
+    recomputation takes a new version, so an unchanged version means
+    nothing at or beneath the object has changed."""
+    versions = dict()
+    todo = [(root,False)]
+    while todo:
+        (obj,ready) = todo.pop()
+        k = id(obj)
+        if k in versions:
+            continue
+        children = obj._children()
+        if not ready:
+            todo.append((obj,True))
+            todo.extend([(c,False) for c in children if id(c) not in versions])
+            continue
+        t = obj.get('xformable.xform')
+        stamp = (obj._version,0 if t is None else t._version,obj._geometry(),
+                 obj._appearance(),tuple([versions[id(c)] for c in children]))
+        box = obj._box
+        if box is None or box[0] != stamp:
+            local = obj._extent([c._box[2] for c in children])
+            placed = local if t is None else t.mapBox(local)
+            box = obj._box = (stamp,local,placed,next(_versions))
+        versions[k] = box[3]
+    return root._box
+
+# The attributes whose change may alter the handles at or beneath an object.
+_handleKeys = frozenset(['xformable.handles','csg.references','reference.target'])
+
+def _indexed(root):
+    """Bring up to date the handle directories of root and of the objects
+    beneath it; return root's.  A directory maps the name of each handle
+    found at or beneath an object to where it is found, in depth-first
+    order: -1 for the object itself, otherwise the index of a child.  An
+    object caches (directory,parents), where parents are the objects whose
+    directories were built from this one; only the directories dropped
+    (see _unindex) since the last lookup are rebuilt."""
+    todo = [(root,False)]
+    while todo:
+        (obj,ready) = todo.pop()
+        if obj._handleIndex is not None:
+            continue
+        children = obj._children()
+        if not ready:
+            todo.append((obj,True))
+            todo.extend([(c,False) for c in children if c._handleIndex is None])
+            continue
+        obj._handleIndex = (obj._handleDirectory(children),dict())
+        for c in children:
+            c._handleIndex[1][id(obj)] = obj
+    return root._handleIndex[0]
+
+def _unindex(obj):
+    """Drop the handle directories of obj and of the objects above it."""
+    todo = [obj]
+    while todo:
+        o = todo.pop()
+        entry = o._handleIndex
+        if entry is not None:
+            o._handleIndex = None
+            todo.extend(entry[1].values())
+
+def _placed(obj,p,path):
+    """Map p, a point in obj's space, back along path (see _handles)."""
+    while True:
+        t = obj.get('xformable.xform')
+        p = (_worldXform if t is None else t).mapPoint(p)
+        if path is None:
+            return p
+        (label,obj,path) = path
+
 @checkdoc
 class Transformable(AmbrosiaObject):
     """This class describes all ambrosia objects that can be transformed."""
+    _fields = ( 'xformable.centroid', 'xformable.cullable', 'xformable.handles', 'xformable.tags', 'xformable.xform' )
+    __slots__ = [ "_version", "_box", "_handleIndex" ]
+    # may this object be emitted once, as a #declare, and instanced?
+    _POV_shareable = True
+    # may this object be left out of a shot when it is out of view?
+    _POV_cullable = True
+    # does this object emit several POV objects (which must be grouped)?
+    _POV_compound = False
 
     def __init__(self,description="A transformable object."):
         """Initialize a Transformable object."""
+        self._box = None
+        self._handleIndex = None
         super().__init__(description=description)
-        self.set('xformable.xform',Transform())
         self.set('xformable.centroid',origin)
-        self.set('xformable.tags',set())
-        self.set('xformable.handles',dict())
+
+    def _revive(self):
+        super()._revive()
+        self._box = None
+        self._handleIndex = None
+        self._version = next(_versions)
+
+    def set(self,key,value):
+        """Set attribute value; the object takes a new version stamp."""
+        super().set(key,value)
+        self._version = next(_versions)
+        if self._handleIndex is not None and key in _handleKeys:
+            _unindex(self)
 
     def getTags(self):
         """Return tag set."""
-        return self.get('xformable.tags')
+        tags = self.get('xformable.tags')
+        if tags is None:
+            tags = set()
+            self.set('xformable.tags',tags)
+        return tags
+
+    def _getTags(self):
+        """Return tag set, without making one for an untagged object."""
+        return self.get('xformable.tags') or _noTags
 
     def tags(self,tl):
         """Replace tags from iterable."""
@@ -585,47 +1238,143 @@ class Transformable(AmbrosiaObject):
 
     def tag(self,*items):
         """Mix in new tags."""
-        self.getTags().update(items)
+        tags = self.getTags()
+        tags.update(items)
+        self.set('xformable.tags',tags)  # takes a new version
         return self
 
     def hasTag(self,tag):
         """Check for specific tag."""
-        return tag in self.getTags()
+        return tag in self._getTags()
 
     def untag(self,tag):
         """Remove a tag from the tag set."""
-        self.getTags().discard(tag)
+        tags = self.get('xformable.tags')
+        if tags:
+            tags.discard(tag)
+            self.set('xformable.tags',tags)  # takes a new version
         return self
 
+    def cullable(self,v=True):
+        """Allow (or, with v False, forbid) leaving this object out of shots
+        that do not see it; an unseen object may still cast a shadow or be
+        reflected into view."""
+        self.set('xformable.cullable',v)
+        return self
+
+    def getCullable(self):
+        """Return True if this object may be left out of shots that do not see it."""
+        v = self.get('xformable.cullable')
+        return self._POV_cullable if v is None else v
+
     def handle(self,name,pt):
         """Identify a location with a name."""
         l = self.get('xformable.handles')
         assert(isinstance(name,str))
         assert(len(pt) == 3)
+        if l is None:
+            l = dict()
         l[name] = pt
+        self.set('xformable.handles',l)  # takes a new version
         return self
 
     def getHandle(self,name):
         """Get the location associated with name."""
         assert(isinstance(name,str))
-        l = self.get('xformable.handles')
-        if name in l:
-            return self.getXform().mapPoint(l[name])
-        else:
-            return None
+        for (obj,p,path) in self._handles(name):
+            return _placed(obj,p,path)
+        return None
 
     def getHandles(self,name):
         """Get a list of all handles with a particular name."""
         assert(isinstance(name,str))
+        result = []
+        for (obj,p,path) in self._handles(name):
+            label = [obj.getName()]
+            up = path
+            while up is not None:
+                (piece,parent,up) = up
+                label.append(piece)
+            result.append(("".join(reversed(label)),_placed(obj,p,path)))
+        return result
+
+    def _handles(self,name):
+        """Generate the handles with a particular name, at or beneath this
+        object, in depth-first order.  Each is a triple: the object holding
+        it, its location, and the path back to this object, a chain of
+        (label,parent,path) triples ending in None.  Only the objects whose
+        directories (see _indexed) hold the name are visited."""
+        places = _indexed(self).get(name)
+        if places is None:
+            return
+        todo = [(self,None,iter(places))]
+        while todo:
+            (obj,path,places) = todo[-1]
+            i = next(places,None)
+            if i is None:
+                todo.pop()
+            elif i < 0:
+                yield (obj,obj.get('xformable.handles')[name],path)
+            else:
+                child = obj._children()[i]
+                todo.append((child,(obj._childLabel(i),obj,path),iter(child._handleIndex[0][name])))
+
+    def _handleDirectory(self,children):
+        """Build this object's handle directory (see _indexed) from those
+        of its children."""
         l = self.get('xformable.handles')
-        if name in l:
-            return [(self.getName(),self.getXform().mapPoint(l[name]))]
-        else:
-            return []
+        directory = dict([(k,[-1]) for k in l]) if l else dict()
+        for (i,c) in enumerate(children):
+            for k in c._handleIndex[0]:
+                places = directory.get(k)
+                if places is None:
+                    directory[k] = [i]
+                else:
+                    places.append(i)
+        return directory or _noHandles
+
+    def _children(self):
+        """Return the objects directly beneath this one in the scene graph."""
+        return ()
+
+    def getLocalBounds(self):
+        """Return the box, (low,high), bounding this object in its own coordinates."""
+        return _bounded(self)[1]
+
+    def getBounds(self,t=None):
+        """Return the box bounding this object, as placed by its transform
+        (and then by t, if given; for example, a context's total transform)."""
+        box = _bounded(self)[2]
+        return box if t is None else t.mapBox(box)
+
+    def _extent(self,boxes):
+        """Compute the box bounding this object in its own coordinates, given
+        the (placed) boxes of its children.  Unless known, it is infinite."""
+        return infiniteBox
+
+    def _geometry(self):
+        """Return a value that changes if the object's geometry is changed in place."""
+        return None
+
+    def _appearance(self):
+        """Return a value that changes if the object's material is changed in place."""
+        return None
+
+    def _POV_enter(self,context):
+        """Start writing this object.  Objects that contain others return
+        (children,state,inner): the children are written next, in the
+        context inner, and then _POV_leave(context,state) is called.
+        Others are written in full, and None is returned."""
+        self._POV_(context)
+        return None
 
     def getXform(self):
         """Return the transform associated with this object."""
-        return self.get('xformable.xform')
+        t = self.get('xformable.xform')
+        if t is None:
+            t = Transform()
+            self.set('xformable.xform',t)
+        return t
 
     def xform(self,t):
         """Set the transform to t."""
@@ -708,10 +1457,10 @@ class Transformable(AmbrosiaObject):
             super().__handle__(msg)
 
     def _POV_(self,context):
-        context.pushXform(self.getXform())
-        context.pushTags(self.getTags())
+        context.pushXform(self.get('xformable.xform'))
+        context.pushTags(self._getTags())
         context.getTotalXform()._POV_(context)
-        if self.getTags():
+        if self._getTags():
             print("// tags: {}".format(context.getMergedTags()))
         context.popTags()
         context.popXform()
@@ -722,6 +1471,7 @@ class Transformable(AmbrosiaObject):
 class Primitive(Transformable):
     """Primitive objects are Transformable and can have materials associated
     with them."""
+    _fields = ( 'primitive.material', )
 
     def __init__(self,description="A primitive object."):
         """Initialize the the Primitive object."""
@@ -741,6 +1491,10 @@ class Primitive(Transformable):
         self.set('primitive.material',m)
         return self
 
+    def _appearance(self):
+        m = self.getMaterial()
+        return None if m is None else m._stamp()
+
 
     def __handle__(self,msg):
         """Handle transform- or material-setting message."""
@@ -762,19 +1516,44 @@ class Primitive(Transformable):
 
 ###############################################################################
 # The Context class: a graphics context for ambrosia objects.
+# All contexts start from this transform, so that the transforms composed
+# beneath it may be reused from one walk to the next.
+_worldXform = Transform("The world transform.")
+
 @checkdoc
 class Context(AmbrosiaObject):
     """This class provides a nested graphics context for
     determining default graphics values for ambrosia objects."""
+    _fields = ( 'context.selectionPredicate', 'context.verboseGrouping' )
 
-    __slots__ = [ "_materialStack", "_transformStack", "_tagStack" ]
+    __slots__ = [ "_materialStack", "_transformStack", "_tagStack", "_shared", "_uses", "_declarations", "_bodies", "_pending", "_names", "_merges", "_mergeCounts", "_materials", "_seen", "_chains", "_frustum", "_kept", "_culled", "_frustumKey", "_cache", "_recording", "_profile", "_boundRoots" ]
     def __init__(self,description="A graphics context."):
         super().__init__(description=description)
-        self._materialStack = [[defaultMaterial,defaultMaterial]]
-        t = Transform()
+        self._materialStack = [[defaultMaterial,defaultMaterial,0]]
+        t = _worldXform
         self._transformStack = [[t,t]]
         s = set()
         self._tagStack = [[s,s]]
+        self._shared = set()
+        self._uses = dict()
+        self._declarations = dict()
+        self._bodies = dict()
+        self._pending = []
+        self._names = count(1)
+        self._merges = dict()
+        self._mergeCounts = [0,0]
+        self._materials = dict()
+        self._seen = set()
+        self._frustum = None
+        self._frustumKey = None
+        self._kept = set()
+        self._culled = 0
+        # with a POVCache, material chains are numbered alike from shot to shot
+        self._cache = environment.getPOVCache()
+        self._chains = dict() if self._cache is None else self._cache._chains
+        self._recording = 0
+        self._profile = environment.getPOVProfile()
+        self._boundRoots = set()
         self.verboseGrouping(False)
 
     def getXform(self):
@@ -803,11 +1582,12 @@ class Context(AmbrosiaObject):
 
     def getSelectionPredicate(self):
         """Return current selection predicate."""
-        return self.get('selectionPredicate')
+        return self.get('context.selectionPredicate')
 
-    def selectionPredicate(self):
+    def selectionPredicate(self,f):
         """Set selection predicate to f."""
         self.set('context.selectionPredicate',f)
+        return self
 
     def selects(self,object):
         """Return True if the selection predicate would select object."""
@@ -827,8 +1607,13 @@ class Context(AmbrosiaObject):
         return self
 
     def pushXform(self,t):
-        """Add a new transform to the transform stack."""
-        newTotal = t*self.getTotalXform()
+        """Add a new transform to the transform stack (None is the identity).
+        The accumulated transform is shared with earlier walks that composed
+        the same transforms; it should not be modified."""
+        if t is None:
+            newTotal = self.getTotalXform()
+        else:
+            newTotal = t._composedWith(self.getTotalXform())
         self._transformStack.append([t,newTotal])
         return self
 
@@ -838,9 +1623,38 @@ class Context(AmbrosiaObject):
 
     def pushMaterial(self,m):
         """Add a new material to the material stack."""
-        newMat = m.mergeWith(self.getMergedMaterial())
-        self._materialStack.append([m,newMat])
-        return self
+        (parent,merged,chain) = self._materialStack[-1]
+        self._materialStack.append([m,self._merged(m,merged),self._chain(chain,m)])
+        return self
+
+    def _chain(self,chain,m):
+        """Return the number that identifies material m, as it is now, pushed
+        above chain."""
+        key = (chain,id(m))
+        stamp = m._stamp()
+        entry = self._chains.get(key)
+        if entry is None or entry[0] is not m or entry[1] != stamp:
+            entry = (m,stamp,next(_chainNumbers))
+            self._chains[key] = entry
+        return entry[2]
+
+    def _merged(self,m,parent):
+        """Return m merged with parent.  Each distinct merge is made once;
+        later requests for the same (unchanged) pair reuse the result."""
+        key = (id(m),id(parent))
+        stamp = (m._stamp(),parent._stamp())
+        entry = self._merges.get(key)
+        if entry is not None and entry[0] is m and entry[1] is parent and entry[2] == stamp:
+            self._mergeCounts[0] += 1
+            return entry[3]
+        self._mergeCounts[1] += 1
+        result = m.mergeWith(parent)
+        self._merges[key] = (m,parent,stamp,result)
+        return result
+
+    def getMergeStats(self):
+        """Return the number of material merges reused and made by this context."""
+        return tuple(self._mergeCounts)
 
     def popMaterial(self):
         """Remove last material from stack."""
@@ -856,6 +1670,284 @@ class Context(AmbrosiaObject):
         """Remove last tagset from stack."""
         self._tagStack.pop()
 
+    def share(self,root):
+        """Find the objects that appear more than once, in the same setting,
+        beneath root.  Each of these is emitted once, as a POV #declare, and
+        every appearance of it becomes an instance of that declaration.
+        The setting is the materials, tags, and grouping in effect where the
+        object is referenced; the transform, applied to each instance, may
+        differ.  Objects that are (or contain) lights are never shared."""
+        self._bound(root)
+        # first, the objects referenced more than once, anywhere
+        counts = dict()
+        shareable = dict()
+        todo = [(root,False)]
+        while todo:
+            (obj,finished) = todo.pop()
+            k = id(obj)
+            children = obj._children()
+            if finished:
+                shareable[k] = obj._POV_shareable and all(shareable[id(c)] for c in children)
+            elif k not in shareable:
+                shareable[k] = False # until finished
+                if isinstance(obj,Reference):
+                    t = id(obj.getObject())
+                    counts[t] = counts.get(t,0)+1
+                todo.append((obj,True))
+                todo.extend([(c,False) for c in children if id(c) not in shareable])
+        self._shared = set(k for k in counts if counts[k] > 1 and shareable[k])
+        # next, the number of times each of these appears in each setting;
+        # this follows the material and tag pushes made by Reference and CSG
+        uses = dict()
+        todo = [(root,self._materialKey(),self.getMergedTags(),self.getVerboseGrouping())]
+        while todo:
+            (obj,materials,tags,vg) = todo.pop()
+            if isinstance(obj,Reference):
+                materials = self._chain(materials,obj.getMaterial())
+                tags = obj._getTags().union(tags)
+                target = obj.getObject()
+                if id(target) in self._shared:
+                    key = (id(target),materials,frozenset(tags),vg)
+                    uses[key] = uses.get(key,0)+1
+                    if uses[key] > 1:
+                        continue
+                todo.append((target,materials,tags,vg))
+            elif isinstance(obj,CSG):
+                materials = self._chain(materials,obj.getMaterial())
+                tags = obj._getTags().union(tags)
+                todo.extend([(r,materials,tags,True) for r in obj._POV_operands()])
+        self._uses = uses
+        return self
+
+    def cull(self,root,frustum):
+        """Leave out the objects beneath root whose bounds lie entirely
+        outside frustum, a list of planes (normal,offset) with the visible
+        side where dotProduct(normal,p)+offset >= 0 (see Camera._frustum).
+        Objects that are (or contain) lights, or are not getCullable(),
+        are always kept.  Intersections and differences are culled whole,
+        if at all: leaving out one of their operands would change the
+        shape of the rest.  Declarations are written whole."""
+        self._bound(root)
+        kept = set()
+        done = set()
+        todo = [(root,False)]
+        while todo:
+            (obj,finished) = todo.pop()
+            k = id(obj)
+            children = obj._children()
+            if finished:
+                if not obj.getCullable() or any(id(c) in kept for c in children):
+                    kept.add(k)
+            elif k not in done:
+                done.add(k)
+                todo.append((obj,True))
+                todo.extend([(c,False) for c in children if id(c) not in done])
+        # everything beneath an intersection or difference is kept
+        done = set()
+        todo = [(root,False)]
+        while todo:
+            (obj,whole) = todo.pop()
+            if (id(obj),whole) in done:
+                continue
+            done.add((id(obj),whole))
+            if whole:
+                kept.add(id(obj))
+            whole = whole or (isinstance(obj,CSG) and obj.get('csg.action') != 'union')
+            todo.extend([(c,whole) for c in obj._children()])
+        self._kept = kept
+        self._frustum = frustum
+        self._frustumKey = tuple([(tuple(n),offset) for (n,offset) in frustum])
+        return self
+
+    def _bound(self,root):
+        """Bring the bounds beneath root up to date, once per context (the
+        scene is not changed while a shot is written); see _bounded."""
+        if id(root) not in self._boundRoots:
+            _bounded(root)
+            self._boundRoots.add(id(root))
+
+    def _culls(self,obj):
+        """Return True if obj, placed by the current transform, is out of view."""
+        if self._frustum is None or id(obj) in self._kept or obj._box is None:
+            return False
+        box = obj._box[2]
+        if not boxIsFinite(box):
+            culled = boxIsEmpty(box)
+        else:
+            (low,high) = self.getTotalXform().mapBox(box)
+            # out of view if the box's corner farthest along some normal is outside
+            culled = False
+            for (n,offset) in self._frustum:
+                far = [h if c > 0 else l for (c,l,h) in zip(n,low,high)]
+                if dotProduct(n,far)+offset < 0:
+                    culled = True
+                    break
+        if culled:
+            self._culled += 1
+        return culled
+
+    def getCullCount(self):
+        """Return the number of objects this context has left out of view."""
+        return self._culled
+
+    def _POV_caching(self,root):
+        """Prepare to write root, and the objects beneath it, with the
+        POVCache (if any, and if every object is to be written); return it."""
+        if self._cache is None or self.getSelectionPredicate() is not None:
+            return None
+        return self._cache
+
+    def _POV_instancing(self,obj):
+        """Return True if obj is a reference to a shared object.  How it is
+        written depends on the rest of the shot (see _POV_instance), so it
+        is walked whenever a fragment holding it is copied."""
+        return isinstance(obj,Reference) and id(obj.getObject()) in self._shared
+
+    def _setting(self):
+        """Return the current transforms, materials, tags, and grouping."""
+        return (self._transformStack[-1],self._materialStack[-1],self._tagStack[-1],
+                self.getVerboseGrouping())
+
+    def _pushSetting(self,setting):
+        """Make setting (see _setting) current; return the grouping it replaces."""
+        (x,m,g,vg) = setting
+        self._transformStack.append(x)
+        self._materialStack.append(m)
+        self._tagStack.append(g)
+        old = self.getVerboseGrouping()
+        self.verboseGrouping(vg)
+        return old
+
+    def _popSetting(self,vg):
+        """Restore the setting replaced by _pushSetting, which returned vg."""
+        self._tagStack.pop()
+        self._materialStack.pop()
+        self._transformStack.pop()
+        self.verboseGrouping(vg)
+
+    def _fragmentKey(self,obj):
+        """Return the key of obj's POVCache fragment in the current setting,
+        and the current accumulated transform."""
+        total = self.getTotalXform()
+        tags = self.getMergedTags()
+        return ((id(obj),obj._box[3],id(total),total._version,self._materialKey(),
+                 frozenset(tags) if tags else None,self.getVerboseGrouping(),self._frustumKey,
+                 environment.getDeclareShared(),environment.getBoundCSG()),total)
+
+    def _materialKey(self):
+        """Identify the materials currently in effect."""
+        return self._materialStack[-1][2]
+
+    def isShared(self,obj):
+        """Return True iff obj may be emitted as an instance of a POV #declare."""
+        return id(obj) in self._shared
+
+    def _POV_instance(self,obj):
+        """Start to emit the shared obj, as in _POV_enter.  If it appears
+        more than once in the current setting, it is declared (once) and
+        an instance of it is written; otherwise it is written out in full.
+        A declaration is written in a context of its own, and finished by
+        _POV_declaration."""
+        key = (id(obj),self._materialKey(),frozenset(self.getMergedTags()),self.getVerboseGrouping())
+        if self._uses.get(key,0) < 2:
+            return ((obj,),None,self)
+        if key in self._declarations:
+            self._POV_object(self._declarations[key])
+            return ((),None,self)
+        local = Context()
+        local._assign(self._attrItems())
+        local._materialStack = [self._materialStack[-1]]
+        local._tagStack = [self._tagStack[-1]]
+        local._shared = self._shared
+        local._uses = self._uses
+        local._declarations = self._declarations
+        local._bodies = self._bodies
+        local._pending = self._pending
+        local._names = self._names
+        local._merges = self._merges
+        local._mergeCounts = self._mergeCounts
+        local._materials = self._materials
+        local._seen = self._seen
+        local._chains = self._chains
+        local._cache = self._cache
+        local._boundRoots = self._boundRoots
+        pov.capture()
+        return ((obj,),(obj,key),local)
+
+    def _POV_declaration(self,obj,key):
+        """Declare obj, written since _POV_instance, and write an instance of it."""
+        body = pov.release()
+        if not body.strip():
+            name = None
+        elif body in self._bodies:
+            # identical to an earlier declaration (another setting, same result)
+            name = self._bodies[body]
+        else:
+            name = "Shared_{}".format(next(self._names))
+            self._bodies[body] = name
+            if obj._POV_compound:
+                body = "union {{\n{}}}".format(body)
+            self._declare(name,body)
+        self._declarations[key] = name
+        self._POV_object(name)
+
+    def _POV_object(self,name):
+        """Write an instance of the declared object, name (if any)."""
+        self._flush()
+        if name is not None:
+            prt("object {{ {} ".format(name))
+            pov.writeXform(self.getTotalXform().getMatrix(),prefix="matrix")
+            prt("}\n")
+
+    def _POV_material(self,m):
+        """Emit the (merged) material m.  A texture or interior that is used
+        again is declared, once, and then referred to by name."""
+        stamp = m._stamp()
+        entry = self._materials.get(id(m))
+        if entry is None or entry[0] is not m or entry[1] != stamp:
+            pov.capture()
+            m._POV_texture()
+            texture = pov.release()
+            pov.capture()
+            m._POV_interior()
+            interior = pov.release()
+            entry = (m,stamp,texture,interior)
+            self._materials[id(m)] = entry
+        for (kind,body) in (("texture",entry[2]),("interior",entry[3])):
+            name = self._declared(kind,body)
+            if name is None:
+                prt(body)
+            else:
+                prt("{}{{{}}}".format(kind,name))
+
+    def _declared(self,kind,body):
+        """Return the name of the declaration of body, or None if body is
+        to be written in full (it is empty, or seen for the first time)."""
+        if not body:
+            return None
+        name = self._bodies.get(body)
+        if name is None:
+            if body not in self._seen:
+                self._seen.add(body)
+                return None
+            name = "{}_{}".format(kind.capitalize(),next(self._names))
+            self._bodies[body] = name
+            self._declare(name,body)
+            self._flush()
+        return name
+
+    def _declare(self,name,body):
+        """Queue the declaration of name; see _flush."""
+        self._pending.append("#declare {} = {}\n".format(name,body))
+
+    def _flush(self):
+        """Write queued declarations, unless output is being captured.
+        Declarations are written in order, after those they depend on."""
+        if not pov.isCapturing():
+            for d in self._pending:
+                prt(d)
+            self._pending.clear()
+
     def mapPoint(self,p):
         """Map point according to the current context."""
         return self.getTotalXform().mapPoint(p)
@@ -875,6 +1967,7 @@ class Reference(Primitive):
     materials to one of several instances of a single objects.
     Effectively, References are handles to objects that can carry
     instance-specific graphical information."""
+    _fields = ( 'reference.target', )
 
     def __init__(self,object=None,description="An ambrosia object reference."):
         """Create a reference to an object."""
@@ -891,29 +1984,31 @@ class Reference(Primitive):
         if o is not None:
             self.description("A reference to: "+o.getDescription())
 
-    def getHandle(self,name):
-        result = super().getHandle(name)
-        if result is not None:
-            return result
-        else:
-            result = self.getObject().getHandle(name)
-            if result is not None:
-                return self.getXform().mapPoint(result)
-            else:
-                return None
+    def _children(self):
+        o = self.getObject()
+        return () if o is None else (o,)
 
-    def getHandles(self,name):
-        result = super().getHandles(name)
-        x = self.getXform()
-        n = self.getName()+'.'
-        result.extend([(n+where,x.mapPoint(p)) for (where,p) in self.getObject().getHandles(name)])
-        return result
+    def _extent(self,boxes):
+        return boxes[0] if boxes else emptyBox
+
+    def _childLabel(self,i):
+        return self.getName()+'.'
 
     def _POV_(self,context):
-        context.pushXform(self.getXform())
+        _POV_walk(self,context)
+
+    def _POV_enter(self,context):
+        context.pushXform(self.get('xformable.xform'))
         context.pushMaterial(self.getMaterial())
-        context.pushTags(self.getTags())
-        self.getObject()._POV_(context)
+        context.pushTags(self._getTags())
+        o = self.getObject()
+        if context.isShared(o):
+            return context._POV_instance(o)
+        return ((o,),None,context)
+
+    def _POV_leave(self,context,declaration):
+        if declaration is not None:
+            context._POV_declaration(*declaration)
         context.popTags()
         context.popMaterial()
         context.popXform()
@@ -923,6 +2018,9 @@ class Reference(Primitive):
 @checkdoc
 class CSG(Primitive):
     """This is the main grouping mechanism."""
+    _fields = ( 'csg.action', 'csg.references' )
+    # does POV need a bounding box for this object?  (it bounds unions well)
+    _POV_bounded = False
     def __init__(self,description="A group object."):
         super().__init__(description=description)
         self.set('csg.references',[])
@@ -943,32 +2041,35 @@ class CSG(Primitive):
         for m in msgs:
             typeCheck(m,{Transform,Material})
             r.__handle__(m)
-        self.getReferences().append(r)
+        refs = self.getReferences()
+        refs.append(r)
+        entry = self._handleIndex
+        if entry is not None:
+            # extend the handle directory in place, unless r brings new names
+            names = _indexed(r)
+            if all(k in entry[0] for k in names):
+                for k in names:
+                    entry[0][k].append(len(refs)-1)
+                r._handleIndex[1][id(self)] = self
+            else:
+                _unindex(self)
         return self
 
     def clear(self):
         """Remove all objects from CSG group."""
-        self.getReferences().clear()
+        refs = self.getReferences()
+        refs.clear()
+        self.set('csg.references',refs)  # takes a new version
         return self
 
-    def getHandle(self,name):
-        result = super().getHandle(name)
-        if result is not None:
-            return result
-        for r in self.getReferences():
-            result = r.getHandle(name)
-            if result is not None:
-                return self.getXform().mapPoint(result)
-        return None
+    def _children(self):
+        return self.getReferences()
 
-    def getHandles(self,name):
-        result = super().getHandles(name)
-        x = self.getXform()
-        n = self.getName()
-        for (i,r) in zip(count(),self.getReferences()):
-            nm = "{}[{}].".format(n,i)
-            result.extend([(nm+where,x.mapPoint(p)) for (where,p) in r.getHandles(name)])
-        return result
+    def _extent(self,boxes):
+        return boxUnion(*boxes)
+
+    def _childLabel(self,i):
+        return "{}[{}].".format(self.getName(),i)
 
     def __getitem__(self,item):
         """Return the ith reference."""
@@ -984,20 +2085,38 @@ class CSG(Primitive):
 
     def _POV_(self,context):
         """Write POV description of this group object."""
-        refs = self.get('csg.references')
+        _POV_walk(self,context)
+
+    def _POV_operands(self):
+        """Return the references that are written to POV."""
+        return self.get('csg.references')
+
+    def _POV_enter(self,context):
+        refs = self._POV_operands()
         action = self.get('csg.action')
-        t = self.getXform()
+        t = self.get('xformable.xform')
         m = self.getMaterial()
-        g = self.getTags()
+        g = self._getTags()
         vg = context.getVerboseGrouping()
         context.verboseGrouping(True)
         context.pushMaterial(m)
         context.pushXform(t)
         context.pushTags(g)
+        box = None
         if vg:
             prt("{} {{".format(action))
-        for o in refs:
-            o._POV_(context)
+            if self._POV_bounded and environment.getBoundCSG():
+                # bounds are brought up to date as the walk begins
+                box = context.getTotalXform().mapBox((self._box or _bounded(self))[1])
+        return (refs,(vg,box),context)
+
+    def _POV_leave(self,context,state):
+        (vg,box) = state
+        if box is not None and boxIsFinite(box):
+            prt("bounded_by {box {")
+            pov.writePoint(box[0])
+            pov.writePoint(box[1])
+            prt("}}\n")
         if vg:
             prt("}")
         context.popTags()
@@ -1017,23 +2136,132 @@ class Group(CSG):
 @checkdoc
 class Intersection(CSG):
     """This is the main grouping structure in ambrosia."""
+    _POV_bounded = True
     def __init__(self,description="An intersection object."):
         super().__init__(description=description)
         self._action("intersection")
 
+    def _extent(self,boxes):
+        return boxIntersection(*boxes) if boxes else emptyBox
+
 @checkdoc
 class Difference(CSG):
     """This is the main grouping structure in ambrosia."""
+    _POV_bounded = True
     def __init__(self,description="A difference object."):
         super().__init__(description=description)
         self._action("difference")
 
+    def _extent(self,boxes):
+        return boxes[0] if boxes else emptyBox
+
+    def _POV_operands(self):
+        """Return the references written to POV: the first, and those
+        subtracted from it that might overlap it."""
+        refs = self.get('csg.references')
+        if len(refs) < 2 or not environment.getBoundCSG():
+            return refs
+        if self._box is None: # (otherwise brought up to date by the context)
+            _bounded(self)
+        base = refs[0]._box[2]
+        if boxIsEmpty(base):
+            return refs
+        return [refs[0]]+[r for r in refs[1:] if boxIsEmpty(r._box[2]) or
+                          not boxIsEmpty(boxIntersection(base,r._box[2]))]
+
 # Global "pov"
 def POV(obj,context=None):
     """Utility routine for dumping POV with optional context."""
     if context is None:
         context = Context()
-    obj._POV_(context)
+    profile = context._profile if context else None
+    if profile is None or isinstance(obj,super):
+        obj._POV_(context)
+    else:
+        frame = profile._enter(obj)
+        obj._POV_(context)
+        if frame is not None:
+            profile._leave(frame)
+
+def _POV_walk(root,context):
+    """Write root, and the objects beneath it, to POV.  The walk keeps its
+    own stack (see _POV_enter), so deep scenes need no deep recursion.
+    With a POVCache, an object written before, in the same setting, is
+    copied from its fragment; otherwise its output is captured to make one."""
+    context._bound(root)
+    cache = context._POV_caching(root)
+    profile = context._profile
+    todo = [(root,context,None,"enter")]
+    while todo:
+        (obj,context,state,step) = todo.pop()
+        if step == "leave":
+            obj._POV_leave(context,state)
+            continue
+        if step == "copy":
+            # obj is an iterator over the rest of a fragment
+            for item in obj:
+                if isinstance(item,str):
+                    prt(item)
+                elif isinstance(item,list):
+                    todo.append((obj,context,None,"copy"))
+                    todo.append((iter(item),context,None,"copy"))
+                    break
+                elif isinstance(item,tuple):
+                    # an instance, walked in the setting it was found in
+                    (ref,setting) = item
+                    todo.append((obj,context,None,"copy"))
+                    todo.append((None,context,context._pushSetting(setting),"restore"))
+                    todo.append((ref,context,None,"enter"))
+                    break
+                else:
+                    item._POV_(context)
+            continue
+        if step == "restore":
+            context._popSetting(state)
+            continue
+        if step == "keep":
+            fragment = pov.releaseItems()
+            context._recording -= 1
+            cache._store(state[0],obj,state[1],fragment)
+            _POV_fragment(fragment,context,todo)
+            continue
+        if step == "profiled":
+            profile._leave(state)
+            continue
+        if context._culls(obj):
+            continue
+        if profile is not None:
+            frame = profile._enter(obj)
+            if frame is not None:
+                todo.append((obj,context,frame,"profiled"))
+        if cache is not None:
+            if context._POV_instancing(obj):
+                if context._recording:
+                    pov.mark((obj,context._setting()))
+                    continue
+            else:
+                (key,total) = context._fragmentKey(obj)
+                fragment = cache._lookup(key,obj,total)
+                if fragment is not None:
+                    _POV_fragment(fragment,context,todo)
+                    continue
+                pov.capture()
+                context._recording += 1
+                todo.append((obj,context,(key,total),"keep"))
+        entered = obj._POV_enter(context)
+        if entered is not None:
+            (children,state,inner) = entered
+            todo.append((obj,context,state,"leave"))
+            for i in range(len(children)-1,-1,-1):
+                todo.append((children[i],inner,None,"enter"))
+
+def _POV_fragment(fragment,context,todo):
+    """Place a POVCache fragment: within the fragment being captured, if
+    any, or else copied to the output (by the walk, from todo)."""
+    if context._recording:
+        pov.mark(fragment)
+    else:
+        todo.append((iter(fragment),context,None,"copy"))
 
 # Continue to set up the environment.
 pov = POVWriter("The global POV writer.")
@@ -1042,9 +2270,7 @@ environment.writer(pov)
 # A shorthand for printing
 def prt(v):
     """Basic print method w/o newline."""
-    global environment
-    of = environment.getWriter().getOutputFile() or stdout
-    print(v,end="",file=of)
+    environment.getWriter().write(v if isinstance(v,str) else str(v))
 
 ###############################################################################
 # Global message sourcing primitives
@@ -1212,6 +2438,14 @@ class Color(AmbrosiaObject):
         """Create a copy of this object."""
         return super().copy()
 
+    def __getstate__(self):
+        return (self._attrItems(),self.getRGBAF())
+
+    def __setstate__(self,state):
+        (items,c) = state
+        super().__setstate__(items)
+        self.color(c)
+
     def _POV_(self,contextIgnored=None):
         prt("rgbft <{},{},{},{},{}>".format(self.getRed(),self.getGreen(),self.getBlue(),self.getTransmit(),self.getFilter()))
 
@@ -1222,6 +2456,7 @@ class Color(AmbrosiaObject):
 class Material(Transformable):
     """Representation of materials.  This particular implementation is
     biased toward materials that are found in POV."""
+    _fields = ( 'material.UVMapped', 'material.ambient', 'material.caustics', 'material.color', 'material.colors', 'material.diffuse', 'material.fadeDistance', 'material.fadePower', 'material.image', 'material.imageType', 'material.metallic', 'material.pattern', 'material.pattern_frq', 'material.phong', 'material.reflection', 'material.refraction', 'material.roughness', 'material.specularity', 'material.transparency', 'material.turbulence' )
     def __init__(self,description="A material."):
         """Initialize material."""
         super().__init__(description=description)
@@ -1229,6 +2464,11 @@ class Material(Transformable):
         self.scale(100)
         self.translate(-50,-50,-50)
 
+    def _stamp(self):
+        """A value that changes whenever this material (or its transform) does."""
+        t = self.get('xformable.xform')
+        return (self._version,t._version if t is not None else 0)
+
     def type(self,t):
         """Shorthand for setting values for materials."""
         if t == "plastic":
@@ -1511,8 +2751,9 @@ class Material(Transformable):
     def mergeWith(self,m):
         """New material with material's attributes, m providing missing values."""
         nm = Material()
-        nm._attrs = m._attrs.copy()
-        nm._attrs.update(self._attrs)
+        nm._assign(m._attrItems())
+        for (key,value) in self._attrItems():
+            nm.set(key,value)
         return nm
 
     def _POV_turbulence(self,contextIgnored=None):
@@ -1614,13 +2855,22 @@ class Material(Transformable):
                 prt(" fade_power {}".format(fp))
             prt("}")
 
-    def _POV_(self,contextIgnored=None):
+    def _POV_texture(self):
         prt("texture{")
         self._POV_pigment()
         self._POV_finish()
         self.getXform()._POV_(None)
         prt("}")
-        self._POV_interior()
+
+    def _POV_(self,context=None):
+        if context is not None and context._recording:
+            # written, as the shot requires, when the fragment is copied
+            pov.mark(self)
+        elif context is not None and environment.getDeclareShared():
+            context._POV_material(self)
+        else:
+            self._POV_texture()
+            self._POV_interior()
 
 ###############################################################################
 # Unique global objects
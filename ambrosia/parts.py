@@ -2,6 +2,7 @@
 # Project Ambrosia (c) 2013-19 duane a. bailey
 #
 """This module contains all the primitive modelling objects."""
+import math
 from ambrosia.decorators import *
 from ambrosia.basics import *
 from ambrosia.objects import *
@@ -9,11 +10,21 @@ from ambrosia.cameras import *
 
 __all__ = ('Cone', 'Cube', 'Cylinder', 'Plane', 'Sphere', 'Superellipsoid', 'Torus', 'SOR', 'Spindle', 'Prism')
 
+def _capsBox(a,b,ra,rb):
+    """The box bounding a cone (or cylinder) with caps of radius ra at a and rb at b."""
+    axis = vectorDifference(b,a)
+    l = vectorLength(axis)
+    # the half-widths of a unit disc perpendicular to the axis
+    w = [math.sqrt(max(0,1-sqr(x/l))) for x in axis] if l > 0 else [1,1,1]
+    return boxUnion(*[(vectorDifference(c,vectorScale(w,r)),vectorSum(c,vectorScale(w,r)))
+                      for (c,r) in ((a,ra),(b,rb))])
+
 ###############################################################################
 # Cube.  A solid CSG cube.
 @checkdoc
 class Cube(Primitive):
     """A regular cube, 100 units on a side."""
+    _fields = ( 'cube.dimensions', )
     def __init__(self,description="A cube."):
         """Construct a basic cube."""
         super().__init__(description=description)
@@ -28,10 +39,13 @@ class Cube(Primitive):
         """Get the base dimensions of the cube."""
         return self.get('cube.dimensions')
 
+    def _extent(self,boxes):
+        d = self.getDimensions()
+        return (tuple(vectorScale(d,-0.5)),tuple(vectorScale(d,0.5)))
+
     def _POV_(self,context):
         if context.selects(self):
             d = self.getDimensions()
-            t = self.getXform()
             prt('box { ')
             pov.writePoint(vectorScale(d,-0.5))
             pov.writePoint(vectorScale(d,0.5))
@@ -44,6 +58,7 @@ class Cube(Primitive):
 @checkdoc
 class Plane(Primitive):
     """A class that describes a plane."""
+    _fields = ( 'plane.normal', 'plane.offset' )
     def __init__(self,description="A plane."):
         super().__init__(description=description)
         self.normal(0,1,0).offset(0)
@@ -70,7 +85,6 @@ class Plane(Primitive):
         if context.selects(self):
             n = self.getNormal()
             o = self.getOffset()
-            t = self.getXform()
             m = self.getMaterial()
             prt('plane { ')
             pov.writePoint(n)
@@ -83,6 +97,7 @@ class Plane(Primitive):
 @checkdoc
 class Sphere(Primitive):
     """Sphere objects."""
+    _fields = ( 'sphere.center', 'sphere.radius' )
     def __init__(self,description="A sphere."):
         super().__init__(description=description)
         self.center([0,0,0]).radius(50)
@@ -105,11 +120,15 @@ class Sphere(Primitive):
         """Get the radius of the sphere."""
         return self.get('sphere.radius')
 
+    def _extent(self,boxes):
+        c = self.getCenter()
+        r = self.getRadius()
+        return (tuple([x-r for x in c]),tuple([x+r for x in c]))
+
     def _POV_(self,context):
         if context.selects(self):
             c = self.getCenter()
             r = self.getRadius()
-            t = self.getXform()
             m = self.getMaterial()
             prt('sphere { ')
             pov.writePoint(c)
@@ -121,6 +140,7 @@ class Sphere(Primitive):
 # Cone
 @checkdoc
 class Cone(Primitive):
+    _fields = ( 'cone.bottomCenter', 'cone.bottomRadius', 'cone.capped', 'cone.topCenter', 'cone.topRadius' )
     def __init__(self,description="A cone."):
         super().__init__(description=description)
         self.topCenter([0,50,0]).topRadius(0)
@@ -172,6 +192,9 @@ class Cone(Primitive):
         """Get the capped."""
         return self.get('cone.capped')
 
+    def _extent(self,boxes):
+        return _capsBox(self.getBottomCenter(),self.getTopCenter(),self.getBottomRadius(),self.getTopRadius())
+
     def _POV_(self,context):
         if context.selects(self):
             topCenter = self.getTopCenter()
@@ -179,7 +202,6 @@ class Cone(Primitive):
             topRadius = self.getTopRadius()
             bottomRadius = self.getBottomRadius()
             capped = self.getCapped()
-            t = self.getXform()
             m = self.getMaterial()
             prt('cone { ')
             pov.writePoint(topCenter)
@@ -196,6 +218,7 @@ class Cone(Primitive):
 # Cylinder
 @checkdoc
 class Cylinder(Primitive):
+    _fields = ( 'cylinder.bottomCenter', 'cylinder.capped', 'cylinder.radius', 'cylinder.topCenter' )
     def __init__(self,description="A cylinder"):
         super().__init__(description=description)
         self.topCenter([0,50,0]).bottomCenter([0,-50,0])
@@ -237,13 +260,16 @@ class Cylinder(Primitive):
         """Get the capped."""
         return self.get('cylinder.capped')
 
+    def _extent(self,boxes):
+        r = self.getRadius()
+        return _capsBox(self.getBottomCenter(),self.getTopCenter(),r,r)
+
     def _POV_(self,context):
         if context.selects(self):
             topCenter = self.getTopCenter()
             bottomCenter = self.getBottomCenter()
             radius = self.getRadius()
             capped = self.getCapped()
-            t = self.getXform()
             m = self.getMaterial()
             prt('cylinder { ')
             pov.writePoint(topCenter)
@@ -258,6 +284,7 @@ class Cylinder(Primitive):
 # Superellipsoid
 @checkdoc
 class Superellipsoid(Primitive):
+    _fields = ( 'superellipsoid.roundness', )
     def __init__(self,description="A superellipsoid."):
         super().__init__(description=description)
         self.roundness(1,1).scale(50,50,50)
@@ -271,10 +298,12 @@ class Superellipsoid(Primitive):
         """Get the roundness."""
         return self.get('superellipsoid.roundness')
 
+    def _extent(self,boxes):
+        return ((-1,-1,-1),(1,1,1))
+
     def _POV_(self,context):
         if context.selects(self):
             r = self.getRoundness()
-            t = self.getXform()
             m = self.getMaterial()
             prt('superellipsoid {{ <{}, {}>\n'.format(r[0],r[1]))
             POV(super(),context)
@@ -284,6 +313,7 @@ class Superellipsoid(Primitive):
 # Torus
 @checkdoc
 class Torus(Primitive):
+    _fields = ( 'torus.major', 'torus.minor', 'torus.sturmian' )
     def __init__(self,description="A torus."):
         super().__init__(description=description)
         self.major(75).minor(25)
@@ -314,13 +344,17 @@ class Torus(Primitive):
     def getSturmian(self):
         """Get the sturmian."""
         return self.get('torus.sturmian')
+
+    def _extent(self,boxes):
+        r = self.getMajor()+self.getMinor()
+        m = self.getMinor()
+        return ((-r,-m,-r),(r,m,r))
     
 
     def _POV_(self,context):
         if context.selects(self):
             major = self.getMajor()
             minor = self.getMinor()
-            t = self.getXform()
             m = self.getMaterial()
             prt('torus {')
             if self.getSturmian():
@@ -332,6 +366,7 @@ class Torus(Primitive):
 ################################################################################ SOR: a surface of discrete or continuous revolution
 @checkdoc
 class SOR(Primitive):
+    _fields = ( 'SOR.profile', 'SOR.sturm', 'SOR.type' )
     def __init__(self,description="A SOR object."):
         super().__init__(description=description)
         self.linear() # other choice: Bezier
@@ -385,6 +420,19 @@ class SOR(Primitive):
         """Return true if this SOR is sturmian."""
         return self.get('SOR.sturm')
 
+    def _hull(self):
+        """Return points whose convex hull contains the profile curve."""
+        p = self.getProfile() or []
+        if self.getType() != "cubic":
+            return p
+        # a cubic spline runs from p[1] to p[-2]; each piece is a Bezier curve
+        result = []
+        for i in range(1,len(p)-2):
+            (a,b,c,d) = p[i-1:i+3]
+            result.extend([b,[b[j]+(c[j]-a[j])/6 for j in (0,1)],
+                           [c[j]-(d[j]-b[j])/6 for j in (0,1)],c])
+        return result
+
 ###############################################################################
 # Spindle: a smoothly turned object
 @checkdoc
@@ -396,6 +444,13 @@ class Spindle(SOR):
     def __init__(self,description="A spindle object."):
         super().__init__(description=description)
 
+    def _extent(self,boxes):
+        h = self._hull()
+        if not h:
+            return emptyBox
+        r = max([abs(p[0]) for p in h])
+        return ((-r,min([p[1] for p in h]),-r),(r,max([p[1] for p in h]),r))
+
     def _POV_(self,context):
         if context.selects(self):
             outline = self.getProfile()
@@ -421,6 +476,13 @@ class Prism(SOR):
         super().__init__(description=description)
         self.xRot(-90) # orientation should be along +y
 
+    def _extent(self,boxes):
+        h = self._hull()
+        if not h:
+            return emptyBox
+        return ((min([p[0] for p in h]),-50,min([p[1] for p in h])),
+                (max([p[0] for p in h]),50,max([p[1] for p in h])))
+
     def _POV_(self,context):
         if context.selects(self):
             outline = self.getProfile()
@@ -5,8 +5,12 @@ This collection of utilities eliminates the need for scripts in ambrosia.
 The module is not automatically imported with ambrosia, but is imported
 as needed.
 """
+import hashlib
 import os
+import re
+import shutil
 import sys
+import tempfile
 
 def uniqueIdString(model):
     """Return a unique number that changes several hundred times per second.
@@ -26,13 +30,17 @@ def uniqueIdString(model):
 
 def pathOf(utility):
     """Determine and return the full path of a unix command, or None."""
-    f = list(os.popen('type {}'.format(utility)))
-    if not f:
-        return None
-    return f[0].split()[-1]
+    return shutil.which(utility)
 
-execs = { e : pathOf(e) for e in ['bash', 'convert', 'ffmpeg', 'less', 'povray',
-           'composite', 'mogrify', 'python3']}
+class Executables(dict):
+    """The full paths of unix commands (or None), by name.  Each command is
+    looked up (on the PATH, without a shell) when it is first needed, and
+    remembered; clear forgets them all, should the PATH change."""
+    def __missing__(self,utility):
+        path = self[utility] = pathOf(utility)
+        return path
+
+execs = Executables()
 
 def removeFiles(*filenames):
     """Remove each of the files associated with the filenames.  Exceptions are quietly ignored.
@@ -191,3 +199,107 @@ def render(model,**kargs):
         success = standardRender(model,runlog)
     result = result if success else None
     return result
+
+def sceneHash(model):
+    """Return a digest of the model's '.ini' and '.pov' files.
+    Files mentioned by name in these files (images, for example) contribute
+    their size and modification time, so that changing them changes the hash.
+    """
+    h = hashlib.sha256()
+    for ext in ['.ini','.pov']:
+        with open(model+ext,'rb') as f:
+            text = f.read()
+        h.update(ext.encode())
+        h.update(text)
+        for name in re.findall(rb'"([^"\n]+)"',text):
+            path = os.path.join(os.path.dirname(model),os.fsdecode(name))
+            if os.path.isfile(path):
+                st = os.stat(path)
+                h.update(name+' {} {}'.format(st.st_size,st.st_mtime_ns).encode())
+    return h.hexdigest()
+
+def trimCache(cache,limit):
+    """Remove the least recently used images from cache until it holds at most limit bytes."""
+    entries = []
+    for name in os.listdir(cache):
+        if name.endswith('.png'):
+            path = os.path.join(cache,name)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime,st.st_size,path))
+    entries.sort(reverse=True)
+    total = 0
+    for (mtime,size,path) in entries:
+        total += size
+        if total > limit:
+            removeFiles(path)
+
+def cachedRender(model,cache,limit,**kargs):
+    """Render model, unless an identical scene was rendered before.
+    Rendered images are kept in the folder 'cache', named by the hash of the
+    scene; the folder is trimmed to 'limit' bytes, least recently used first.
+    Returns the path of the image (possibly in the cache), or None.
+    """
+    cached = os.path.join(cache,sceneHash(model)+'.png')
+    try:
+        os.utime(cached)
+    except FileNotFoundError:
+        pass
+    else:
+        removeFiles(model+'.ini',model+'.pov')
+        return cached
+    result = render(model,**kargs)
+    if result:
+        os.makedirs(cache,exist_ok=True)
+        partial = '{}.{}'.format(cached,os.getpid())
+        shutil.copyfile(result,partial)
+        os.replace(partial,cached)
+        trimCache(cache,limit)
+    return result
+
+class RenderJob:
+    """A single render, performed in a private work directory.
+    The directory is made atomically (by tempfile.mkdtemp) within the project
+    folder, so any number of jobs may run at once, in threads or processes,
+    without sharing file names or a counter file.  The directory's unique
+    suffix is the job's id, and is used to name the image it produces.
+    """
+    def __init__(self,projectFolder,name,keep=False):
+        self.projectFolder = projectFolder
+        self.name = name
+        self.keep = keep
+        self.workDir = tempfile.mkdtemp(prefix='.{}-'.format(name),dir=projectFolder)
+        self.id = os.path.basename(self.workDir)[len(name)+2:]
+        self.model = os.path.join(self.workDir,name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,*exc):
+        self.close()
+
+    def target(self):
+        """The default name of this job's image in the project folder."""
+        return os.path.join(self.projectFolder,'{}-{}.png'.format(self.name,self.id))
+
+    def collect(self,result,target=None):
+        """Move (or, if it is cached, copy) the image result to target; return target, or None."""
+        if not result:
+            return None
+        target = target or self.target()
+        if os.path.dirname(result) == self.workDir:
+            os.replace(result,target)
+        else:
+            shutil.copyfile(result,target)
+        return target
+
+    def close(self):
+        """Remove the work directory, unless it is kept or holds a record of errors."""
+        if self.keep or not os.path.isdir(self.workDir):
+            return
+        for name in os.listdir(self.workDir):
+            if name.endswith(('.runlog','.log','.err')):
+                return
+        shutil.rmtree(self.workDir,ignore_errors=True)
@@ -22,6 +22,7 @@ _coefficientIndices = [
 class Surface(Primitive):
     """Surfaces are modeled by mathematical equations.
     This class implements those surfaces."""
+    _fields = ( 'surface.coeffDict', 'surface.coefficients', 'surface.degree', 'surface.ncoeffs' )
     def __init__(self,degree=2,description="A general surface."):
         super().__init__(description=description)
         self.degree(degree)
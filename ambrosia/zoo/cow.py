@@ -1,11 +1,9 @@
+import os
 from ambrosia.meshes import *
 class Cow(Mesh):
 #Width = 100.000000, height = 61.248650, depth = 32.581828
 #Faces = 5804, verts = 2905
     def __init__(self,description="A cow."):
         super().__init__(description=description)
-        self.registerVertices([(0.151632,-0.043319,-0.088240),(0.163424,-0.033934,-0.084110),(0.163118,-0.053632,-0.080509),(0.176307,-0.028912,-0.075048),(0.174429,-0.051613,-0.073945),(0.186153,-0.032952,-0.063704),(0.189315,-0.049201,-0.055717),(0.173804,-0.063906,-0.070661),(0.161034,-0.067741,-0.076137),(0.140389,-0.069190,-0.082181),(0.145322,-0.055406,-0.086283),(0.157816,-0.075509,-0.073519),(0.138192,-0.077096,-0.078394),(0.154266,-0.085543,-0.067386),(0.135011,-0.089151,-0.072101),(0.149841,-0.099483,-0.056737),(0.171041,-0.083631,-0.062782),(0.168093,-0.096230,-0.053987),(0.177320,-0.089655,-0.053516),(0.184184,-0.079694,-0.052024),(0.173471,-0.072013,-0.067806),(0.189413,-0.066971,-0.054402),(0.193459,-0.039143,-0.053249),(0.208154,-0.049197,-0.039120),(0.198182,-0.066130,-0.047168),(0.207124,-0.066515,-0.040230),(0.202761,-0.081721,-0.043833),(0.196476,-0.090057,-0.046360),(0.188690,-0.100183,-0.047815),(0.173919,-0.106841,-0.048328),(0.164617,-0.107226,-0.049417),(0.147354,-0.105405,-0.053127),(0.130347,-0.103472,-0.065500),(0.218399,-0.050317,-0.028474),(0.215266,-0.066881,-0.031205),(0.211697,-0.086351,-0.033205),(0.204823,-0.096860,-0.035501),(0.194501,-0.108176,-0.036238),(0.176913,-0.115464,-0.038631),(0.162048,-0.115458,-0.038997),(0.146737,-0.114612,-0.043114),(0.127207,-0.114332,-0.055583),(0.219478,-0.052101,0.000000),(0.215563,-0.069100,0.000000),(0.212011,-0.088090,0.000000),(0.204525,-0.099288,0.000000),(0.193084,-0.109020,0.000000),(0.175810,-0.117842,0.000000),(0.157206,-0.118594,0.000000),(0.139104,-0.115767,0.000000),(0.114431,-0.112874,0.000000),(0.210494,-0.005449,-0.052197),(0.196007,0.009243,-0.065935),(0.205931,0.020756,-0.057789),(0.221028,0.002516,-0.042896),(0.213464,-0.019979,-0.043119),(0.204941,-0.012892,-0.055260),(0.191200,-0.007885,-0.067298),(0.187124,-0.017289,-0.066948),(0.184218,-0.011043,-0.080549),(0.221695,-0.026978,-0.034260),(0.226959,-0.032913,-0.026174),(0.228942,-0.035011,0.000000),(0.233141,-0.025236,-0.026460),(0.234200,-0.026527,0.000000),(0.227702,-0.017102,-0.032693),(-0.186730,-0.126846,-0.072724),(-0.200269,-0.121650,-0.068734),(-0.197681,-0.113892,-0.079919),(-0.215231,-0.122333,-0.071895),(-0.186577,-0.131854,-0.068515),(-0.204286,-0.125329,-0.055792),(-0.172936,-0.110728,-0.089918),(-0.174822,-0.133585,-0.076857),(-0.158897,-0.134677,-0.076851),(-0.131127,-0.117733,-0.092056),(-0.145617,-0.132967,-0.081908),(-0.134020,-0.135074,-0.080319),(-0.119900,-0.131254,-0.082342),(-0.083914,-0.114436,-0.086508),(-0.085460,-0.124961,-0.080023),(-0.087026,-0.133043,-0.055692),(-0.131920,-0.137182,-0.056383),(-0.175350,-0.135447,-0.049875),(-0.188488,-0.133209,-0.047303),(-0.208123,-0.126980,-0.048423),(-0.217360,-0.125516,-0.057054),(-0.216263,-0.127978,-0.035082),(-0.218282,-0.125867,-0.045040),(-0.174864,-0.138412,-0.037265),(-0.129996,-0.141141,-0.038801),(-0.088879,-0.136793,-0.038332),(-0.028631,-0.108629,-0.067239),(-0.029589,-0.119286,-0.040196),(-0.032958,-0.123429,0.000000),(-0.093124,-0.138963,0.000000),(-0.130650,-0.142215,0.000000),(-0.173213,-0.138707,0.000000),(-0.217185,-0.128515,0.000000),(0.094219,-0.233681,-0.092180),(0.099529,-0.233037,-0.094610),(0.103024,-0.251108,-0.098406),(0.110484,-0.229458,-0.089020),(0.118452,-0.227420,-0.090089),(0.124524,-0.244307,-0.094556),(0.121795,-0.227439,-0.082455),(0.128137,-0.244862,-0.084422),(0.095844,-0.252722,-0.098640),(0.095895,-0.258407,-0.097275),(0.102626,-0.265096,-0.096185),(0.094562,-0.267823,-0.097911),(0.103567,-0.269698,-0.093310),(0.133746,-0.257319,-0.085165),(0.131541,-0.259378,-0.094703),(0.107215,-0.248860,-0.099697),(0.105454,-0.229746,-0.090331),(0.093305,-0.269449,-0.080794),(0.103028,-0.273468,-0.083446),(0.112435,-0.269327,-0.072862),(0.096573,-0.267552,-0.070070),(0.099990,-0.254143,-0.070758),(0.096030,-0.230503,-0.073687),(0.092467,-0.235613,-0.082425),(0.092983,-0.256797,-0.083263),(0.120449,-0.260524,-0.096424),(0.113567,-0.245711,-0.095012),(0.112245,-0.262962,-0.099434),(0.107901,-0.264457,-0.098613),(0.122522,-0.240906,-0.076252),(0.129756,-0.258219,-0.078265),(0.108134,-0.251206,-0.066999),(0.122197,-0.260130,-0.071886),(0.116951,-0.243805,-0.070312),(0.110819,-0.228575,-0.070200),(0.106516,-0.227735,-0.070801),(0.119652,-0.229019,-0.077250),(-0.351031,-0.127929,-0.074958),(-0.361327,-0.135308,-0.092156),(-0.346329,-0.110115,-0.098805),(-0.369442,-0.146553,-0.100466),(-0.354120,-0.112251,-0.108431),(-0.378704,-0.144584,-0.108351),(-0.363870,-0.110824,-0.111714),(-0.389360,-0.142823,-0.110803),(-0.373118,-0.105818,-0.112881),(-0.400874,-0.139564,-0.108783),(-0.383926,-0.100190,-0.109093),(-0.426665,-0.132176,-0.090310),(-0.427465,-0.132342,-0.076247),(-0.416338,-0.104737,-0.067286),(-0.411207,-0.092703,-0.072459),(-0.409594,-0.092636,-0.088601),(-0.414212,-0.104651,-0.088808),(-0.393862,-0.211772,-0.105841),(-0.395395,-0.184051,-0.104758),(-0.384457,-0.182154,-0.103507),(-0.394562,-0.167138,-0.107680),(-0.382410,-0.167097,-0.106350),(-0.398357,-0.166455,-0.107137),(-0.402767,-0.212539,-0.102363),(-0.405794,-0.186640,-0.100188),(-0.410365,-0.163707,-0.100533),(-0.413412,-0.137314,-0.097562),(-0.412343,-0.213497,-0.095521),(-0.416551,-0.186697,-0.095035),(-0.422809,-0.163866,-0.093197),(-0.385483,-0.211532,-0.104683),(-0.378361,-0.183205,-0.098428),(-0.374581,-0.165928,-0.098284),(-0.366856,-0.151215,-0.087812),(-0.375731,-0.170406,-0.085835),(-0.380673,-0.187256,-0.088433),(-0.382274,-0.207222,-0.090077),(-0.379895,-0.208358,-0.097915),(-0.374034,-0.154007,-0.077657),(-0.381652,-0.171758,-0.080821),(-0.389689,-0.171911,-0.076643),(-0.392014,-0.189498,-0.082999),(-0.384215,-0.151447,-0.071952),(-0.398713,-0.141174,-0.070072),(-0.402944,-0.169870,-0.076071),(-0.401200,-0.189668,-0.082059),(-0.401668,-0.211681,-0.085626),(-0.390890,-0.209001,-0.084864),(-0.415739,-0.138953,-0.069703),(-0.391552,-0.124882,-0.063855),(-0.408093,-0.114353,-0.064345),(-0.419882,-0.163214,-0.077390),(-0.411562,-0.188949,-0.082757),(-0.407401,-0.211036,-0.086166),(-0.423988,-0.164123,-0.084467),(-0.418819,-0.191745,-0.086581),(-0.414819,-0.213050,-0.090479),(-0.411822,-0.109533,-0.092163),(0.115462,-0.202488,-0.089474),(0.120920,-0.178266,-0.089315),(0.124840,-0.175668,-0.081128),(0.123697,-0.161325,-0.091104),(0.127157,-0.161148,-0.081471),(0.124546,-0.131663,-0.091209),(0.127698,-0.129963,-0.082485),(0.125991,-0.114042,-0.096715),(0.128372,-0.112267,-0.085896),(0.096150,-0.204636,-0.091833),(0.093428,-0.183357,-0.095430),(0.090286,-0.207448,-0.089175),(0.094390,-0.166691,-0.097135),(0.087267,-0.184136,-0.092937),(0.094102,-0.137087,-0.100409),(0.084877,-0.164864,-0.096339),(0.087419,-0.120722,-0.105335),(0.079685,-0.138893,-0.098582),(0.087982,-0.208227,-0.084427),(0.081019,-0.183509,-0.088097),(0.075318,-0.165342,-0.088735),(0.076562,-0.120495,-0.101419),(0.073259,-0.136992,-0.093436),(0.088737,-0.204731,-0.079077),(0.082516,-0.182847,-0.078770),(0.076796,-0.164206,-0.078643),(0.070450,-0.120147,-0.095345),(0.069776,-0.138029,-0.079958),(0.098022,-0.200774,-0.070543),(0.090147,-0.179929,-0.069632),(0.086728,-0.163792,-0.068957),(0.067570,-0.113820,-0.070276),(0.082062,-0.128337,-0.068466),(0.117778,-0.202358,-0.083059),(0.116088,-0.118676,-0.102684),(0.116564,-0.132080,-0.099745),(0.108794,-0.203130,-0.093560),(0.114251,-0.164500,-0.100127),(0.102500,-0.204603,-0.093859),(0.102880,-0.114330,-0.108920),(0.104272,-0.131832,-0.102359),(0.106310,-0.167061,-0.099835),(0.104214,-0.187519,-0.096865),(0.113024,-0.184363,-0.096489),(0.094508,-0.115153,-0.060193),(0.082376,-0.115687,-0.062319),(0.096420,-0.124117,-0.066410),(0.097154,-0.162886,-0.063884),(0.117114,-0.200457,-0.073259),(0.105253,-0.203869,-0.067347),(0.114575,-0.171896,-0.069268),(0.099687,-0.179163,-0.064494),(0.118703,-0.115018,-0.061286),(0.121577,-0.130974,-0.065277),(0.116908,-0.157711,-0.067272),(0.136515,-0.079598,-0.094125),(0.132344,-0.082134,-0.105576),(0.133543,-0.093828,-0.089657),(0.119057,-0.078950,-0.115372),(0.129532,-0.097146,-0.100619),(0.102908,-0.082977,-0.116532),(0.119809,-0.103055,-0.106895),(0.082559,-0.082370,-0.114142),(0.102567,-0.102681,-0.112928),(0.072135,-0.084454,-0.108826),(0.083627,-0.104707,-0.109973),(0.065469,-0.086255,-0.102492),(0.074057,-0.101439,-0.106852),(0.057209,-0.084341,-0.084520),(0.067869,-0.099157,-0.097657),(0.140132,-0.068911,-0.097442),(0.137243,-0.066441,-0.106541),(0.124857,-0.063599,-0.117247),(0.106277,-0.064855,-0.120141),(0.086969,-0.064878,-0.117377),(0.074828,-0.068665,-0.114225),(0.066231,-0.070937,-0.109807),(0.053474,-0.069766,-0.091484),(0.144596,-0.051868,-0.101414),(0.085901,-0.052656,-0.118497),(0.109153,-0.048198,-0.120693),(0.128206,-0.049258,-0.116352),(0.138246,-0.051715,-0.111365),(0.065276,-0.054803,-0.113391),(0.075991,-0.054722,-0.118560),(0.223297,0.241026,-0.003422),(0.220924,0.242132,0.000000),(0.247128,0.251199,0.000000),(0.226023,0.235265,-0.016984),(0.245785,0.249785,-0.007243),(0.228224,0.221200,-0.029734),(0.247610,0.246500,-0.014821),(0.231054,0.207165,-0.033886),(0.250021,0.230243,-0.029427),(0.233926,0.193105,-0.038023),(0.256142,0.218758,-0.034021),(0.238705,0.164863,-0.046244),(0.260111,0.202646,-0.040078),(0.241354,0.134616,-0.050012),(0.269728,0.180481,-0.045466),(0.250455,0.094946,-0.049943),(0.275232,0.149879,-0.048944),(0.254570,0.070535,-0.046575),(0.278327,0.114517,-0.045254),(0.258391,0.060415,-0.041269),(0.284352,0.091070,-0.039174),(0.260267,0.051239,-0.035536),(0.286507,0.084611,-0.036220),(0.266282,0.035608,-0.025701),(0.289858,0.077750,-0.030784),(0.273885,0.031677,-0.018759),(0.292424,0.070445,-0.024076),(0.270990,0.029698,0.000000),(0.296089,0.062050,-0.017682),(0.295097,0.274706,-0.015005),(0.268217,0.259031,-0.010266),(0.267884,0.260853,0.000000),(0.335044,0.108069,0.000000),(0.315312,0.085035,0.000000),(0.317951,0.087108,-0.019759),(0.334472,0.106580,-0.018546),(0.311350,0.091394,-0.024736),(0.308571,0.099930,-0.031196),(0.332907,0.111124,-0.030000),(0.307323,0.110311,-0.038720),(0.329212,0.123758,-0.040081),(0.304701,0.129171,-0.046152),(0.326553,0.147841,-0.049692),(0.297160,0.162359,-0.051866),(0.321238,0.173646,-0.053954),(0.287485,0.190240,-0.047862),(0.310993,0.198880,-0.050483),(0.281440,0.213975,-0.041199),(0.310587,0.220309,-0.047634),(0.276506,0.228784,-0.038637),(0.303875,0.240707,-0.044300),(0.270329,0.241691,-0.031748),(0.298209,0.264534,-0.032305),(0.268407,0.254215,-0.018037),(0.296954,0.270466,-0.024193),(0.256603,0.005398,-0.020135),(0.255908,0.006290,0.000000),(0.156347,0.224636,0.000000),(0.194738,0.233750,0.000000),(0.193959,0.226688,-0.016771),(0.158496,0.220532,-0.020259),(0.196201,0.212599,-0.029505),(0.163084,0.208399,-0.034148),(0.199955,0.197737,-0.035283),(0.174290,0.192459,-0.042296),(0.203924,0.181624,-0.041340),(0.177774,0.172294,-0.051234),(0.207816,0.153261,-0.049465),(0.186133,0.145592,-0.058161),(0.217226,0.122202,-0.051506),(0.197181,0.115091,-0.061567),(0.228496,0.083588,-0.057419),(0.212261,0.071057,-0.065130),(0.203538,0.090776,-0.065744),(0.236019,0.060989,-0.053990),(0.214374,0.052353,-0.064246),(0.239003,0.045997,-0.045726),(0.217690,0.031097,-0.052050),(0.242344,0.028492,-0.038015),(0.251030,0.013791,-0.027633),(0.295556,0.062505,0.000000),(0.190332,0.112609,-0.072057),(0.197703,0.083949,-0.071314),(0.201455,0.065785,-0.071826),(0.196787,0.030881,-0.071828),(0.201453,0.048298,-0.071749),(0.173804,0.142737,-0.067453),(0.170679,0.143630,-0.070243),(0.162023,0.168090,-0.059772),(0.176725,-0.010937,-0.093718),(0.181837,0.001571,-0.098126),(0.191445,0.007060,-0.081934),(0.183130,0.023041,-0.097422),(0.192645,0.024125,-0.079561),(0.187329,0.047019,-0.102480),(0.195806,0.047743,-0.086581),(0.189281,0.064484,-0.101437),(0.195539,0.065766,-0.089158),(0.183987,0.088638,-0.096075),(0.193083,0.083226,-0.084958),(0.179427,0.117734,-0.083040),(0.182809,0.116749,-0.076967),(0.176631,0.143859,-0.064859),(0.135201,0.222706,0.000000),(0.135626,0.219448,-0.018027),(0.140688,0.209273,-0.034177),(0.152523,0.183638,-0.054602),(0.146950,-0.042571,-0.099578),(0.156995,-0.030669,-0.101330),(0.129325,0.216648,-0.021275),(0.132043,0.211714,-0.032681),(0.141372,0.190765,-0.051750),(0.148988,0.171191,-0.066333),(0.157119,0.150477,-0.075876),(0.162326,0.122075,-0.091528),(0.167284,0.096852,-0.103734),(0.171923,0.068918,-0.113208),(0.172436,0.040363,-0.117018),(0.167646,0.019459,-0.113880),(0.166370,0.004327,-0.113132),(0.160851,-0.015326,-0.104306),(0.123741,-0.022364,-0.119149),(0.133279,0.008153,-0.125969),(0.103146,0.219520,-0.017763),(0.101834,0.222638,0.000000),(0.136014,0.025099,-0.127806),(0.136566,0.038335,-0.129557),(0.130557,0.072191,-0.125946),(0.124731,0.096800,-0.114440),(0.119981,0.126661,-0.101842),(0.118213,0.156893,-0.086181),(0.108332,0.188905,-0.063222),(0.104582,0.205687,-0.040375),(0.102259,0.215310,-0.025935),(-0.055248,0.212273,-0.016074),(-0.054160,0.216878,0.000000),(-0.004231,0.217953,0.000000),(-0.053880,0.203440,-0.028867),(-0.003822,0.204287,-0.028171),(-0.048709,0.193510,-0.043005),(-0.005017,0.191671,-0.046180),(-0.047046,0.173708,-0.062972),(-0.001540,0.164369,-0.070055),(-0.053265,0.157274,-0.081999),(0.008120,0.142366,-0.087403),(-0.045979,0.122397,-0.108626),(0.014519,0.119432,-0.099933),(-0.023687,0.079264,-0.125449),(0.016314,0.081864,-0.118587),(-0.023698,0.058692,-0.132101),(0.015165,0.063388,-0.123304),(-0.025925,0.041795,-0.135663),(0.017409,0.048141,-0.125619),(-0.023374,0.025043,-0.137038),(0.016773,0.033753,-0.127477),(-0.022925,0.004772,-0.136324),(0.018419,0.013061,-0.124313),(-0.022547,-0.019436,-0.133131),(0.019840,-0.008662,-0.114035),(-0.024840,-0.042420,-0.125381),(0.017269,-0.019991,-0.110296),(-0.023130,-0.069447,-0.109690),(0.016385,-0.045608,-0.101981),(-0.024550,-0.087777,-0.092984),(0.018033,-0.063185,-0.092106),(-0.023737,-0.096994,-0.076491),(0.015453,-0.077786,-0.083120),(0.014658,-0.085737,-0.072831),(0.013657,-0.101641,-0.057618),(0.013686,-0.106066,-0.041955),(-0.133583,0.213284,-0.018611),(-0.132337,0.218078,0.000000),(-0.100503,0.217293,0.000000),(-0.133375,0.207994,-0.027146),(-0.099764,0.212501,-0.015140),(-0.140262,0.202408,-0.044314),(-0.104316,0.206572,-0.026658),(-0.137391,0.192828,-0.064105),(-0.102413,0.200380,-0.038914),(-0.145078,0.177167,-0.076106),(-0.095567,0.190996,-0.054451),(-0.168673,0.164278,-0.083774),(-0.096867,0.174419,-0.070008),(-0.174520,0.133986,-0.114622),(-0.118228,0.144375,-0.097109),(-0.152854,0.087679,-0.146735),(-0.089132,0.089708,-0.134620),(-0.142162,0.061792,-0.158432),(-0.077059,0.060218,-0.147226),(-0.131289,0.029420,-0.168223),(-0.075804,0.044152,-0.152320),(-0.130965,-0.014362,-0.170141),(-0.074204,0.021360,-0.154295),(-0.128117,-0.047517,-0.164561),(-0.076564,-0.006366,-0.157630),(-0.126334,-0.075486,-0.150403),(-0.075508,-0.039327,-0.151155),(-0.130036,-0.096061,-0.131302),(-0.081770,-0.070517,-0.139518),(-0.130225,-0.105634,-0.116774),(-0.084807,-0.090833,-0.123738),(-0.084843,-0.101159,-0.108740),(-0.199169,0.219576,-0.013349),(-0.195560,0.222531,0.000000),(-0.164226,0.219333,0.000000),(-0.200374,0.214775,-0.027603),(-0.167026,0.215131,-0.015191),(-0.206888,0.209517,-0.051403),(-0.173102,0.211620,-0.029303),(-0.211461,0.205239,-0.072544),(-0.179389,0.204648,-0.054197),(-0.217997,0.197172,-0.090283),(-0.182220,0.194776,-0.076106),(-0.232765,0.183868,-0.105019),(-0.189172,0.183104,-0.081962),(-0.232903,0.156731,-0.115104),(-0.205503,0.163071,-0.094684),(-0.223066,0.131370,-0.123886),(-0.197689,0.141748,-0.110339),(-0.218181,0.101249,-0.135218),(-0.192405,0.124661,-0.125419),(-0.225571,0.073440,-0.144004),(-0.189684,0.086267,-0.145699),(-0.226583,0.041444,-0.151099),(-0.185343,0.060367,-0.155339),(-0.217163,-0.026004,-0.155326),(-0.182956,0.009611,-0.169025),(-0.215230,-0.051010,-0.145161),(-0.185334,-0.043099,-0.163314),(-0.217848,-0.068919,-0.130905),(-0.183740,-0.070322,-0.149623),(-0.218378,-0.079737,-0.111293),(-0.177749,-0.089724,-0.135334),(0.086805,-0.041921,-0.120849),(0.086397,-0.023590,-0.124680),(0.068053,0.222454,0.000000),(0.068638,0.218414,-0.022239),(0.070771,0.213625,-0.028878),(0.072101,0.205759,-0.040111),(0.072882,0.192215,-0.058598),(0.074100,0.177303,-0.074108),(0.080608,0.120974,-0.106818),(0.079456,0.137699,-0.098911),(0.085395,0.085889,-0.117237),(0.087290,0.066312,-0.121197),(0.088423,0.045805,-0.124600),(0.088803,0.024900,-0.126673),(0.090250,0.002860,-0.129118),(0.041591,-0.089195,-0.067871),(0.055274,-0.091397,-0.075873),(0.043443,-0.102140,-0.057684),(0.051332,-0.110794,0.000000),(0.044729,-0.109400,-0.043452),(0.082881,-0.111834,0.000000),(0.044304,-0.077968,-0.082303),(0.047683,-0.049017,-0.100164),(0.059709,-0.012596,-0.110625),(0.056175,-0.050706,-0.102130),(0.045399,-0.064678,-0.089454),(0.015137,-0.111983,0.000000),(-0.172865,-0.100192,-0.116865),(-0.214207,0.220827,-0.013390),(-0.212708,0.224567,0.000000),(-0.217246,0.216244,-0.026764),(-0.219372,0.211484,-0.052926),(-0.224156,0.209399,-0.072213),(-0.235831,0.200620,-0.098235),(-0.249793,0.182992,-0.111331),(-0.250983,0.152252,-0.118149),(-0.258355,0.109580,-0.120942),(-0.257228,0.089104,-0.124364),(-0.258705,0.072625,-0.129226),(-0.257126,0.047210,-0.137116),(-0.257899,0.015613,-0.140132),(-0.261399,-0.010221,-0.129585),(-0.255905,-0.033213,-0.117362),(-0.253370,-0.050668,-0.107583),(-0.245999,0.222770,-0.012150),(-0.245264,0.226554,0.000000),(-0.249056,0.218661,-0.024759),(-0.252086,0.217351,-0.043381),(-0.270586,0.205585,-0.080639),(-0.277224,0.182655,-0.106410),(-0.275651,0.157270,-0.114320),(-0.278979,0.124938,-0.115883),(-0.280632,0.098628,-0.118976),(-0.279729,0.085064,-0.123468),(-0.270904,0.067163,-0.130459),(-0.267352,0.047651,-0.136580),(-0.272667,0.016309,-0.137703),(-0.280978,-0.008735,-0.127764),(-0.282642,-0.031691,-0.111417),(-0.281972,-0.043717,-0.102888),(-0.280953,-0.047137,-0.096422),(-0.255842,-0.058192,-0.094338),(-0.214300,-0.090155,-0.090757),(-0.223278,-0.085687,-0.089424),(-0.197464,-0.101744,-0.088543),(-0.285572,0.225644,-0.013838),(-0.283351,0.227997,0.000000),(-0.287630,0.222864,-0.022925),(-0.291365,0.219184,-0.043314),(-0.294827,0.206167,-0.080532),(-0.298192,0.179468,-0.108166),(-0.307218,0.150147,-0.117114),(-0.307438,0.120699,-0.120388),(-0.303241,0.098598,-0.123830),(-0.293453,0.082020,-0.127296),(-0.284654,0.064642,-0.133511),(-0.284091,0.045745,-0.141187),(-0.296376,0.006320,-0.140690),(-0.305247,-0.025116,-0.126803),(-0.306818,-0.049526,-0.112814),(-0.307548,-0.058679,-0.104469),(-0.308279,-0.067832,-0.096124),(-0.344903,0.234377,-0.006717),(-0.340559,0.235686,0.000000),(-0.347349,0.230995,-0.021880),(-0.347924,0.226409,-0.039513),(-0.349137,0.218542,-0.060465),(-0.349361,0.201546,-0.087597),(-0.346106,0.170068,-0.111049),(-0.334841,0.127415,-0.125219),(-0.331224,0.109529,-0.126966),(-0.329707,0.099769,-0.127362),(-0.324988,0.073960,-0.131670),(-0.320949,0.051688,-0.137127),(-0.319086,0.033028,-0.139538),(-0.315905,0.002121,-0.137505),(-0.320663,-0.038366,-0.125449),(-0.334287,-0.077265,-0.116710),(-0.382923,0.240747,-0.005110),(-0.381369,0.244018,0.000000),(-0.385380,0.230977,-0.021737),(-0.385144,0.228466,-0.036315),(-0.388517,0.222814,-0.056532),(-0.386178,0.209600,-0.078448),(-0.380506,0.190018,-0.094132),(-0.370644,0.154224,-0.112588),(-0.360196,0.119456,-0.120904),(-0.356676,0.090747,-0.122427),(-0.356314,0.070315,-0.123735),(-0.346315,0.051544,-0.129056),(-0.342546,0.019694,-0.133964),(-0.339259,-0.007271,-0.134413),(-0.340098,-0.044954,-0.126118),(-0.350190,-0.077620,-0.119038),(-0.429584,0.212389,-0.031713),(-0.428382,0.213887,0.000000),(-0.416893,0.220802,0.000000),(-0.430329,0.202217,-0.051268),(-0.413464,0.224891,-0.038010),(-0.428912,0.188671,-0.061139),(-0.417151,0.216498,-0.055477),(-0.425236,0.172646,-0.070477),(-0.411487,0.203759,-0.068964),(-0.421828,0.154414,-0.076293),(-0.405421,0.187108,-0.085396),(-0.415526,0.120657,-0.088600),(-0.402090,0.163420,-0.091095),(-0.408300,0.081837,-0.098762),(-0.397254,0.123622,-0.098591),(-0.402731,0.061372,-0.105344),(-0.388868,0.089603,-0.108482),(-0.393635,0.041981,-0.111363),(-0.382077,0.066298,-0.116493),(-0.387725,0.008390,-0.116241),(-0.374767,0.047070,-0.121597),(-0.387239,-0.022944,-0.114008),(-0.368321,0.009308,-0.128156),(-0.389819,-0.056004,-0.106501),(-0.367729,-0.018085,-0.128406),(-0.392634,-0.082093,-0.100102),(-0.371378,-0.056409,-0.121941),(-0.396508,-0.096962,-0.096361),(-0.375880,-0.082599,-0.113360),(-0.451112,0.202809,-0.029520),(-0.446681,0.204074,0.000000),(-0.447410,0.190536,-0.043343),(-0.446075,0.178935,-0.050143),(-0.443127,0.162960,-0.057369),(-0.441600,0.145384,-0.061520),(-0.435899,0.117308,-0.069779),(-0.428065,0.084423,-0.084707),(-0.420038,0.059730,-0.091828),(-0.414154,0.032521,-0.095240),(-0.406652,0.001440,-0.098415),(-0.400946,-0.024512,-0.101551),(-0.401422,-0.054072,-0.096163),(-0.405364,-0.073869,-0.091530),(-0.448587,0.178985,-0.021174),(-0.448595,0.185642,0.000000),(-0.447776,0.171131,-0.027047),(-0.447200,0.159564,-0.031683),(-0.444856,0.148288,-0.036499),(-0.444048,0.137151,-0.037075),(-0.440742,0.113967,-0.042028),(-0.434651,0.082422,-0.052448),(-0.429631,0.057882,-0.061856),(-0.423438,0.031271,-0.073171),(-0.418274,0.009520,-0.074646),(-0.405982,-0.029231,-0.079390),(-0.323896,-0.086684,-0.096640),(-0.336748,-0.107219,-0.088547),(0.126608,0.221581,0.000000),(-0.358771,-0.135955,-0.071274),(-0.409646,-0.238886,-0.106391),(-0.403794,-0.238241,-0.108822),(-0.399941,-0.256312,-0.112618),(-0.391720,-0.234663,-0.103232),(-0.382939,-0.232625,-0.104301),(-0.376247,-0.249511,-0.108768),(-0.379255,-0.232643,-0.096667),(-0.372265,-0.250067,-0.098634),(-0.407855,-0.257926,-0.112851),(-0.407798,-0.263612,-0.111487),(-0.400380,-0.270300,-0.110397),(-0.409268,-0.273027,-0.112123),(-0.399343,-0.274903,-0.107521),(-0.366084,-0.262524,-0.099377),(-0.368514,-0.264582,-0.108915),(-0.395323,-0.254065,-0.113908),(-0.397263,-0.234951,-0.104543),(-0.410653,-0.274653,-0.095006),(-0.399937,-0.278673,-0.097657),(-0.389570,-0.274532,-0.087074),(-0.407052,-0.272757,-0.084282),(-0.403286,-0.259347,-0.084969),(-0.407650,-0.235707,-0.087898),(-0.411576,-0.240818,-0.096637),(-0.411008,-0.262001,-0.097475),(-0.380738,-0.265728,-0.110635),(-0.388323,-0.250916,-0.109223),(-0.389780,-0.268166,-0.113646),(-0.394567,-0.269662,-0.112825),(-0.378454,-0.246110,-0.090464),(-0.370481,-0.263423,-0.092477),(-0.394310,-0.256411,-0.081211),(-0.378811,-0.265334,-0.086097),(-0.384594,-0.249010,-0.084524),(-0.391351,-0.233779,-0.084412),(-0.396094,-0.232940,-0.085013),(-0.381616,-0.234224,-0.091461),(-0.402734,-0.050955,-0.081987),(-0.419178,0.012969,-0.067105),(-0.435430,0.127637,-0.028850),(-0.433268,0.114354,-0.028063),(-0.431278,0.088094,-0.032200),(-0.429297,0.058766,-0.043036),(-0.424690,0.036044,-0.054640),(-0.437520,0.123487,0.000000),(-0.437779,0.173171,0.000000),(-0.438472,0.160224,0.000000),(-0.439845,0.144404,0.000000),(-0.466347,0.144252,-0.005764),(-0.462060,0.093683,-0.005313),(-0.463278,0.093546,0.000000),(-0.463695,0.191838,-0.006214),(-0.467669,0.144116,0.000000),(-0.447505,0.222660,-0.006664),(-0.465127,0.191902,0.000000),(-0.424584,0.240016,-0.007114),(-0.448896,0.223315,0.000000),(-0.401435,0.244406,-0.007564),(-0.425456,0.241407,0.000000),(-0.462733,0.144624,-0.009983),(-0.458732,0.094059,-0.009203),(-0.459782,0.191665,-0.010763),(-0.443705,0.220870,-0.011543),(-0.422203,0.236217,-0.012323),(-0.400363,0.240040,-0.013103),(-0.457797,0.145133,-0.011529),(-0.454186,0.094573,-0.010628),(-0.454437,0.191428,-0.012430),(-0.438515,0.218425,-0.013330),(-0.418950,0.231026,-0.014231),(-0.452859,0.145641,-0.009987),(-0.449640,0.095086,-0.009206),(-0.449091,0.191191,-0.010767),(-0.433323,0.215979,-0.011547),(-0.415696,0.225835,-0.012327),(-0.449244,0.146013,-0.005769),(-0.446310,0.095462,-0.005319),(-0.445176,0.191017,-0.006220),(-0.429521,0.214188,-0.006671),(-0.413314,0.222033,-0.007122),(-0.447918,0.146150,-0.000007),(-0.445089,0.095600,-0.000006),(-0.443741,0.190953,-0.000007),(-0.412440,0.220640,-0.000009),(-0.401827,0.246005,0.000000),(0.404862,0.238549,-0.062636),(0.407645,0.232838,-0.060503),(0.408549,0.229273,-0.061809),(0.406676,0.245999,-0.063803),(0.415975,0.249032,-0.057285),(0.415943,0.245467,-0.058570),(0.421562,0.244848,-0.052321),(0.422578,0.235306,-0.048672),(0.419701,0.243144,-0.053347),(0.416858,0.227932,-0.057537),(0.420624,0.231196,-0.053619),(0.421558,0.228295,-0.052076),(0.413189,0.223470,-0.058788),(0.407646,0.225477,-0.060311),(0.418742,0.222182,-0.055352),(0.420691,0.224500,-0.050578),(0.423530,0.231423,-0.046321),(0.418882,0.249223,-0.049990),(0.424395,0.241683,-0.048098),(0.404987,0.252783,-0.057608),(0.410545,0.253323,-0.053995),(0.398479,0.232001,-0.061312),(0.401235,0.246671,-0.060862),(0.402217,0.255685,-0.059109),(0.409641,0.259792,-0.054289),(0.415176,0.259522,-0.051658),(0.414234,0.252338,-0.053271),(0.422631,0.254440,-0.046823),(0.428137,0.244141,-0.045197),(0.429987,0.233966,-0.044379),(0.425416,0.226608,-0.044080),(0.421578,0.219949,-0.051039),(0.415994,0.217633,-0.055728),(0.409503,0.217990,-0.059233),(0.404005,0.223652,-0.060403),(0.431925,0.239990,-0.040152),(0.430969,0.232716,-0.040833),(0.428205,0.222684,-0.041739),(0.424371,0.217857,-0.048556),(0.414185,0.212014,-0.054420),(0.408651,0.212280,-0.057016),(0.397621,0.216205,-0.059130),(0.392148,0.220672,-0.057666),(0.425451,0.254086,-0.043233),(0.429108,0.246636,-0.042229),(0.416182,0.261981,-0.048694),(0.403167,0.258231,-0.057039),(0.397539,0.247832,-0.063413),(0.395284,0.247480,-0.061431),(0.396623,0.232089,-0.062165),(0.391199,0.248504,-0.060452),(0.406120,0.267434,-0.047933),(0.410573,0.263320,-0.053029),(0.411772,0.265918,-0.041771),(0.421985,0.258744,-0.034453),(0.428471,0.249199,-0.030932),(0.432094,0.239286,-0.032879),(0.432946,0.230274,-0.034711),(0.392090,0.230123,-0.060405),(0.396331,0.273783,-0.036999),(0.405676,0.270139,-0.028379),(0.419527,0.258534,-0.022478),(0.429604,0.248229,-0.020923),(0.435103,0.238142,-0.021121),(0.437657,0.226932,-0.028704),(0.435704,0.215422,-0.033426),(0.432730,0.206306,-0.043428),(0.420670,0.194173,-0.050761),(0.415116,0.192561,-0.052633),(0.402228,0.191181,-0.057062),(0.393952,0.194085,-0.058434),(0.383928,0.207830,-0.057777),(0.378462,0.222381,-0.056243),(0.375699,0.242767,-0.057898),(0.377536,0.228041,-0.057519),(0.396792,0.261800,-0.055606),(0.378517,0.257172,-0.054725),(0.427356,0.247139,0.000007),(0.438052,0.238156,-0.011999),(0.444269,0.224221,-0.019931),(0.444073,0.207530,-0.027980),(0.445705,0.188112,-0.036299),(0.390299,0.187709,-0.058966),(0.382035,0.195165,-0.059898),(0.378390,0.204268,-0.058933),(0.370165,0.212652,-0.059741),(0.368356,0.221754,-0.058819),(0.365648,0.231753,-0.057789),(0.397186,0.273882,-0.000028),(0.385887,0.280777,-0.014012),(0.386046,0.270204,-0.047200),(0.369622,0.276379,-0.044376),(0.380145,0.282819,-0.025620),(0.361336,0.262908,-0.047332),(0.365689,0.246337,-0.056379),(0.444706,0.181015,-0.038807),(0.438220,0.167543,-0.041804),(0.417923,0.167538,-0.050523),(0.398547,0.180167,-0.057137),(0.454501,0.223422,-0.011961),(0.440142,0.237098,0.000021),(0.460216,0.220711,0.000044),(0.464815,0.215981,0.000050),(0.464568,0.212401,-0.012355),(0.460708,0.205832,-0.020245),(0.459701,0.197980,-0.024671),(0.455820,0.184137,-0.033264),(0.452084,0.176110,-0.035798),(0.448453,0.162283,-0.035206),(0.447436,0.156169,-0.038523),(0.421559,0.160175,-0.050415),(0.395753,0.166603,-0.059288),(0.386542,0.172408,-0.062203),(0.374612,0.183694,-0.064489),(0.365487,0.197441,-0.063889),(0.362809,0.210109,-0.061661),(0.361025,0.220953,-0.059667),(0.481264,0.201250,0.000069),(0.482876,0.198475,-0.011377),(0.479021,0.193733,-0.019091),(0.475206,0.187884,-0.025067),(0.469580,0.178384,-0.031390),(0.464966,0.170303,-0.032969),(0.462184,0.161290,-0.034680),(0.461233,0.155808,-0.035188),(0.496565,0.190261,-0.012489),(0.495430,0.187433,-0.020985),(0.490907,0.189086,-0.018875),(0.493403,0.179931,-0.029007),(0.483285,0.175653,-0.031972),(0.487106,0.183326,-0.025783),(0.490560,0.172116,-0.033387),(0.478713,0.167395,-0.031724),(0.489606,0.160342,-0.035408),(0.480467,0.161279,-0.035105),(0.491091,0.193829,-0.011077),(0.470350,0.154997,-0.036419),(0.513890,0.182082,-0.013682),(0.511071,0.182433,-0.017236),(0.503709,0.185424,-0.019526),(0.518699,0.174643,0.000110),(0.520323,0.176419,-0.012534),(0.516526,0.176948,-0.017894),(0.505937,0.187494,0.000095),(0.506597,0.186637,-0.013072),(0.500760,0.178013,-0.028459),(0.507186,0.175023,-0.026148),(0.515535,0.167214,-0.021561),(0.522196,0.167053,-0.010733),(0.518740,0.167106,0.000112),(0.515098,0.156985,0.000112),(0.518556,0.154964,-0.009032),(0.513266,0.150557,0.000112),(0.515847,0.149345,-0.007704),(0.514768,0.146394,-0.015308),(0.517456,0.152138,-0.017565),(0.508162,0.143568,-0.023677),(0.497916,0.144281,-0.030751),(0.498783,0.150077,-0.033864),(0.518334,0.159589,-0.018710),(0.510873,0.150086,-0.024954),(0.506175,0.158015,-0.030518),(0.513602,0.155657,-0.025420),(0.499728,0.166452,-0.032302),(0.502465,0.151725,-0.031945),(0.498865,0.171848,-0.030856),(0.491400,0.153158,-0.037085),(0.490496,0.149362,-0.035586),(0.482216,0.153339,-0.038699),(0.469465,0.144823,-0.035537),(0.480410,0.148613,-0.037270),(0.489626,0.144635,-0.034178),(0.480460,0.143799,-0.034987),(0.475906,0.141884,-0.034126),(0.464923,0.147463,-0.034272),(0.465847,0.140907,-0.033082),(0.470452,0.138004,-0.031625),(0.460333,0.148447,-0.034975),(0.459458,0.141893,-0.033743),(0.459752,0.132403,-0.020884),(0.477022,0.135470,-0.024678),(0.473543,0.130218,-0.017761),(0.486224,0.134306,-0.022255),(0.482724,0.129141,-0.016234),(0.497249,0.135915,-0.020510),(0.492850,0.128782,-0.012813),(0.446534,0.147913,-0.038397),(0.444744,0.141269,-0.036212),(0.452288,0.134765,-0.026018),(0.442144,0.136106,-0.030247),(0.500466,0.132994,0.000106),(0.502128,0.131869,-0.007231),(0.507528,0.136767,-0.010536),(0.490350,0.127816,0.000099),(0.479262,0.127331,-0.007139),(0.480313,0.127645,0.000090),(0.467304,0.128619,-0.010391),(0.443731,0.129544,0.000057),(0.433644,0.127934,0.000048),(0.436095,0.126318,-0.014484),(0.458077,0.128978,-0.013832),(0.448830,0.129423,-0.018169),(0.454711,0.130470,0.000066),(0.447164,0.128721,-0.010855),(0.469352,0.127738,0.000080),(0.437761,0.127023,-0.021835),(0.414473,0.125100,0.000032),(0.418740,0.123604,-0.014344),(0.422058,0.124922,-0.028077),(0.389356,0.117682,-0.018830),(0.387933,0.119668,0.000010),(0.422850,0.134730,-0.034527),(0.393594,0.120917,-0.033339),(0.424513,0.138997,-0.040557),(0.423496,0.150543,-0.045856),(0.396712,0.149787,-0.056342),(0.396874,0.138960,-0.049108),(0.395268,0.131739,-0.040580),(0.379177,0.158846,-0.064248),(0.372006,0.146322,-0.057949),(0.364035,0.135992,-0.045884),(0.362350,0.128912,-0.039186),(0.352176,0.135016,-0.044799),(0.360473,0.114323,-0.000013),(0.358292,0.113907,-0.016665),(0.354367,0.116967,-0.029121),(0.344025,0.129099,-0.040587),(0.359074,0.156979,-0.063058),(0.336506,0.144743,-0.049934),(0.350110,0.151640,-0.055082),(0.355738,0.138983,-0.048152),(0.339932,0.178899,-0.061399),(0.347161,0.181972,-0.064960),(0.355348,0.190346,-0.066149),(0.367288,0.169959,-0.064743),(0.353610,0.212205,-0.063994),(0.360097,0.231037,-0.059574),(0.352749,0.223857,-0.061039),(0.344569,0.209943,-0.059409),(0.334499,0.205311,-0.058719),(0.330944,0.172754,-0.054441),(0.346399,0.220871,-0.058395),(0.337276,0.219858,-0.057377),(0.329145,0.201133,-0.053500),(0.413618,0.260130,-0.000009),(0.496787,0.192140,0.000085),(0.513272,0.182763,0.000103),(0.354148,0.302758,-0.000075),(0.367884,0.296196,-0.000060),(0.367626,0.296322,-0.013025),(0.356622,0.301983,-0.014032),(0.366402,0.294919,-0.026916),(0.355596,0.302514,-0.019492),(0.365377,0.293442,-0.030689),(0.341376,0.304557,-0.000086),(0.341113,0.302888,-0.013584),(0.342720,0.302784,-0.021916),(0.356347,0.303130,-0.025889),(0.343553,0.304120,-0.026401),(0.355248,0.300265,-0.034389),(0.363472,0.293882,-0.035197),(0.375196,0.290619,-0.000052),(0.369819,0.285709,-0.036135),(0.331223,0.294957,-0.045379),(0.330238,0.285047,-0.047219),(0.326767,0.282518,-0.040039),(0.328708,0.294834,-0.034299),(0.325963,0.283820,-0.034396),(0.330838,0.300964,-0.021817),(0.330369,0.301031,-0.000095),(0.332563,0.299575,-0.026586),(0.332478,0.299928,-0.030240),(0.334124,0.300717,-0.038450),(0.322398,0.286282,-0.031325),(0.325289,0.295783,-0.024938),(0.327914,0.294394,-0.029728),(0.321205,0.292830,-0.000101),(0.305187,0.279120,-0.023334),(0.318578,0.278640,-0.037475),(0.309442,0.273076,-0.036896),(0.324924,0.279796,-0.040260),(0.330144,0.274384,-0.051034),(0.319096,0.271931,-0.053764),(0.312778,0.268016,-0.051247),(0.308180,0.258021,-0.052107),(0.304722,0.258039,-0.042836),(0.333781,0.277279,-0.052647),(0.333618,0.272449,-0.059550),(0.323472,0.270890,-0.062215),(0.315274,0.266258,-0.061568),(0.311625,0.258809,-0.060359),(0.336994,0.271676,-0.070737),(0.326860,0.269312,-0.074421),(0.321462,0.264411,-0.071080),(0.316934,0.256876,-0.068954),(0.352064,0.269908,-0.052880),(0.343685,0.274184,-0.058711),(0.343593,0.271811,-0.062593),(0.345321,0.271318,-0.067275),(0.339602,0.274205,-0.077897),(0.330300,0.270276,-0.084501),(0.324857,0.262652,-0.081422),(0.349688,0.274919,-0.076217),(0.343929,0.278914,-0.088576),(0.332874,0.273701,-0.091573),(0.328359,0.263356,-0.088815),(0.332618,0.273862,-0.102586),(0.337942,0.282732,-0.109196),(0.332124,0.280526,-0.123999),(0.341811,0.284699,-0.100847),(0.353097,0.280614,-0.087720),(0.349014,0.286031,-0.105480),(0.345240,0.287369,-0.109857),(0.339434,0.289710,-0.124185),(0.331799,0.286483,-0.138103),(0.328218,0.273202,-0.133805),(0.327055,0.278001,-0.145253),(0.327128,0.264587,-0.101511),(0.328586,0.267065,-0.117838),(0.321331,0.255749,-0.076509),(0.324647,0.256171,-0.090328),(0.324417,0.258033,-0.100236),(0.324873,0.254523,-0.120810),(0.330686,0.261446,-0.145093),(0.332718,0.247722,-0.136374),(0.337604,0.230743,-0.122500),(0.326082,0.243083,-0.107256),(0.335178,0.226702,-0.109051),(0.319051,0.240794,-0.054929),(0.320678,0.242605,-0.063981),(0.331799,0.232794,-0.057844),(0.328376,0.229912,-0.047009),(0.325539,0.240691,-0.091846),(0.324138,0.243483,-0.073165),(0.337417,0.225923,-0.091705),(0.353866,0.258082,-0.054065),(0.356657,0.255094,-0.051669),(0.352928,0.249790,-0.053941),(0.337280,0.282738,-0.137688),(0.332560,0.275098,-0.143816),(0.339328,0.274493,-0.128403),(0.336397,0.273461,-0.136720),(0.335380,0.274743,-0.140226),(0.336563,0.271862,-0.129534),(0.342152,0.283330,-0.124865),(0.342139,0.278779,-0.125304),(0.337331,0.277921,-0.135369),(0.342319,0.274331,-0.117454),(0.349119,0.256065,-0.061494),(0.349876,0.265869,-0.067908),(0.357828,0.254164,-0.080258),(0.360486,0.264636,-0.083902),(0.359362,0.273686,-0.092189),(0.352707,0.278578,-0.104441),(0.346973,0.281375,-0.114131),(0.344233,0.279549,-0.114244),(0.349928,0.275856,-0.104640),(0.352041,0.268244,-0.092546),(0.351292,0.261163,-0.085869),(0.343569,0.272115,-0.103914),(0.350192,0.241532,-0.053735),(0.351425,0.255100,-0.080019),(0.344667,0.266684,-0.095275),(0.342148,0.260272,-0.085743),(0.337705,0.252348,-0.079967),(0.337496,0.254160,-0.088976),(0.337274,0.258749,-0.098657),(0.337844,0.262914,-0.112955),(0.337643,0.267413,-0.121705),(0.335582,0.248941,-0.092186),(0.334387,0.250175,-0.104918),(0.335003,0.255959,-0.117252),(0.335705,0.261389,-0.125932),(0.338310,0.238856,-0.092320),(0.336153,0.238349,-0.106102),(0.336767,0.245238,-0.120139),(0.334716,0.252551,-0.129514),(0.333655,0.263375,-0.136691),(0.333581,0.267347,-0.139995),(0.352844,0.234520,-0.057224),(0.345621,0.234174,-0.053436),(0.350516,0.249441,-0.078700),(0.357881,0.250282,-0.077885),(0.346910,0.244719,-0.077264),(0.408548,0.244030,-0.062191),(0.330073,0.218526,-0.052744),(0.294023,0.278205,0.000000),(0.301122,0.283477,-0.000116),(0.314631,0.241112,-0.048356),(-0.378445,-0.132061,-0.065567),(0.163424,-0.033934,0.084110),(0.151632,-0.043319,0.088240),(0.145322,-0.055406,0.086283),(0.176307,-0.028912,0.075048),(0.163118,-0.053632,0.080509),(0.186153,-0.032952,0.063704),(0.174429,-0.051613,0.073945),(0.173804,-0.063906,0.070661),(0.189315,-0.049201,0.055717),(0.161034,-0.067741,0.076137),(0.140389,-0.069190,0.082181),(0.157816,-0.075509,0.073519),(0.154266,-0.085543,0.067386),(0.138192,-0.077096,0.078394),(0.149841,-0.099483,0.056737),(0.135011,-0.089151,0.072101),(0.171041,-0.083631,0.062782),(0.177320,-0.089655,0.053516),(0.168093,-0.096230,0.053987),(0.184184,-0.079694,0.052024),(0.173471,-0.072013,0.067806),(0.193459,-0.039143,0.053249),(0.198182,-0.066130,0.047168),(0.208154,-0.049197,0.039120),(0.189413,-0.066971,0.054402),(0.202761,-0.081721,0.043833),(0.207124,-0.066515,0.040230),(0.196476,-0.090057,0.046360),(0.188690,-0.100183,0.047815),(0.173919,-0.106841,0.048328),(0.164617,-0.107226,0.049417),(0.147354,-0.105405,0.053127),(0.130347,-0.103472,0.065500),(0.215266,-0.066881,0.031205),(0.218399,-0.050317,0.028474),(0.211697,-0.086351,0.033205),(0.204823,-0.096860,0.035501),(0.194501,-0.108176,0.036238),(0.176913,-0.115464,0.038631),(0.162048,-0.115458,0.038997),(0.146737,-0.114612,0.043114),(0.127207,-0.114332,0.055583),(0.205931,0.020756,0.057789),(0.196007,0.009243,0.065935),(0.210494,-0.005449,0.052197),(0.221028,0.002516,0.042896),(0.213464,-0.019979,0.043119),(0.204941,-0.012892,0.055260),(0.191200,-0.007885,0.067298),(0.187124,-0.017289,0.066948),(0.184218,-0.011043,0.080549),(0.221695,-0.026978,0.034260),(0.226959,-0.032913,0.026174),(0.233141,-0.025236,0.026460),(0.227702,-0.017102,0.032693),(-0.200269,-0.121650,0.068734),(-0.186730,-0.126846,0.072724),(-0.172936,-0.110728,0.089918),(-0.215231,-0.122333,0.071895),(-0.197681,-0.113892,0.079919),(-0.186577,-0.131854,0.068515),(-0.174822,-0.133585,0.076857),(-0.158897,-0.134677,0.076851),(-0.131127,-0.117733,0.092056),(-0.134020,-0.135074,0.080319),(-0.145617,-0.132967,0.081908),(-0.119900,-0.131254,0.082342),(-0.083914,-0.114436,0.086508),(-0.087026,-0.133043,0.055692),(-0.085460,-0.124961,0.080023),(-0.131920,-0.137182,0.056383),(-0.175350,-0.135447,0.049875),(-0.204286,-0.125329,0.055792),(-0.208123,-0.126980,0.048423),(-0.188488,-0.133209,0.047303),(-0.217360,-0.125516,0.057054),(-0.218282,-0.125867,0.045040),(-0.216263,-0.127978,0.035082),(-0.174864,-0.138412,0.037265),(-0.129996,-0.141141,0.038801),(-0.028631,-0.108629,0.067239),(-0.088879,-0.136793,0.038332),(-0.029589,-0.119286,0.040196),(0.099529,-0.233037,0.094610),(0.094219,-0.233681,0.092180),(0.095844,-0.252722,0.098640),(0.118452,-0.227420,0.090089),(0.110484,-0.229458,0.089020),(0.113567,-0.245711,0.095012),(0.121795,-0.227439,0.082455),(0.124524,-0.244307,0.094556),(0.095895,-0.258407,0.097275),(0.103024,-0.251108,0.098406),(0.094562,-0.267823,0.097911),(0.102626,-0.265096,0.096185),(0.103567,-0.269698,0.093310),(0.133746,-0.257319,0.085165),(0.128137,-0.244862,0.084422),(0.105454,-0.229746,0.090331),(0.107215,-0.248860,0.099697),(0.092983,-0.256797,0.083263),(0.093305,-0.269449,0.080794),(0.103028,-0.273468,0.083446),(0.096573,-0.267552,0.070070),(0.092467,-0.235613,0.082425),(0.096030,-0.230503,0.073687),(0.099990,-0.254143,0.070758),(0.120449,-0.260524,0.096424),(0.131541,-0.259378,0.094703),(0.112245,-0.262962,0.099434),(0.107901,-0.264457,0.098613),(0.122522,-0.240906,0.076252),(0.108134,-0.251206,0.066999),(0.112435,-0.269327,0.072862),(0.116951,-0.243805,0.070312),(0.122197,-0.260130,0.071886),(0.129756,-0.258219,0.078265),(0.110819,-0.228575,0.070200),(0.106516,-0.227735,0.070801),(-0.361327,-0.135308,0.092156),(-0.351031,-0.127929,0.074958),(-0.336748,-0.107219,0.088547),(-0.369442,-0.146553,0.100466),(-0.346329,-0.110115,0.098805),(-0.378704,-0.144584,0.108351),(-0.354120,-0.112251,0.108431),(-0.389360,-0.142823,0.110803),(-0.363870,-0.110824,0.111714),(-0.400874,-0.139564,0.108783),(-0.373118,-0.105818,0.112881),(-0.427465,-0.132342,0.076247),(-0.426665,-0.132176,0.090310),(-0.414212,-0.104651,0.088808),(-0.409594,-0.092636,0.088601),(-0.411207,-0.092703,0.072459),(-0.416338,-0.104737,0.067286),(-0.395395,-0.184051,0.104758),(-0.393862,-0.211772,0.105841),(-0.385483,-0.211532,0.104683),(-0.394562,-0.167138,0.107680),(-0.384457,-0.182154,0.103507),(-0.382410,-0.167097,0.106350),(-0.398357,-0.166455,0.107137),(-0.405794,-0.186640,0.100188),(-0.402767,-0.212539,0.102363),(-0.410365,-0.163707,0.100533),(-0.413412,-0.137314,0.097562),(-0.416551,-0.186697,0.095035),(-0.412343,-0.213497,0.095521),(-0.422809,-0.163866,0.093197),(-0.379895,-0.208358,0.097915),(-0.378361,-0.183205,0.098428),(-0.374581,-0.165928,0.098284),(-0.366856,-0.151215,0.087812),(-0.375731,-0.170406,0.085835),(-0.380673,-0.187256,0.088433),(-0.382274,-0.207222,0.090077),(-0.381652,-0.171758,0.080821),(-0.374034,-0.154007,0.077657),(-0.389689,-0.171911,0.076643),(-0.384215,-0.151447,0.071952),(-0.402944,-0.169870,0.076071),(-0.398713,-0.141174,0.070072),(-0.401200,-0.189668,0.082059),(-0.401668,-0.211681,0.085626),(-0.392014,-0.189498,0.082999),(-0.408093,-0.114353,0.064345),(-0.391552,-0.124882,0.063855),(-0.415739,-0.138953,0.069703),(-0.419882,-0.163214,0.077390),(-0.411562,-0.188949,0.082757),(-0.407401,-0.211036,0.086166),(-0.423988,-0.164123,0.084467),(-0.418819,-0.191745,0.086581),(-0.414819,-0.213050,0.090479),(0.120920,-0.178266,0.089315),(0.115462,-0.202488,0.089474),(0.117778,-0.202358,0.083059),(0.123697,-0.161325,0.091104),(0.124840,-0.175668,0.081128),(0.124546,-0.131663,0.091209),(0.127157,-0.161148,0.081471),(0.125991,-0.114042,0.096715),(0.127698,-0.129963,0.082485),(0.096150,-0.204636,0.091833),(0.090286,-0.207448,0.089175),(0.093428,-0.183357,0.095430),(0.087267,-0.184136,0.092937),(0.094390,-0.166691,0.097135),(0.084877,-0.164864,0.096339),(0.094102,-0.137087,0.100409),(0.079685,-0.138893,0.098582),(0.087419,-0.120722,0.105335),(0.076562,-0.120495,0.101419),(0.081019,-0.183509,0.088097),(0.075318,-0.165342,0.088735),(0.073259,-0.136992,0.093436),(0.070450,-0.120147,0.095345),(0.087982,-0.208227,0.084427),(0.082516,-0.182847,0.078770),(0.076796,-0.164206,0.078643),(0.069776,-0.138029,0.079958),(0.067570,-0.113820,0.070276),(0.088737,-0.204731,0.079077),(0.090147,-0.179929,0.069632),(0.086728,-0.163792,0.068957),(0.082062,-0.128337,0.068466),(0.082376,-0.115687,0.062319),(0.108794,-0.203130,0.093560),(0.116088,-0.118676,0.102684),(0.116564,-0.132080,0.099745),(0.114251,-0.164500,0.100127),(0.113024,-0.184363,0.096489),(0.102500,-0.204603,0.093859),(0.102880,-0.114330,0.108920),(0.104272,-0.131832,0.102359),(0.106310,-0.167061,0.099835),(0.104214,-0.187519,0.096865),(0.098022,-0.200774,0.070543),(0.094508,-0.115153,0.060193),(0.096420,-0.124117,0.066410),(0.097154,-0.162886,0.063884),(0.099687,-0.179163,0.064494),(0.119652,-0.229019,0.077250),(0.105253,-0.203869,0.067347),(0.117114,-0.200457,0.073259),(0.118703,-0.115018,0.061286),(0.121577,-0.130974,0.065277),(0.116908,-0.157711,0.067272),(0.128372,-0.112267,0.085896),(0.114575,-0.171896,0.069268),(0.136515,-0.079598,0.094125),(0.133543,-0.093828,0.089657),(0.132344,-0.082134,0.105576),(0.129532,-0.097146,0.100619),(0.119057,-0.078950,0.115372),(0.119809,-0.103055,0.106895),(0.102908,-0.082977,0.116532),(0.102567,-0.102681,0.112928),(0.082559,-0.082370,0.114142),(0.083627,-0.104707,0.109973),(0.072135,-0.084454,0.108826),(0.074057,-0.101439,0.106852),(0.065469,-0.086255,0.102492),(0.067869,-0.099157,0.097657),(0.057209,-0.084341,0.084520),(0.055274,-0.091397,0.075873),(0.140132,-0.068911,0.097442),(0.137243,-0.066441,0.106541),(0.124857,-0.063599,0.117247),(0.106277,-0.064855,0.120141),(0.086969,-0.064878,0.117377),(0.074828,-0.068665,0.114225),(0.066231,-0.070937,0.109807),(0.053474,-0.069766,0.091484),(0.144596,-0.051868,0.101414),(0.085901,-0.052656,0.118497),(0.109153,-0.048198,0.120693),(0.128206,-0.049258,0.116352),(0.138246,-0.051715,0.111365),(0.065276,-0.054803,0.113391),(0.056175,-0.050706,0.102130),(0.075991,-0.054722,0.118560),(0.223297,0.241026,0.003422),(0.245785,0.249785,0.007243),(0.226023,0.235265,0.016984),(0.247610,0.246500,0.014821),(0.228224,0.221200,0.029734),(0.250021,0.230243,0.029427),(0.231054,0.207165,0.033886),(0.256142,0.218758,0.034021),(0.233926,0.193105,0.038023),(0.260111,0.202646,0.040078),(0.238705,0.164863,0.046244),(0.269728,0.180481,0.045466),(0.241354,0.134616,0.050012),(0.275232,0.149879,0.048944),(0.250455,0.094946,0.049943),(0.278327,0.114517,0.045254),(0.254570,0.070535,0.046575),(0.284352,0.091070,0.039174),(0.258391,0.060415,0.041269),(0.286507,0.084611,0.036220),(0.260267,0.051239,0.035536),(0.289858,0.077750,0.030784),(0.266282,0.035608,0.025701),(0.292424,0.070445,0.024076),(0.273885,0.031677,0.018759),(0.296089,0.062050,0.017682),(0.268217,0.259031,0.010266),(0.295097,0.274706,0.015005),(0.334472,0.106580,0.018546),(0.311350,0.091394,0.024736),(0.317951,0.087108,0.019759),(0.332907,0.111124,0.030000),(0.308571,0.099930,0.031196),(0.329212,0.123758,0.040081),(0.307323,0.110311,0.038720),(0.326553,0.147841,0.049692),(0.304701,0.129171,0.046152),(0.321238,0.173646,0.053954),(0.297160,0.162359,0.051866),(0.310993,0.198880,0.050483),(0.287485,0.190240,0.047862),(0.310587,0.220309,0.047634),(0.281440,0.213975,0.041199),(0.303875,0.240707,0.044300),(0.276506,0.228784,0.038637),(0.298209,0.264534,0.032305),(0.270329,0.241691,0.031748),(0.296954,0.270466,0.024193),(0.268407,0.254215,0.018037),(0.256603,0.005398,0.020135),(0.158496,0.220532,0.020259),(0.193959,0.226688,0.016771),(0.163084,0.208399,0.034148),(0.196201,0.212599,0.029505),(0.174290,0.192459,0.042296),(0.199955,0.197737,0.035283),(0.177774,0.172294,0.051234),(0.203924,0.181624,0.041340),(0.186133,0.145592,0.058161),(0.207816,0.153261,0.049465),(0.197181,0.115091,0.061567),(0.217226,0.122202,0.051506),(0.203538,0.090776,0.065744),(0.228496,0.083588,0.057419),(0.212261,0.071057,0.065130),(0.214374,0.052353,0.064246),(0.236019,0.060989,0.053990),(0.217690,0.031097,0.052050),(0.239003,0.045997,0.045726),(0.242344,0.028492,0.038015),(0.251030,0.013791,0.027633),(0.190332,0.112609,0.072057),(0.197703,0.083949,0.071314),(0.201455,0.065785,0.071826),(0.201453,0.048298,0.071749),(0.196787,0.030881,0.071828),(0.162023,0.168090,0.059772),(0.170679,0.143630,0.070243),(0.173804,0.142737,0.067453),(0.176725,-0.010937,0.093718),(0.191445,0.007060,0.081934),(0.181837,0.001571,0.098126),(0.192645,0.024125,0.079561),(0.183130,0.023041,0.097422),(0.195806,0.047743,0.086581),(0.187329,0.047019,0.102480),(0.195539,0.065766,0.089158),(0.189281,0.064484,0.101437),(0.193083,0.083226,0.084958),(0.183987,0.088638,0.096075),(0.182809,0.116749,0.076967),(0.179427,0.117734,0.083040),(0.176631,0.143859,0.064859),(0.135626,0.219448,0.018027),(0.140688,0.209273,0.034177),(0.152523,0.183638,0.054602),(0.156995,-0.030669,0.101330),(0.146950,-0.042571,0.099578),(0.129325,0.216648,0.021275),(0.132043,0.211714,0.032681),(0.141372,0.190765,0.051750),(0.148988,0.171191,0.066333),(0.157119,0.150477,0.075876),(0.162326,0.122075,0.091528),(0.167284,0.096852,0.103734),(0.171923,0.068918,0.113208),(0.172436,0.040363,0.117018),(0.167646,0.019459,0.113880),(0.166370,0.004327,0.113132),(0.160851,-0.015326,0.104306),(0.123741,-0.022364,0.119149),(0.103146,0.219520,0.017763),(0.133279,0.008153,0.125969),(0.136014,0.025099,0.127806),(0.136566,0.038335,0.129557),(0.130557,0.072191,0.125946),(0.124731,0.096800,0.114440),(0.119981,0.126661,0.101842),(0.118213,0.156893,0.086181),(0.108332,0.188905,0.063222),(0.104582,0.205687,0.040375),(0.102259,0.215310,0.025935),(-0.055248,0.212273,0.016074),(-0.003822,0.204287,0.028171),(-0.053880,0.203440,0.028867),(-0.005017,0.191671,0.046180),(-0.048709,0.193510,0.043005),(-0.001540,0.164369,0.070055),(-0.047046,0.173708,0.062972),(0.008120,0.142366,0.087403),(-0.053265,0.157274,0.081999),(0.014519,0.119432,0.099933),(-0.045979,0.122397,0.108626),(0.016314,0.081864,0.118587),(-0.023687,0.079264,0.125449),(0.015165,0.063388,0.123304),(-0.023698,0.058692,0.132101),(0.017409,0.048141,0.125619),(-0.025925,0.041795,0.135663),(0.016773,0.033753,0.127477),(-0.023374,0.025043,0.137038),(0.018419,0.013061,0.124313),(-0.022925,0.004772,0.136324),(0.019840,-0.008662,0.114035),(-0.022547,-0.019436,0.133131),(0.017269,-0.019991,0.110296),(-0.024840,-0.042420,0.125381),(0.016385,-0.045608,0.101981),(-0.023130,-0.069447,0.109690),(0.018033,-0.063185,0.092106),(-0.024550,-0.087777,0.092984),(0.015453,-0.077786,0.083120),(-0.023737,-0.096994,0.076491),(0.014658,-0.085737,0.072831),(0.013657,-0.101641,0.057618),(0.013686,-0.106066,0.041955),(-0.133583,0.213284,0.018611),(-0.099764,0.212501,0.015140),(-0.133375,0.207994,0.027146),(-0.104316,0.206572,0.026658),(-0.140262,0.202408,0.044314),(-0.102413,0.200380,0.038914),(-0.137391,0.192828,0.064105),(-0.095567,0.190996,0.054451),(-0.145078,0.177167,0.076106),(-0.096867,0.174419,0.070008),(-0.168673,0.164278,0.083774),(-0.118228,0.144375,0.097109),(-0.174520,0.133986,0.114622),(-0.089132,0.089708,0.134620),(-0.152854,0.087679,0.146735),(-0.077059,0.060218,0.147226),(-0.142162,0.061792,0.158432),(-0.075804,0.044152,0.152320),(-0.131289,0.029420,0.168223),(-0.074204,0.021360,0.154295),(-0.130965,-0.014362,0.170141),(-0.076564,-0.006366,0.157630),(-0.128117,-0.047517,0.164561),(-0.075508,-0.039327,0.151155),(-0.126334,-0.075486,0.150403),(-0.081770,-0.070517,0.139518),(-0.130036,-0.096061,0.131302),(-0.084807,-0.090833,0.123738),(-0.130225,-0.105634,0.116774),(-0.084843,-0.101159,0.108740),(-0.199169,0.219576,0.013349),(-0.167026,0.215131,0.015191),(-0.200374,0.214775,0.027603),(-0.173102,0.211620,0.029303),(-0.206888,0.209517,0.051403),(-0.179389,0.204648,0.054197),(-0.211461,0.205239,0.072544),(-0.182220,0.194776,0.076106),(-0.217997,0.197172,0.090283),(-0.189172,0.183104,0.081962),(-0.232765,0.183868,0.105019),(-0.205503,0.163071,0.094684),(-0.232903,0.156731,0.115104),(-0.197689,0.141748,0.110339),(-0.223066,0.131370,0.123886),(-0.192405,0.124661,0.125419),(-0.218181,0.101249,0.135218),(-0.189684,0.086267,0.145699),(-0.225571,0.073440,0.144004),(-0.185343,0.060367,0.155339),(-0.226583,0.041444,0.151099),(-0.182956,0.009611,0.169025),(-0.217163,-0.026004,0.155326),(-0.185334,-0.043099,0.163314),(-0.215230,-0.051010,0.145161),(-0.183740,-0.070322,0.149623),(-0.217848,-0.068919,0.130905),(-0.177749,-0.089724,0.135334),(-0.218378,-0.079737,0.111293),(-0.172865,-0.100192,0.116865),(0.086397,-0.023590,0.124680),(0.086805,-0.041921,0.120849),(0.068638,0.218414,0.022239),(0.070771,0.213625,0.028878),(0.072101,0.205759,0.040111),(0.072882,0.192215,0.058598),(0.074100,0.177303,0.074108),(0.079456,0.137699,0.098911),(0.080608,0.120974,0.106818),(0.085395,0.085889,0.117237),(0.087290,0.066312,0.121197),(0.088423,0.045805,0.124600),(0.088803,0.024900,0.126673),(0.090250,0.002860,0.129118),(0.041591,-0.089195,0.067871),(0.043443,-0.102140,0.057684),(0.044729,-0.109400,0.043452),(0.044304,-0.077968,0.082303),(0.059709,-0.012596,0.110625),(0.047683,-0.049017,0.100164),(0.045399,-0.064678,0.089454),(-0.214207,0.220827,0.013390),(-0.217246,0.216244,0.026764),(-0.219372,0.211484,0.052926),(-0.224156,0.209399,0.072213),(-0.235831,0.200620,0.098235),(-0.249793,0.182992,0.111331),(-0.250983,0.152252,0.118149),(-0.258355,0.109580,0.120942),(-0.257228,0.089104,0.124364),(-0.258705,0.072625,0.129226),(-0.257126,0.047210,0.137116),(-0.257899,0.015613,0.140132),(-0.261399,-0.010221,0.129585),(-0.255905,-0.033213,0.117362),(-0.253370,-0.050668,0.107583),(-0.245999,0.222770,0.012150),(-0.249056,0.218661,0.024759),(-0.252086,0.217351,0.043381),(-0.270586,0.205585,0.080639),(-0.277224,0.182655,0.106410),(-0.275651,0.157270,0.114320),(-0.278979,0.124938,0.115883),(-0.280632,0.098628,0.118976),(-0.279729,0.085064,0.123468),(-0.270904,0.067163,0.130459),(-0.267352,0.047651,0.136580),(-0.272667,0.016309,0.137703),(-0.280978,-0.008735,0.127764),(-0.282642,-0.031691,0.111417),(-0.281972,-0.043717,0.102888),(-0.280953,-0.047137,0.096422),(-0.255842,-0.058192,0.094338),(-0.197464,-0.101744,0.088543),(-0.223278,-0.085687,0.089424),(-0.214300,-0.090155,0.090757),(-0.285572,0.225644,0.013838),(-0.287630,0.222864,0.022925),(-0.291365,0.219184,0.043314),(-0.294827,0.206167,0.080532),(-0.298192,0.179468,0.108166),(-0.307218,0.150147,0.117114),(-0.307438,0.120699,0.120388),(-0.303241,0.098598,0.123830),(-0.293453,0.082020,0.127296),(-0.284654,0.064642,0.133511),(-0.284091,0.045745,0.141187),(-0.296376,0.006320,0.140690),(-0.305247,-0.025116,0.126803),(-0.306818,-0.049526,0.112814),(-0.307548,-0.058679,0.104469),(-0.308279,-0.067832,0.096124),(-0.344903,0.234377,0.006717),(-0.347349,0.230995,0.021880),(-0.347924,0.226409,0.039513),(-0.349137,0.218542,0.060465),(-0.349361,0.201546,0.087597),(-0.346106,0.170068,0.111049),(-0.334841,0.127415,0.125219),(-0.331224,0.109529,0.126966),(-0.329707,0.099769,0.127362),(-0.324988,0.073960,0.131670),(-0.320949,0.051688,0.137127),(-0.319086,0.033028,0.139538),(-0.315905,0.002121,0.137505),(-0.320663,-0.038366,0.125449),(-0.334287,-0.077265,0.116710),(-0.382923,0.240747,0.005110),(-0.385380,0.230977,0.021737),(-0.385144,0.228466,0.036315),(-0.388517,0.222814,0.056532),(-0.386178,0.209600,0.078448),(-0.380506,0.190018,0.094132),(-0.370644,0.154224,0.112588),(-0.360196,0.119456,0.120904),(-0.356676,0.090747,0.122427),(-0.356314,0.070315,0.123735),(-0.346315,0.051544,0.129056),(-0.342546,0.019694,0.133964),(-0.339259,-0.007271,0.134413),(-0.340098,-0.044954,0.126118),(-0.350190,-0.077620,0.119038),(-0.429584,0.212389,0.031713),(-0.413464,0.224891,0.038010),(-0.430329,0.202217,0.051268),(-0.417151,0.216498,0.055477),(-0.428912,0.188671,0.061139),(-0.411487,0.203759,0.068964),(-0.425236,0.172646,0.070477),(-0.405421,0.187108,0.085396),(-0.421828,0.154414,0.076293),(-0.402090,0.163420,0.091095),(-0.415526,0.120657,0.088600),(-0.397254,0.123622,0.098591),(-0.408300,0.081837,0.098762),(-0.388868,0.089603,0.108482),(-0.402731,0.061372,0.105344),(-0.382077,0.066298,0.116493),(-0.393635,0.041981,0.111363),(-0.374767,0.047070,0.121597),(-0.387725,0.008390,0.116241),(-0.368321,0.009308,0.128156),(-0.387239,-0.022944,0.114008),(-0.367729,-0.018085,0.128406),(-0.389819,-0.056004,0.106501),(-0.371378,-0.056409,0.121941),(-0.392634,-0.082093,0.100102),(-0.375880,-0.082599,0.113360),(-0.396508,-0.096962,0.096361),(-0.383926,-0.100190,0.109093),(-0.451112,0.202809,0.029520),(-0.447410,0.190536,0.043343),(-0.446075,0.178935,0.050143),(-0.443127,0.162960,0.057369),(-0.441600,0.145384,0.061520),(-0.435899,0.117308,0.069779),(-0.428065,0.084423,0.084707),(-0.420038,0.059730,0.091828),(-0.414154,0.032521,0.095240),(-0.406652,0.001440,0.098415),(-0.400946,-0.024512,0.101551),(-0.401422,-0.054072,0.096163),(-0.405364,-0.073869,0.091530),(-0.448587,0.178985,0.021174),(-0.447776,0.171131,0.027047),(-0.447200,0.159564,0.031683),(-0.444856,0.148288,0.036499),(-0.444048,0.137151,0.037075),(-0.440742,0.113967,0.042028),(-0.434651,0.082422,0.052448),(-0.429631,0.057882,0.061856),(-0.423438,0.031271,0.073171),(-0.418274,0.009520,0.074646),(-0.405982,-0.029231,0.079390),(-0.323896,-0.086684,0.096640),(-0.411822,-0.109533,0.092163),(-0.358771,-0.135955,0.071274),(-0.390890,-0.209001,0.084864),(-0.403794,-0.238241,0.108822),(-0.409646,-0.238886,0.106391),(-0.407855,-0.257926,0.112851),(-0.382939,-0.232625,0.104301),(-0.391720,-0.234663,0.103232),(-0.388323,-0.250916,0.109223),(-0.379255,-0.232643,0.096667),(-0.376247,-0.249511,0.108768),(-0.407798,-0.263612,0.111487),(-0.399941,-0.256312,0.112618),(-0.409268,-0.273027,0.112123),(-0.400380,-0.270300,0.110397),(-0.399343,-0.274903,0.107521),(-0.366084,-0.262524,0.099377),(-0.372265,-0.250067,0.098634),(-0.397263,-0.234951,0.104543),(-0.395323,-0.254065,0.113908),(-0.411008,-0.262001,0.097475),(-0.410653,-0.274653,0.095006),(-0.399937,-0.278673,0.097657),(-0.407052,-0.272757,0.084282),(-0.411576,-0.240818,0.096637),(-0.407650,-0.235707,0.087898),(-0.403286,-0.259347,0.084969),(-0.380738,-0.265728,0.110635),(-0.368514,-0.264582,0.108915),(-0.389780,-0.268166,0.113646),(-0.394567,-0.269662,0.112825),(-0.378454,-0.246110,0.090464),(-0.394310,-0.256411,0.081211),(-0.389570,-0.274532,0.087074),(-0.384594,-0.249010,0.084524),(-0.378811,-0.265334,0.086097),(-0.370481,-0.263423,0.092477),(-0.391351,-0.233779,0.084412),(-0.396094,-0.232940,0.085013),(-0.381616,-0.234224,0.091461),(-0.405592,-0.072341,0.078460),(-0.402734,-0.050955,0.081987),(-0.419178,0.012969,0.067105),(-0.435430,0.127637,0.028850),(-0.433268,0.114354,0.028063),(-0.431278,0.088094,0.032200),(-0.429297,0.058766,0.043036),(-0.424690,0.036044,0.054640),(-0.439999,0.135022,0.000000),(-0.462212,0.024984,0.001916),(-0.459356,0.058900,0.004863),(-0.460476,0.058774,0.000000),(-0.462060,0.093683,0.005313),(-0.466347,0.144252,0.005764),(-0.463695,0.191838,0.006214),(-0.447505,0.222660,0.006664),(-0.424584,0.240016,0.007114),(-0.401435,0.244406,0.007564),(-0.458181,0.024855,0.005147),(-0.456295,0.059244,0.008423),(-0.458732,0.094059,0.009203),(-0.462733,0.144624,0.009983),(-0.459782,0.191665,0.010763),(-0.443705,0.220870,0.011543),(-0.422203,0.236217,0.012323),(-0.400363,0.240040,0.013103),(-0.452676,0.024680,0.006330),(-0.452113,0.059714,0.009727),(-0.454186,0.094573,0.010628),(-0.457797,0.145133,0.011529),(-0.454437,0.191428,0.012430),(-0.438515,0.218425,0.013330),(-0.418950,0.231026,0.014231),(-0.447169,0.024504,0.005150),(-0.447931,0.060184,0.008426),(-0.449640,0.095086,0.009206),(-0.452859,0.145641,0.009987),(-0.449091,0.191191,0.010767),(-0.433323,0.215979,0.011547),(-0.415696,0.225835,0.012327),(-0.443137,0.024375,0.001921),(-0.444869,0.060528,0.004868),(-0.446310,0.095462,0.005319),(-0.449244,0.146013,0.005769),(-0.445176,0.191017,0.006220),(-0.429521,0.214188,0.006671),(-0.413314,0.222033,0.007122),(-0.441658,0.024328,-0.002491),(-0.443746,0.060654,0.000006),(-0.443130,0.024375,-0.006904),(-0.444864,0.060529,-0.004858),(-0.447158,0.024503,-0.010137),(-0.447923,0.060185,-0.008420),(-0.452663,0.024679,-0.011323),(-0.452103,0.059715,-0.009727),(-0.458170,0.024855,-0.010145),(-0.456286,0.059245,-0.008429),(-0.462205,0.024984,-0.006918),(-0.459351,0.058901,-0.004873),(-0.463687,0.025031,-0.002496),(0.407645,0.232838,0.060503),(0.404862,0.238549,0.062636),(0.398479,0.232001,0.061312),(0.415975,0.249032,0.057285),(0.406676,0.245999,0.063803),(0.408548,0.244030,0.062191),(0.419701,0.243144,0.053347),(0.422578,0.235306,0.048672),(0.421562,0.244848,0.052321),(0.408549,0.229273,0.061809),(0.416858,0.227932,0.057537),(0.415007,0.229847,0.058214),(0.421558,0.228295,0.052076),(0.420624,0.231196,0.053619),(0.413189,0.223470,0.058788),(0.418742,0.222182,0.055352),(0.420691,0.224500,0.050578),(0.423530,0.231423,0.046321),(0.418882,0.249223,0.049990),(0.414234,0.252338,0.053271),(0.424395,0.241683,0.048098),(0.410545,0.253323,0.053995),(0.404987,0.252783,0.057608),(0.402217,0.255685,0.059109),(0.397539,0.247832,0.063413),(0.409641,0.259792,0.054289),(0.415176,0.259522,0.051658),(0.422631,0.254440,0.046823),(0.428137,0.244141,0.045197),(0.429987,0.233966,0.044379),(0.425416,0.226608,0.044080),(0.421578,0.219949,0.051039),(0.415994,0.217633,0.055728),(0.409503,0.217990,0.059233),(0.407646,0.225477,0.060311),(0.404005,0.223652,0.060403),(0.430969,0.232716,0.040833),(0.431925,0.239990,0.040152),(0.428205,0.222684,0.041739),(0.424371,0.217857,0.048556),(0.414185,0.212014,0.054420),(0.408651,0.212280,0.057016),(0.397621,0.216205,0.059130),(0.429108,0.246636,0.042229),(0.425451,0.254086,0.043233),(0.416182,0.261981,0.048694),(0.410573,0.263320,0.053029),(0.395284,0.247480,0.061431),(0.403167,0.258231,0.057039),(0.396623,0.232089,0.062165),(0.392148,0.220672,0.057666),(0.396792,0.261800,0.055606),(0.406120,0.267434,0.047933),(0.411772,0.265918,0.041771),(0.421985,0.258744,0.034453),(0.428471,0.249199,0.030932),(0.432094,0.239286,0.032879),(0.432946,0.230274,0.034711),(0.392090,0.230123,0.060405),(0.405676,0.270139,0.028379),(0.396331,0.273783,0.036999),(0.419527,0.258534,0.022478),(0.429604,0.248229,0.020923),(0.435103,0.238142,0.021121),(0.437657,0.226932,0.028704),(0.435704,0.215422,0.033426),(0.432730,0.206306,0.043428),(0.420670,0.194173,0.050761),(0.402228,0.191181,0.057062),(0.415116,0.192561,0.052633),(0.393952,0.194085,0.058434),(0.383928,0.207830,0.057777),(0.391199,0.248504,0.060452),(0.377536,0.228041,0.057519),(0.375699,0.242767,0.057898),(0.386046,0.270204,0.047200),(0.378517,0.257172,0.054725),(0.438052,0.238156,0.011999),(0.444269,0.224221,0.019931),(0.444073,0.207530,0.027980),(0.445705,0.188112,0.036299),(0.390299,0.187709,0.058966),(0.378390,0.204268,0.058933),(0.382035,0.195165,0.059898),(0.378462,0.222381,0.056243),(0.370165,0.212652,0.059741),(0.365648,0.231753,0.057789),(0.365689,0.246337,0.056379),(0.385887,0.280777,0.014012),(0.380145,0.282819,0.025620),(0.369622,0.276379,0.044376),(0.361336,0.262908,0.047332),(0.444706,0.181015,0.038807),(0.438220,0.167543,0.041804),(0.417923,0.167538,0.050523),(0.398547,0.180167,0.057137),(0.454501,0.223422,0.011961),(0.464568,0.212401,0.012355),(0.459701,0.197980,0.024671),(0.460708,0.205832,0.020245),(0.455820,0.184137,0.033264),(0.452084,0.176110,0.035798),(0.448453,0.162283,0.035206),(0.447436,0.156169,0.038523),(0.421559,0.160175,0.050415),(0.395753,0.166603,0.059288),(0.386542,0.172408,0.062203),(0.374612,0.183694,0.064489),(0.365487,0.197441,0.063889),(0.368356,0.221754,0.058819),(0.361025,0.220953,0.059667),(0.360097,0.231037,0.059574),(0.482876,0.198475,0.011377),(0.479021,0.193733,0.019091),(0.475206,0.187884,0.025067),(0.469580,0.178384,0.031390),(0.464966,0.170303,0.032969),(0.462184,0.161290,0.034680),(0.461233,0.155808,0.035188),(0.495430,0.187433,0.020985),(0.496565,0.190261,0.012489),(0.491091,0.193829,0.011077),(0.487106,0.183326,0.025783),(0.483285,0.175653,0.031972),(0.493403,0.179931,0.029007),(0.490560,0.172116,0.033387),(0.489606,0.160342,0.035408),(0.478713,0.167395,0.031724),(0.490388,0.194867,0.000079),(0.490907,0.189086,0.018875),(0.480467,0.161279,0.035105),(0.470350,0.154997,0.036419),(0.511071,0.182433,0.017236),(0.513890,0.182082,0.013682),(0.506597,0.186637,0.013072),(0.520323,0.176419,0.012534),(0.516526,0.176948,0.017894),(0.503709,0.185424,0.019526),(0.500760,0.178013,0.028459),(0.507186,0.175023,0.026148),(0.515535,0.167214,0.021561),(0.522196,0.167053,0.010733),(0.515847,0.149345,0.007704),(0.514768,0.146394,0.015308),(0.518556,0.154964,0.009032),(0.508162,0.143568,0.023677),(0.510873,0.150086,0.024954),(0.502465,0.151725,0.031945),(0.517456,0.152138,0.017565),(0.518334,0.159589,0.018710),(0.513602,0.155657,0.025420),(0.506175,0.158015,0.030518),(0.499728,0.166452,0.032302),(0.498865,0.171848,0.030856),(0.490496,0.149362,0.035586),(0.498783,0.150077,0.033864),(0.491400,0.153158,0.037085),(0.482216,0.153339,0.038699),(0.469465,0.144823,0.035537),(0.489626,0.144635,0.034178),(0.480410,0.148613,0.037270),(0.475906,0.141884,0.034126),(0.480460,0.143799,0.034987),(0.465847,0.140907,0.033082),(0.464923,0.147463,0.034272),(0.470452,0.138004,0.031625),(0.460333,0.148447,0.034975),(0.459752,0.132403,0.020884),(0.459458,0.141893,0.033743),(0.473543,0.130218,0.017761),(0.477022,0.135470,0.024678),(0.482724,0.129141,0.016234),(0.486224,0.134306,0.022255),(0.492850,0.128782,0.012813),(0.497249,0.135915,0.020510),(0.446534,0.147913,0.038397),(0.452288,0.134765,0.026018),(0.444744,0.141269,0.036212),(0.502128,0.131869,0.007231),(0.505988,0.138438,0.000109),(0.507528,0.136767,0.010536),(0.479262,0.127331,0.007139),(0.467304,0.128619,0.010391),(0.447164,0.128721,0.010855),(0.458077,0.128978,0.013832),(0.448830,0.129423,0.018169),(0.442144,0.136106,0.030247),(0.436095,0.126318,0.014484),(0.418740,0.123604,0.014344),(0.437761,0.127023,0.021835),(0.422058,0.124922,0.028077),(0.393594,0.120917,0.033339),(0.422850,0.134730,0.034527),(0.395268,0.131739,0.040580),(0.423496,0.150543,0.045856),(0.424513,0.138997,0.040557),(0.396712,0.149787,0.056342),(0.396874,0.138960,0.049108),(0.379177,0.158846,0.064248),(0.372006,0.146322,0.057949),(0.362350,0.128912,0.039186),(0.364035,0.135992,0.045884),(0.355738,0.138983,0.048152),(0.389356,0.117682,0.018830),(0.358292,0.113907,0.016665),(0.354367,0.116967,0.029121),(0.344025,0.129099,0.040587),(0.367288,0.169959,0.064743),(0.352176,0.135016,0.044799),(0.336506,0.144743,0.049934),(0.350110,0.151640,0.055082),(0.339932,0.178899,0.061399),(0.330944,0.172754,0.054441),(0.359074,0.156979,0.063058),(0.347161,0.181972,0.064960),(0.355348,0.190346,0.066149),(0.362809,0.210109,0.061661),(0.353610,0.212205,0.063994),(0.352749,0.223857,0.061039),(0.352844,0.234520,0.057224),(0.346399,0.220871,0.058395),(0.344569,0.209943,0.059409),(0.334499,0.205311,0.058719),(0.329145,0.201133,0.053500),(0.337276,0.219858,0.057377),(0.330073,0.218526,0.052744),(0.356622,0.301983,0.014032),(0.367626,0.296322,0.013025),(0.355596,0.302514,0.019492),(0.366402,0.294919,0.026916),(0.356347,0.303130,0.025889),(0.341113,0.302888,0.013584),(0.342720,0.302784,0.021916),(0.343553,0.304120,0.026401),(0.343381,0.303927,0.033760),(0.365377,0.293442,0.030689),(0.355248,0.300265,0.034389),(0.363472,0.293882,0.035197),(0.369819,0.285709,0.036135),(0.330238,0.285047,0.047219),(0.331223,0.294957,0.045379),(0.328708,0.294834,0.034299),(0.326767,0.282518,0.040039),(0.327914,0.294394,0.029728),(0.330838,0.300964,0.021817),(0.332563,0.299575,0.026586),(0.332478,0.299928,0.030240),(0.334124,0.300717,0.038450),(0.325289,0.295783,0.024938),(0.322398,0.286282,0.031325),(0.325963,0.283820,0.034396),(0.324809,0.296659,-0.000099),(0.309442,0.273076,0.036896),(0.318578,0.278640,0.037475),(0.324924,0.279796,0.040260),(0.330144,0.274384,0.051034),(0.319096,0.271931,0.053764),(0.308180,0.258021,0.052107),(0.312778,0.268016,0.051247),(0.333781,0.277279,0.052647),(0.323472,0.270890,0.062215),(0.333618,0.272449,0.059550),(0.315274,0.266258,0.061568),(0.311625,0.258809,0.060359),(0.326860,0.269312,0.074421),(0.336994,0.271676,0.070737),(0.316934,0.256876,0.068954),(0.321462,0.264411,0.071080),(0.343685,0.274184,0.058711),(0.352064,0.269908,0.052880),(0.343593,0.271811,0.062593),(0.339602,0.274205,0.077897),(0.345321,0.271318,0.067275),(0.330300,0.270276,0.084501),(0.324857,0.262652,0.081422),(0.343929,0.278914,0.088576),(0.349688,0.274919,0.076217),(0.332874,0.273701,0.091573),(0.328359,0.263356,0.088815),(0.337942,0.282732,0.109196),(0.332618,0.273862,0.102586),(0.328586,0.267065,0.117838),(0.341811,0.284699,0.100847),(0.353097,0.280614,0.087720),(0.349014,0.286031,0.105480),(0.345240,0.287369,0.109857),(0.339434,0.289710,0.124185),(0.331799,0.286483,0.138103),(0.332124,0.280526,0.123999),(0.327055,0.278001,0.145253),(0.328218,0.273202,0.133805),(0.327128,0.264587,0.101511),(0.321331,0.255749,0.076509),(0.324647,0.256171,0.090328),(0.324417,0.258033,0.100236),(0.326082,0.243083,0.107256),(0.324873,0.254523,0.120810),(0.330686,0.261446,0.145093),(0.332718,0.247722,0.136374),(0.337604,0.230743,0.122500),(0.325539,0.240691,0.091846),(0.304722,0.258039,0.042836),(0.314631,0.241112,0.048356),(0.319051,0.240794,0.054929),(0.331799,0.232794,0.057844),(0.320678,0.242605,0.063981),(0.324138,0.243483,0.073165),(0.337417,0.225923,0.091705),(0.335178,0.226702,0.109051),(0.356657,0.255094,0.051669),(0.353866,0.258082,0.054065),(0.352928,0.249790,0.053941),(0.337280,0.282738,0.137688),(0.336397,0.273461,0.136720),(0.339328,0.274493,0.128403),(0.337331,0.277921,0.135369),(0.336563,0.271862,0.129534),(0.342152,0.283330,0.124865),(0.342139,0.278779,0.125304),(0.342319,0.274331,0.117454),(0.349876,0.265869,0.067908),(0.349119,0.256065,0.061494),(0.360486,0.264636,0.083902),(0.352707,0.278578,0.104441),(0.346973,0.281375,0.114131),(0.344233,0.279549,0.114244),(0.352041,0.268244,0.092546),(0.359362,0.273686,0.092189),(0.351292,0.261163,0.085869),(0.349928,0.275856,0.104640),(0.357828,0.254164,0.080258),(0.343569,0.272115,0.103914),(0.344667,0.266684,0.095275),(0.351425,0.255100,0.080019),(0.342148,0.260272,0.085743),(0.337705,0.252348,0.079967),(0.337496,0.254160,0.088976),(0.337274,0.258749,0.098657),(0.337844,0.262914,0.112955),(0.337643,0.267413,0.121705),(0.335582,0.248941,0.092186),(0.334387,0.250175,0.104918),(0.335003,0.255959,0.117252),(0.335705,0.261389,0.125932),(0.336153,0.238349,0.106102),(0.336767,0.245238,0.120139),(0.334716,0.252551,0.129514),(0.333655,0.263375,0.136691),(0.333581,0.267347,0.139995),(0.335380,0.274743,0.140226),(0.345621,0.234174,0.053436),(0.350192,0.241532,0.053735),(0.350516,0.249441,0.078700),(0.357881,0.250282,0.077885),(0.346910,0.244719,0.077264),(0.338310,0.238856,0.092320),(0.415943,0.245467,0.058570),(0.401235,0.246671,0.060862),(0.332560,0.275098,0.143816),(0.328376,0.229912,0.047009),(0.305187,0.279120,0.023334),(-0.378445,-0.132061,0.065567),(-0.405592,-0.072341,-0.078460),(0.415007,0.229847,-0.058214),(0.343381,0.303927,-0.033760),(0.497916,0.144281,0.030751),(-0.289598,-0.069014,-0.097096),(-0.280782,-0.065869,-0.096670),(-0.311374,-0.089618,-0.096676),(-0.293797,-0.088718,-0.095747),(-0.281819,-0.087432,-0.094091),(-0.255291,-0.083645,-0.091470),(-0.248530,-0.084457,-0.089743),(-0.319390,-0.111448,-0.088722),(-0.300004,-0.110261,-0.087926),(-0.282601,-0.112371,-0.082932),(-0.255375,-0.103442,-0.084583),(-0.255506,-0.111154,-0.077645),(-0.246246,-0.097575,-0.086937),(-0.236827,-0.096993,-0.083848),(-0.232836,-0.111642,-0.073571),(-0.243588,-0.110570,-0.078818),(-0.225634,-0.121794,-0.060664),(-0.237775,-0.115466,-0.060561),(-0.229547,-0.121512,-0.050174),(-0.235232,-0.125766,-0.035815),(-0.238615,-0.127291,0.000000),(-0.257595,-0.131448,0.000000),(-0.254017,-0.132633,-0.040659),(-0.252392,-0.122895,-0.060634),(-0.328501,-0.128128,-0.072168),(-0.304318,-0.131524,-0.066211),(-0.281350,-0.129770,-0.065679),(-0.265929,-0.139106,-0.040157),(-0.271216,-0.139096,-0.048892),(-0.280337,-0.137435,-0.055523),(-0.290250,-0.142784,-0.050290),(-0.295268,-0.143516,-0.044578),(-0.309368,-0.143554,-0.047059),(-0.322250,-0.145460,-0.049411),(-0.324291,-0.141902,-0.057046),(-0.332386,-0.139437,-0.060932),(-0.342335,-0.140535,-0.059435),(-0.347609,-0.141174,-0.057007),(-0.348553,-0.144129,-0.050878),(-0.346058,-0.145255,-0.044739),(-0.366829,-0.134243,0.000000),(-0.339021,-0.146635,-0.040493),(-0.343299,-0.141439,0.000000),(-0.327994,-0.147115,-0.043146),(-0.312413,-0.143048,0.000000),(-0.292324,-0.146454,-0.036246),(-0.283885,-0.144559,-0.030734),(-0.286905,-0.140096,0.000000),(-0.272243,-0.143408,-0.034425),(-0.389703,-0.126927,-0.043183),(-0.409099,-0.116042,-0.043963),(-0.421821,-0.104546,-0.040638),(-0.433400,-0.088728,-0.037803),(-0.431004,-0.089180,-0.056825),(-0.441571,-0.070144,-0.033380),(-0.440731,-0.071918,-0.050561),(-0.446264,-0.051652,-0.032035),(-0.444399,-0.052621,-0.046470),(-0.445273,-0.029092,-0.033072),(-0.444190,-0.029542,-0.044629),(-0.439275,0.008828,-0.033849),(-0.437210,0.009227,-0.042645),(-0.434637,0.037857,-0.034485),(-0.430584,0.037266,-0.043722),(-0.431154,0.063007,-0.033848),(-0.432845,0.065827,0.000000),(-0.432063,0.090581,0.000000),(-0.435989,0.038639,0.000000),(-0.444973,-0.028214,0.000000),(-0.445492,-0.048816,0.000000),(-0.442671,-0.070379,0.000000),(-0.429824,-0.092797,0.000000),(-0.419382,-0.105576,0.000000),(-0.404716,-0.117063,0.000000),(-0.388643,-0.125306,0.000000),(-0.371786,-0.134877,-0.044257),(-0.441377,0.008239,0.000000),(-0.430289,0.012112,-0.056084),(-0.434612,-0.029333,-0.064943),(-0.432625,-0.054621,-0.067523),(-0.426873,-0.074199,-0.069228),(-0.421435,-0.028282,-0.072814),(-0.413152,-0.053050,-0.076621),(-0.434312,0.109562,0.000000),(-0.270969,-0.155437,-0.043890),(-0.274719,-0.155430,-0.050085),(-0.281187,-0.154252,-0.054787),(-0.288217,-0.158045,-0.051076),(-0.291775,-0.158564,-0.047026),(-0.289687,-0.160648,-0.041117),(-0.283703,-0.159304,-0.037208),(-0.275447,-0.158488,-0.039826),(-0.327526,-0.159943,-0.050453),(-0.328973,-0.157420,-0.055867),(-0.334715,-0.155672,-0.058623),(-0.341769,-0.156451,-0.057561),(-0.345510,-0.156904,-0.055840),(-0.346179,-0.158999,-0.051493),(-0.344410,-0.159798,-0.047140),(-0.339419,-0.160776,-0.044128),(-0.331600,-0.161117,-0.046010),(-0.284178,-0.168597,-0.036872),(-0.276125,-0.167800,-0.039426),(-0.290016,-0.169907,-0.040685),(-0.292052,-0.167875,-0.046449),(-0.288581,-0.167369,-0.050400),(-0.281724,-0.163669,-0.054020),(-0.275414,-0.164818,-0.049433),(-0.271757,-0.164825,-0.043390),(-0.332905,-0.170365,-0.045458),(-0.328931,-0.169220,-0.049792),(-0.340533,-0.170033,-0.043623),(-0.345400,-0.169078,-0.046560),(-0.347126,-0.168299,-0.050806),(-0.346473,-0.166255,-0.055046),(-0.342825,-0.165813,-0.056726),(-0.335943,-0.165053,-0.057762),(-0.330343,-0.166759,-0.055073),(-0.282481,-0.172662,-0.045084),(-0.337941,-0.173814,-0.051064),(-0.289598,-0.069014,0.097096),(-0.280782,-0.065869,0.096670),(-0.311374,-0.089618,0.096676),(-0.293797,-0.088718,0.095747),(-0.281819,-0.087432,0.094091),(-0.248530,-0.084457,0.089743),(-0.255291,-0.083645,0.091470),(-0.319390,-0.111448,0.088722),(-0.300004,-0.110261,0.087926),(-0.255375,-0.103442,0.084583),(-0.282601,-0.112371,0.082932),(-0.246246,-0.097575,0.086937),(-0.232836,-0.111642,0.073571),(-0.236827,-0.096993,0.083848),(-0.243588,-0.110570,0.078818),(-0.255506,-0.111154,0.077645),(-0.225634,-0.121794,0.060664),(-0.237775,-0.115466,0.060561),(-0.229547,-0.121512,0.050174),(-0.235232,-0.125766,0.035815),(-0.252392,-0.122895,0.060634),(-0.254017,-0.132633,0.040659),(-0.328501,-0.128128,0.072168),(-0.304318,-0.131524,0.066211),(-0.281350,-0.129770,0.065679),(-0.265929,-0.139106,0.040157),(-0.280337,-0.137435,0.055523),(-0.271216,-0.139096,0.048892),(-0.290250,-0.142784,0.050290),(-0.295268,-0.143516,0.044578),(-0.324291,-0.141902,0.057046),(-0.322250,-0.145460,0.049411),(-0.309368,-0.143554,0.047059),(-0.332386,-0.139437,0.060932),(-0.342335,-0.140535,0.059435),(-0.347609,-0.141174,0.057007),(-0.346058,-0.145255,0.044739),(-0.348553,-0.144129,0.050878),(-0.371786,-0.134877,0.044257),(-0.339021,-0.146635,0.040493),(-0.327994,-0.147115,0.043146),(-0.292324,-0.146454,0.036246),(-0.283885,-0.144559,0.030734),(-0.272243,-0.143408,0.034425),(-0.409099,-0.116042,0.043963),(-0.389703,-0.126927,0.043183),(-0.421821,-0.104546,0.040638),(-0.433400,-0.088728,0.037803),(-0.441571,-0.070144,0.033380),(-0.431004,-0.089180,0.056825),(-0.446264,-0.051652,0.032035),(-0.440731,-0.071918,0.050561),(-0.445273,-0.029092,0.033072),(-0.444399,-0.052621,0.046470),(-0.439275,0.008828,0.033849),(-0.444190,-0.029542,0.044629),(-0.434637,0.037857,0.034485),(-0.437210,0.009227,0.042645),(-0.431154,0.063007,0.033848),(-0.430584,0.037266,0.043722),(-0.430289,0.012112,0.056084),(-0.434612,-0.029333,0.064943),(-0.432625,-0.054621,0.067523),(-0.426873,-0.074199,0.069228),(-0.421435,-0.028282,0.072814),(-0.413152,-0.053050,0.076621),(-0.274719,-0.155430,0.050085),(-0.270969,-0.155437,0.043890),(-0.281187,-0.154252,0.054787),(-0.288217,-0.158045,0.051076),(-0.291775,-0.158564,0.047026),(-0.289687,-0.160648,0.041117),(-0.283703,-0.159304,0.037208),(-0.275447,-0.158488,0.039826),(-0.328973,-0.157420,0.055867),(-0.327526,-0.159943,0.050453),(-0.334715,-0.155672,0.058623),(-0.341769,-0.156451,0.057561),(-0.345510,-0.156904,0.055840),(-0.346179,-0.158999,0.051493),(-0.344410,-0.159798,0.047140),(-0.339419,-0.160776,0.044128),(-0.331600,-0.161117,0.046010),(-0.276125,-0.167800,0.039426),(-0.284178,-0.168597,0.036872),(-0.290016,-0.169907,0.040685),(-0.292052,-0.167875,0.046449),(-0.288581,-0.167369,0.050400),(-0.281724,-0.163669,0.054020),(-0.275414,-0.164818,0.049433),(-0.271757,-0.164825,0.043390),(-0.328931,-0.169220,0.049792),(-0.332905,-0.170365,0.045458),(-0.340533,-0.170033,0.043623),(-0.345400,-0.169078,0.046560),(-0.347126,-0.168299,0.050806),(-0.346473,-0.166255,0.055046),(-0.342825,-0.165813,0.056726),(-0.335943,-0.165053,0.057762),(-0.330343,-0.166759,0.055073),(-0.282481,-0.172662,0.045084),(-0.337941,-0.173814,0.051064),(-0.447402,-0.051330,0.009879),(-0.445258,-0.011266,0.007757),(-0.447591,-0.032124,0.008866),(0.133391,-0.270960,-0.106882),(0.137275,-0.278296,-0.107620),(0.125514,-0.281805,-0.111112),(0.147185,-0.290415,-0.112746),(0.136264,-0.295902,-0.121473),(0.156718,-0.306919,-0.119526),(0.147823,-0.311227,-0.123512),(0.124934,-0.311818,-0.120484),(0.120506,-0.300262,-0.118053),(0.115005,-0.285022,-0.109375),(0.111032,-0.275308,-0.104732),(0.119392,-0.270320,-0.106518),(0.142581,-0.278780,-0.099650),(0.139391,-0.269585,-0.097887),(0.144124,-0.271744,-0.088893),(0.108901,-0.291517,-0.105498),(0.114326,-0.304842,-0.111087),(0.106576,-0.280735,-0.101477),(0.105666,-0.285785,-0.086508),(0.130280,-0.314633,-0.091709),(0.106340,-0.296663,-0.088349),(0.115777,-0.310760,-0.091244),(0.115360,-0.285976,-0.068954),(0.116520,-0.299615,-0.070131),(0.122662,-0.308476,-0.068810),(0.135043,-0.311102,-0.070101),(0.142181,-0.314529,-0.093644),(0.146802,-0.310690,-0.073289),(0.141137,-0.272288,-0.080028),(0.146028,-0.278140,-0.089203),(0.150510,-0.289959,-0.104348),(0.161070,-0.302356,-0.113648),(0.155089,-0.291366,-0.095823),(0.166411,-0.307091,-0.101942),(0.153323,-0.290681,-0.080151),(0.160169,-0.304545,-0.080033),(0.145982,-0.280445,-0.082396),(0.128310,-0.279142,-0.067494),(0.133186,-0.292491,-0.067701),(-0.366475,-0.276164,-0.121093),(-0.362194,-0.283500,-0.121832),(-0.375157,-0.287010,-0.125324),(-0.351273,-0.295619,-0.126958),(-0.363308,-0.301107,-0.135684),(-0.340767,-0.312123,-0.133738),(-0.350569,-0.316432,-0.137724),(-0.375795,-0.317023,-0.134696),(-0.380675,-0.305467,-0.132265),(-0.386738,-0.290227,-0.123586),(-0.391117,-0.280513,-0.118944),(-0.381903,-0.275525,-0.120730),(-0.356347,-0.283984,-0.113862),(-0.359862,-0.274789,-0.112098),(-0.354646,-0.276948,-0.103104),(-0.393465,-0.296721,-0.119710),(-0.387486,-0.310047,-0.125299),(-0.396027,-0.285939,-0.115689),(-0.397030,-0.290989,-0.100720),(-0.369903,-0.319838,-0.105921),(-0.396288,-0.301868,-0.102561),(-0.385887,-0.315964,-0.105456),(-0.386346,-0.291180,-0.083166),(-0.385068,-0.304819,-0.084343),(-0.378299,-0.313681,-0.083022),(-0.364655,-0.316307,-0.084312),(-0.356788,-0.319734,-0.107855),(-0.351695,-0.315894,-0.087501),(-0.357939,-0.277492,-0.094240),(-0.352548,-0.283344,-0.103415),(-0.347608,-0.295164,-0.118559),(-0.335971,-0.307561,-0.127860),(-0.342562,-0.296570,-0.110035),(-0.330085,-0.312295,-0.116154),(-0.344508,-0.295886,-0.094363),(-0.336964,-0.309750,-0.094245),(-0.352599,-0.285649,-0.096607),(-0.372075,-0.284346,-0.081705),(-0.366701,-0.297696,-0.081913),(0.137275,-0.278296,0.107620),(0.133391,-0.270960,0.106882),(0.119392,-0.270320,0.106518),(0.147185,-0.290415,0.112746),(0.125514,-0.281805,0.111112),(0.156718,-0.306919,0.119526),(0.136264,-0.295902,0.121473),(0.120506,-0.300262,0.118053),(0.124934,-0.311818,0.120484),(0.147823,-0.311227,0.123512),(0.115005,-0.285022,0.109375),(0.111032,-0.275308,0.104732),(0.150510,-0.289959,0.104348),(0.142581,-0.278780,0.099650),(0.139391,-0.269585,0.097887),(0.106576,-0.280735,0.101477),(0.108901,-0.291517,0.105498),(0.114326,-0.304842,0.111087),(0.115777,-0.310760,0.091244),(0.105666,-0.285785,0.086508),(0.106340,-0.296663,0.088349),(0.115360,-0.285976,0.068954),(0.116520,-0.299615,0.070131),(0.130280,-0.314633,0.091709),(0.122662,-0.308476,0.068810),(0.142181,-0.314529,0.093644),(0.135043,-0.311102,0.070101),(0.144124,-0.271744,0.088893),(0.146028,-0.278140,0.089203),(0.161070,-0.302356,0.113648),(0.155089,-0.291366,0.095823),(0.153323,-0.290681,0.080151),(0.166411,-0.307091,0.101942),(0.145982,-0.280445,0.082396),(0.128310,-0.279142,0.067494),(0.141137,-0.272288,0.080028),(0.133186,-0.292491,0.067701),(0.146802,-0.310690,0.073289),(0.160169,-0.304545,0.080033),(-0.362194,-0.283500,0.121832),(-0.366475,-0.276164,0.121093),(-0.381903,-0.275525,0.120730),(-0.351273,-0.295619,0.126958),(-0.375157,-0.287010,0.125324),(-0.340767,-0.312123,0.133738),(-0.363308,-0.301107,0.135684),(-0.380675,-0.305467,0.132265),(-0.375795,-0.317023,0.134696),(-0.350569,-0.316432,0.137724),(-0.386738,-0.290227,0.123586),(-0.391117,-0.280513,0.118944),(-0.347608,-0.295164,0.118559),(-0.356347,-0.283984,0.113862),(-0.359862,-0.274789,0.112098),(-0.396027,-0.285939,0.115689),(-0.393465,-0.296721,0.119710),(-0.387486,-0.310047,0.125299),(-0.385887,-0.315964,0.105456),(-0.397030,-0.290989,0.100720),(-0.396288,-0.301868,0.102561),(-0.386346,-0.291180,0.083166),(-0.385068,-0.304819,0.084343),(-0.369903,-0.319838,0.105921),(-0.378299,-0.313681,0.083022),(-0.356788,-0.319734,0.107855),(-0.364655,-0.316307,0.084312),(-0.354646,-0.276948,0.103104),(-0.352548,-0.283344,0.103415),(-0.335971,-0.307561,0.127860),(-0.342562,-0.296570,0.110035),(-0.344508,-0.295886,0.094363),(-0.330085,-0.312295,0.116154),(-0.352599,-0.285649,0.096607),(-0.372075,-0.284346,0.081705),(-0.357939,-0.277492,0.094240),(-0.366701,-0.297696,0.081913),(-0.351695,-0.315894,0.087501),(-0.336964,-0.309750,0.094245),(0.417761,0.239124,-0.059226),(0.417728,0.234660,-0.060561),(0.414937,0.235647,-0.061341),(0.419575,0.236274,-0.058603),(0.412168,0.238545,-0.062806),(0.414927,0.239389,-0.061884),(0.509582,0.146009,0.000110),(0.512163,0.144797,-0.008058),(0.510250,0.142514,-0.012829),(0.498138,0.139656,-0.021073),(0.489887,0.138941,-0.022796),(0.511977,0.162139,-0.016470),(0.506454,0.166060,-0.018713),(0.502730,0.169945,-0.021000),(0.507367,0.163214,-0.018105),(0.479768,0.139124,-0.024389),(0.419575,0.236274,0.058603),(0.414927,0.239389,0.061884),(0.412168,0.238545,0.062806),(0.417728,0.234660,0.060561),(0.414937,0.235647,0.061341),(0.417761,0.239124,0.059226),(0.512163,0.144797,0.008058),(0.510250,0.142514,0.012829),(0.498138,0.139656,0.021073),(0.511977,0.162139,0.016470),(0.507367,0.163214,0.018105),(0.506454,0.166060,0.018713),(0.502730,0.169945,0.021000),(0.489887,0.138941,0.022796),(0.479768,0.139124,0.024389),(0.356790,0.302429,-0.047095),(0.363160,0.297030,-0.048669),(0.344860,0.306318,-0.049192),(0.358336,0.305450,-0.059682),(0.364691,0.300000,-0.060356),(0.350104,0.309109,-0.059137),(0.363541,0.310248,-0.071313),(0.369996,0.304531,-0.069230),(0.358055,0.312165,-0.071905),(0.368914,0.313408,-0.075727),(0.374448,0.307782,-0.074554),(0.364283,0.314606,-0.078253),(0.377053,0.314775,-0.080378),(0.379842,0.310852,-0.078036),(0.366772,0.288858,-0.049543),(0.366463,0.292901,-0.062929),(0.370854,0.297311,-0.070889),(0.374404,0.299663,-0.076243),(0.381649,0.300854,-0.079045),(0.389856,0.303749,-0.080801),(0.388044,0.311920,-0.079968),(0.373343,0.315847,-0.081997),(0.387058,0.316735,-0.082230),(0.395332,0.304486,-0.080751),(0.397190,0.312246,-0.080004),(0.386078,0.318916,-0.085686),(0.395280,0.316055,-0.083262),(0.404521,0.306016,-0.078964),(0.404520,0.313045,-0.079189),(0.403567,0.316734,-0.081541),(0.402531,0.318888,-0.085892),(0.432002,0.319838,-0.077473),(0.366679,0.278192,-0.053322),(0.366459,0.283713,-0.062913),(0.369850,0.290387,-0.075189),(0.353791,0.276812,-0.057751),(0.354450,0.282419,-0.068258),(0.360593,0.287213,-0.079876),(0.376205,0.295201,-0.077657),(0.366861,0.291445,-0.086052),(0.382539,0.297198,-0.079419),(0.377833,0.295007,-0.085057),(0.390722,0.299288,-0.082193),(0.390572,0.298969,-0.088624),(0.397907,0.300748,-0.087631),(0.396177,0.300331,-0.083039),(0.408012,0.303247,-0.086707),(0.405344,0.301946,-0.082183),(0.372159,0.298614,-0.093766),(0.388609,0.299500,-0.094062),(0.398721,0.302949,-0.092925),(0.357648,0.296355,-0.089053),(0.348667,0.292933,-0.081832),(0.341666,0.285063,-0.066802),(0.341783,0.280913,-0.061671),(0.410690,0.305232,-0.089316),(0.395901,0.308412,-0.095089),(0.407883,0.309889,-0.092431),(0.383954,0.307253,-0.097799),(0.368446,0.306153,-0.095700),(0.356709,0.302820,-0.089311),(0.346850,0.299313,-0.081173),(0.336256,0.291267,-0.064231),(0.345937,0.307483,-0.080361),(0.356687,0.310271,-0.090435),(0.368466,0.313427,-0.094997),(0.384867,0.314703,-0.098945),(0.336237,0.299650,-0.065265),(0.334587,0.289669,-0.057003),(0.332817,0.297663,-0.054344),(0.397689,0.313835,-0.097328),(0.408758,0.316081,-0.093666),(0.337506,0.301772,-0.049461),(0.384050,0.318814,-0.093933),(0.368624,0.316466,-0.088267),(0.357807,0.315049,-0.082654),(0.349729,0.312523,-0.075367),(0.339994,0.307554,-0.061838),(0.394304,0.318975,-0.086597),(0.395932,0.318794,-0.094033),(0.405161,0.319305,-0.090505),(0.344860,0.306318,0.049192),(0.356790,0.302429,0.047095),(0.350104,0.309109,0.059137),(0.363160,0.297030,0.048669),(0.358336,0.305450,0.059682),(0.358055,0.312165,0.071905),(0.364691,0.300000,0.060356),(0.363541,0.310248,0.071313),(0.364283,0.314606,0.078253),(0.374448,0.307782,0.074554),(0.369996,0.304531,0.069230),(0.368914,0.313408,0.075727),(0.373343,0.315847,0.081997),(0.379842,0.310852,0.078036),(0.366772,0.288858,0.049543),(0.366463,0.292901,0.062929),(0.370854,0.297311,0.070889),(0.374404,0.299663,0.076243),(0.381649,0.300854,0.079045),(0.388044,0.311920,0.079968),(0.377053,0.314775,0.080378),(0.387058,0.316735,0.082230),(0.386078,0.318916,0.085686),(0.389856,0.303749,0.080801),(0.397190,0.312246,0.080004),(0.395280,0.316055,0.083262),(0.394304,0.318975,0.086597),(0.395332,0.304486,0.080751),(0.404520,0.313045,0.079189),(0.403567,0.316734,0.081541),(0.402531,0.318888,0.085892),(0.432002,0.319838,0.077473),(0.404521,0.306016,0.078964),(0.366679,0.278192,0.053322),(0.366459,0.283713,0.062913),(0.353791,0.276812,0.057751),(0.354450,0.282419,0.068258),(0.369850,0.290387,0.075189),(0.360593,0.287213,0.079876),(0.376205,0.295201,0.077657),(0.366861,0.291445,0.086052),(0.382539,0.297198,0.079419),(0.377833,0.295007,0.085057),(0.390722,0.299288,0.082193),(0.390572,0.298969,0.088624),(0.396177,0.300331,0.083039),(0.397907,0.300748,0.087631),(0.405344,0.301946,0.082183),(0.388609,0.299500,0.094062),(0.398721,0.302949,0.092925),(0.408012,0.303247,0.086707),(0.410690,0.305232,0.089316),(0.357648,0.296355,0.089053),(0.348667,0.292933,0.081832),(0.341666,0.285063,0.066802),(0.341783,0.280913,0.061671),(0.407883,0.309889,0.092431),(0.395901,0.308412,0.095089),(0.383954,0.307253,0.097799),(0.368446,0.306153,0.095700),(0.372159,0.298614,0.093766),(0.356709,0.302820,0.089311),(0.346850,0.299313,0.081173),(0.336256,0.291267,0.064231),(0.334587,0.289669,0.057003),(0.356687,0.310271,0.090435),(0.345937,0.307483,0.080361),(0.368466,0.313427,0.094997),(0.384867,0.314703,0.098945),(0.336237,0.299650,0.065265),(0.332817,0.297663,0.054344),(0.397689,0.313835,0.097328),(0.408758,0.316081,0.093666),(0.337506,0.301772,0.049461),(0.368624,0.316466,0.088267),(0.384050,0.318814,0.093933),(0.357807,0.315049,0.082654),(0.349729,0.312523,0.075367),(0.339994,0.307554,0.061838),(0.395932,0.318794,0.094033),(0.405161,0.319305,0.090505),(-0.451676,-0.011952,0.008548),(-0.450560,-0.043071,0.009695),(-0.450989,-0.070326,0.011114),(-0.444266,-0.070171,0.007826),(-0.451987,-0.092856,0.010095),(-0.441582,-0.080369,0.005719),(-0.459976,-0.111888,0.008153),(-0.435809,-0.097529,-0.010437),(-0.445920,-0.115332,-0.011523),(-0.466651,-0.131144,0.001761),(-0.460461,-0.134790,-0.011410),(-0.455503,-0.010332,0.006426),(-0.458197,-0.036030,0.009924),(-0.461938,-0.054274,0.011628),(-0.466071,-0.082281,0.014832),(-0.469013,-0.104820,0.014915),(-0.479143,-0.122129,0.013033),(-0.488332,-0.139786,0.012015),(-0.459472,-0.008403,0.005557),(-0.467709,-0.034223,0.009158),(-0.472594,-0.052514,0.014081),(-0.475063,-0.073094,0.016424),(-0.479499,-0.097453,0.015415),(-0.493046,-0.123917,0.016585),(-0.498369,-0.148417,0.015510),(-0.467233,-0.019052,0.007788),(-0.475424,-0.038478,0.009928),(-0.480585,-0.060458,0.013631),(-0.490542,-0.079013,0.012075),(-0.496028,-0.115942,0.015119),(-0.507390,-0.145124,0.017771),(-0.470862,-0.011791,0.003735),(-0.484687,-0.050899,0.011055),(-0.500377,-0.078924,0.006989),(-0.500529,-0.103444,0.011156),(-0.508587,-0.130519,0.015033),(-0.518149,-0.148279,0.019298),(-0.475146,-0.011630,-0.001441),(-0.488858,-0.043711,0.001633),(-0.500996,-0.072788,0.002207),(-0.510996,-0.110960,0.005694),(-0.520025,-0.139308,0.013084),(-0.522196,-0.157647,0.018970),(-0.469800,-0.009984,-0.014531),(-0.481884,-0.043805,-0.016897),(-0.499242,-0.072220,-0.010403),(-0.502881,-0.099920,-0.014562),(-0.510746,-0.125393,-0.004359),(-0.516327,-0.152916,0.004560),(-0.468667,-0.016306,-0.016316),(-0.476426,-0.052413,-0.022365),(-0.488805,-0.089448,-0.026716),(-0.497803,-0.122990,-0.021486),(-0.504920,-0.136023,-0.009988),(-0.512767,-0.150902,0.002502),(-0.464975,-0.032038,-0.019717),(-0.469401,-0.064417,-0.028917),(-0.477762,-0.093704,-0.028564),(-0.484921,-0.121083,-0.023838),(-0.495188,-0.136956,-0.014066),(-0.509740,-0.152483,0.002507),(-0.451873,-0.029072,-0.014936),(-0.455384,-0.061275,-0.024050),(-0.459650,-0.080048,-0.026981),(-0.477615,-0.112885,-0.027535),(-0.475378,-0.131219,-0.018491),(-0.485115,-0.146574,-0.004132),(-0.496861,-0.151519,0.001731),(-0.434551,-0.032299,-0.003589)])
-        self.registerTriangles([(0,1,2),(1,3,4),(4,3,5),(6,7,4),(7,8,2),(8,9,10),(8,11,12),(11,13,14),(14,13,15),(13,16,17),(17,16,18),(18,16,19),(16,20,21),(16,13,11),(8,7,20),(7,6,21),(6,5,22),(21,23,24),(24,19,21),(25,26,19),(25,24,23),(19,26,27),(27,28,18),(28,29,17),(17,29,30),(30,31,15),(31,32,14),(33,34,25),(34,35,26),(35,36,27),(36,37,28),(37,38,29),(38,39,30),(39,40,31),(40,41,32),(42,43,34),(43,44,35),(44,45,36),(45,46,37),(46,47,38),(47,48,39),(48,49,40),(49,50,41),(51,52,53),(53,54,51),(51,54,55),(55,56,51),(51,56,57),(5,3,58),(58,3,59),(59,57,58),(56,55,22),(22,55,23),(23,55,60),(61,33,23),(61,62,42),(61,63,64),(23,21,6),(22,23,6),(58,57,56),(5,58,56),(65,60,55),(65,63,61),(66,67,68),(68,67,69),(66,70,71),(66,72,73),(73,72,74),(72,75,76),(76,75,77),(77,75,78),(75,79,80),(80,81,82),(82,77,78),(77,82,76),(82,83,74),(70,66,73),(70,83,84),(84,85,71),(71,69,67),(69,71,86),(87,88,85),(87,85,89),(83,82,90),(82,81,91),(81,92,93),(94,95,91),(95,96,90),(96,97,89),(97,98,87),(70,73,83),(74,83,73),(99,100,101),(102,103,104),(103,105,106),(107,101,108),(108,109,110),(110,109,111),(106,112,113),(114,115,102),(100,115,114),(108,110,116),(110,111,117),(116,117,118),(116,119,120),(121,122,123),(113,124,125),(126,114,125),(126,127,101),(109,127,111),(101,127,109),(108,123,107),(106,128,129),(119,118,130),(119,130,120),(131,132,130),(129,128,132),(132,133,134),(132,128,135),(130,134,121),(136,137,138),(137,139,140),(139,141,142),(141,143,144),(143,145,146),(147,148,149),(150,151,152),(153,154,155),(154,156,157),(156,143,141),(154,158,156),(158,145,143),(159,160,154),(160,161,158),(161,162,145),(163,164,160),(164,165,161),(165,147,162),(166,155,167),(155,157,168),(157,141,139),(169,139,137),(169,170,168),(170,171,167),(171,172,173),(174,175,170),(170,175,171),(175,176,177),(178,176,175),(179,180,176),(180,181,177),(181,182,183),(149,148,184),(179,185,186),(184,187,180),(187,188,181),(188,189,182),(148,190,187),(190,191,188),(191,192,189),(165,164,191),(164,163,192),(147,165,190),(147,152,193),(194,195,196),(195,197,198),(197,199,200),(199,201,202),(203,100,99),(204,203,205),(206,204,207),(208,206,209),(210,208,211),(207,205,212),(209,207,213),(211,209,214),(215,211,216),(213,212,217),(214,213,218),(216,214,219),(220,216,221),(218,217,222),(219,218,223),(221,219,224),(225,221,226),(227,105,103),(194,103,102),(228,201,199),(229,199,197),(195,194,230),(231,197,195),(203,232,115),(230,102,115),(210,233,234),(208,234,235),(206,235,236),(204,236,232),(233,228,229),(234,229,231),(235,231,237),(236,237,230),(222,217,121),(238,239,226),(240,226,224),(241,224,223),(212,122,121),(105,135,128),(133,135,242),(243,242,244),(222,134,133),(245,223,222),(242,135,105),(246,238,240),(247,240,241),(202,246,247),(200,247,248),(198,248,244),(196,244,242),(249,12,14),(250,249,251),(252,250,253),(254,252,255),(256,254,257),(258,256,259),(260,258,261),(262,260,263),(264,9,12),(265,264,249),(266,265,250),(267,266,252),(268,267,254),(269,268,256),(270,269,258),(271,270,260),(32,41,246),(210,259,257),(233,257,255),(228,255,253),(201,253,251),(251,14,32),(264,272,10),(268,273,274),(267,274,275),(266,275,276),(265,276,272),(263,220,225),(277,270,271),(259,210,215),(261,215,220),(273,268,269),(278,269,270),(279,280,281),(282,279,283),(284,282,285),(286,284,287),(288,286,289),(290,288,291),(292,290,293),(294,292,295),(296,294,297),(298,296,299),(300,298,301),(302,300,303),(304,302,305),(306,304,307),(308,309,310),(311,312,313),(314,313,315),(314,315,316),(317,316,318),(319,318,320),(321,320,322),(323,322,324),(325,324,326),(327,326,328),(329,328,330),(331,330,332),(333,332,309),(63,334,335),(336,337,338),(339,338,340),(341,340,342),(343,342,344),(345,344,346),(347,346,348),(349,348,350),(351,352,350),(351,350,353),(354,353,355),(356,355,357),(54,357,358),(65,358,334),(309,283,281),(334,304,306),(337,280,279),(337,279,282),(338,282,284),(340,284,286),(342,286,288),(344,288,290),(346,290,292),(348,292,294),(350,294,296),(353,296,298),(355,298,300),(357,300,302),(358,302,304),(312,359,307),(313,307,305),(315,305,303),(316,303,301),(316,301,299),(318,299,297),(320,297,295),(322,295,293),(324,293,291),(326,291,289),(328,289,287),(330,287,285),(332,285,283),(54,53,356),(360,349,352),(361,352,351),(362,351,354),(53,52,363),(354,356,53),(363,364,354),(365,366,367),(3,1,368),(59,368,369),(370,369,371),(372,371,373),(374,373,375),(376,375,377),(378,377,379),(380,379,366),(370,52,57),(365,367,381),(365,381,360),(380,360,361),(378,361,362),(376,362,364),(374,364,363),(372,363,52),(381,347,349),(382,336,339),(383,339,341),(384,341,343),(385,343,345),(367,345,347),(386,387,1),(388,383,384),(389,384,385),(390,385,367),(391,367,366),(392,366,379),(393,379,377),(394,377,375),(395,375,373),(396,373,371),(397,371,369),(398,369,368),(399,368,1),(10,272,386),(387,386,400),(387,400,401),(388,402,403),(399,401,404),(397,398,404),(397,404,405),(396,405,406),(395,406,407),(394,407,408),(393,408,409),(392,409,410),(391,410,411),(390,411,412),(389,412,402),(413,414,415),(416,413,417),(418,416,419),(420,418,421),(422,420,423),(424,422,425),(426,424,427),(428,426,429),(430,428,431),(432,430,433),(434,432,435),(436,434,437),(438,436,439),(440,438,441),(442,440,443),(444,442,445),(92,444,446),(93,92,447),(94,93,448),(449,450,451),(452,449,453),(454,452,455),(456,454,457),(458,456,459),(460,458,461),(462,460,463),(464,462,465),(466,464,467),(468,466,469),(470,468,471),(472,470,473),(474,472,475),(476,474,477),(478,476,479),(75,478,480),(481,482,483),(484,481,485),(486,484,487),(488,486,489),(490,488,491),(492,490,493),(494,492,495),(496,494,497),(498,496,499),(500,498,501),(502,500,503),(504,502,505),(506,504,507),(508,506,509),(510,508,511),(512,513,400),(514,403,402),(515,402,412),(516,412,411),(517,411,410),(518,410,409),(519,409,408),(520,521,408),(520,408,407),(522,407,406),(523,406,405),(524,405,404),(525,404,401),(526,401,400),(276,275,400),(386,272,400),(273,512,400),(274,273,400),(275,274,400),(238,246,50),(527,528,225),(529,225,239),(246,41,50),(530,531,239),(532,239,238),(533,262,528),(534,535,536),(534,536,271),(537,271,262),(512,273,278),(512,278,277),(535,526,513),(535,513,277),(514,515,415),(530,538,448),(531,448,447),(529,447,446),(527,446,445),(533,445,443),(537,443,441),(534,441,439),(535,439,437),(535,437,435),(526,435,433),(525,433,431),(524,431,429),(523,429,427),(522,427,425),(520,425,423),(521,423,421),(521,421,419),(519,419,417),(517,518,417),(517,417,415),(515,516,415),(453,451,414),(455,453,413),(457,455,416),(459,457,418),(461,459,420),(463,461,422),(465,463,424),(467,465,426),(469,467,428),(471,469,430),(473,471,432),(475,473,434),(477,475,436),(479,477,438),(480,479,440),(79,480,442),(80,79,444),(92,81,80),(485,483,450),(487,485,449),(489,487,452),(491,489,454),(493,491,456),(495,493,458),(497,495,460),(499,497,462),(501,499,464),(503,501,466),(505,503,468),(507,505,470),(509,507,472),(511,509,474),(539,511,476),(72,539,478),(57,52,51),(28,27,36),(535,277,536),(540,541,482),(542,540,481),(543,542,484),(544,543,486),(545,544,488),(546,545,490),(547,546,492),(548,547,494),(549,548,496),(550,549,498),(551,550,500),(552,551,502),(553,552,504),(554,553,506),(555,554,508),(556,557,541),(558,556,540),(559,558,542),(560,559,543),(561,560,544),(562,561,545),(563,562,546),(564,563,547),(565,564,548),(566,565,549),(567,566,550),(568,567,551),(569,568,552),(570,569,553),(571,570,554),(572,571,555),(510,539,72),(573,555,510),(574,575,510),(576,574,510),(577,578,557),(579,577,556),(580,579,558),(581,580,559),(582,581,560),(583,582,561),(584,583,562),(585,584,563),(586,585,564),(587,586,565),(588,587,566),(589,588,567),(590,589,568),(591,590,569),(592,591,570),(593,592,571),(594,595,578),(596,594,577),(597,596,579),(598,597,580),(599,598,581),(600,599,582),(601,600,583),(602,601,584),(603,602,585),(604,603,586),(605,604,587),(606,605,588),(607,606,589),(608,607,590),(609,608,591),(610,611,595),(612,610,594),(613,612,596),(614,613,597),(615,614,598),(616,615,599),(617,616,600),(618,617,601),(619,618,602),(620,619,603),(621,620,604),(622,621,605),(623,622,606),(624,623,607),(625,624,608),(142,625,609),(626,627,628),(629,626,630),(631,629,632),(633,631,634),(635,633,636),(637,635,638),(639,637,640),(641,639,642),(643,641,644),(645,643,646),(647,645,648),(649,647,650),(651,649,652),(653,651,654),(655,656,627),(657,655,626),(658,657,629),(659,658,631),(660,659,633),(661,660,635),(662,661,637),(663,662,639),(664,663,641),(665,664,643),(666,665,645),(667,666,647),(668,667,649),(151,668,651),(669,670,656),(671,669,655),(672,671,657),(673,672,658),(674,673,659),(675,674,660),(676,675,661),(677,676,662),(678,677,663),(679,678,664),(680,679,665),(625,654,652),(624,652,650),(623,650,648),(622,648,646),(621,646,644),(620,644,642),(619,642,640),(618,640,638),(617,638,636),(616,636,634),(615,634,632),(614,632,630),(140,609,138),(592,593,681),(681,682,138),(248,241,245),(683,382,383),(144,625,142),(162,653,146),(146,654,625),(152,151,653),(162,193,653),(136,684,174),(169,137,136),(177,183,172),(685,686,687),(688,689,690),(689,691,692),(693,687,694),(694,695,696),(696,695,697),(692,698,699),(700,701,688),(686,701,700),(694,696,702),(696,697,703),(702,703,704),(702,705,706),(707,708,709),(699,710,711),(712,700,711),(712,713,687),(695,713,697),(687,713,695),(694,709,693),(685,693,709),(692,714,715),(705,704,716),(705,716,706),(717,718,716),(715,714,718),(718,719,720),(718,714,721),(716,720,707),(691,721,714),(688,153,166),(708,192,163),(685,163,159),(686,159,153),(688,701,153),(173,691,689),(192,708,707),(189,707,720),(182,720,719),(183,719,721),(172,721,691),(668,151,150),(680,666,667),(722,667,668),(723,679,680),(724,674,675),(725,675,676),(726,676,677),(727,677,678),(728,678,679),(674,724,729),(730,670,669),(730,669,671),(730,671,672),(731,672,673),(732,673,674),(733,734,735),(736,733,737),(738,736,739),(740,738,741),(742,740,743),(744,745,734),(746,744,733),(747,746,736),(748,747,738),(749,748,740),(750,751,745),(752,750,744),(753,752,746),(754,753,747),(749,754,748),(755,756,751),(757,755,750),(758,757,752),(759,758,753),(760,761,756),(762,760,755),(763,762,757),(764,763,758),(765,766,761),(767,765,760),(627,767,762),(768,627,763),(749,612,754),(769,611,610),(749,742,610),(749,610,612),(612,630,754),(612,613,630),(770,771,772),(773,774,775),(776,777,778),(779,772,771),(780,781,779),(779,782,783),(781,784,782),(781,785,784),(781,786,785),(787,776,774),(787,788,776),(776,788,786),(789,790,774),(773,791,792),(793,789,792),(794,790,789),(795,796,790),(797,787,796),(798,788,787),(799,786,788),(799,800,786),(800,801,785),(801,802,784),(784,802,803),(782,803,804),(791,783,804),(799,805,806),(806,807,800),(807,808,801),(808,809,802),(802,809,810),(803,810,811),(804,811,812),(813,814,798),(813,797,795),(815,795,794),(794,793,816),(793,817,818),(818,817,791),(819,791,812),(816,818,820),(821,822,816),(823,815,822),(824,813,815),(825,814,813),(826,805,814),(826,827,806),(806,827,807),(828,819,812),(829,830,823),(831,824,823),(832,825,824),(833,826,825),(834,827,826),(834,835,807),(835,836,808),(836,837,809),(809,837,838),(810,838,839),(810,839,840),(811,840,841),(812,841,842),(820,828,842),(843,820,844),(845,820,846),(846,820,843),(847,832,831),(848,833,832),(849,834,833),(850,835,834),(835,850,851),(835,851,836),(840,852,853),(841,853,854),(841,854,855),(842,855,856),(843,844,856),(846,843,857),(858,830,829),(859,829,860),(861,862,860),(860,846,863),(863,846,864),(851,865,837),(865,866,838),(866,867,839),(867,868,840),(840,868,852),(869,849,848),(870,871,869),(872,873,869),(869,873,874),(874,875,850),(875,876,851),(876,877,865),(877,878,866),(866,878,879),(879,880,867),(867,880,881),(868,881,882),(852,882,883),(853,883,884),(854,884,885),(856,855,885),(857,856,886),(887,888,873),(888,889,874),(889,890,875),(890,891,876),(891,892,877),(892,893,878),(893,894,879),(895,896,897),(898,899,900),(898,901,902),(901,903,904),(905,888,887),(905,897,889),(900,890,889),(900,899,891),(899,902,892),(902,904,893),(904,906,894),(907,908,909),(910,911,907),(911,912,908),(913,914,895),(914,909,896),(909,915,898),(908,916,915),(912,917,916),(911,918,912),(919,918,911),(912,918,917),(919,920,921),(922,923,921),(923,924,925),(926,927,928),(929,925,930),(925,924,926),(931,932,930),(933,931,934),(935,933,903),(915,935,901),(936,928,937),(934,928,936),(903,936,938),(904,938,906),(906,938,939),(936,937,940),(937,941,942),(940,939,938),(942,943,939),(906,939,944),(944,939,945),(939,943,945),(943,946,945),(894,944,947),(944,945,948),(945,946,949),(948,945,949),(950,951,949),(952,953,951),(954,955,953),(894,947,956),(947,948,957),(948,949,958),(948,958,959),(960,961,962),(961,955,954),(961,960,963),(963,964,955),(963,965,964),(964,966,953),(967,968,969),(966,970,951),(970,971,949),(972,967,973),(965,974,966),(974,972,973),(970,966,973),(970,973,971),(958,949,971),(958,971,975),(973,969,975),(968,976,977),(969,977,978),(978,977,979),(976,980,979),(959,975,978),(981,978,982),(956,957,983),(959,981,983),(880,984,985),(984,983,986),(983,981,987),(881,985,988),(985,986,989),(986,987,990),(990,991,992),(980,993,994),(979,994,995),(991,982,995),(995,996,992),(990,987,982),(988,989,997),(998,992,996),(999,1000,992),(1001,999,998),(1000,989,990),(997,989,1000),(1002,997,999),(1003,1004,997),(884,883,1004),(885,884,1003),(886,885,1005),(1006,886,1007),(1007,1005,1008),(1005,1003,1002),(1008,1002,1001),(1009,1001,1010),(1011,1008,1009),(1012,1009,1013),(1014,831,830),(847,870,848),(1015,895,905),(1016,907,914),(1017,1018,1019),(1020,1019,1021),(1022,1021,1023),(1024,1017,1020),(1025,1020,1022),(1026,1022,1027),(1028,1027,1029),(1027,1023,1030),(1031,858,859),(1031,859,862),(1021,1019,862),(1023,1021,862),(1032,1030,1023),(1032,1023,862),(1032,862,861),(1033,1034,1035),(1036,1035,1037),(1038,1039,1024),(1040,1038,1025),(1041,1040,1026),(1042,1041,1028),(1043,1044,1045),(1044,1043,1046),(1039,1038,1044),(1038,1040,1045),(1040,1041,1036),(1041,1042,1033),(1046,1043,1047),(1048,1049,1047),(1037,1035,1050),(1043,1050,1048),(1050,1051,1052),(1048,1052,1053),(1053,1054,1055),(1035,1034,1056),(1056,1051,1050),(1057,1058,1052),(1058,1059,1053),(1059,1060,1054),(1061,1062,1058),(1058,1062,1063),(1063,1064,1060),(1056,1065,1066),(1056,1066,1057),(1067,1061,1057),(1068,1069,1061),(1069,1070,1062),(1070,1071,1063),(1072,1073,1069),(1073,1074,1070),(1074,1075,1071),(1076,1077,1078),(1073,1079,1076),(1076,1079,1077),(1073,1072,1080),(1080,1081,1079),(1081,1082,1077),(1082,1083,1078),(1083,1084,1085),(1085,1084,1086),(1074,1076,1087),(1087,1076,1088),(1063,1071,1089),(1071,1075,1090),(1075,1087,1091),(1091,1087,1088),(1088,1078,1085),(1091,1088,1092),(1092,1088,1085),(1085,1086,1093),(1092,1085,1093),(1094,1095,1096),(1096,1095,1097),(1090,1091,1096),(1055,1054,1098),(1054,1060,1099),(1098,1100,1101),(1098,1099,1100),(1090,1102,1103),(1103,1064,1089),(1060,1064,1103),(1099,1103,1100),(1103,1104,1100),(1102,1097,1104),(1065,861,863),(1105,863,1106),(1105,1106,1107),(1105,1065,863),(1106,863,864),(1107,1106,864),(1084,1108,1109),(1110,1111,1112),(1110,1113,1111),(1083,1114,1108),(1114,1115,1116),(1117,1110,1116),(1065,1105,1118),(1119,1118,1120),(1066,1065,1067),(1067,1065,1068),(1068,1065,1119),(1072,1068,1119),(1072,1119,1080),(1118,1105,1107),(1119,1121,1122),(1081,1080,1122),(1082,1081,1123),(1114,1083,1082),(1114,1124,1125),(1124,1123,1126),(1122,1127,1126),(1121,1128,1127),(1117,1115,1125),(1125,1126,1129),(1118,1107,1130),(1121,1120,1131),(1126,1127,1132),(1127,1128,1133),(1128,1131,1134),(1135,1133,1134),(1132,1133,1135),(1129,1132,1136),(1117,1129,1137),(1110,1117,1138),(1139,1135,1134),(1136,1135,1139),(1137,1136,1140),(1138,1137,1141),(1142,1113,1138),(1140,1139,1143),(1141,1140,1144),(1142,1141,1145),(1113,1142,1146),(1111,1113,1147),(1148,1112,1111),(1130,1149,1150),(1150,1149,1007),(1130,1107,1006),(1107,864,857),(1100,1150,1011),(1131,1120,1151),(1120,1152,1151),(1151,1152,1153),(1134,1131,1151),(1134,1151,1143),(1152,1120,1130),(1130,1150,1153),(1143,1151,1153),(921,925,929),(937,928,927),(897,896,898),(956,984,880),(1004,883,882),(820,818,819),(1154,770,791),(791,772,783),(774,776,778),(817,792,791),(777,786,781),(776,786,777),(790,796,774),(829,821,845),(814,805,799),(1093,1086,1109),(1109,1112,1148),(1153,1100,1104),(1143,1104,1097),(1144,1097,1095),(1145,1095,1094),(1146,1094,1093),(1148,1147,1093),(1100,1012,1155),(314,994,993),(327,1101,1155),(327,1155,1013),(325,1013,1010),(323,1010,998),(321,998,996),(319,996,995),(317,995,994),(1047,1049,331),(1156,1157,1047),(333,308,1047),(1158,1101,327),(1158,327,329),(1055,1158,329),(1055,329,331),(1049,1055,331),(1153,1150,1100),(205,99,122),(107,123,122),(84,83,89),(86,71,85),(628,754,630),(759,754,628),(1112,1109,1108),(1159,178,174),(185,179,178),(1160,1161,1162),(1163,1160,1164),(1165,1163,1166),(1167,1168,1165),(1169,1167,1166),(1170,1169,1164),(1171,1169,1170),(1172,1171,1173),(1174,1172,1175),(1176,1172,1174),(1177,1176,1178),(1179,1176,1177),(1180,1176,1179),(1172,1176,1180),(1167,1169,1171),(1168,1167,1180),(1181,1165,1168),(1182,1183,1184),(1184,1179,1182),(1185,1186,1182),(1183,1182,1186),(1187,1185,1179),(1188,1187,1179),(1189,1188,1177),(1190,1189,1178),(1191,1190,1178),(1192,1191,1174),(1193,1194,1183),(1195,1193,1186),(1196,1195,1185),(1188,1197,1196),(1198,1197,1188),(1199,1198,1189),(1200,1199,1190),(1201,1200,1191),(43,42,1194),(44,43,1193),(45,44,1195),(46,45,1196),(47,46,1197),(48,47,1198),(49,48,1199),(50,49,1200),(1202,1203,1204),(1204,1205,1202),(1206,1205,1204),(1204,1207,1206),(1208,1207,1204),(1209,1163,1165),(1210,1163,1209),(1209,1208,1210),(1206,1207,1165),(1183,1206,1181),(1211,1206,1183),(1194,1212,1211),(62,1212,1194),(1213,1212,62),(1168,1184,1183),(1168,1183,1181),(1207,1208,1209),(1207,1209,1165),(1211,1214,1205),(1213,1214,1211),(1215,1216,1217),(1218,1215,1219),(1220,1216,1215),(1221,1217,1216),(1222,1217,1221),(1223,1217,1222),(1224,1223,1225),(1226,1223,1224),(1227,1223,1226),(1228,1229,1226),(1226,1224,1230),(1225,1230,1224),(1231,1230,1225),(1221,1216,1220),(1231,1220,1232),(1232,1233,1234),(1215,1218,1232),(1235,1232,1218),(1233,1236,1237),(1238,1233,1237),(1230,1231,1238),(1228,1230,1239),(1240,1228,1241),(95,94,1242),(96,95,1241),(97,96,1239),(98,97,1238),(1231,1221,1220),(1221,1231,1222),(1243,1244,1245),(1246,1247,1248),(1249,1246,1250),(1251,1252,1245),(1253,1254,1251),(1255,1254,1253),(1256,1257,1250),(1258,1259,1248),(1258,1243,1252),(1253,1251,1260),(1255,1253,1261),(1262,1261,1263),(1263,1261,1260),(1264,1265,1266),(1267,1268,1250),(1259,1269,1267),(1270,1269,1259),(1255,1270,1254),(1270,1252,1251),(1245,1260,1251),(1271,1257,1256),(1272,1273,1263),(1266,1272,1263),(1274,1275,1273),(1271,1276,1275),(1277,1274,1272),(1271,1274,1277),(1278,1272,1266),(1279,1280,1281),(1282,1279,1283),(1284,1282,1285),(1286,1284,1287),(1288,1286,1289),(1290,1291,1292),(1293,1294,1295),(1296,1297,1298),(1299,1296,1300),(1286,1299,1301),(1299,1302,1296),(1288,1302,1299),(1303,1304,1297),(1305,1303,1296),(1306,1305,1302),(1307,1308,1304),(1309,1307,1303),(1291,1309,1305),(1300,1298,1310),(1301,1300,1311),(1284,1301,1312),(1279,1282,1313),(1314,1313,1282),(1315,1314,1312),(1316,1315,1311),(1317,1318,1313),(1315,1317,1314),(1319,1317,1315),(1319,1320,1318),(1321,1322,1320),(1323,1321,1319),(1324,1323,1325),(1290,1295,1326),(1327,1322,1328),(1329,1328,1322),(1330,1329,1321),(1331,1330,1323),(1332,1290,1328),(1333,1332,1329),(1334,1333,1330),(1307,1309,1332),(1308,1307,1333),(1309,1291,1290),(1292,1291,1306),(1335,1336,1337),(1338,1335,1339),(1340,1338,1341),(1342,1340,1343),(1243,1344,1345),(1344,1346,1347),(1346,1348,1349),(1348,1350,1351),(1350,1352,1353),(1345,1347,1354),(1347,1349,1355),(1349,1351,1356),(1351,1353,1357),(1358,1354,1359),(1354,1355,1360),(1355,1356,1361),(1356,1357,1362),(1363,1359,1364),(1359,1360,1365),(1360,1361,1366),(1361,1362,1367),(1249,1337,1336),(1246,1336,1368),(1342,1369,1370),(1340,1370,1371),(1336,1335,1372),(1338,1371,1372),(1373,1344,1243),(1247,1368,1373),(1374,1352,1350),(1375,1350,1348),(1376,1348,1346),(1377,1346,1344),(1369,1374,1375),(1370,1375,1376),(1371,1376,1377),(1372,1377,1373),(1363,1378,1278),(1367,1379,1380),(1366,1380,1381),(1365,1381,1382),(1264,1358,1363),(1383,1249,1257),(1383,1277,1384),(1385,1384,1382),(1278,1378,1384),(1364,1382,1384),(1383,1385,1337),(1379,1386,1387),(1380,1387,1388),(1386,1389,1343),(1387,1343,1341),(1388,1341,1339),(1390,1339,1337),(1173,1391,1392),(1391,1393,1394),(1393,1395,1396),(1395,1397,1398),(1397,1399,1400),(1399,1401,1402),(1401,1403,1404),(1403,1405,1406),(1170,1407,1391),(1407,1408,1393),(1408,1409,1395),(1409,1410,1397),(1410,1411,1399),(1411,1412,1401),(1412,1413,1403),(1413,1414,1405),(1201,1192,1389),(1400,1352,1374),(1398,1374,1369),(1396,1369,1342),(1394,1342,1389),(1175,1392,1389),(1415,1407,1170),(1416,1411,1410),(1417,1410,1409),(1418,1409,1408),(1419,1408,1407),(1357,1404,1406),(1413,1420,1421),(1352,1400,1402),(1353,1402,1404),(1411,1416,1422),(1412,1422,1420),(280,1423,1424),(1423,1425,1426),(1425,1427,1428),(1427,1429,1430),(1429,1431,1432),(1431,1433,1434),(1433,1435,1436),(1435,1437,1438),(1437,1439,1440),(1439,1441,1442),(1441,1443,1444),(1443,1445,1446),(1445,1447,1448),(1447,306,359),(1449,1450,1156),(312,311,1451),(1452,1453,1451),(1452,1451,1454),(1455,1454,1456),(1457,1456,1458),(1459,1458,1460),(1461,1460,1462),(1463,1462,1464),(1465,1464,1466),(1467,1466,1468),(1469,1468,1470),(1471,1470,1450),(1472,1213,64),(337,336,1473),(1474,1473,1475),(1476,1475,1477),(1478,1477,1479),(1480,1479,1481),(1482,1481,1483),(1484,1483,1485),(1486,1485,1487),(1486,1487,1488),(1489,1488,1490),(1491,1490,1205),(1492,1205,1214),(1493,1214,1213),(1424,1449,310),(1447,1472,335),(1423,280,337),(1423,337,1474),(1425,1474,1476),(1427,1476,1478),(1429,1478,1480),(1431,1480,1482),(1433,1482,1484),(1435,1484,1486),(1437,1486,1489),(1439,1489,1491),(1441,1491,1492),(1443,1492,1493),(1445,1493,1472),(359,312,1453),(1448,1453,1452),(1446,1452,1455),(1442,1444,1455),(1442,1455,1457),(1440,1457,1459),(1438,1459,1461),(1436,1461,1463),(1434,1463,1465),(1432,1465,1467),(1430,1467,1469),(1428,1469,1471),(1426,1471,1449),(1490,1202,1205),(1483,1494,1495),(1485,1495,1496),(1487,1496,1497),(1498,1203,1202),(1490,1488,1498),(1488,1497,1498),(1499,1500,1501),(1160,1163,1210),(1502,1210,1503),(1504,1503,1505),(1506,1505,1507),(1508,1507,1509),(1510,1509,1511),(1512,1511,1513),(1514,1513,1501),(1203,1503,1210),(1515,1499,1501),(1515,1501,1513),(1494,1513,1511),(1495,1511,1509),(1496,1509,1507),(1497,1507,1505),(1498,1505,1503),(1481,1515,1494),(336,382,1516),(1473,1516,1517),(1475,1517,1518),(1477,1518,1499),(1479,1499,1515),(1519,1520,1161),(1516,1521,1522),(1517,1522,1523),(1518,1523,1524),(1499,1524,1525),(1500,1525,1526),(1514,1526,1527),(1512,1527,1528),(1510,1528,1529),(1508,1529,1530),(1506,1530,1531),(1504,1531,1532),(1502,1532,1519),(1415,1162,1161),(1533,1520,1519),(1533,1519,1532),(1534,1521,683),(1535,1532,1531),(1536,1531,1530),(1536,1530,1529),(1537,1529,1528),(1538,1528,1527),(1539,1527,1526),(1540,1526,1525),(1541,1525,1524),(1542,1524,1523),(1543,1523,1522),(1544,1522,1521),(414,1545,1546),(1545,1547,1548),(1547,1549,1550),(1549,1551,1552),(1551,1553,1554),(1553,1555,1556),(1555,1557,1558),(1557,1559,1560),(1559,1561,1562),(1561,1563,1564),(1563,1565,1566),(1565,1567,1568),(1567,1569,1570),(1569,1571,1572),(1571,1573,1574),(1573,1575,1576),(1575,1240,1577),(1240,1242,1578),(1242,94,538),(450,1579,1580),(1579,1581,1582),(1581,1583,1584),(1583,1585,1586),(1585,1587,1588),(1587,1589,1590),(1589,1591,1592),(1591,1593,1594),(1593,1595,1596),(1595,1597,1598),(1597,1599,1600),(1599,1601,1602),(1601,1603,1604),(1603,1605,1606),(1605,1607,1608),(1607,1223,1227),(482,1609,1610),(1609,1611,1612),(1611,1613,1614),(1613,1615,1616),(1615,1617,1618),(1617,1619,1620),(1619,1621,1622),(1621,1623,1624),(1623,1625,1626),(1625,1627,1628),(1627,1629,1630),(1629,1631,1632),(1631,1633,1634),(1633,1635,1636),(1635,1637,1638),(1533,1639,1640),(403,514,1641),(1534,1641,1642),(1544,1642,1643),(1543,1643,1644),(1542,1644,1645),(1541,1645,1646),(1540,1646,1647),(1540,1647,1648),(1539,1648,1649),(1538,1649,1650),(1537,1650,1651),(1536,1651,1652),(1535,1652,1639),(1418,1419,1415),(1533,1415,1520),(1533,1640,1416),(1533,1416,1417),(1533,1417,1418),(1386,1379,532),(1406,1653,1654),(1362,1654,1655),(50,1201,1386),(1655,530,532),(1379,1367,532),(1405,1656,1653),(1421,1657,1658),(1421,1658,1659),(1414,1659,1656),(1422,1416,1640),(1422,1640,1639),(1639,1652,1657),(1420,1639,1657),(415,1641,514),(538,530,1655),(1578,1655,1654),(1577,1654,1653),(1576,1653,1656),(1574,1656,1659),(1572,1659,1658),(1570,1658,1657),(1566,1568,1657),(1566,1657,1652),(1564,1652,1651),(1562,1651,1650),(1560,1650,1649),(1558,1649,1648),(1556,1648,1647),(1554,1647,1646),(1550,1552,1646),(1550,1646,1645),(1548,1645,1644),(1546,1644,1643),(1546,1643,1642),(415,1642,1641),(451,1580,1545),(1580,1582,1547),(1582,1584,1549),(1584,1586,1551),(1586,1588,1553),(1588,1590,1555),(1590,1592,1557),(1592,1594,1559),(1594,1596,1561),(1596,1598,1563),(1598,1600,1565),(1600,1602,1567),(1602,1604,1569),(1604,1606,1571),(1606,1608,1573),(1608,1227,1575),(1227,1229,1240),(1229,1228,1240),(483,1610,1579),(1610,1612,1581),(1612,1614,1583),(1614,1616,1585),(1616,1618,1587),(1618,1620,1589),(1620,1622,1591),(1622,1624,1593),(1624,1626,1595),(1626,1628,1597),(1628,1630,1599),(1630,1632,1601),(1632,1634,1603),(1634,1636,1605),(1636,1638,1607),(1638,1217,1223),(1204,1203,1208),(1196,1187,1188),(1421,1420,1657),(541,1660,1609),(1660,1661,1611),(1661,1662,1613),(1662,1663,1615),(1663,1664,1617),(1664,1665,1619),(1665,1666,1621),(1666,1667,1623),(1667,1668,1625),(1668,1669,1627),(1669,1670,1629),(1670,1671,1631),(1671,1672,1633),(1672,1673,1635),(1673,1674,1637),(557,1675,1660),(1675,1676,1661),(1676,1677,1662),(1677,1678,1663),(1678,1679,1664),(1679,1680,1665),(1680,1681,1666),(1681,1682,1667),(1682,1683,1668),(1683,1684,1669),(1684,1685,1670),(1685,1686,1671),(1686,1687,1672),(1687,1688,1673),(1688,1689,1674),(1689,1690,1691),(1638,1637,1692),(1674,1691,1693),(1637,1693,1694),(1637,1694,1692),(578,1695,1675),(1695,1696,1676),(1696,1697,1677),(1697,1698,1678),(1698,1699,1679),(1699,1700,1680),(1700,1701,1681),(1701,1702,1682),(1702,1703,1683),(1703,1704,1684),(1704,1705,1685),(1705,1706,1686),(1706,1707,1687),(1707,1708,1688),(1708,1709,1689),(1709,1710,1690),(595,1711,1695),(1711,1712,1696),(1712,1713,1697),(1713,1714,1698),(1714,1715,1699),(1715,1716,1700),(1716,1717,1701),(1717,1718,1702),(1718,1719,1703),(1719,1720,1704),(1720,1721,1705),(1721,1722,1706),(1722,1723,1707),(1723,1724,1708),(1724,1725,1709),(611,1726,1711),(1726,1727,1712),(1727,1728,1713),(1728,1729,1714),(1729,1730,1715),(1730,1731,1716),(1731,1732,1717),(1732,1733,1718),(1733,1734,1719),(1734,1735,1720),(1735,1736,1721),(1736,1737,1722),(1737,1738,1723),(1738,1739,1724),(1739,1740,1725),(1740,1287,1285),(627,1741,1742),(1741,1743,1744),(1743,1745,1746),(1745,1747,1748),(1747,1749,1750),(1749,1751,1752),(1751,1753,1754),(1753,1755,1756),(1755,1757,1758),(1757,1759,1760),(1759,1761,1762),(1761,1763,1764),(1763,1765,1766),(1765,1767,1768),(656,1769,1741),(1769,1770,1743),(1770,1771,1745),(1771,1772,1747),(1772,1773,1749),(1773,1774,1751),(1774,1775,1753),(1775,1776,1755),(1776,1777,1757),(1777,1778,1759),(1778,1779,1761),(1779,1780,1763),(1780,1781,1765),(1781,1293,1767),(670,1782,1769),(1782,1783,1770),(1783,1784,1771),(1784,1785,1772),(1785,1786,1773),(1786,1787,1774),(1787,1788,1775),(1788,1789,1776),(1789,1790,1777),(1790,1791,1778),(1791,1792,1779),(1766,1740,1739),(1764,1739,1738),(1762,1738,1737),(1760,1737,1736),(1758,1736,1735),(1756,1735,1734),(1754,1734,1733),(1752,1733,1732),(1750,1732,1731),(1748,1731,1730),(1746,1730,1729),(1744,1729,1728),(1283,1725,1285),(1710,1709,1725),(1281,1793,1725),(1381,1388,1390),(382,683,1521),(1287,1740,1289),(1767,1306,1288),(1766,1768,1289),(1293,1292,1794),(1767,1794,1306),(1795,1280,1313),(1280,1279,1313),(1796,1325,1315),(1797,1798,1799),(1800,1801,1802),(1803,1800,1804),(1805,1806,1799),(1807,1808,1805),(1809,1808,1807),(1810,1811,1804),(1812,1813,1802),(1812,1797,1806),(1807,1805,1814),(1809,1807,1815),(1816,1815,1817),(1817,1815,1814),(1818,1819,1820),(1821,1822,1804),(1813,1823,1821),(1824,1823,1813),(1809,1824,1808),(1824,1806,1805),(1799,1814,1805),(1799,1798,1818),(1825,1811,1810),(1826,1827,1817),(1820,1826,1817),(1828,1829,1827),(1825,1830,1829),(1831,1828,1826),(1825,1828,1831),(1832,1826,1820),(1833,1803,1811),(1297,1801,1800),(1334,1818,1798),(1308,1798,1797),(1304,1797,1812),(1297,1812,1801),(1803,1310,1298),(1818,1334,1331),(1819,1331,1324),(1832,1324,1796),(1831,1796,1316),(1833,1316,1310),(1293,1781,1834),(1779,1792,1835),(1780,1835,1834),(1792,1791,1836),(1786,1837,1838),(1787,1838,1839),(1788,1839,1840),(1789,1840,1841),(1790,1841,1836),(1837,1786,1842),(1782,670,730),(1783,1782,730),(1783,730,731),(1784,731,732),(1785,732,1842),(1843,1844,1845),(1844,1846,735),(1846,1847,737),(1847,1848,739),(1848,1849,741),(1849,1850,743),(1850,1851,769),(1852,1853,1844),(1853,1854,1846),(1854,1855,1847),(1855,1856,1848),(1856,1857,1849),(1857,1858,1850),(1858,1859,1851),(1860,1861,1853),(1861,1862,1854),(1862,1863,1855),(1863,1864,1856),(1864,1865,1857),(1865,1866,1858),(1858,1866,1859),(1867,1868,1861),(1868,1869,1862),(1869,1870,1863),(1870,1871,1864),(1871,1872,1865),(1872,1873,1866),(1874,1875,1868),(1875,1876,1869),(1876,1877,1870),(1877,1878,1871),(1878,1879,1872),(1879,1880,1873),(1881,1882,1875),(1882,766,1876),(766,765,1877),(765,767,1878),(767,627,1879),(627,768,1880),(1883,1884,1882),(1884,761,766),(1885,1886,1884),(1886,756,761),(1887,1888,1886),(1888,751,756),(1889,1890,1888),(1890,745,751),(1891,1892,1890),(1892,734,745),(1893,1845,1892),(1845,735,734),(1866,1727,1859),(611,769,1851),(1726,1851,1859),(1727,1726,1859),(1866,1742,1727),(1742,1728,1727),(1894,1895,1896),(1897,1898,1899),(1900,1901,1902),(1903,1904,1905),(1906,1907,1905),(1908,1904,1903),(1909,1906,1904),(1909,1910,1906),(1910,1911,1906),(1902,1912,1913),(1902,1914,1912),(1911,1914,1902),(1915,1916,1898),(1896,1898,1916),(1916,1917,1918),(1915,1919,1917),(1913,1920,1919),(1912,1921,1920),(1914,1922,1921),(1911,1923,1922),(1911,1924,1923),(1925,1924,1911),(1926,1925,1910),(1926,1909,1908),(1927,1908,1928),(1929,1928,1896),(1930,1931,1923),(1932,1930,1923),(1933,1932,1924),(1934,1933,1925),(1934,1926,1927),(1935,1927,1929),(1936,1929,1896),(1937,1938,1921),(1921,1938,1939),(1920,1939,1940),(1917,1919,1940),(1941,1917,1942),(1918,1941,1943),(1944,1896,1943),(1941,1942,1945),(1940,1946,1945),(1939,1947,1946),(1938,1948,1947),(1937,1949,1948),(1931,1950,1949),(1951,1950,1931),(1932,1951,1930),(1944,1943,1952),(1953,1954,1946),(1948,1955,1953),(1949,1956,1955),(1950,1957,1956),(1951,1958,1957),(1959,1958,1951),(1960,1959,1932),(1961,1960,1933),(1961,1934,1935),(1962,1963,1935),(1962,1935,1936),(1964,1936,1944),(1965,1944,1952),(1952,1966,1967),(1967,1966,1968),(1966,1945,1969),(1968,1966,1970),(1956,847,1014),(1957,1971,847),(1958,1972,1971),(1959,1973,1972),(1974,1973,1959),(1960,1974,1959),(1975,1964,1965),(1976,1977,1965),(1976,1965,1978),(1979,1978,1967),(1967,1968,1980),(1968,1970,1981),(1953,858,1982),(1954,1982,1983),(1969,1983,1984),(1970,1969,1984),(1981,1970,1985),(1986,1974,1960),(1987,1986,1961),(1988,1987,1963),(1989,1988,1962),(1975,1989,1964),(1972,1990,870),(1990,871,870),(1991,872,871),(1991,1990,1972),(1992,1993,1972),(1994,1992,1973),(1995,1994,1974),(1996,1995,1986),(1997,1996,1987),(1998,1997,1987),(1998,1988,1989),(1999,1989,1975),(2000,1975,1977),(2001,1977,1976),(2002,1976,1979),(1979,2003,2004),(2003,1980,2005),(2006,887,872),(2007,2006,1991),(2008,2007,1993),(2009,2008,1992),(2010,2009,1994),(2011,2010,1995),(2012,2011,1996),(2013,2014,2015),(2016,2017,2018),(2019,2018,2017),(2020,2019,2021),(2006,2015,2022),(2023,2015,2006),(2008,2016,2023),(2017,2016,2008),(2021,2017,2009),(2024,2021,2010),(2025,2024,2011),(2026,2027,2028),(2029,910,1016),(2030,2029,2027),(2028,913,1015),(2031,2028,2014),(2032,2031,2013),(2033,2026,2031),(2034,2030,2026),(2030,2035,2029),(2035,919,910),(2034,2035,2030),(920,919,2035),(2036,922,920),(2037,2036,2038),(2039,2040,2041),(2042,2043,2044),(2037,2042,2040),(2044,2045,2041),(2045,2046,2020),(2046,2047,2019),(2047,2032,2018),(2048,2049,2050),(2049,2041,2020),(2050,2020,2024),(2025,2051,2024),(2052,2051,2025),(2048,2050,2051),(2053,2048,2054),(2051,2052,2054),(2055,2056,2054),(2052,2025,2012),(2057,2052,2058),(2057,2055,2052),(2057,2059,2055),(2060,2058,2012),(2057,2058,2060),(2061,2059,2057),(2061,2057,2062),(2063,2064,2059),(2065,2066,2064),(2067,2068,2066),(2060,2012,1997),(2062,2060,2069),(2070,2061,2062),(2070,2062,2071),(2072,960,2073),(2067,2072,2074),(963,960,2072),(2075,963,2072),(2075,965,963),(2076,2075,2067),(968,967,2077),(2078,2076,2065),(2079,2078,2063),(2077,967,972),(974,965,2075),(972,974,2076),(2077,2076,2078),(2079,2077,2078),(2079,2061,2070),(2079,2070,2080),(2081,2077,2079),(976,968,2081),(2082,2081,2083),(2082,2084,2085),(980,976,2082),(2083,2080,2086),(2084,2086,2087),(2071,2069,2088),(2086,2080,2071),(2088,1998,1999),(2089,2088,2090),(2086,2089,2091),(2090,1999,2000),(2091,2090,2092),(2087,2091,2093),(2094,2095,2096),(993,980,2097),(2098,2097,2085),(2099,2085,2094),(2100,2099,2094),(2087,2095,2094),(2093,2092,2101),(2100,2102,2103),(2096,2104,2103),(2104,2105,2106),(2095,2093,2096),(2093,2107,2104),(2107,2108,2105),(2101,2109,2108),(2001,2002,2109),(2002,2110,2111),(2110,2004,2112),(2004,2005,2113),(2111,2112,2114),(2109,2111,2115),(2108,2115,2116),(2105,2116,2117),(2115,2114,2118),(2116,2118,2119),(1955,1014,858),(1971,870,847),(2014,1015,2022),(2027,1016,913),(1018,1017,2120),(2121,2120,2122),(2123,2122,2124),(1017,1024,2125),(2120,2125,2126),(2122,2126,2127),(2124,2127,2128),(2129,2124,2130),(1982,858,1031),(1031,1018,2121),(1983,2121,2123),(1983,2123,2129),(2129,2131,2132),(1983,2129,2132),(1984,1983,2132),(2133,2134,2135),(2136,2135,2137),(1039,2138,2125),(2138,2139,2126),(2139,2140,2127),(2140,2141,2128),(2142,2143,2144),(2143,2142,2145),(2138,1039,2145),(2139,2138,2142),(2140,2139,2137),(2141,2140,2135),(2143,1046,1157),(2146,2147,2143),(2136,2144,2143),(2147,2148,2143),(2149,2148,2147),(2150,2147,2146),(2151,2152,2146),(2153,2133,2136),(2149,2153,2136),(2154,2155,2149),(2156,2154,2150),(2157,2156,2152),(2158,2159,2155),(2158,2154,2156),(2160,2161,2156),(2162,2163,2153),(2162,2153,2149),(2159,2164,2162),(2165,2166,2164),(2167,2165,2159),(2168,2167,2158),(2169,2170,2166),(2171,2169,2165),(2172,2171,2167),(2173,2174,2175),(2176,2169,2171),(2173,2176,2174),(2177,2170,2169),(2178,2177,2169),(2179,2178,2176),(2180,2179,2173),(2181,2180,2182),(2183,2181,2184),(2174,2171,2172),(2175,2174,2185),(2168,2161,2160),(2172,2168,2186),(2185,2172,2187),(2175,2185,2188),(2184,2182,2175),(2175,2188,2189),(2184,2175,2190),(2191,2183,2184),(2184,2190,2192),(2193,2192,2190),(2193,2189,2194),(2188,2187,2194),(2151,2195,2196),(2157,2151,2197),(2198,2197,2196),(2198,2199,2197),(2194,2187,2186),(2186,2160,2200),(2160,2157,2199),(2198,2200,2199),(2198,2201,2200),(2202,2194,2200),(1985,1984,2163),(2203,1985,2204),(2205,2203,2204),(1985,2163,2204),(1981,1985,2203),(1981,2203,2205),(2206,2181,2183),(2207,2208,2209),(2207,2210,2208),(2211,2180,2181),(2212,2211,2206),(2208,2213,2212),(2204,2163,2214),(2215,2214,2216),(2164,2163,2162),(2166,2163,2164),(2214,2163,2166),(2214,2166,2170),(2177,2214,2170),(2205,2204,2215),(2216,2214,2177),(2177,2178,2217),(2178,2179,2218),(2180,2211,2218),(2218,2211,2212),(2217,2218,2219),(2220,2221,2217),(2222,2216,2221),(2219,2212,2213),(2223,2219,2213),(2205,2215,2224),(2224,2216,2222),(2220,2223,2225),(2222,2220,2226),(2227,2222,2228),(2229,2228,2230),(2228,2226,2231),(2226,2225,2232),(2225,2213,2233),(2213,2208,2210),(2229,2230,2234),(2230,2231,2235),(2231,2232,2236),(2232,2233,2237),(2233,2210,2237),(2234,2235,2238),(2235,2236,2239),(2236,2237,2240),(2237,2210,2241),(2210,2207,2242),(2207,2243,2242),(2244,2113,2245),(2113,2244,2114),(2205,2245,2113),(1981,2205,2005),(2244,2198,2118),(2246,2224,2227),(2246,2247,2224),(2248,2247,2246),(2246,2227,2229),(2246,2229,2234),(2245,2224,2247),(2244,2245,2247),(2248,2246,2249),(2042,2038,2035),(2049,2048,2053),(2013,2023,2016),(2088,2069,1997),(2001,2101,2092),(1941,1966,1952),(1895,1899,1898),(1928,1903,1896),(1902,1897,2250),(1896,2251,1918),(1911,1901,1907),(1901,1911,1902),(1897,1913,1915),(1946,1954,1969),(1931,1937,1922),(2252,2183,2191),(2243,2252,2191),(2198,2248,2249),(2201,2249,2238),(2202,2238,2239),(2193,2239,2240),(2192,2240,2241),(2191,2241,2242),(2118,2198,2253),(2098,1451,311),(2119,2253,1464),(2119,1464,1462),(2117,1462,1460),(2106,1460,1458),(2103,1458,1456),(2100,1456,1454),(2099,1454,1451),(2146,2254,1470),(1157,1156,1450),(2254,1450,1470),(1464,2253,2196),(1466,1464,2196),(1466,2196,2195),(1468,1466,2195),(1468,2195,2146),(2198,2244,2248),(1244,1345,1358),(1260,1245,1244),(1231,1234,1233),(1232,1235,1236),(1742,1866,628),(1866,1873,768),(2252,2243,2209),(1320,2255,1795),(1322,1327,2255),(1873,1880,768),(764,759,768),(2,10,0),(4,2,1),(4,5,6),(2,4,7),(10,2,8),(12,9,8),(14,12,11),(17,15,13),(21,19,16),(11,20,16),(20,11,8),(21,20,7),(19,24,25),(18,19,27),(17,18,28),(15,17,30),(14,15,31),(25,23,33),(26,25,34),(27,26,35),(29,28,37),(30,29,38),(31,30,39),(32,31,40),(34,33,42),(35,34,43),(36,35,44),(37,36,45),(38,37,46),(39,38,47),(40,39,48),(41,40,49),(22,5,56),(23,60,61),(42,33,61),(64,62,61),(55,54,65),(61,60,65),(68,72,66),(71,67,66),(76,74,72),(80,78,75),(82,78,80),(74,76,82),(84,71,70),(90,89,83),(91,90,82),(93,91,81),(91,93,94),(90,91,95),(89,90,96),(87,89,97),(101,107,99),(104,125,102),(106,104,103),(113,104,106),(102,125,114),(114,101,100),(116,123,108),(117,116,110),(118,119,116),(120,123,116),(123,120,121),(125,104,113),(125,124,126),(101,114,126),(109,108,101),(129,112,106),(130,118,131),(132,131,129),(134,130,132),(135,133,132),(121,120,130),(138,682,136),(140,138,137),(142,140,139),(144,142,141),(146,144,143),(149,152,147),(152,149,150),(155,166,153),(157,155,154),(141,157,156),(143,156,158),(154,153,159),(158,154,160),(145,158,161),(160,159,163),(161,160,164),(162,161,165),(167,173,166),(168,167,155),(139,168,157),(168,139,169),(167,168,170),(173,167,171),(170,169,174),(177,171,175),(175,174,178),(176,178,179),(177,176,180),(183,177,181),(184,186,149),(186,184,179),(180,179,184),(181,180,187),(182,181,188),(187,184,148),(188,187,190),(189,188,191),(191,190,165),(192,191,164),(190,148,147),(193,162,147),(196,227,194),(198,196,195),(200,198,197),(202,200,199),(99,205,203),(205,207,204),(207,209,206),(209,211,208),(211,215,210),(212,213,207),(213,214,209),(214,216,211),(216,220,215),(217,218,213),(218,219,214),(219,221,216),(221,225,220),(222,223,218),(223,224,219),(224,226,221),(226,239,225),(103,194,227),(102,230,194),(199,229,228),(197,231,229),(230,237,195),(195,237,231),(115,100,203),(115,232,230),(234,208,210),(235,206,208),(236,204,206),(232,203,204),(229,234,233),(231,235,234),(237,236,235),(230,232,236),(121,134,222),(226,240,238),(224,241,240),(223,245,241),(121,217,212),(128,106,105),(242,243,133),(244,245,243),(133,243,222),(222,243,245),(105,227,242),(240,247,246),(241,248,247),(247,200,202),(248,198,200),(244,196,198),(242,227,196),(14,251,249),(251,253,250),(253,255,252),(255,257,254),(257,259,256),(259,261,258),(261,263,260),(263,528,262),(12,249,264),(249,250,265),(250,252,266),(252,254,267),(254,256,268),(256,258,269),(258,260,270),(260,262,271),(246,202,32),(257,233,210),(255,228,233),(253,201,228),(251,202,201),(32,202,251),(10,9,264),(274,267,268),(275,266,267),(276,265,266),(272,264,265),(225,528,263),(271,536,277),(215,261,259),(220,263,261),(269,278,273),(270,277,278),(281,283,279),(283,285,282),(285,287,284),(287,289,286),(289,291,288),(291,293,290),(293,295,292),(295,297,294),(297,299,296),(299,301,298),(301,303,300),(303,305,302),(305,307,304),(307,359,306),(310,1156,308),(313,314,311),(316,317,314),(318,319,317),(320,321,319),(322,323,321),(324,325,323),(326,327,325),(328,329,327),(330,331,329),(332,333,331),(309,308,333),(335,64,63),(338,339,336),(340,341,339),(342,343,341),(344,345,343),(346,347,345),(348,349,347),(350,352,349),(353,354,351),(355,356,354),(357,54,356),(358,65,54),(334,63,65),(281,310,309),(306,335,334),(282,338,337),(284,340,338),(286,342,340),(288,344,342),(290,346,344),(292,348,346),(294,350,348),(296,353,350),(298,355,353),(300,357,355),(302,358,357),(304,334,358),(307,313,312),(305,315,313),(303,316,315),(299,318,316),(297,320,318),(295,322,320),(293,324,322),(291,326,324),(289,328,326),(287,330,328),(285,332,330),(283,309,332),(352,361,360),(351,362,361),(354,364,362),(53,363,354),(368,59,3),(369,370,59),(371,372,370),(373,374,372),(375,376,374),(377,378,376),(379,380,378),(366,365,380),(57,59,370),(360,380,365),(361,378,380),(362,376,378),(364,374,376),(363,372,374),(52,370,372),(349,360,381),(339,383,382),(341,384,383),(343,385,384),(345,367,385),(347,381,367),(1,0,386),(384,389,388),(385,390,389),(367,391,390),(366,392,391),(379,393,392),(377,394,393),(375,395,394),(373,396,395),(371,397,396),(369,398,397),(368,399,398),(1,387,399),(386,0,10),(401,399,387),(403,683,388),(404,398,399),(405,396,397),(406,395,396),(407,394,395),(408,393,394),(409,392,393),(410,391,392),(411,390,391),(412,389,390),(402,388,389),(415,417,413),(417,419,416),(419,421,418),(421,423,420),(423,425,422),(425,427,424),(427,429,426),(429,431,428),(431,433,430),(433,435,432),(435,437,434),(437,439,436),(439,441,438),(441,443,440),(443,445,442),(445,446,444),(446,447,92),(447,448,93),(448,538,94),(451,453,449),(453,455,452),(455,457,454),(457,459,456),(459,461,458),(461,463,460),(463,465,462),(465,467,464),(467,469,466),(469,471,468),(471,473,470),(473,475,472),(475,477,474),(477,479,476),(479,480,478),(480,79,75),(483,485,481),(485,487,484),(487,489,486),(489,491,488),(491,493,490),(493,495,492),(495,497,494),(497,499,496),(499,501,498),(501,503,500),(503,505,502),(505,507,504),(507,509,506),(509,511,508),(511,539,510),(402,515,514),(412,516,515),(411,517,516),(410,518,517),(409,519,518),(408,521,519),(407,522,520),(406,523,522),(405,524,523),(404,525,524),(401,526,525),(400,513,526),(400,272,276),(50,532,238),(225,529,527),(239,531,529),(239,532,530),(528,527,533),(271,537,534),(262,533,537),(277,513,512),(448,531,530),(447,529,531),(446,527,529),(445,533,527),(443,537,533),(441,534,537),(439,535,534),(435,526,535),(433,525,526),(431,524,525),(429,523,524),(427,522,523),(425,520,522),(423,521,520),(419,519,521),(417,518,519),(415,516,517),(414,413,453),(413,416,455),(416,418,457),(418,420,459),(420,422,461),(422,424,463),(424,426,465),(426,428,467),(428,430,469),(430,432,471),(432,434,473),(434,436,475),(436,438,477),(438,440,479),(440,442,480),(442,444,79),(444,92,80),(450,449,485),(449,452,487),(452,454,489),(454,456,491),(456,458,493),(458,460,495),(460,462,497),(462,464,499),(464,466,501),(466,468,503),(468,470,505),(470,472,507),(472,474,509),(474,476,511),(476,478,539),(478,75,72),(482,481,540),(481,484,542),(484,486,543),(486,488,544),(488,490,545),(490,492,546),(492,494,547),(494,496,548),(496,498,549),(498,500,550),(500,502,551),(502,504,552),(504,506,553),(506,508,554),(508,510,555),(541,540,556),(540,542,558),(542,543,559),(543,544,560),(544,545,561),(545,546,562),(546,547,563),(547,548,564),(548,549,565),(549,550,566),(550,551,567),(551,552,568),(552,553,569),(553,554,570),(554,555,571),(555,573,572),(72,576,510),(510,575,573),(557,556,577),(556,558,579),(558,559,580),(559,560,581),(560,561,582),(561,562,583),(562,563,584),(563,564,585),(564,565,586),(565,566,587),(566,567,588),(567,568,589),(568,569,590),(569,570,591),(570,571,592),(571,572,593),(578,577,594),(577,579,596),(579,580,597),(580,581,598),(581,582,599),(582,583,600),(583,584,601),(584,585,602),(585,586,603),(586,587,604),(587,588,605),(588,589,606),(589,590,607),(590,591,608),(591,592,609),(595,594,610),(594,596,612),(596,597,613),(597,598,614),(598,599,615),(599,600,616),(600,601,617),(601,602,618),(602,603,619),(603,604,620),(604,605,621),(605,606,622),(606,607,623),(607,608,624),(608,609,625),(609,140,142),(628,630,626),(630,632,629),(632,634,631),(634,636,633),(636,638,635),(638,640,637),(640,642,639),(642,644,641),(644,646,643),(646,648,645),(648,650,647),(650,652,649),(652,654,651),(654,146,653),(627,626,655),(626,629,657),(629,631,658),(631,633,659),(633,635,660),(635,637,661),(637,639,662),(639,641,663),(641,643,664),(643,645,665),(645,647,666),(647,649,667),(649,651,668),(651,653,151),(656,655,669),(655,657,671),(657,658,672),(658,659,673),(659,660,674),(660,661,675),(661,662,676),(662,663,677),(663,664,678),(664,665,679),(665,666,680),(652,624,625),(650,623,624),(648,622,623),(646,621,622),(644,620,621),(642,619,620),(640,618,619),(638,617,618),(636,616,617),(634,615,616),(632,614,615),(630,613,614),(681,609,592),(138,609,681),(245,244,248),(383,388,683),(146,145,162),(625,144,146),(653,193,152),(174,169,136),(172,171,177),(687,693,685),(690,711,688),(692,690,689),(699,690,692),(688,711,700),(700,687,686),(702,709,694),(703,702,696),(704,705,702),(706,709,702),(709,706,707),(711,690,699),(711,710,712),(687,700,712),(695,694,687),(709,708,685),(715,698,692),(716,704,717),(718,717,715),(720,716,718),(721,719,718),(707,706,716),(714,692,691),(166,689,688),(163,685,708),(159,686,685),(153,701,686),(689,166,173),(707,189,192),(720,182,189),(719,183,182),(721,172,183),(691,173,172),(150,2256,668),(667,722,680),(668,2256,722),(675,725,724),(676,726,725),(677,727,726),(678,728,727),(679,723,728),(729,1842,674),(672,731,730),(673,732,731),(674,1842,732),(735,737,733),(737,739,736),(739,741,738),(741,743,740),(743,769,742),(734,733,744),(733,736,746),(736,738,747),(738,740,748),(740,742,749),(745,744,750),(744,746,752),(746,747,753),(747,748,754),(751,750,755),(750,752,757),(752,753,758),(753,754,759),(756,755,760),(755,757,762),(757,758,763),(758,759,764),(761,760,765),(760,762,767),(762,763,627),(763,764,768),(610,742,769),(772,791,770),(775,1154,773),(771,2257,779),(779,2257,780),(783,772,779),(782,779,781),(774,796,787),(774,773,789),(792,789,773),(792,817,793),(789,793,794),(790,794,795),(796,795,797),(787,797,798),(788,798,799),(785,786,800),(784,785,801),(803,782,784),(804,783,782),(800,799,806),(801,800,807),(802,801,808),(810,803,802),(811,804,803),(812,791,804),(798,797,813),(795,815,813),(794,822,815),(816,822,794),(818,816,793),(791,819,818),(820,845,816),(816,845,821),(822,821,823),(815,823,824),(813,824,825),(814,825,826),(806,805,826),(823,821,829),(823,830,831),(824,831,832),(825,832,833),(826,833,834),(807,827,834),(808,807,835),(809,808,836),(838,810,809),(840,811,810),(841,812,811),(842,828,812),(842,844,820),(846,860,845),(831,1014,847),(832,847,848),(833,848,849),(834,849,850),(853,841,840),(855,842,841),(856,844,842),(856,857,843),(857,864,846),(829,859,858),(860,862,859),(863,861,860),(837,836,851),(838,837,865),(839,838,866),(840,839,867),(848,870,869),(869,871,872),(874,849,869),(850,849,874),(851,850,875),(865,851,876),(866,865,877),(867,866,879),(881,868,867),(882,852,868),(883,853,852),(884,854,853),(885,855,854),(885,886,856),(886,1006,857),(873,872,887),(874,873,888),(875,874,889),(876,875,890),(877,876,891),(878,877,892),(879,878,893),(897,905,895),(902,899,898),(904,902,901),(887,2022,905),(889,888,905),(889,897,900),(891,890,900),(892,891,899),(893,892,902),(894,893,904),(909,914,907),(907,1016,910),(908,907,911),(895,1015,913),(896,895,914),(898,896,909),(915,909,908),(916,908,912),(911,910,919),(921,918,919),(921,920,922),(925,921,923),(928,934,930),(928,930,926),(930,932,929),(926,930,925),(930,934,931),(934,903,933),(903,901,935),(901,898,915),(936,903,934),(938,904,903),(940,938,936),(942,940,937),(939,940,942),(944,894,906),(948,947,944),(949,946,950),(951,950,952),(953,952,954),(956,879,894),(957,956,947),(959,957,948),(962,2073,960),(954,962,961),(955,961,963),(953,955,964),(969,973,967),(951,953,966),(949,951,970),(966,964,965),(973,966,974),(975,959,958),(975,971,973),(977,969,968),(978,975,969),(979,982,978),(979,977,976),(978,981,959),(982,987,981),(983,984,956),(983,957,959),(985,881,880),(986,985,984),(987,986,983),(988,882,881),(989,988,985),(990,989,986),(992,1000,990),(994,979,980),(995,982,979),(992,991,995),(982,991,990),(997,1004,988),(992,998,999),(998,1010,1001),(1000,999,997),(999,1001,1002),(997,1002,1003),(1004,1003,884),(1003,1005,885),(1005,1007,886),(1007,1149,1006),(1008,1011,1007),(1002,1008,1005),(1001,1009,1008),(1010,1013,1009),(1009,1012,1011),(1013,1155,1012),(830,858,1014),(905,2022,1015),(914,913,1016),(1019,1020,1017),(1021,1022,1020),(1023,1027,1022),(1020,1025,1024),(1022,1026,1025),(1027,1028,1026),(1029,2258,1028),(1030,1029,1027),(862,1019,1018),(862,1018,1031),(1035,1036,1033),(1037,1045,1036),(1024,1025,1038),(1025,1026,1040),(1026,1028,1041),(1028,2258,1042),(1045,1037,1043),(1046,2145,1044),(1044,2145,1039),(1045,1044,1038),(1036,1045,1040),(1033,1036,1041),(1047,1157,1046),(1047,1043,1048),(1050,1043,1037),(1052,1048,1050),(1053,1049,1048),(1055,1049,1053),(1050,1035,1056),(1052,1051,1057),(1053,1052,1058),(1054,1053,1059),(1058,1057,1061),(1063,1059,1058),(1060,1059,1063),(1057,1051,1056),(1057,1066,1067),(1061,1067,1068),(1062,1061,1069),(1063,1062,1070),(1069,1068,1072),(1070,1069,1073),(1071,1070,1074),(1078,1088,1076),(1076,1074,1073),(1079,1073,1080),(1077,1079,1081),(1078,1077,1082),(1085,1078,1083),(1087,1075,1074),(1089,1064,1063),(1090,1089,1071),(1091,1090,1075),(1092,1096,1091),(1093,1094,1092),(1096,1092,1094),(1097,1102,1096),(1096,1102,1090),(1098,1158,1055),(1099,1098,1054),(1101,1158,1098),(1103,1089,1090),(1103,1099,1060),(1104,1103,1102),(1109,1086,1084),(1112,1116,1110),(1108,1084,1083),(1116,1108,1114),(1116,1115,1117),(1118,1119,1065),(1120,1121,1119),(1122,1080,1119),(1122,1123,1081),(1123,1124,1082),(1082,1124,1114),(1125,1115,1114),(1126,1125,1124),(1126,1123,1122),(1127,1122,1121),(1129,1117,1125),(1130,1120,1118),(1131,1128,1121),(1132,1129,1126),(1133,1132,1127),(1134,1133,1128),(1135,1136,1132),(1136,1137,1129),(1137,1138,1117),(1138,1113,1110),(1139,1140,1136),(1140,1141,1137),(1141,1142,1138),(1143,1144,1140),(1144,1145,1141),(1145,1146,1142),(1146,1147,1113),(1147,1148,1111),(1007,1011,1150),(1006,1149,1130),(857,1006,1107),(1011,1012,1100),(1143,1139,1134),(1153,1152,1130),(929,918,921),(927,941,937),(898,900,897),(880,879,956),(882,988,1004),(819,828,820),(791,773,1154),(778,775,774),(781,780,777),(845,860,829),(799,798,814),(1148,1093,1109),(1104,1143,1153),(1097,1144,1143),(1095,1145,1144),(1094,1146,1145),(1093,1147,1146),(1155,1101,1100),(993,311,314),(1013,325,327),(1010,323,325),(998,321,323),(996,319,321),(995,317,319),(994,314,317),(331,333,1047),(1047,308,1156),(122,212,205),(122,99,107),(89,85,84),(85,88,86),(628,768,759),(1108,1116,1112),(174,684,1159),(178,1159,185),(1162,1164,1160),(1164,1166,1163),(1165,1166,1167),(1166,1164,1169),(1164,1162,1170),(1170,1173,1171),(1173,1175,1172),(1174,1178,1176),(1179,1184,1180),(1180,1171,1172),(1171,1180,1167),(1180,1184,1168),(1182,1179,1185),(1179,1177,1188),(1177,1178,1189),(1178,1174,1191),(1174,1175,1192),(1183,1186,1193),(1186,1185,1195),(1185,1187,1196),(1188,1189,1198),(1189,1190,1199),(1190,1191,1200),(1191,1192,1201),(1194,1193,43),(1193,1195,44),(1195,1196,45),(1196,1197,46),(1197,1198,47),(1198,1199,48),(1199,1200,49),(1200,1201,50),(1165,1181,1206),(1211,1183,1194),(1194,42,62),(62,64,1213),(1205,1206,1211),(1211,1212,1213),(1217,1219,1215),(1215,1232,1220),(1222,1225,1223),(1226,1229,1227),(1226,1230,1228),(1225,1222,1231),(1232,1234,1231),(1238,1239,1230),(1239,1241,1228),(1241,1242,1240),(1242,1241,95),(1241,1239,96),(1239,1238,97),(1238,1237,98),(1245,1252,1243),(1248,1250,1246),(1250,1257,1249),(1250,1268,1256),(1248,1247,1258),(1252,1259,1258),(1260,1261,1253),(1261,1262,1255),(1263,1273,1262),(1260,1266,1263),(1266,1260,1264),(1250,1248,1267),(1267,1248,1259),(1259,1252,1270),(1251,1254,1270),(1256,1276,1271),(1273,1272,1274),(1275,1274,1271),(1272,1278,1277),(1277,1383,1271),(1266,1265,1278),(1281,1283,1279),(1283,1285,1282),(1285,1287,1284),(1287,1289,1286),(1289,1768,1288),(1292,1295,1290),(1295,1292,1293),(1298,1300,1296),(1300,1301,1299),(1301,1284,1286),(1299,1286,1288),(1297,1296,1303),(1296,1302,1305),(1302,1288,1306),(1304,1303,1307),(1303,1305,1309),(1305,1306,1291),(1310,1311,1300),(1311,1312,1301),(1312,1282,1284),(1282,1312,1314),(1312,1311,1315),(1311,1310,1316),(1313,1314,1317),(1315,1325,1319),(1318,1317,1319),(1320,1319,1321),(1319,1325,1323),(1325,1796,1324),(1326,1328,1290),(1328,1326,1327),(1322,1321,1329),(1321,1323,1330),(1323,1324,1331),(1328,1329,1332),(1329,1330,1333),(1330,1331,1334),(1332,1333,1307),(1333,1334,1308),(1290,1332,1309),(1306,1794,1292),(1337,1339,1335),(1339,1341,1338),(1341,1343,1340),(1343,1389,1342),(1345,1244,1243),(1347,1345,1344),(1349,1347,1346),(1351,1349,1348),(1353,1351,1350),(1354,1358,1345),(1355,1354,1347),(1356,1355,1349),(1357,1356,1351),(1359,1363,1358),(1360,1359,1354),(1361,1360,1355),(1362,1361,1356),(1364,1378,1363),(1365,1364,1359),(1366,1365,1360),(1367,1366,1361),(1336,1246,1249),(1368,1247,1246),(1370,1340,1342),(1371,1338,1340),(1372,1368,1336),(1372,1335,1338),(1243,1258,1373),(1373,1258,1247),(1350,1375,1374),(1348,1376,1375),(1346,1377,1376),(1344,1373,1377),(1375,1370,1369),(1376,1371,1370),(1377,1372,1371),(1373,1368,1372),(1278,1265,1363),(1380,1366,1367),(1381,1365,1366),(1382,1364,1365),(1363,1265,1264),(1257,1271,1383),(1384,1385,1383),(1382,1390,1385),(1384,1277,1278),(1384,1378,1364),(1337,1249,1383),(1387,1380,1379),(1388,1381,1380),(1343,1387,1386),(1341,1388,1387),(1339,1390,1388),(1337,1385,1390),(1392,1175,1173),(1394,1392,1391),(1396,1394,1393),(1398,1396,1395),(1400,1398,1397),(1402,1400,1399),(1404,1402,1401),(1406,1404,1403),(1391,1173,1170),(1393,1391,1407),(1395,1393,1408),(1397,1395,1409),(1399,1397,1410),(1401,1399,1411),(1403,1401,1412),(1405,1403,1413),(1389,1386,1201),(1374,1398,1400),(1369,1396,1398),(1342,1394,1396),(1389,1392,1394),(1389,1192,1175),(1170,1162,1415),(1410,1417,1416),(1409,1418,1417),(1408,1419,1418),(1407,1415,1419),(1406,1362,1357),(1421,1414,1413),(1402,1353,1352),(1404,1357,1353),(1422,1412,1411),(1420,1413,1412),(1424,281,280),(1426,1424,1423),(1428,1426,1425),(1430,1428,1427),(1432,1430,1429),(1434,1432,1431),(1436,1434,1433),(1438,1436,1435),(1440,1438,1437),(1442,1440,1439),(1444,1442,1441),(1446,1444,1443),(1448,1446,1445),(359,1448,1447),(1156,310,1449),(1451,1453,312),(1454,1455,1452),(1456,1457,1455),(1458,1459,1457),(1460,1461,1459),(1462,1463,1461),(1464,1465,1463),(1466,1467,1465),(1468,1469,1467),(1470,1471,1469),(1450,1449,1471),(64,335,1472),(1473,1474,337),(1475,1476,1474),(1477,1478,1476),(1479,1480,1478),(1481,1482,1480),(1483,1484,1482),(1485,1486,1484),(1488,1489,1486),(1490,1491,1489),(1205,1492,1491),(1214,1493,1492),(1213,1472,1493),(310,281,1424),(335,306,1447),(1474,1425,1423),(1476,1427,1425),(1478,1429,1427),(1480,1431,1429),(1482,1433,1431),(1484,1435,1433),(1486,1437,1435),(1489,1439,1437),(1491,1441,1439),(1492,1443,1441),(1493,1445,1443),(1472,1447,1445),(1453,1448,359),(1452,1446,1448),(1455,1444,1446),(1457,1440,1442),(1459,1438,1440),(1461,1436,1438),(1463,1434,1436),(1465,1432,1434),(1467,1430,1432),(1469,1428,1430),(1471,1426,1428),(1449,1424,1426),(1495,1485,1483),(1496,1487,1485),(1497,1488,1487),(1498,1202,1490),(1210,1502,1160),(1503,1504,1502),(1505,1506,1504),(1507,1508,1506),(1509,1510,1508),(1511,1512,1510),(1513,1514,1512),(1501,1500,1514),(1210,1208,1203),(1513,1494,1515),(1511,1495,1494),(1509,1496,1495),(1507,1497,1496),(1505,1498,1497),(1503,1203,1498),(1494,1483,1481),(1516,1473,336),(1517,1475,1473),(1518,1477,1475),(1499,1479,1477),(1515,1481,1479),(1161,1160,1519),(1522,1517,1516),(1523,1518,1517),(1524,1499,1518),(1525,1500,1499),(1526,1514,1500),(1527,1512,1514),(1528,1510,1512),(1529,1508,1510),(1530,1506,1508),(1531,1504,1506),(1532,1502,1504),(1519,1160,1502),(1161,1520,1415),(1532,1535,1533),(683,403,1534),(1531,1536,1535),(1529,1537,1536),(1528,1538,1537),(1527,1539,1538),(1526,1540,1539),(1525,1541,1540),(1524,1542,1541),(1523,1543,1542),(1522,1544,1543),(1521,1534,1544),(1546,415,414),(1548,1546,1545),(1550,1548,1547),(1552,1550,1549),(1554,1552,1551),(1556,1554,1553),(1558,1556,1555),(1560,1558,1557),(1562,1560,1559),(1564,1562,1561),(1566,1564,1563),(1568,1566,1565),(1570,1568,1567),(1572,1570,1569),(1574,1572,1571),(1576,1574,1573),(1577,1576,1575),(1578,1577,1240),(538,1578,1242),(1580,451,450),(1582,1580,1579),(1584,1582,1581),(1586,1584,1583),(1588,1586,1585),(1590,1588,1587),(1592,1590,1589),(1594,1592,1591),(1596,1594,1593),(1598,1596,1595),(1600,1598,1597),(1602,1600,1599),(1604,1602,1601),(1606,1604,1603),(1608,1606,1605),(1227,1608,1607),(1610,483,482),(1612,1610,1609),(1614,1612,1611),(1616,1614,1613),(1618,1616,1615),(1620,1618,1617),(1622,1620,1619),(1624,1622,1621),(1626,1624,1623),(1628,1626,1625),(1630,1628,1627),(1632,1630,1629),(1634,1632,1631),(1636,1634,1633),(1638,1636,1635),(1641,1534,403),(1642,1544,1534),(1643,1543,1544),(1644,1542,1543),(1645,1541,1542),(1646,1540,1541),(1648,1539,1540),(1649,1538,1539),(1650,1537,1538),(1651,1536,1537),(1652,1535,1536),(1639,1533,1535),(1415,1533,1418),(532,50,1386),(1654,1362,1406),(1655,1367,1362),(532,1367,1655),(1653,1406,1405),(1659,1414,1421),(1656,1405,1414),(1639,1420,1422),(1655,1578,538),(1654,1577,1578),(1653,1576,1577),(1656,1574,1576),(1659,1572,1574),(1658,1570,1572),(1657,1568,1570),(1652,1564,1566),(1651,1562,1564),(1650,1560,1562),(1649,1558,1560),(1648,1556,1558),(1647,1554,1556),(1646,1552,1554),(1645,1548,1550),(1644,1546,1548),(1642,415,1546),(1545,414,451),(1547,1545,1580),(1549,1547,1582),(1551,1549,1584),(1553,1551,1586),(1555,1553,1588),(1557,1555,1590),(1559,1557,1592),(1561,1559,1594),(1563,1561,1596),(1565,1563,1598),(1567,1565,1600),(1569,1567,1602),(1571,1569,1604),(1573,1571,1606),(1575,1573,1608),(1240,1575,1227),(1579,450,483),(1581,1579,1610),(1583,1581,1612),(1585,1583,1614),(1587,1585,1616),(1589,1587,1618),(1591,1589,1620),(1593,1591,1622),(1595,1593,1624),(1597,1595,1626),(1599,1597,1628),(1601,1599,1630),(1603,1601,1632),(1605,1603,1634),(1607,1605,1636),(1223,1607,1638),(1609,482,541),(1611,1609,1660),(1613,1611,1661),(1615,1613,1662),(1617,1615,1663),(1619,1617,1664),(1621,1619,1665),(1623,1621,1666),(1625,1623,1667),(1627,1625,1668),(1629,1627,1669),(1631,1629,1670),(1633,1631,1671),(1635,1633,1672),(1637,1635,1673),(1660,541,557),(1661,1660,1675),(1662,1661,1676),(1663,1662,1677),(1664,1663,1678),(1665,1664,1679),(1666,1665,1680),(1667,1666,1681),(1668,1667,1682),(1669,1668,1683),(1670,1669,1684),(1671,1670,1685),(1672,1671,1686),(1673,1672,1687),(1674,1673,1688),(1691,1674,1689),(1692,1217,1638),(1693,1637,1674),(1675,557,578),(1676,1675,1695),(1677,1676,1696),(1678,1677,1697),(1679,1678,1698),(1680,1679,1699),(1681,1680,1700),(1682,1681,1701),(1683,1682,1702),(1684,1683,1703),(1685,1684,1704),(1686,1685,1705),(1687,1686,1706),(1688,1687,1707),(1689,1688,1708),(1690,1689,1709),(1695,578,595),(1696,1695,1711),(1697,1696,1712),(1698,1697,1713),(1699,1698,1714),(1700,1699,1715),(1701,1700,1716),(1702,1701,1717),(1703,1702,1718),(1704,1703,1719),(1705,1704,1720),(1706,1705,1721),(1707,1706,1722),(1708,1707,1723),(1709,1708,1724),(1711,595,611),(1712,1711,1726),(1713,1712,1727),(1714,1713,1728),(1715,1714,1729),(1716,1715,1730),(1717,1716,1731),(1718,1717,1732),(1719,1718,1733),(1720,1719,1734),(1721,1720,1735),(1722,1721,1736),(1723,1722,1737),(1724,1723,1738),(1725,1724,1739),(1285,1725,1740),(1742,628,627),(1744,1742,1741),(1746,1744,1743),(1748,1746,1745),(1750,1748,1747),(1752,1750,1749),(1754,1752,1751),(1756,1754,1753),(1758,1756,1755),(1760,1758,1757),(1762,1760,1759),(1764,1762,1761),(1766,1764,1763),(1768,1766,1765),(1741,627,656),(1743,1741,1769),(1745,1743,1770),(1747,1745,1771),(1749,1747,1772),(1751,1749,1773),(1753,1751,1774),(1755,1753,1775),(1757,1755,1776),(1759,1757,1777),(1761,1759,1778),(1763,1761,1779),(1765,1763,1780),(1767,1765,1781),(1769,656,670),(1770,1769,1782),(1771,1770,1783),(1772,1771,1784),(1773,1772,1785),(1774,1773,1786),(1775,1774,1787),(1776,1775,1788),(1777,1776,1789),(1778,1777,1790),(1779,1778,1791),(1739,1764,1766),(1738,1762,1764),(1737,1760,1762),(1736,1758,1760),(1735,1756,1758),(1734,1754,1756),(1733,1752,1754),(1732,1750,1752),(1731,1748,1750),(1730,1746,1748),(1729,1744,1746),(1728,1742,1744),(1725,1793,1710),(1725,1283,1281),(1390,1382,1381),(1521,1516,382),(1288,1768,1767),(1289,1740,1766),(1794,1767,1293),(1313,1318,1795),(1315,1316,1796),(1799,1806,1797),(1802,1804,1800),(1804,1811,1803),(1804,1822,1810),(1802,1801,1812),(1806,1813,1812),(1814,1815,1807),(1815,1816,1809),(1817,1827,1816),(1814,1820,1817),(1820,1814,1818),(1804,1802,1821),(1821,1802,1813),(1813,1806,1824),(1805,1808,1824),(1818,1814,1799),(1810,1830,1825),(1827,1826,1828),(1829,1828,1825),(1826,1832,1831),(1831,1833,1825),(1820,1819,1832),(1811,1825,1833),(1800,1298,1297),(1798,1308,1334),(1797,1304,1308),(1812,1297,1304),(1298,1800,1803),(1331,1819,1818),(1324,1832,1819),(1796,1831,1832),(1316,1833,1831),(1310,1803,1833),(1834,1294,1293),(1835,1780,1779),(1834,1781,1780),(1838,1787,1786),(1839,1788,1787),(1840,1789,1788),(1841,1790,1789),(1836,1791,1790),(1842,729,1837),(731,1784,1783),(732,1785,1784),(1842,1786,1785),(1845,1893,1843),(735,1845,1844),(737,735,1846),(739,737,1847),(741,739,1848),(743,741,1849),(769,743,1850),(1844,1843,1852),(1846,1844,1853),(1847,1846,1854),(1848,1847,1855),(1849,1848,1856),(1850,1849,1857),(1851,1850,1858),(1853,1852,1860),(1854,1853,1861),(1855,1854,1862),(1856,1855,1863),(1857,1856,1864),(1858,1857,1865),(1861,1860,1867),(1862,1861,1868),(1863,1862,1869),(1864,1863,1870),(1865,1864,1871),(1866,1865,1872),(1868,1867,1874),(1869,1868,1875),(1870,1869,1876),(1871,1870,1877),(1872,1871,1878),(1873,1872,1879),(1875,1874,1881),(1876,1875,1882),(1877,1876,766),(1878,1877,765),(1879,1878,767),(1880,1879,627),(1882,1881,1883),(766,1882,1884),(1884,1883,1885),(761,1884,1886),(1886,1885,1887),(756,1886,1888),(1888,1887,1889),(751,1888,1890),(1890,1889,1891),(745,1890,1892),(1892,1891,1893),(734,1892,1845),(1851,1726,611),(1896,1903,1894),(1899,2250,1897),(1905,1894,1903),(1905,1904,1906),(1903,1928,1908),(1904,1908,1909),(1913,1897,1902),(1898,1897,1915),(1916,2251,1896),(1918,2251,1916),(1917,1916,1915),(1919,1915,1913),(1920,1913,1912),(1921,1912,1914),(1922,1914,1911),(1911,1910,1925),(1910,1909,1926),(1908,1927,1926),(1928,1929,1927),(1923,1924,1932),(1924,1925,1933),(1925,1926,1934),(1927,1935,1934),(1929,1936,1935),(1896,1944,1936),(1921,1922,1937),(1939,1920,1921),(1940,1919,1920),(1940,1942,1917),(1941,1918,1917),(1943,1896,1918),(1945,1966,1941),(1945,1942,1940),(1946,1940,1939),(1947,1939,1938),(1948,1938,1937),(1949,1937,1931),(1931,1930,1951),(1946,1947,1953),(1953,1947,1948),(1955,1948,1949),(1956,1949,1950),(1957,1950,1951),(1951,1932,1959),(1932,1933,1960),(1933,1934,1961),(1935,1963,1961),(1936,1964,1962),(1944,1965,1964),(1952,1978,1965),(1967,1978,1952),(1969,1970,1966),(1014,1955,1956),(847,1956,1957),(1971,1957,1958),(1972,1958,1959),(1965,1977,1975),(1978,1979,1976),(1967,2003,1979),(1980,2003,1967),(1981,1980,1968),(1982,1954,1953),(1983,1969,1954),(1984,1985,1970),(1960,1961,1986),(1961,1963,1987),(1963,1962,1988),(1962,1964,1989),(870,1971,1972),(871,1990,1991),(1972,1993,1991),(1972,1973,1992),(1973,1974,1994),(1974,1986,1995),(1986,1987,1996),(1987,1988,1998),(1989,1999,1998),(1975,2000,1999),(1977,2001,2000),(1976,2002,2001),(1979,2110,2002),(2004,2110,1979),(2005,2004,2003),(872,1991,2006),(1991,1993,2007),(1993,1992,2008),(1992,1994,2009),(1994,1995,2010),(1995,1996,2011),(1996,1997,2012),(2015,2023,2013),(2017,2021,2019),(2021,2024,2020),(2022,887,2006),(2006,2007,2023),(2023,2007,2008),(2008,2009,2017),(2009,2010,2021),(2010,2011,2024),(2011,2012,2025),(2028,2031,2026),(1016,2027,2029),(2027,2026,2030),(1015,2014,2028),(2014,2013,2031),(2013,2018,2032),(2031,2032,2033),(2026,2033,2034),(910,2029,2035),(2035,2038,920),(920,2038,2036),(2038,2042,2037),(2041,2049,2259),(2041,2259,2039),(2044,2040,2042),(2040,2039,2037),(2041,2040,2044),(2020,2041,2045),(2019,2020,2046),(2018,2019,2047),(2020,2050,2049),(2024,2051,2050),(2051,2054,2048),(2054,2056,2053),(2054,2052,2055),(2012,2058,2052),(2060,2062,2057),(2059,2061,2063),(2064,2063,2065),(2066,2065,2067),(1997,2069,2060),(2069,2071,2062),(2071,2080,2070),(2073,2074,2072),(2074,2068,2067),(2072,2067,2075),(2067,2065,2076),(2077,2081,968),(2065,2063,2078),(2063,2061,2079),(2075,2076,974),(2076,2077,972),(2080,2083,2079),(2079,2083,2081),(2081,2082,976),(2083,2084,2082),(2085,2097,2082),(2082,2097,980),(2086,2084,2083),(2087,2085,2084),(2088,2089,2071),(2071,2089,2086),(1999,2090,2088),(2090,2091,2089),(2091,2087,2086),(2000,2092,2090),(2092,2093,2091),(2093,2095,2087),(2096,2102,2094),(2097,2098,993),(2085,2099,2098),(2094,2102,2100),(2094,2085,2087),(2101,2107,2093),(2103,2102,2096),(2106,2103,2104),(2104,2096,2093),(2105,2104,2107),(2108,2107,2101),(2109,2101,2001),(2111,2109,2002),(2112,2111,2110),(2113,2112,2004),(2114,2115,2111),(2115,2108,2109),(2116,2105,2108),(2117,2106,2105),(2118,2116,2115),(2119,2117,2116),(858,1953,1955),(2022,2015,2014),(913,2028,2027),(2120,2121,1018),(2122,2123,2121),(2124,2129,2123),(2125,2120,1017),(2126,2122,2120),(2127,2124,2122),(2128,2130,2124),(2130,2131,2129),(2121,1983,1982),(2121,1982,1031),(2135,2136,2133),(2137,2144,2136),(2125,1024,1039),(2126,2125,2138),(2127,2126,2139),(2128,2127,2140),(2144,2137,2142),(2145,1046,2143),(2145,2142,2138),(2142,2137,2139),(2137,2135,2140),(2135,2134,2141),(1157,2254,2143),(2143,2254,2146),(2143,2148,2136),(2147,2150,2149),(2146,2152,2150),(2146,2195,2151),(2136,2148,2149),(2149,2150,2154),(2150,2152,2156),(2152,2151,2157),(2155,2154,2158),(2156,2161,2158),(2156,2157,2160),(2149,2155,2162),(2162,2155,2159),(2164,2159,2165),(2159,2158,2167),(2158,2161,2168),(2166,2165,2169),(2165,2167,2171),(2167,2168,2172),(2175,2182,2173),(2171,2174,2176),(2169,2176,2178),(2176,2173,2179),(2173,2182,2180),(2182,2184,2181),(2172,2185,2174),(2160,2186,2168),(2186,2187,2172),(2187,2188,2185),(2189,2190,2175),(2192,2191,2184),(2190,2189,2193),(2194,2202,2193),(2194,2189,2188),(2196,2197,2151),(2197,2199,2157),(2196,2253,2198),(2186,2200,2194),(2199,2200,2160),(2200,2201,2202),(2183,2252,2206),(2209,2243,2207),(2181,2206,2211),(2206,2209,2212),(2212,2209,2208),(2214,2215,2204),(2216,2224,2215),(2177,2221,2216),(2217,2221,2177),(2218,2217,2178),(2218,2179,2180),(2212,2219,2218),(2219,2223,2217),(2217,2223,2220),(2221,2220,2222),(2213,2225,2223),(2224,2245,2205),(2222,2227,2224),(2225,2226,2220),(2226,2228,2222),(2228,2229,2227),(2231,2230,2228),(2232,2231,2226),(2233,2232,2225),(2210,2233,2213),(2235,2234,2230),(2236,2235,2231),(2237,2236,2232),(2238,2249,2234),(2239,2238,2235),(2240,2239,2236),(2241,2240,2237),(2242,2241,2210),(2114,2112,2113),(2113,2005,2205),(2005,1980,1981),(2118,2114,2244),(2234,2249,2246),(2247,2248,2244),(2035,2043,2042),(2053,2259,2049),(2016,2018,2013),(1997,1998,2088),(2092,2000,2001),(1952,1943,1941),(1898,1896,1895),(2250,1900,1902),(1907,1906,1911),(1969,1945,1946),(1922,1923,1931),(2191,2242,2243),(2249,2201,2198),(2238,2202,2201),(2239,2193,2202),(2240,2192,2193),(2241,2191,2192),(2253,2119,2118),(311,993,2098),(1462,2117,2119),(1460,2106,2117),(1458,2103,2106),(1456,2100,2103),(1454,2099,2100),(1451,2098,2099),(1470,1468,2146),(1450,2254,1157),(1358,1264,1244),(1244,1264,1260),(1233,1238,1231),(1236,1233,1232),(768,628,1866),(2209,2206,2252),(1795,1318,1320),(2255,1320,1322),(572,2260,593),(2260,572,2261),(2261,572,573),(681,593,2262),(593,2260,2263),(2260,2261,2264),(2261,573,2265),(2265,573,2266),(2266,573,575),(681,2262,2267),(2262,2263,2268),(2263,2264,2269),(2264,2270,2271),(2270,2264,2265),(2265,2266,2272),(2266,575,2273),(2273,575,2274),(2274,2275,2273),(2273,2275,2272),(2275,2271,2270),(575,574,69),(574,576,68),(68,576,72),(86,2276,69),(69,2276,2274),(2274,2276,2277),(2277,2276,2278),(2276,86,88),(2277,2278,2279),(2278,88,87),(98,2280,2279),(2280,2281,2282),(2283,2277,2279),(2277,2283,2271),(2271,2275,2277),(2277,2275,2274),(682,2267,2284),(2267,2268,2285),(2268,2269,2286),(2269,2271,2283),(2282,2287,2288),(2289,2286,2283),(2289,2290,2285),(2290,2291,2292),(2293,2294,2285),(2294,2295,2284),(2295,2296,136),(2296,2297,684),(2298,2299,2300),(2299,2301,2302),(2301,2303,2304),(2303,2293,2292),(2291,2305,2304),(2305,2306,2307),(2306,2308,2281),(2308,2287,2282),(2309,2310,186),(2310,2311,149),(2311,2312,2313),(2312,2314,2315),(2314,2316,2317),(2316,2318,2319),(2318,2320,2321),(2320,2322,2323),(2322,2324,727),(727,2324,726),(2324,2325,2326),(2324,2322,2327),(2320,2318,2328),(2318,2316,2329),(2316,2314,2330),(2314,2312,2331),(2312,2311,2332),(2311,2310,2333),(2310,2309,2334),(2309,2335,2300),(2322,2320,2336),(727,728,2323),(728,2337,2321),(2337,2338,2319),(2338,2339,2317),(2339,2340,2315),(2340,150,2313),(2313,150,149),(723,680,2341),(728,723,2337),(723,2341,2338),(2341,2342,2339),(2342,2256,2340),(2340,2256,150),(2256,2342,722),(2326,2343,725),(2343,729,724),(2342,2341,680),(2344,2345,2288),(2345,2346,2289),(2346,2347,2290),(2347,2348,2291),(2348,2349,2305),(2349,2350,2306),(2350,2351,2308),(2351,2344,2287),(2352,2353,2294),(2353,2354,2295),(2354,2355,2296),(2355,2356,2297),(2356,2357,2298),(2357,2358,2299),(2358,2359,2301),(2359,2360,2303),(2360,2352,2293),(2361,2362,2351),(2363,2361,2350),(2364,2363,2349),(2365,2364,2348),(2366,2365,2347),(2367,2366,2346),(2368,2367,2345),(2362,2368,2344),(2369,2370,2352),(2371,2369,2360),(2372,2371,2359),(2373,2372,2358),(2374,2373,2357),(2375,2374,2356),(2376,2375,2355),(2377,2376,2354),(2370,2377,2353),(2367,2368,2378),(2366,2367,2378),(2365,2366,2378),(2364,2365,2378),(2363,2364,2378),(2361,2363,2378),(2362,2361,2378),(2368,2362,2378),(2377,2370,2379),(2376,2377,2379),(2375,2376,2379),(2374,2375,2379),(2373,2374,2379),(2372,2373,2379),(2371,2372,2379),(2369,2371,2379),(2370,2369,2379),(1159,2335,2309),(1159,2298,2335),(684,2297,2298),(1710,2380,1690),(2381,1690,2380),(1691,1690,2381),(2382,1710,1793),(2380,1710,2382),(2381,2380,2383),(1691,2381,2384),(2385,1691,2386),(1693,1691,2385),(2382,1793,1281),(2383,2382,2387),(2384,2383,2388),(2389,2384,2390),(2386,2384,2389),(2385,2386,2389),(1693,2385,2391),(2392,1693,2393),(2393,2394,2392),(2391,2394,2393),(2395,2394,2391),(1694,1693,2392),(1692,1694,1218),(1217,1692,1219),(1218,2396,1235),(2392,2396,1218),(2397,2396,2392),(2398,2396,2397),(1235,2396,2398),(2399,2398,2397),(1236,2398,2399),(2280,98,1237),(2281,2280,2399),(2397,2400,2401),(2395,2400,2397),(2397,2394,2395),(2392,2394,2397),(2387,1281,1280),(2388,2387,2402),(2390,2388,2403),(2395,2390,2404),(2405,2401,2400),(2404,2406,2407),(2408,2406,2404),(2409,2408,2403),(2410,2411,2412),(2413,2410,2403),(2414,2413,2402),(2415,2414,1280),(2416,2417,2418),(2419,2416,2300),(2420,2419,2302),(2411,2420,2304),(2421,2409,2412),(2422,2421,2304),(2423,2422,2307),(2405,2423,2281),(2424,2425,1327),(2426,2424,1326),(2427,2426,1295),(2428,2427,2429),(2430,2428,2431),(2432,2430,2433),(2434,2432,2435),(2436,2434,2437),(2438,2436,2439),(1839,2438,1840),(2325,2438,1839),(2436,2438,2325),(2432,2434,2336),(2430,2432,2328),(2428,2430,2329),(2427,2428,2330),(2426,2427,2331),(2424,2426,2332),(2425,2424,2333),(2418,2425,2334),(2434,2436,2327),(2439,1841,1840),(2440,1841,2439),(2441,2440,2437),(2442,2441,2435),(2443,2442,2433),(1294,2443,2431),(1295,1294,2429),(2444,1792,1836),(2440,1836,1841),(2444,1836,2440),(2445,2444,2441),(1834,2445,2442),(1294,1834,2443),(1835,2445,1834),(2343,2326,1839),(729,2343,1838),(2444,2445,1835),(2446,2447,2405),(2448,2446,2407),(2449,2448,2406),(2450,2449,2408),(2451,2450,2409),(2452,2451,2421),(2453,2452,2422),(2447,2453,2423),(2454,2455,2411),(2456,2454,2410),(2457,2456,2413),(2458,2457,2414),(2459,2458,2415),(2460,2459,2417),(2461,2460,2416),(2462,2461,2419),(2455,2462,2420),(2463,2464,2452),(2464,2465,2451),(2465,2466,2450),(2466,2467,2449),(2467,2468,2448),(2468,2469,2446),(2469,2470,2447),(2470,2463,2453),(2471,2472,2462),(2472,2473,2461),(2473,2474,2460),(2474,2475,2459),(2475,2476,2458),(2476,2477,2457),(2477,2478,2456),(2478,2479,2454),(2479,2471,2455),(2480,2470,2469),(2480,2469,2468),(2480,2468,2467),(2480,2467,2466),(2480,2466,2465),(2480,2465,2464),(2480,2464,2463),(2480,2463,2470),(2481,2471,2479),(2481,2479,2478),(2481,2478,2477),(2481,2477,2476),(2481,2476,2475),(2481,2475,2474),(2481,2474,2473),(2481,2473,2472),(2481,2472,2471),(2418,2255,1327),(2418,2417,2255),(2415,1795,2255),(2482,2483,2484),(2263,2262,593),(2264,2263,2260),(2265,2264,2261),(2267,682,681),(2268,2267,2262),(2269,2268,2263),(2271,2269,2264),(2272,2270,2265),(2273,2272,2266),(2270,2272,2275),(69,2274,575),(68,69,574),(88,2278,2276),(87,2279,2278),(2279,87,98),(2282,2279,2280),(2279,2282,2283),(2284,136,682),(2285,2284,2267),(2286,2285,2268),(2283,2286,2269),(2288,2283,2282),(2283,2288,2289),(2285,2286,2289),(2292,2285,2290),(2285,2292,2293),(2284,2285,2294),(136,2284,2295),(684,136,2296),(2300,2335,2298),(2302,2300,2299),(2304,2302,2301),(2292,2304,2303),(2304,2292,2291),(2307,2304,2305),(2281,2307,2306),(2282,2281,2308),(186,185,2309),(149,186,2310),(2313,149,2311),(2315,2313,2312),(2317,2315,2314),(2319,2317,2316),(2321,2319,2318),(2323,2321,2320),(727,2323,2322),(2326,726,2324),(2327,2325,2324),(2328,2336,2320),(2329,2328,2318),(2330,2329,2316),(2331,2330,2314),(2332,2331,2312),(2333,2332,2311),(2334,2333,2310),(2300,2334,2309),(2336,2327,2322),(2321,2323,728),(2319,2321,2337),(2317,2319,2338),(2315,2317,2339),(2313,2315,2340),(2338,2337,723),(2339,2338,2341),(2340,2339,2342),(725,726,2326),(724,725,2343),(680,722,2342),(2288,2287,2344),(2289,2288,2345),(2290,2289,2346),(2291,2290,2347),(2305,2291,2348),(2306,2305,2349),(2308,2306,2350),(2287,2308,2351),(2294,2293,2352),(2295,2294,2353),(2296,2295,2354),(2297,2296,2355),(2298,2297,2356),(2299,2298,2357),(2301,2299,2358),(2303,2301,2359),(2293,2303,2360),(2351,2350,2361),(2350,2349,2363),(2349,2348,2364),(2348,2347,2365),(2347,2346,2366),(2346,2345,2367),(2345,2344,2368),(2344,2351,2362),(2352,2360,2369),(2360,2359,2371),(2359,2358,2372),(2358,2357,2373),(2357,2356,2374),(2356,2355,2375),(2355,2354,2376),(2354,2353,2377),(2353,2352,2370),(2309,185,1159),(2298,1159,684),(2382,2383,2380),(2383,2384,2381),(2384,2386,1691),(1281,2387,2382),(2387,2388,2383),(2388,2390,2384),(2390,2395,2389),(2389,2391,2385),(2391,2393,1693),(2391,2389,2395),(2392,1218,1694),(1218,1219,1692),(2398,1236,1235),(2399,1237,1236),(1237,2399,2280),(2399,2401,2281),(2401,2399,2397),(1280,2402,2387),(2402,2403,2388),(2403,2404,2390),(2404,2400,2395),(2400,2407,2405),(2407,2400,2404),(2404,2403,2408),(2403,2412,2409),(2412,2403,2410),(2403,2402,2413),(2402,1280,2414),(1280,1795,2415),(2418,2300,2416),(2300,2302,2419),(2302,2304,2420),(2304,2412,2411),(2412,2304,2421),(2304,2307,2422),(2307,2281,2423),(2281,2401,2405),(1327,1326,2424),(1326,1295,2426),(1295,2429,2427),(2429,2431,2428),(2431,2433,2430),(2433,2435,2432),(2435,2437,2434),(2437,2439,2436),(2439,1840,2438),(1839,2326,2325),(2325,2327,2436),(2336,2328,2432),(2328,2329,2430),(2329,2330,2428),(2330,2331,2427),(2331,2332,2426),(2332,2333,2424),(2333,2334,2425),(2334,2300,2418),(2327,2336,2434),(2439,2437,2440),(2437,2435,2441),(2435,2433,2442),(2433,2431,2443),(2431,2429,1294),(2440,2441,2444),(2441,2442,2445),(2442,2443,1834),(1839,1838,2343),(1838,1837,729),(1835,1792,2444),(2405,2407,2446),(2407,2406,2448),(2406,2408,2449),(2408,2409,2450),(2409,2421,2451),(2421,2422,2452),(2422,2423,2453),(2423,2405,2447),(2411,2410,2454),(2410,2413,2456),(2413,2414,2457),(2414,2415,2458),(2415,2417,2459),(2417,2416,2460),(2416,2419,2461),(2419,2420,2462),(2420,2411,2455),(2452,2453,2463),(2451,2452,2464),(2450,2451,2465),(2449,2450,2466),(2448,2449,2467),(2446,2448,2468),(2447,2446,2469),(2453,2447,2470),(2462,2455,2471),(2461,2462,2472),(2460,2461,2473),(2459,2460,2474),(2458,2459,2475),(2457,2458,2476),(2456,2457,2477),(2454,2456,2478),(2455,2454,2479),(1327,2425,2418),(2255,2417,2415),(2485,2486,2487),(2486,2488,2489),(2488,2490,2491),(2492,2493,2489),(2493,2494,2487),(2494,2495,2496),(2488,2486,2497),(2486,2485,2498),(113,112,2499),(2495,2494,2500),(2500,2494,2493),(2493,2492,2501),(124,2498,2485),(111,2502,2503),(2501,2492,2504),(2502,2500,2505),(2500,2501,2506),(2507,118,117),(2505,2508,2507),(2505,2506,2509),(2506,2504,2510),(2504,2511,2512),(124,2485,2496),(126,2496,2495),(127,2495,2502),(112,129,2513),(2499,2514,2497),(2515,2516,2490),(2515,2517,2518),(2515,2497,2514),(2517,2519,2520),(2517,2514,2521),(2514,2499,2513),(2507,2522,131),(2522,2513,129),(2508,2523,2522),(2523,2521,2513),(2523,2508,2509),(2510,2523,2509),(2521,2523,2519),(2510,2512,2523),(2519,2523,2512),(2520,2512,2511),(2492,2491,2511),(124,113,2498),(2490,2516,2518),(2524,2525,2526),(2525,2527,2528),(2527,2529,2530),(2531,2532,2528),(2532,2533,2526),(2533,2534,2535),(2527,2525,2536),(2525,2524,2537),(699,698,2538),(2534,2533,2539),(2539,2533,2532),(2532,2531,2540),(710,2537,2524),(697,2541,2542),(2540,2531,2543),(2541,2539,2544),(2539,2540,2545),(2546,704,703),(2544,2547,2546),(2544,2545,2548),(2545,2543,2549),(2543,2550,2551),(710,2524,2535),(712,2535,2534),(713,2534,2541),(698,715,2552),(2538,2553,2536),(2554,2555,2529),(2554,2556,2557),(2554,2536,2553),(2556,2558,2559),(2556,2553,2560),(2553,2538,2552),(2546,2561,717),(2561,2552,715),(2547,2562,2561),(2562,2560,2552),(2562,2547,2548),(2549,2562,2548),(2560,2562,2558),(2549,2551,2562),(2558,2562,2551),(2559,2551,2550),(2531,2530,2550),(710,699,2537),(2529,2555,2557),(2563,2564,2565),(2566,2563,2567),(2568,2566,2569),(2570,2571,2572),(2573,2570,2569),(2574,2573,2567),(2563,2566,2575),(2564,2563,2576),(1256,1268,2577),(2573,2574,2578),(2573,2579,2580),(2580,2571,2570),(2564,2577,1267),(2578,1255,1262),(2571,2580,2581),(2579,2578,2582),(2580,2579,2583),(1273,2584,2582),(2585,2583,2582),(2581,2583,2585),(2586,2581,2587),(2588,2586,2589),(2564,1267,1269),(2565,1269,1270),(2574,1270,1255),(1276,1256,2590),(2591,2590,2577),(2592,2575,2566),(2593,2575,2592),(2576,2575,2593),(2594,2593,2595),(2591,2593,2594),(2590,2591,2596),(2597,2584,1273),(2598,2597,1275),(2599,2585,2584),(2596,2599,2597),(2587,2585,2599),(2587,2599,2589),(2594,2599,2596),(2599,2600,2589),(2599,2594,2601),(2600,2601,2595),(2572,2571,2586),(2577,1268,1267),(2568,2572,2588),(2602,2603,2604),(2605,2602,2606),(2607,2605,2608),(2609,2610,2611),(2612,2609,2608),(2613,2612,2606),(2602,2605,2614),(2603,2602,2615),(1810,1822,2616),(2612,2613,2617),(2612,2618,2619),(2619,2610,2609),(2603,2616,1821),(2617,1809,1816),(2610,2619,2620),(2618,2617,2621),(2619,2618,2622),(1827,2623,2621),(2624,2622,2621),(2620,2622,2624),(2625,2620,2626),(2627,2625,2628),(2603,1821,1823),(2604,1823,1824),(2613,1824,1809),(1830,1810,2629),(2630,2629,2616),(2631,2614,2605),(2632,2614,2631),(2615,2614,2632),(2633,2632,2634),(2630,2632,2633),(2629,2630,2635),(2636,2623,1827),(2637,2636,1829),(2638,2624,2623),(2635,2638,2636),(2626,2624,2638),(2626,2638,2628),(2633,2638,2635),(2638,2639,2628),(2638,2633,2640),(2639,2640,2634),(2611,2610,2625),(2616,1822,1821),(2607,2611,2627),(2487,2496,2485),(2489,2487,2486),(2491,2489,2488),(2489,2491,2492),(2487,2489,2493),(2496,2487,2494),(2497,2515,2488),(2498,2497,2486),(2499,2498,113),(2500,2502,2495),(2493,2501,2500),(2503,117,111),(2504,2506,2501),(2505,2503,2502),(2506,2505,2500),(117,2503,2507),(2507,2503,2505),(2509,2508,2505),(2510,2509,2506),(2512,2510,2504),(2496,126,124),(2495,127,126),(2502,111,127),(2513,2499,112),(2497,2498,2499),(2490,2488,2515),(2518,2516,2515),(2514,2517,2515),(2520,2518,2517),(2521,2519,2517),(2513,2521,2514),(131,118,2507),(129,131,2522),(2522,2507,2508),(2513,2522,2523),(2512,2520,2519),(2511,2518,2520),(2511,2504,2492),(2518,2511,2491),(2518,2491,2490),(2526,2535,2524),(2528,2526,2525),(2530,2528,2527),(2528,2530,2531),(2526,2528,2532),(2535,2526,2533),(2536,2554,2527),(2537,2536,2525),(2538,2537,699),(2539,2541,2534),(2532,2540,2539),(2542,703,697),(2543,2545,2540),(2544,2542,2541),(2545,2544,2539),(703,2542,2546),(2546,2542,2544),(2548,2547,2544),(2549,2548,2545),(2551,2549,2543),(2535,712,710),(2534,713,712),(2541,697,713),(2552,2538,698),(2536,2537,2538),(2529,2527,2554),(2557,2555,2554),(2553,2556,2554),(2559,2557,2556),(2560,2558,2556),(2552,2560,2553),(717,704,2546),(715,717,2561),(2561,2546,2547),(2552,2561,2562),(2551,2559,2558),(2550,2557,2559),(2550,2543,2531),(2557,2550,2530),(2557,2530,2529),(2565,2567,2563),(2567,2569,2566),(2569,2572,2568),(2572,2569,2570),(2569,2567,2573),(2567,2565,2574),(2575,2576,2563),(2576,2577,2564),(2577,2590,1256),(2578,2579,2573),(2580,2570,2573),(1262,2582,2578),(2581,2586,2571),(2582,2583,2579),(2583,2581,2580),(2582,1262,1273),(2582,2584,2585),(2585,2587,2581),(2587,2589,2586),(2589,2600,2588),(1269,2565,2564),(1270,2574,2565),(1255,2578,2574),(2590,2598,1276),(2577,2576,2591),(2566,2568,2592),(2592,2595,2593),(2593,2591,2576),(2595,2601,2594),(2594,2596,2591),(2596,2598,2590),(1273,1275,2597),(1275,1276,2598),(2584,2597,2599),(2597,2598,2596),(2601,2600,2599),(2595,2588,2600),(2586,2588,2572),(2588,2595,2592),(2588,2592,2568),(2604,2606,2602),(2606,2608,2605),(2608,2611,2607),(2611,2608,2609),(2608,2606,2612),(2606,2604,2613),(2614,2615,2602),(2615,2616,2603),(2616,2629,1810),(2617,2618,2612),(2619,2609,2612),(1816,2621,2617),(2620,2625,2610),(2621,2622,2618),(2622,2620,2619),(2621,1816,1827),(2621,2623,2624),(2624,2626,2620),(2626,2628,2625),(2628,2639,2627),(1823,2604,2603),(1824,2613,2604),(1809,2617,2613),(2629,2637,1830),(2616,2615,2630),(2605,2607,2631),(2631,2634,2632),(2632,2630,2615),(2634,2640,2633),(2633,2635,2630),(2635,2637,2629),(1827,1829,2636),(1829,1830,2637),(2623,2636,2638),(2636,2637,2635),(2640,2639,2638),(2634,2627,2639),(2625,2627,2611),(2627,2634,2631),(2627,2631,2607),(2641,2642,2643),(777,2644,2641),(777,780,2642),(2642,780,2257),(2642,2257,771),(2643,771,770),(2645,770,1154),(778,2641,2646),(2647,2648,923),(2648,2649,924),(2649,2650,926),(926,2650,2651),(2652,929,932),(2652,932,931),(2653,933,935),(2654,935,915),(2654,915,916),(916,917,2653),(2653,917,2655),(918,2652,2655),(927,2651,2656),(942,941,2656),(942,2656,943),(2651,952,950),(2650,954,952),(962,954,2650),(2647,2073,2648),(2073,962,2649),(918,929,2652),(933,2653,2655),(2656,950,946),(1154,775,2646),(2657,2658,2659),(2657,1901,1900),(1907,1901,2657),(1905,1907,2660),(1905,2660,2661),(1894,2661,2659),(1899,1895,2659),(2662,1900,2250),(2663,2647,922),(2664,2663,2036),(2665,2664,2037),(2665,2039,2259),(2044,2043,2666),(2044,2666,2667),(2046,2668,2669),(2032,2047,2669),(2033,2032,2669),(2034,2033,2669),(2667,2034,2668),(2666,2035,2034),(2670,2259,2053),(2671,2053,2056),(2055,2671,2056),(2066,2670,2671),(2068,2665,2670),(2068,2074,2664),(2663,2073,2647),(2074,2073,2663),(2666,2043,2035),(2668,2046,2045),(2064,2671,2055),(2250,1899,2659),(2643,2645,2646),(2643,2646,2641),(2641,2644,2642),(2641,778,777),(2642,2644,777),(771,2643,2642),(770,2645,2643),(2646,775,778),(923,922,2647),(924,923,2648),(926,924,2649),(2651,927,926),(931,2655,2652),(935,2654,2653),(2653,2654,916),(2655,917,918),(2656,941,927),(950,2656,2651),(952,2651,2650),(2650,2649,962),(2649,2648,2073),(2655,931,933),(946,943,2656),(2646,2645,1154),(2659,2661,2660),(2659,2660,2657),(2657,2662,2658),(1900,2662,2657),(2657,2660,1907),(2661,1894,1905),(2659,1895,1894),(2250,2658,2662),(922,2036,2663),(2036,2037,2664),(2037,2039,2665),(2259,2670,2665),(2667,2045,2044),(2669,2047,2046),(2669,2668,2034),(2034,2667,2666),(2053,2671,2670),(2671,2064,2066),(2670,2066,2068),(2664,2665,2068),(2663,2664,2074),(2045,2667,2668),(2055,2059,2064),(2659,2658,2250),(2258,1029,2672),(1029,1030,2673),(2674,2672,2675),(2672,2673,2676),(2677,2675,2678),(2675,2676,2679),(2680,2678,2681),(2679,2682,2681),(2683,2681,2684),(2682,2685,2684),(1030,1032,2686),(2673,2686,2687),(2676,2687,2688),(2679,2688,2689),(2682,2689,2690),(2685,2690,2691),(2684,2685,2692),(2693,2684,2694),(2692,2691,2695),(2694,2692,2696),(2697,2694,2698),(2696,2695,2699),(2698,2696,2700),(2698,2701,2702),(2703,2702,2701),(2703,2701,2700),(2703,2700,2699),(2686,1032,861),(2687,2686,2704),(2687,2705,2706),(2704,2707,2708),(2704,861,1065),(2705,2708,2709),(2688,2706,2710),(2706,2709,2711),(2689,2710,2712),(2710,2711,2713),(2690,2712,2714),(2712,2713,2715),(2714,2715,2716),(2717,2716,2718),(2691,2714,2717),(2695,2717,2719),(2715,2713,2720),(2721,2722,2716),(2718,2716,2722),(2711,2723,2720),(2711,2709,2724),(2709,2708,2725),(2708,2707,2726),(2726,2707,1065),(2727,2703,2718),(2728,2729,2727),(2730,2728,2722),(2731,2730,2721),(2732,2731,2720),(2733,2732,2723),(2734,2733,2724),(2727,2729,2703),(2734,2725,2726),(2726,1056,1034),(2735,2736,2732),(2736,2737,2731),(2737,2738,2730),(2739,2735,2733),(2739,2734,2740),(2741,2740,1034),(2742,2728,2730),(2742,2743,2729),(2744,1042,2258),(2745,2746,2693),(2746,2747,2683),(2747,2748,2680),(2674,2677,2749),(1042,2744,2741),(2677,2680,2748),(2744,2749,2739),(2749,2748,2735),(2748,2747,2736),(2747,2746,2737),(2750,2751,2745),(2752,2751,2750),(2752,2702,2703),(2745,2738,2737),(2751,2742,2738),(2742,2751,2752),(2743,2752,2703),(2729,2743,2703),(2699,2719,2703),(2719,2718,2703),(2130,2128,2753),(2131,2130,2754),(2754,2753,2755),(2756,2754,2757),(2757,2755,2758),(2759,2757,2760),(2760,2758,2761),(2762,2763,2760),(2764,2761,2765),(2766,2762,2764),(2132,2131,2756),(2767,2756,2759),(2768,2759,2763),(2769,2763,2762),(2770,2762,2766),(2771,2766,2772),(2766,2773,2774),(2773,2765,2775),(2776,2772,2777),(2772,2774,2778),(2774,2775,2779),(2780,2777,2781),(2777,2778,2782),(2782,2778,2779),(2782,2783,2784),(2781,2782,2784),(2785,2781,2784),(2132,2767,2786),(2767,2768,2787),(2787,2768,2769),(2788,2786,2787),(1984,2786,2788),(2789,2787,2790),(2790,2769,2770),(2791,2790,2792),(2792,2770,2771),(2793,2792,2794),(2794,2771,2776),(2795,2794,2796),(2797,2796,2798),(2799,2798,2800),(2796,2776,2780),(2798,2780,2785),(2795,2797,2801),(2802,2801,2797),(2799,2803,2804),(2805,2793,2795),(2791,2793,2805),(2789,2791,2806),(2788,2789,2807),(2788,2808,2153),(2803,2784,2804),(2809,2810,2802),(2810,2811,2801),(2811,2812,2813),(2812,2814,2805),(2814,2815,2806),(2815,2816,2807),(2784,2809,2804),(2807,2816,2817),(2153,2808,2817),(2818,2819,2815),(2820,2818,2814),(2821,2820,2812),(2819,2822,2816),(2816,2822,2823),(2817,2823,2134),(2810,2824,2821),(2825,2824,2810),(2141,2826,2753),(2827,2828,2775),(2829,2827,2765),(2830,2829,2761),(2755,2753,2826),(2826,2141,2134),(2758,2755,2831),(2831,2826,2823),(2830,2831,2822),(2829,2830,2819),(2827,2829,2818),(2832,2779,2775),(2832,2833,2783),(2784,2783,2833),(2821,2828,2827),(2824,2832,2828),(2832,2824,2825),(2784,2833,2825),(2784,2825,2809),(2784,2800,2785),(2784,2803,2800),(2672,2674,2258),(2673,2672,1029),(2675,2677,2674),(2676,2675,2672),(2678,2680,2677),(2679,2678,2675),(2681,2683,2680),(2681,2678,2679),(2684,2693,2683),(2684,2681,2682),(2686,2673,1030),(2687,2676,2673),(2688,2679,2676),(2689,2682,2679),(2690,2685,2682),(2691,2692,2685),(2692,2694,2684),(2694,2697,2693),(2695,2696,2692),(2696,2698,2694),(2698,2750,2697),(2699,2700,2696),(2700,2701,2698),(2702,2750,2698),(861,2704,2686),(2704,2705,2687),(2706,2688,2687),(2708,2705,2704),(1065,2707,2704),(2709,2706,2705),(2710,2689,2688),(2711,2710,2706),(2712,2690,2689),(2713,2712,2710),(2714,2691,2690),(2715,2714,2712),(2716,2717,2714),(2718,2719,2717),(2717,2695,2691),(2719,2699,2695),(2720,2721,2715),(2716,2715,2721),(2722,2727,2718),(2720,2713,2711),(2724,2723,2711),(2725,2724,2709),(2726,2725,2708),(1065,1056,2726),(2727,2722,2728),(2722,2721,2730),(2721,2720,2731),(2720,2723,2732),(2723,2724,2733),(2724,2725,2734),(2726,2740,2734),(1034,2740,2726),(2732,2733,2735),(2731,2732,2736),(2730,2731,2737),(2733,2734,2739),(2740,2741,2739),(1034,1033,2741),(2730,2738,2742),(2729,2728,2742),(2258,2674,2744),(2693,2697,2745),(2683,2693,2746),(2680,2683,2747),(2749,2744,2674),(2741,1033,1042),(2748,2749,2677),(2739,2741,2744),(2735,2739,2749),(2736,2735,2748),(2737,2736,2747),(2745,2697,2750),(2750,2702,2752),(2737,2746,2745),(2738,2745,2751),(2752,2743,2742),(2753,2754,2130),(2754,2756,2131),(2755,2757,2754),(2757,2759,2756),(2758,2760,2757),(2760,2763,2759),(2761,2764,2760),(2760,2764,2762),(2765,2773,2764),(2764,2773,2766),(2756,2767,2132),(2759,2768,2767),(2763,2769,2768),(2762,2770,2769),(2766,2771,2770),(2772,2776,2771),(2774,2772,2766),(2775,2774,2773),(2777,2780,2776),(2778,2777,2772),(2779,2778,2774),(2781,2785,2780),(2782,2781,2777),(2779,2783,2782),(2786,1984,2132),(2787,2786,2767),(2769,2790,2787),(2787,2789,2788),(2788,2163,1984),(2790,2791,2789),(2770,2792,2790),(2792,2793,2791),(2771,2794,2792),(2794,2795,2793),(2776,2796,2794),(2796,2797,2795),(2798,2799,2797),(2800,2803,2799),(2780,2798,2796),(2785,2800,2798),(2801,2813,2795),(2797,2799,2802),(2804,2802,2799),(2795,2813,2805),(2805,2806,2791),(2806,2807,2789),(2807,2808,2788),(2153,2163,2788),(2802,2804,2809),(2801,2802,2810),(2813,2801,2811),(2805,2813,2812),(2806,2805,2814),(2807,2806,2815),(2817,2808,2807),(2817,2133,2153),(2815,2814,2818),(2814,2812,2820),(2812,2811,2821),(2816,2815,2819),(2823,2817,2816),(2134,2133,2817),(2821,2811,2810),(2810,2809,2825),(2753,2128,2141),(2775,2765,2827),(2765,2761,2829),(2761,2758,2830),(2826,2831,2755),(2134,2823,2826),(2831,2830,2758),(2823,2822,2831),(2822,2819,2830),(2819,2818,2829),(2818,2820,2827),(2775,2828,2832),(2783,2779,2832),(2827,2820,2821),(2828,2821,2824),(2825,2833,2832),(2483,2834,2835),(2483,2835,2484),(2484,2835,2482),(2482,2835,2836),(2482,2836,2837),(2837,2836,2838),(2837,2838,2839),(2839,2838,2840),(2839,2840,2841),(2841,2840,2842),(2842,2840,2843),(2842,2843,2844),(2834,2845,2835),(2845,2846,2835),(2835,2846,2836),(2846,2847,2836),(2847,2848,2836),(2836,2848,2838),(2848,2849,2838),(2838,2849,2840),(2849,2850,2840),(2840,2850,2843),(2850,2851,2843),(2845,2852,2853),(2845,2853,2846),(2846,2853,2854),(2846,2854,2847),(2847,2854,2855),(2847,2855,2848),(2848,2855,2856),(2848,2856,2849),(2849,2856,2857),(2849,2857,2850),(2850,2857,2858),(2850,2858,2851),(2852,2859,2860),(2852,2860,2853),(2853,2860,2861),(2853,2861,2854),(2854,2861,2855),(2855,2861,2862),(2855,2862,2856),(2856,2862,2863),(2856,2863,2857),(2857,2863,2864),(2857,2864,2858),(2859,2865,2866),(2859,2866,2860),(2860,2866,2867),(2860,2867,2861),(2861,2867,2868),(2861,2868,2862),(2862,2868,2869),(2862,2869,2863),(2863,2869,2870),(2863,2870,2864),(2865,2871,2872),(2865,2872,2866),(2866,2872,2873),(2866,2873,2867),(2867,2873,2874),(2867,2874,2868),(2868,2874,2875),(2868,2875,2869),(2869,2875,2876),(2869,2876,2870),(2871,2877,2878),(2871,2878,2872),(2872,2878,2879),(2872,2879,2873),(2873,2879,2880),(2873,2880,2874),(2874,2880,2881),(2874,2881,2875),(2875,2881,2882),(2875,2882,2876),(2877,2883,2884),(2877,2884,2878),(2878,2884,2885),(2878,2885,2879),(2879,2885,2886),(2879,2886,2880),(2880,2886,2887),(2880,2887,2881),(2881,2887,2888),(2881,2888,2882),(2883,2889,2890),(2883,2890,2884),(2884,2890,2891),(2884,2891,2885),(2885,2891,2892),(2885,2892,2886),(2886,2892,2893),(2886,2893,2887),(2887,2893,2894),(2887,2894,2888),(2889,2895,2890),(2895,2896,2890),(2890,2896,2891),(2896,2897,2891),(2897,2898,2891),(2891,2898,2892),(2898,2899,2892),(2892,2899,2893),(2899,2900,2893),(2893,2900,2894),(2900,2901,2894),(1867,2834,2483),(1852,2871,2865),(1852,2865,2859),(1852,2859,2852),(1860,1852,2852),(1860,2852,2845),(1867,2845,2834),(1843,1893,2871),(1885,2895,2889),(1887,1885,2889),(1889,1887,2889),(1889,2889,2883),(1889,2883,2877),(1891,1889,2877),(1893,2877,2871),(2895,1883,1881),(2895,1885,1883),(1874,2483,2902),(2902,2895,1881),(2483,2482,2837),(2897,2896,2841),(2902,2483,2837),(2902,2837,2839),(2902,2839,2841),(2895,2902,2841),(2896,2895,2841),(2899,2843,2900),(2899,2898,2897),(2897,2841,2842),(2897,2842,2844),(2897,2844,2843),(2899,2897,2843),(2843,2851,2900),(2851,2858,2900),(2870,2882,2864),(2901,2900,2858),(2901,2858,2864),(2894,2901,2864),(2888,2894,2864),(2882,2888,2864),(2870,2876,2882),(1867,1860,2845),(1852,1843,2871),(1893,1891,2877),(2902,1881,1874),(2483,1874,1867)])
-        self.registerUVVertices([(0.832241,0.422945),(0.848702,0.441886),(0.854060,0.408736),(0.871901,0.452331),(0.872370,0.415338),(0.895047,0.447180),(0.908891,0.422226),(0.877086,0.395502),(0.859418,0.384324),(0.831423,0.371992),(0.829449,0.399162),(0.861230,0.369740),(0.835747,0.356195),(0.868908,0.350347),(0.843867,0.332114),(0.884783,0.323132),(0.888022,0.363025),(0.901080,0.341150),(0.906700,0.356505),(0.912374,0.374408),(0.881392,0.382563),(0.910973,0.395725),(0.914503,0.438675),(0.940867,0.427351),(0.925625,0.400088),(0.938935,0.402793),(0.932230,0.380547),(0.926241,0.366432),(0.921002,0.348702),(0.913726,0.329885),(0.907170,0.322453),(0.889854,0.311459),(0.851779,0.303621),(0.958733,0.428507),(0.954177,0.405048),(0.950476,0.378066),(0.945372,0.361205),(0.941367,0.340732),(0.931568,0.319317),(0.924828,0.307161),(0.909035,0.295291),(0.868873,0.280696),(1.000000,0.425811),(1.000000,0.401258),(1.000000,0.374651),(1.000000,0.356141),(1.000000,0.336388),(1.000000,0.312038),(1.000000,0.294276),(1.000000,0.279065),(1.000000,0.252180),(0.922628,0.492004),(0.896708,0.514218),(0.912915,0.530793),(0.938983,0.503557),(0.936556,0.470879),(0.916165,0.480691),(0.892273,0.487624),(0.890634,0.472379),(0.868793,0.482535),(0.951196,0.461902),(0.963452,0.454457),(1.000000,0.451697),(0.964028,0.465896),(1.000000,0.464099),(0.954608,0.476379),(0.118216,0.320370),(0.105237,0.334006),(0.122292,0.343842),(0.102618,0.342616),(0.112024,0.313557),(0.084863,0.329900),(0.152623,0.335555),(0.131843,0.305705),(0.143394,0.292532),(0.194835,0.298277),(0.163096,0.286028),(0.171858,0.273092),(0.191553,0.266318),(0.254845,0.258241),(0.239546,0.239636),(0.181206,0.210182),(0.128567,0.257124),(0.088208,0.296604),(0.078267,0.308726),(0.072765,0.329329),(0.081709,0.337862),(0.051190,0.331719),(0.064771,0.336363),(0.066835,0.290303),(0.092329,0.243702),(0.129610,0.196015),(0.371862,0.188505),(0.298014,0.126142),(0.000000,0.083057),(0.000000,0.187930),(0.000000,0.236517),(0.000000,0.285070),(0.000000,0.329922),(0.753482,0.163477),(0.758063,0.169497),(0.757296,0.164273),(0.784115,0.176280),(0.793028,0.184443),(0.793273,0.181217),(0.810567,0.182723),(0.814564,0.178190),(0.745424,0.158643),(0.747726,0.154784),(0.760309,0.155275),(0.744462,0.149676),(0.766568,0.151853),(0.819513,0.175785),(0.801378,0.177785),(0.761560,0.169269),(0.774538,0.173043),(0.772835,0.136726),(0.783304,0.143694),(0.816974,0.146936),(0.800204,0.133525),(0.803971,0.142964),(0.791665,0.153918),(0.768257,0.154070),(0.767537,0.144009),(0.785119,0.170196),(0.778242,0.172633),(0.769241,0.164966),(0.764306,0.160728),(0.822799,0.171796),(0.827238,0.168922),(0.823433,0.149206),(0.830736,0.158838),(0.827696,0.162423),(0.820262,0.165845),(0.813267,0.162885),(0.817516,0.177093),(0.066965,0.391021),(0.079490,0.389201),(0.088461,0.405550),(0.084517,0.383632),(0.094581,0.406323),(0.088702,0.388022),(0.094819,0.409815),(0.088251,0.392038),(0.093513,0.415627),(0.084347,0.396821),(0.088125,0.421714),(0.066395,0.406330),(0.056186,0.405830),(0.051002,0.422517),(0.055520,0.430457),(0.067810,0.430750),(0.067229,0.422909),(0.083564,0.347550),(0.082441,0.365412),(0.083713,0.363420),(0.084805,0.376512),(0.086342,0.373166),(0.083630,0.377918),(0.079221,0.349517),(0.077048,0.366321),(0.076475,0.382334),(0.073769,0.400476),(0.072460,0.351296),(0.071399,0.368868),(0.069059,0.384830),(0.084406,0.344977),(0.081011,0.360510),(0.081678,0.371147),(0.074785,0.378643),(0.071490,0.367488),(0.072657,0.357770),(0.073661,0.345459),(0.080294,0.344595),(0.065162,0.378018),(0.066426,0.367985),(0.061815,0.369968),(0.066413,0.359389),(0.058927,0.382343),(0.055376,0.393193),(0.059394,0.374989),(0.064219,0.361934),(0.066855,0.348513),(0.068050,0.346737),(0.052876,0.398646),(0.051458,0.402927),(0.049779,0.414046),(0.058018,0.383774),(0.063164,0.365377),(0.066345,0.350691),(0.062594,0.384509),(0.064889,0.365840),(0.068358,0.351958),(0.070081,0.419166),(0.790151,0.198923),(0.797496,0.223002),(0.816566,0.223792),(0.797933,0.242220),(0.818621,0.239674),(0.798797,0.275219),(0.817445,0.274850),(0.791605,0.301786),(0.812293,0.299938),(0.757309,0.183407),(0.746626,0.200379),(0.751971,0.174750),(0.745438,0.217195),(0.739988,0.192760),(0.739682,0.250609),(0.729894,0.210618),(0.720499,0.269946),(0.716383,0.235472),(0.756562,0.168629),(0.736686,0.183962),(0.724025,0.195240),(0.705830,0.258456),(0.711658,0.227309),(0.768303,0.167432),(0.757392,0.177554),(0.746218,0.187769),(0.702559,0.247869),(0.728388,0.208637),(0.801438,0.172373),(0.790647,0.179649),(0.786178,0.189318),(0.743752,0.225451),(0.778673,0.221032),(0.804488,0.196992),(0.769478,0.291988),(0.774700,0.273743),(0.773918,0.195763),(0.770941,0.237348),(0.763999,0.189929),(0.740925,0.292518),(0.752947,0.266344),(0.759995,0.228443),(0.761628,0.206607),(0.775069,0.215951),(0.819481,0.245651),(0.793843,0.232003),(0.808014,0.240712),(0.814850,0.197339),(0.822070,0.192065),(0.818814,0.175027),(0.826913,0.210635),(0.817214,0.186291),(0.848293,0.273735),(0.843154,0.258305),(0.833793,0.225214),(0.807857,0.357542),(0.785663,0.356220),(0.811798,0.331909),(0.755003,0.358531),(0.789780,0.329792),(0.730263,0.343943),(0.768113,0.318369),(0.699324,0.331579),(0.734707,0.311424),(0.686324,0.317241),(0.706947,0.293568),(0.680941,0.303636),(0.692917,0.289092),(0.689405,0.280169),(0.693324,0.278774),(0.806594,0.377856),(0.789878,0.383737),(0.760002,0.386828),(0.730534,0.377695),(0.702978,0.366964),(0.684603,0.351692),(0.672759,0.339164),(0.668372,0.314666),(0.805309,0.409076),(0.699662,0.390069),(0.734032,0.408342),(0.765417,0.411768),(0.784148,0.409768),(0.666266,0.373739),(0.681432,0.382025),(0.995122,0.762129),(1.000000,0.764568),(1.000000,0.752600),(0.976126,0.755929),(0.990622,0.752500),(0.958762,0.743687),(0.980970,0.749000),(0.953648,0.730982),(0.962707,0.735808),(0.948710,0.717629),(0.957968,0.723621),(0.939089,0.689662),(0.951337,0.708866),(0.934962,0.659118),(0.946845,0.685652),(0.937348,0.613299),(0.943981,0.656654),(0.942400,0.584698),(0.948694,0.622793),(0.949587,0.572228),(0.956422,0.597794),(0.956806,0.561320),(0.959972,0.590722),(0.969372,0.542121),(0.966321,0.582973),(0.978232,0.536567),(0.973852,0.575003),(1.000000,0.534745),(0.981014,0.565641),(0.983829,0.738409),(0.987823,0.744338),(1.000000,0.745767),(1.000000,0.599318),(1.000000,0.583849),(0.980244,0.584962),(0.982368,0.598051),(0.974764,0.590614),(0.967928,0.599218),(0.971393,0.602164),(0.960106,0.608901),(0.961436,0.613688),(0.952150,0.626338),(0.951931,0.633957),(0.944997,0.657170),(0.947032,0.655897),(0.947488,0.684082),(0.948776,0.679231),(0.953732,0.705294),(0.951559,0.694642),(0.955808,0.718516),(0.953920,0.711615),(0.962787,0.731132),(0.965651,0.730053),(0.978642,0.741000),(0.974124,0.734628),(0.975074,0.506675),(1.000000,0.507822),(1.000000,0.806456),(1.000000,0.778901),(0.972545,0.774131),(0.959533,0.800416),(0.952488,0.760987),(0.934299,0.785315),(0.944405,0.745785),(0.924219,0.761219),(0.936334,0.728430),(0.910684,0.738677),(0.925619,0.698096),(0.903597,0.704138),(0.925895,0.659419),(0.903665,0.661803),(0.921634,0.608523),(0.905233,0.598592),(0.900551,0.627758),(0.928417,0.578548),(0.907317,0.573148),(0.939828,0.559467),(0.925294,0.543943),(0.950472,0.536806),(0.965101,0.517365),(1.000000,0.566340),(0.884800,0.660870),(0.889805,0.620963),(0.890983,0.594984),(0.888598,0.546588),(0.891090,0.570704),(0.882160,0.707990),(0.875724,0.710499),(0.887502,0.745697),(0.844793,0.482614),(0.842484,0.502420),(0.871279,0.510788),(0.844377,0.535213),(0.875332,0.536680),(0.840660,0.568991),(0.867478,0.569840),(0.843405,0.592855),(0.863827,0.594529),(0.846818,0.628470),(0.868056,0.619616),(0.862028,0.670962),(0.873154,0.669339),(0.887982,0.707775),(1.000000,0.826327),(0.957938,0.822543),(0.924143,0.807354),(0.890572,0.769899),(0.810429,0.425077),(0.817558,0.448217),(0.948100,0.826821),(0.922769,0.818217),(0.888303,0.787336),(0.866668,0.757715),(0.856795,0.726530),(0.836574,0.684599),(0.823315,0.645551),(0.814644,0.602836),(0.810214,0.560899),(0.810068,0.530469),(0.809912,0.506845),(0.816878,0.474607),(0.756017,0.458791),(0.758973,0.514142),(0.945716,0.858382),(1.000000,0.863449),(0.759900,0.542551),(0.758382,0.563948),(0.755721,0.620558),(0.763688,0.665350),(0.775971,0.715712),(0.799482,0.761125),(0.831847,0.813424),(0.882724,0.841158),(0.920937,0.854979),(0.090122,0.915743),(0.000000,0.922103),(0.000000,0.993822),(0.156560,0.907092),(0.457077,0.955986),(0.230229,0.896883),(0.465554,0.924316),(0.295760,0.864737),(0.493004,0.871728),(0.316628,0.822944),(0.529487,0.824128),(0.372545,0.755880),(0.545925,0.776582),(0.440597,0.676861),(0.543517,0.690932),(0.443498,0.631225),(0.538953,0.650179),(0.439896,0.593533),(0.543834,0.615483),(0.446225,0.556733),(0.541643,0.581717),(0.446967,0.510984),(0.546822,0.532964),(0.446598,0.454494),(0.554831,0.476224),(0.437744,0.398001),(0.549436,0.443599),(0.433848,0.323455),(0.550709,0.367643),(0.417834,0.264514),(0.561542,0.311393),(0.404220,0.219706),(0.558510,0.263244),(0.563219,0.227272),(0.574081,0.167913),(0.600370,0.125504),(0.044064,0.820512),(0.000000,0.826385),(0.000000,0.862102),(0.063913,0.815553),(0.047940,0.858885),(0.097407,0.799961),(0.079640,0.847060),(0.138962,0.787911),(0.115585,0.840736),(0.153783,0.762445),(0.164851,0.833685),(0.146733,0.728320),(0.199203,0.808777),(0.184979,0.681604),(0.218882,0.740774),(0.243500,0.624889),(0.313841,0.661432),(0.267212,0.589930),(0.346512,0.610664),(0.289055,0.543610),(0.353012,0.580820),(0.291183,0.478740),(0.357311,0.539508),(0.289433,0.428693),(0.356074,0.488442),(0.277615,0.383211),(0.352533,0.427209),(0.251542,0.347409),(0.331255,0.369111),(0.232683,0.327063),(0.308746,0.326693),(0.289096,0.298566),(0.021302,0.765145),(0.000000,0.770506),(0.000000,0.795422),(0.043575,0.759544),(0.028871,0.789223),(0.077517,0.747243),(0.053378,0.779556),(0.105195,0.736409),(0.093392,0.763997),(0.124982,0.721575),(0.125935,0.747810),(0.134911,0.698640),(0.130142,0.731165),(0.146107,0.672790),(0.137431,0.698780),(0.161371,0.651344),(0.162043,0.678060),(0.176603,0.619593),(0.183879,0.658289),(0.180856,0.585252),(0.208491,0.610184),(0.187210,0.548070),(0.222038,0.577867),(0.197635,0.469096),(0.237408,0.512276),(0.188875,0.438242),(0.229923,0.445017),(0.172232,0.415711),(0.217537,0.408169),(0.150028,0.399884),(0.207138,0.378437),(0.698275,0.412586),(0.692889,0.450891),(1.000000,0.905501),(0.900264,0.898442),(0.876679,0.890625),(0.838400,0.878610),(0.784446,0.855866),(0.749983,0.830077),(0.705774,0.733966),(0.715418,0.763018),(0.700386,0.670182),(0.698681,0.633000),(0.696453,0.592714),(0.694622,0.550798),(0.694181,0.505778),(0.674999,0.231927),(0.700409,0.254252),(0.705468,0.195891),(1.000000,0.138104),(0.754609,0.164911),(1.000000,0.203013),(0.657187,0.278704),(0.641426,0.367564),(0.657542,0.468212),(0.660068,0.369388),(0.649491,0.317712),(1.000000,0.042767),(0.189225,0.357507),(0.019872,0.754533),(0.000000,0.758631),(0.039018,0.748066),(0.075356,0.739677),(0.099203,0.731346),(0.125634,0.711901),(0.133457,0.687708),(0.140047,0.659779),(0.139363,0.616743),(0.143349,0.596227),(0.147459,0.578320),(0.155941,0.551125),(0.158433,0.516916),(0.146496,0.488853),(0.136872,0.462621),(0.127814,0.442057),(0.015709,0.734047),(0.000000,0.737384),(0.031540,0.728568),(0.054246,0.724196),(0.092194,0.700331),(0.116660,0.675535),(0.125140,0.654388),(0.125317,0.624828),(0.127638,0.599612),(0.132311,0.586370),(0.142856,0.569953),(0.150338,0.550105),(0.148860,0.516979),(0.135844,0.490994),(0.119524,0.466916),(0.111369,0.453963),(0.105233,0.449905),(0.112448,0.433074),(0.127516,0.382357),(0.121258,0.391062),(0.134175,0.360108),(0.015412,0.712674),(0.000000,0.715676),(0.025317,0.709343),(0.046976,0.703625),(0.084876,0.688902),(0.110765,0.663891),(0.115929,0.636361),(0.118803,0.611560),(0.123405,0.593070),(0.130281,0.579898),(0.139600,0.564545),(0.146813,0.545585),(0.141076,0.506131),(0.125325,0.475859),(0.112155,0.452140),(0.104232,0.443108),(0.096211,0.434094),(0.006198,0.689960),(0.000000,0.692697),(0.020024,0.686514),(0.035996,0.682701),(0.054585,0.675916),(0.078199,0.662391),(0.098828,0.639300),(0.113911,0.608983),(0.116517,0.595329),(0.117339,0.587571),(0.122531,0.566169),(0.128527,0.546800),(0.131222,0.530097),(0.130679,0.501960),(0.118702,0.464679),(0.106920,0.431612),(0.004248,0.678642),(0.000000,0.681184),(0.017935,0.671646),(0.029925,0.669806),(0.045994,0.664310),(0.063793,0.655601),(0.077196,0.643681),(0.093871,0.620607),(0.103083,0.596963),(0.105247,0.575170),(0.106390,0.558666),(0.113545,0.544109),(0.118665,0.517027),(0.120074,0.493658),(0.113035,0.460751),(0.104301,0.434156),(0.023456,0.645813),(0.000000,0.647403),(0.000000,0.655041),(0.037745,0.638969),(0.029180,0.658009),(0.045070,0.630734),(0.042085,0.651245),(0.052280,0.621266),(0.052857,0.644607),(0.056955,0.610054),(0.066081,0.635023),(0.066870,0.588077),(0.070917,0.620125),(0.075544,0.561245),(0.077434,0.593366),(0.081437,0.546593),(0.086597,0.569521),(0.087759,0.532552),(0.094201,0.552355),(0.092716,0.506597),(0.099868,0.537848),(0.091139,0.481927),(0.106584,0.507596),(0.084893,0.456165),(0.106936,0.485231),(0.079460,0.436371),(0.100986,0.454379),(0.075886,0.425739),(0.093236,0.433994),(0.020800,0.634232),(0.000000,0.636412),(0.030740,0.627617),(0.035631,0.620741),(0.040982,0.611318),(0.044061,0.600332),(0.050527,0.582675),(0.062185,0.560831),(0.068510,0.543939),(0.071949,0.524312),(0.075582,0.501096),(0.078961,0.481158),(0.074843,0.458539),(0.070688,0.444004),(0.015014,0.620722),(0.000000,0.624896),(0.019204,0.616006),(0.022514,0.608841),(0.026058,0.602098),(0.026515,0.595045),(0.030262,0.580196),(0.038225,0.559232),(0.045516,0.542198),(0.054467,0.523123),(0.056214,0.507131),(0.061470,0.477545),(0.092297,0.420089),(0.081846,0.404916),(1.000000,0.834761),(0.062423,0.386726),(0.080883,0.336436),(0.083793,0.335170),(0.087369,0.324057),(0.082021,0.332873),(0.084645,0.331247),(0.089577,0.319444),(0.079441,0.329289),(0.082444,0.316682),(0.085925,0.325766),(0.084946,0.322525),(0.085640,0.316350),(0.085116,0.318015),(0.083718,0.313263),(0.084375,0.307301),(0.091473,0.308064),(0.089299,0.323903),(0.081909,0.334625),(0.072369,0.316174),(0.076233,0.310588),(0.069996,0.308235),(0.064989,0.315159),(0.066098,0.321217),(0.067599,0.336245),(0.073409,0.335185),(0.074121,0.323281),(0.090016,0.312054),(0.087276,0.322876),(0.090304,0.314198),(0.088654,0.314950),(0.074686,0.320485),(0.077863,0.307776),(0.064654,0.319481),(0.071138,0.309256),(0.068862,0.320511),(0.067622,0.331766),(0.067297,0.333895),(0.074876,0.328714),(0.063927,0.460736),(0.050529,0.509721),(0.021059,0.590575),(0.020588,0.581975),(0.023722,0.563963),(0.031804,0.543091),(0.040730,0.526732),(0.000000,0.587563),(0.000000,0.619901),(0.000000,0.611517),(0.000000,0.600974),(0.003934,0.595482),(0.003660,0.563670),(0.000000,0.563421),(0.004265,0.624855),(0.000000,0.595151),(0.004740,0.646947),(0.000000,0.624556),(0.005333,0.663755),(0.000000,0.646940),(0.005997,0.674055),(0.000000,0.664283),(0.006866,0.596403),(0.006385,0.564362),(0.007450,0.625688),(0.008279,0.646976),(0.009288,0.662311),(0.010414,0.671842),(0.008015,0.597693),(0.007447,0.565329),(0.008704,0.626862),(0.009673,0.647041),(0.010808,0.660334),(0.007019,0.599022),(0.006516,0.566323),(0.007630,0.628083),(0.008480,0.647137),(0.009436,0.658352),(0.004087,0.600021),(0.003793,0.567069),(0.004447,0.629007),(0.004943,0.647229),(0.005484,0.656896),(0.000005,0.600394),(0.000004,0.567346),(0.000005,0.629352),(0.000007,0.656362),(0.000000,0.674865),(0.951142,0.667842),(0.953099,0.663700),(0.952206,0.661249),(0.950464,0.671457),(0.956439,0.670395),(0.955471,0.668340),(0.960695,0.666437),(0.963498,0.660835),(0.959756,0.666034),(0.956341,0.658012),(0.959641,0.658894),(0.960877,0.656980),(0.955013,0.656482),(0.953245,0.659366),(0.958166,0.654140),(0.961914,0.655089),(0.965325,0.658387),(0.962191,0.669854),(0.964078,0.663909),(0.955023,0.676190),(0.958375,0.674762),(0.951404,0.666211),(0.952082,0.673846),(0.953554,0.678707),(0.958059,0.678653),(0.960597,0.676731),(0.959288,0.673000),(0.964878,0.671641),(0.966521,0.664206),(0.967263,0.657913),(0.967135,0.655091),(0.961650,0.652121),(0.957610,0.652268),(0.954275,0.654346),(0.952759,0.659449),(0.970495,0.660852),(0.969931,0.657008),(0.969071,0.652031),(0.963737,0.650129),(0.958415,0.649493),(0.955873,0.651250),(0.953009,0.657071),(0.953525,0.661702),(0.967765,0.670650),(0.968775,0.665387),(0.962926,0.677858),(0.955263,0.679903),(0.949649,0.675654),(0.950924,0.676351),(0.950512,0.666847),(0.951198,0.678444),(0.962604,0.684353),(0.959114,0.680328),(0.967820,0.681780),(0.974069,0.674612),(0.977061,0.667320),(0.975826,0.660594),(0.974534,0.655175),(0.951344,0.667315),(0.970370,0.691780),(0.977769,0.686639),(0.982961,0.675594),(0.984510,0.666613),(0.984561,0.659247),(0.979153,0.651985),(0.975628,0.645789),(0.968162,0.640991),(0.961775,0.636777),(0.959855,0.637285),(0.955142,0.640008),(0.953128,0.644341),(0.952455,0.656445),(0.953040,0.667586),(0.951329,0.680910),(0.951874,0.671349),(0.955681,0.684227),(0.954296,0.688433),(0.999995,0.666893),(0.991283,0.658459),(0.985729,0.648649),(0.979971,0.638915),(0.974133,0.626748),(0.952271,0.641294),(0.950496,0.648776),(0.950819,0.655976),(0.949067,0.664218),(0.949598,0.670725),(0.950105,0.678047),(0.999978,0.692158),(0.988447,0.700123),(0.961274,0.693277),(0.961966,0.703279),(0.978580,0.703257),(0.958540,0.698934),(0.951309,0.686967),(0.972293,0.622626),(0.969726,0.615760),(0.961705,0.620566),(0.954675,0.633932),(0.991625,0.645388),(0.999985,0.657282),(0.999970,0.642342),(0.999966,0.638458),(0.991537,0.636457),(0.986021,0.633629),(0.982933,0.629279),(0.976812,0.621913),(0.974847,0.617905),(0.975062,0.610209),(0.972662,0.606527),(0.962113,0.614833),(0.952666,0.625575),(0.949212,0.632038),(0.945735,0.643290),(0.944914,0.655663),(0.946414,0.665130),(0.947864,0.672915),(0.999954,0.626073),(0.992502,0.624102),(0.987321,0.622246),(0.983225,0.619696),(0.978754,0.615325),(0.977468,0.611499),(0.976160,0.606598),(0.975763,0.603417),(0.991996,0.616436),(0.986525,0.615032),(0.987767,0.616952),(0.981308,0.611132),(0.978973,0.610744),(0.983167,0.614432),(0.978370,0.607180),(0.978937,0.606858),(0.977020,0.600495),(0.976784,0.602830),(0.992821,0.619632),(0.975402,0.601045),(0.991527,0.608355),(0.989269,0.609080),(0.987667,0.612198),(0.999932,0.603378),(0.992334,0.604025),(0.988977,0.604998),(0.999940,0.612967),(0.991788,0.612324),(0.981929,0.608558),(0.983604,0.605641),(0.986695,0.599754),(0.993459,0.598535),(0.999931,0.599199),(0.999931,0.594164),(0.994456,0.592421),(0.999931,0.590823),(0.995247,0.589693),(0.990537,0.588158),(0.989199,0.590972),(0.985180,0.587556),(0.980366,0.589616),(0.978422,0.592831),(0.988515,0.595014),(0.984464,0.590853),(0.980832,0.596153),(0.984259,0.593561),(0.979453,0.602146),(0.979790,0.593169),(0.980337,0.605411),(0.976023,0.595916),(0.976947,0.593857),(0.974509,0.597706),(0.975951,0.594990),(0.975355,0.595227),(0.977817,0.591218),(0.976862,0.592337),(0.977214,0.592005),(0.976578,0.597518),(0.977433,0.593274),(0.978635,0.590632),(0.975862,0.599029),(0.976665,0.595104),(0.985551,0.589167),(0.983547,0.587966),(0.988067,0.585362),(0.985441,0.585700),(0.989299,0.583163),(0.986878,0.584862),(0.991727,0.581329),(0.972696,0.601469),(0.974140,0.597597),(0.981709,0.592035),(0.978258,0.594847),(0.999933,0.582677),(0.995416,0.581741),(0.993393,0.583770),(0.999936,0.581165),(0.995259,0.582651),(0.999940,0.582681),(0.992923,0.585473),(0.999959,0.590415),(0.999965,0.591318),(0.989432,0.589698),(0.990391,0.587325),(0.987122,0.589293),(0.999954,0.588943),(0.992274,0.589192),(0.999946,0.584582),(0.984136,0.589788),(0.999975,0.593307),(0.989101,0.591314),(0.978856,0.591408),(0.984618,0.593327),(0.999992,0.595243),(0.974067,0.597878),(0.973102,0.594557),(0.969681,0.600294),(0.965667,0.608133),(0.955093,0.613871),(0.960812,0.606454),(0.967435,0.601905),(0.946573,0.624680),(0.950811,0.617991),(0.960090,0.612981),(0.965710,0.608216),(0.959725,0.615680),(0.999989,0.597757),(0.985205,0.597880),(0.973901,0.601163),(0.962620,0.613551),(0.944665,0.629423),(0.953108,0.628048),(0.950328,0.628689),(0.957174,0.617580),(0.943120,0.652109),(0.941119,0.651438),(0.941416,0.654288),(0.944461,0.636108),(0.943011,0.669792),(0.947812,0.679631),(0.945460,0.677880),(0.945653,0.672122),(0.944686,0.673082),(0.948102,0.651401),(0.946840,0.678664),(0.946363,0.681811),(0.948710,0.672760),(0.999993,0.678702),(0.999946,0.617471),(0.999936,0.608886),(0.999933,0.725149),(0.999948,0.715771),(0.988727,0.715848),(0.987482,0.723531),(0.976659,0.715308),(0.982569,0.724146),(0.973327,0.714836),(0.999920,0.731876),(0.987331,0.731003),(0.979673,0.730010),(0.976915,0.723956),(0.975587,0.730179),(0.969282,0.722632),(0.969272,0.715702),(0.999956,0.709781),(0.968996,0.708649),(0.956660,0.730116),(0.954793,0.725071),(0.961191,0.725751),(0.966906,0.731868),(0.966535,0.727164),(0.979040,0.734617),(0.999908,0.735220),(0.974607,0.732900),(0.971128,0.732979),(0.963530,0.732224),(0.969169,0.730393),(0.975645,0.734425),(0.971221,0.732224),(0.999900,0.735301),(0.975710,0.735347),(0.962728,0.727662),(0.962225,0.729040),(0.960760,0.725091),(0.951182,0.718877),(0.946867,0.722455),(0.948306,0.723435),(0.946684,0.719669),(0.955545,0.722121),(0.950203,0.718731),(0.943775,0.715540),(0.939516,0.719072),(0.938612,0.720302),(0.939100,0.717736),(0.934141,0.712626),(0.928741,0.715431),(0.930732,0.715383),(0.931809,0.713213),(0.952545,0.706485),(0.946144,0.712117),(0.942642,0.710515),(0.938754,0.709108),(0.928228,0.712236),(0.920276,0.713363),(0.921829,0.711698),(0.931690,0.708498),(0.919766,0.711910),(0.914547,0.713371),(0.915915,0.709709),(0.904773,0.712195),(0.900518,0.714019),(0.886260,0.713079),(0.908678,0.714557),(0.922491,0.709123),(0.906578,0.711745),(0.901937,0.713450),(0.888358,0.715077),(0.874454,0.714219),(0.876782,0.709026),(0.866960,0.710231),(0.904224,0.709363),(0.890395,0.707879),(0.925596,0.709718),(0.913620,0.706900),(0.904613,0.706846),(0.886675,0.701615),(0.868388,0.699468),(0.876180,0.692020),(0.889204,0.681778),(0.898849,0.696133),(0.899875,0.681935),(0.945731,0.703561),(0.937315,0.703179),(0.945060,0.692510),(0.954740,0.692918),(0.912469,0.696861),(0.929335,0.701287),(0.915528,0.682598),(0.951741,0.698833),(0.954205,0.696070),(0.951724,0.694323),(0.876629,0.710085),(0.870077,0.706710),(0.884851,0.706168),(0.877122,0.705461),(0.873943,0.706010),(0.883054,0.705616),(0.888616,0.710441),(0.888252,0.707889),(0.878526,0.707789),(0.894790,0.706459),(0.944502,0.699123),(0.938977,0.704011),(0.929768,0.692916),(0.927210,0.697582),(0.920066,0.702312),(0.908363,0.706320),(0.898846,0.708936),(0.898000,0.709019),(0.907509,0.705905),(0.918173,0.702153),(0.923689,0.699088),(0.906510,0.706478),(0.951535,0.690464),(0.928736,0.696057),(0.914154,0.703970),(0.921841,0.702350),(0.925989,0.700124),(0.917949,0.700344),(0.909417,0.702028),(0.897295,0.702385),(0.889878,0.703827),(0.914664,0.697649),(0.903223,0.697339),(0.892832,0.698875),(0.885764,0.700516),(0.915202,0.690331),(0.902680,0.689251),(0.890925,0.691363),(0.882482,0.695185),(0.876234,0.700811),(0.873520,0.702581),(0.948822,0.684824),(0.951173,0.687810),(0.929697,0.693190),(0.931790,0.690815),(0.930244,0.691942),(0.951915,0.669790),(0.949562,0.684306),(1.000000,0.741203),(0.999877,0.740395),(0.951458,0.706343),(0.054606,0.394585),(0.848702,0.441886),(0.832241,0.422945),(0.829449,0.399162),(0.871901,0.452331),(0.854060,0.408736),(0.895047,0.447180),(0.872370,0.415338),(0.877086,0.395502),(0.908891,0.422226),(0.859418,0.384324),(0.831423,0.371992),(0.861230,0.369740),(0.868908,0.350347),(0.835747,0.356195),(0.884783,0.323132),(0.843867,0.332114),(0.888022,0.363025),(0.906700,0.356505),(0.901080,0.341150),(0.912374,0.374408),(0.881392,0.382563),(0.914503,0.438675),(0.925625,0.400088),(0.940867,0.427351),(0.910973,0.395725),(0.932230,0.380547),(0.938935,0.402793),(0.926241,0.366432),(0.921002,0.348702),(0.913726,0.329885),(0.907170,0.322453),(0.889854,0.311459),(0.851779,0.303621),(0.954177,0.405048),(0.958733,0.428507),(0.950476,0.378066),(0.945372,0.361205),(0.941367,0.340732),(0.931568,0.319317),(0.924828,0.307161),(0.909035,0.295291),(0.868873,0.280696),(0.912915,0.530793),(0.896708,0.514218),(0.922628,0.492004),(0.938983,0.503557),(0.936556,0.470879),(0.916165,0.480691),(0.892273,0.487624),(0.890634,0.472379),(0.868793,0.482535),(0.951196,0.461902),(0.963452,0.454457),(0.964028,0.465896),(0.954608,0.476379),(0.105237,0.334006),(0.118216,0.320370),(0.152623,0.335555),(0.102618,0.342616),(0.122292,0.343842),(0.112024,0.313557),(0.131843,0.305705),(0.143394,0.292532),(0.194835,0.298277),(0.171858,0.273092),(0.163096,0.286028),(0.191553,0.266318),(0.254845,0.258241),(0.181206,0.210182),(0.239546,0.239636),(0.128567,0.257124),(0.088208,0.296604),(0.084863,0.329900),(0.072765,0.329329),(0.078267,0.308726),(0.081709,0.337862),(0.064771,0.336363),(0.051190,0.331719),(0.066835,0.290303),(0.092329,0.243702),(0.371862,0.188505),(0.129610,0.196015),(0.298014,0.126142),(0.758063,0.169497),(0.753482,0.163477),(0.745424,0.158643),(0.793028,0.184443),(0.784115,0.176280),(0.778242,0.172633),(0.810567,0.182723),(0.793273,0.181217),(0.747726,0.154784),(0.757296,0.164273),(0.744462,0.149676),(0.760309,0.155275),(0.766568,0.151853),(0.819513,0.175785),(0.814564,0.178190),(0.774538,0.173043),(0.761560,0.169269),(0.767537,0.144009),(0.772835,0.136726),(0.783304,0.143694),(0.800204,0.133525),(0.768257,0.154070),(0.791665,0.153918),(0.803971,0.142964),(0.785119,0.170196),(0.801378,0.177785),(0.769241,0.164966),(0.764306,0.160728),(0.822799,0.171796),(0.823433,0.149206),(0.816974,0.146936),(0.827696,0.162423),(0.830736,0.158838),(0.827238,0.168922),(0.820262,0.165845),(0.813267,0.162885),(0.079490,0.389201),(0.066965,0.391021),(0.081846,0.404916),(0.084517,0.383632),(0.088461,0.405550),(0.088702,0.388022),(0.094581,0.406323),(0.088251,0.392038),(0.094819,0.409815),(0.084347,0.396821),(0.093513,0.415627),(0.056186,0.405830),(0.066395,0.406330),(0.067229,0.422909),(0.067810,0.430750),(0.055520,0.430457),(0.051002,0.422517),(0.082441,0.365412),(0.083564,0.347550),(0.084406,0.344977),(0.084805,0.376512),(0.083713,0.363420),(0.086342,0.373166),(0.083630,0.377918),(0.077048,0.366321),(0.079221,0.349517),(0.076475,0.382334),(0.073769,0.400476),(0.071399,0.368868),(0.072460,0.351296),(0.069059,0.384830),(0.080294,0.344595),(0.081011,0.360510),(0.081678,0.371147),(0.074785,0.378643),(0.071490,0.367488),(0.072657,0.357770),(0.073661,0.345459),(0.066426,0.367985),(0.065162,0.378018),(0.061815,0.369968),(0.058927,0.382343),(0.059394,0.374989),(0.055376,0.393193),(0.064219,0.361934),(0.066855,0.348513),(0.066413,0.359389),(0.049779,0.414046),(0.051458,0.402927),(0.052876,0.398646),(0.058018,0.383774),(0.063164,0.365377),(0.066345,0.350691),(0.062594,0.384509),(0.064889,0.365840),(0.068358,0.351958),(0.797496,0.223002),(0.790151,0.198923),(0.804488,0.196992),(0.797933,0.242220),(0.816566,0.223792),(0.798797,0.275219),(0.818621,0.239674),(0.791605,0.301786),(0.817445,0.274850),(0.757309,0.183407),(0.751971,0.174750),(0.746626,0.200379),(0.739988,0.192760),(0.745438,0.217195),(0.729894,0.210618),(0.739682,0.250609),(0.716383,0.235472),(0.720499,0.269946),(0.705830,0.258456),(0.736686,0.183962),(0.724025,0.195240),(0.711658,0.227309),(0.702559,0.247869),(0.756562,0.168629),(0.757392,0.177554),(0.746218,0.187769),(0.728388,0.208637),(0.743752,0.225451),(0.768303,0.167432),(0.790647,0.179649),(0.786178,0.189318),(0.778673,0.221032),(0.793843,0.232003),(0.773918,0.195763),(0.769478,0.291988),(0.774700,0.273743),(0.770941,0.237348),(0.775069,0.215951),(0.763999,0.189929),(0.740925,0.292518),(0.752947,0.266344),(0.759995,0.228443),(0.761628,0.206607),(0.801438,0.172373),(0.819481,0.245651),(0.808014,0.240712),(0.814850,0.197339),(0.817214,0.186291),(0.817516,0.177093),(0.818814,0.175027),(0.822070,0.192065),(0.848293,0.273735),(0.843154,0.258305),(0.833793,0.225214),(0.812293,0.299938),(0.826913,0.210635),(0.807857,0.357542),(0.811798,0.331909),(0.785663,0.356220),(0.789780,0.329792),(0.755003,0.358531),(0.768113,0.318369),(0.730263,0.343943),(0.734707,0.311424),(0.699324,0.331579),(0.706947,0.293568),(0.686324,0.317241),(0.692917,0.289092),(0.680941,0.303636),(0.693324,0.278774),(0.689405,0.280169),(0.700409,0.254252),(0.806594,0.377856),(0.789878,0.383737),(0.760002,0.386828),(0.730534,0.377695),(0.702978,0.366964),(0.684603,0.351692),(0.672759,0.339164),(0.668372,0.314666),(0.805309,0.409076),(0.699662,0.390069),(0.734032,0.408342),(0.765417,0.411768),(0.784148,0.409768),(0.666266,0.373739),(0.660068,0.369388),(0.681432,0.382025),(0.995122,0.762129),(0.990622,0.752500),(0.976126,0.755929),(0.980970,0.749000),(0.958762,0.743687),(0.962707,0.735808),(0.953648,0.730982),(0.957968,0.723621),(0.948710,0.717629),(0.951337,0.708866),(0.939089,0.689662),(0.946845,0.685652),(0.934962,0.659118),(0.943981,0.656654),(0.937348,0.613299),(0.948694,0.622793),(0.942400,0.584698),(0.956422,0.597794),(0.949587,0.572228),(0.959972,0.590722),(0.956806,0.561320),(0.966321,0.582973),(0.969372,0.542121),(0.973852,0.575003),(0.978232,0.536567),(0.981014,0.565641),(0.987823,0.744338),(0.983829,0.738409),(0.982368,0.598051),(0.974764,0.590614),(0.980244,0.584962),(0.971393,0.602164),(0.967928,0.599218),(0.961436,0.613688),(0.960106,0.608901),(0.951931,0.633957),(0.952150,0.626338),(0.947032,0.655897),(0.944997,0.657170),(0.948776,0.679231),(0.947488,0.684082),(0.951559,0.694642),(0.953732,0.705294),(0.953920,0.711615),(0.955808,0.718516),(0.965651,0.730053),(0.962787,0.731132),(0.974124,0.734628),(0.978642,0.741000),(0.975074,0.506675),(0.959533,0.800416),(0.972545,0.774131),(0.934299,0.785315),(0.952488,0.760987),(0.924219,0.761219),(0.944405,0.745785),(0.910684,0.738677),(0.936334,0.728430),(0.903597,0.704138),(0.925619,0.698096),(0.903665,0.661803),(0.925895,0.659419),(0.900551,0.627758),(0.921634,0.608523),(0.905233,0.598592),(0.907317,0.573148),(0.928417,0.578548),(0.925294,0.543943),(0.939828,0.559467),(0.950472,0.536806),(0.965101,0.517365),(0.884800,0.660870),(0.889805,0.620963),(0.890983,0.594984),(0.891090,0.570704),(0.888598,0.546588),(0.887502,0.745697),(0.875724,0.710499),(0.882160,0.707990),(0.844793,0.482614),(0.871279,0.510788),(0.842484,0.502420),(0.875332,0.536680),(0.844377,0.535213),(0.867478,0.569840),(0.840660,0.568991),(0.863827,0.594529),(0.843405,0.592855),(0.868056,0.619616),(0.846818,0.628470),(0.873154,0.669339),(0.862028,0.670962),(0.887982,0.707775),(0.957938,0.822543),(0.924143,0.807354),(0.890572,0.769899),(0.817558,0.448217),(0.810429,0.425077),(0.948100,0.826821),(0.922769,0.818217),(0.888303,0.787336),(0.866668,0.757715),(0.856795,0.726530),(0.836574,0.684599),(0.823315,0.645551),(0.814644,0.602836),(0.810214,0.560899),(0.810068,0.530469),(0.809912,0.506845),(0.816878,0.474607),(0.756017,0.458791),(0.945716,0.858382),(0.758973,0.514142),(0.759900,0.542551),(0.758382,0.563948),(0.755721,0.620558),(0.763688,0.665350),(0.775971,0.715712),(0.799482,0.761125),(0.831847,0.813424),(0.882724,0.841158),(0.920937,0.854979),(0.090122,0.915743),(0.457077,0.955986),(0.156560,0.907092),(0.465554,0.924316),(0.230229,0.896883),(0.493004,0.871728),(0.295760,0.864737),(0.529487,0.824128),(0.316628,0.822944),(0.545925,0.776582),(0.372545,0.755880),(0.543517,0.690932),(0.440597,0.676861),(0.538953,0.650179),(0.443498,0.631225),(0.543834,0.615483),(0.439896,0.593533),(0.541643,0.581717),(0.446225,0.556733),(0.546822,0.532964),(0.446967,0.510984),(0.554831,0.476224),(0.446598,0.454494),(0.549436,0.443599),(0.437744,0.398001),(0.550709,0.367643),(0.433848,0.323455),(0.561542,0.311393),(0.417834,0.264514),(0.558510,0.263244),(0.404220,0.219706),(0.563219,0.227272),(0.574081,0.167913),(0.600370,0.125504),(0.044064,0.820512),(0.047940,0.858885),(0.063913,0.815553),(0.079640,0.847060),(0.097407,0.799961),(0.115585,0.840736),(0.138962,0.787911),(0.164851,0.833685),(0.153783,0.762445),(0.199203,0.808777),(0.146733,0.728320),(0.218882,0.740774),(0.184979,0.681604),(0.313841,0.661432),(0.243500,0.624889),(0.346512,0.610664),(0.267212,0.589930),(0.353012,0.580820),(0.289055,0.543610),(0.357311,0.539508),(0.291183,0.478740),(0.356074,0.488442),(0.289433,0.428693),(0.352533,0.427209),(0.277615,0.383211),(0.331255,0.369111),(0.251542,0.347409),(0.308746,0.326693),(0.232683,0.327063),(0.289096,0.298566),(0.021302,0.765145),(0.028871,0.789223),(0.043575,0.759544),(0.053378,0.779556),(0.077517,0.747243),(0.093392,0.763997),(0.105195,0.736409),(0.125935,0.747810),(0.124982,0.721575),(0.130142,0.731165),(0.134911,0.698640),(0.137431,0.698780),(0.146107,0.672790),(0.162043,0.678060),(0.161371,0.651344),(0.183879,0.658289),(0.176603,0.619593),(0.208491,0.610184),(0.180856,0.585252),(0.222038,0.577867),(0.187210,0.548070),(0.237408,0.512276),(0.197635,0.469096),(0.229923,0.445017),(0.188875,0.438242),(0.217537,0.408169),(0.172232,0.415711),(0.207138,0.378437),(0.150028,0.399884),(0.189225,0.357507),(0.692889,0.450891),(0.698275,0.412586),(0.900264,0.898442),(0.876679,0.890625),(0.838400,0.878610),(0.784446,0.855866),(0.749983,0.830077),(0.715418,0.763018),(0.705774,0.733966),(0.700386,0.670182),(0.698681,0.633000),(0.696453,0.592714),(0.694622,0.550798),(0.694181,0.505778),(0.674999,0.231927),(0.705468,0.195891),(0.754609,0.164911),(0.657187,0.278704),(0.657542,0.468212),(0.641426,0.367564),(0.649491,0.317712),(0.019872,0.754533),(0.039018,0.748066),(0.075356,0.739677),(0.099203,0.731346),(0.125634,0.711901),(0.133457,0.687708),(0.140047,0.659779),(0.139363,0.616743),(0.143349,0.596227),(0.147459,0.578320),(0.155941,0.551125),(0.158433,0.516916),(0.146496,0.488853),(0.136872,0.462621),(0.127814,0.442057),(0.015709,0.734047),(0.031540,0.728568),(0.054246,0.724196),(0.092194,0.700331),(0.116660,0.675535),(0.125140,0.654388),(0.125317,0.624828),(0.127638,0.599612),(0.132311,0.586370),(0.142856,0.569953),(0.150338,0.550105),(0.148860,0.516979),(0.135844,0.490994),(0.119524,0.466916),(0.111369,0.453963),(0.105233,0.449905),(0.112448,0.433074),(0.134175,0.360108),(0.121258,0.391062),(0.127516,0.382357),(0.015412,0.712674),(0.025317,0.709343),(0.046976,0.703625),(0.084876,0.688902),(0.110765,0.663891),(0.115929,0.636361),(0.118803,0.611560),(0.123405,0.593070),(0.130281,0.579898),(0.139600,0.564545),(0.146813,0.545585),(0.141076,0.506131),(0.125325,0.475859),(0.112155,0.452140),(0.104232,0.443108),(0.096211,0.434094),(0.006198,0.689960),(0.020024,0.686514),(0.035996,0.682701),(0.054585,0.675916),(0.078199,0.662391),(0.098828,0.639300),(0.113911,0.608983),(0.116517,0.595329),(0.117339,0.587571),(0.122531,0.566169),(0.128527,0.546800),(0.131222,0.530097),(0.130679,0.501960),(0.118702,0.464679),(0.106920,0.431612),(0.004248,0.678642),(0.017935,0.671646),(0.029925,0.669806),(0.045994,0.664310),(0.063793,0.655601),(0.077196,0.643681),(0.093871,0.620607),(0.103083,0.596963),(0.105247,0.575170),(0.106390,0.558666),(0.113545,0.544109),(0.118665,0.517027),(0.120074,0.493658),(0.113035,0.460751),(0.104301,0.434156),(0.023456,0.645813),(0.029180,0.658009),(0.037745,0.638969),(0.042085,0.651245),(0.045070,0.630734),(0.052857,0.644607),(0.052280,0.621266),(0.066081,0.635023),(0.056955,0.610054),(0.070917,0.620125),(0.066870,0.588077),(0.077434,0.593366),(0.075544,0.561245),(0.086597,0.569521),(0.081437,0.546593),(0.094201,0.552355),(0.087759,0.532552),(0.099868,0.537848),(0.092716,0.506597),(0.106584,0.507596),(0.091139,0.481927),(0.106936,0.485231),(0.084893,0.456165),(0.100986,0.454379),(0.079460,0.436371),(0.093236,0.433994),(0.075886,0.425739),(0.088125,0.421714),(0.020800,0.634232),(0.030740,0.627617),(0.035631,0.620741),(0.040982,0.611318),(0.044061,0.600332),(0.050527,0.582675),(0.062185,0.560831),(0.068510,0.543939),(0.071949,0.524312),(0.075582,0.501096),(0.078961,0.481158),(0.074843,0.458539),(0.070688,0.444004),(0.015014,0.620722),(0.019204,0.616006),(0.022514,0.608841),(0.026058,0.602098),(0.026515,0.595045),(0.030262,0.580196),(0.038225,0.559232),(0.045516,0.542198),(0.054467,0.523123),(0.056214,0.507131),(0.061470,0.477545),(0.092297,0.420089),(0.070081,0.419166),(0.062423,0.386726),(0.068050,0.346737),(0.083793,0.335170),(0.080883,0.336436),(0.085925,0.325766),(0.084645,0.331247),(0.082021,0.332873),(0.087276,0.322876),(0.079441,0.329289),(0.089577,0.319444),(0.084946,0.322525),(0.087369,0.324057),(0.085116,0.318015),(0.085640,0.316350),(0.083718,0.313263),(0.084375,0.307301),(0.082444,0.316682),(0.081909,0.334625),(0.089299,0.323903),(0.074121,0.323281),(0.072369,0.316174),(0.076233,0.310588),(0.064989,0.315159),(0.073409,0.335185),(0.067599,0.336245),(0.066098,0.321217),(0.090016,0.312054),(0.091473,0.308064),(0.090304,0.314198),(0.088654,0.314950),(0.074686,0.320485),(0.064654,0.319481),(0.069996,0.308235),(0.068862,0.320511),(0.071138,0.309256),(0.077863,0.307776),(0.067622,0.331766),(0.067297,0.333895),(0.074876,0.328714),(0.060824,0.444819),(0.063927,0.460736),(0.050529,0.509721),(0.021059,0.590575),(0.020588,0.581975),(0.023722,0.563963),(0.031804,0.543091),(0.040730,0.526732),(0.000000,0.594776),(0.001319,0.517189),(0.003370,0.540591),(0.000000,0.540410),(0.003660,0.563670),(0.003934,0.595482),(0.004265,0.624855),(0.004740,0.646947),(0.005333,0.663755),(0.005997,0.674055),(0.003576,0.517249),(0.005875,0.541092),(0.006385,0.564362),(0.006866,0.596403),(0.007450,0.625688),(0.008279,0.646976),(0.009288,0.662311),(0.010414,0.671842),(0.004451,0.517335),(0.006847,0.541790),(0.007447,0.565329),(0.008015,0.597693),(0.008704,0.626862),(0.009673,0.647041),(0.010808,0.660334),(0.003666,0.517424),(0.005987,0.542506),(0.006516,0.566323),(0.007019,0.599022),(0.007630,0.628083),(0.008480,0.647137),(0.009436,0.658352),(0.001380,0.517491),(0.003483,0.543042),(0.003793,0.567069),(0.004087,0.600021),(0.004447,0.629007),(0.004943,0.647229),(0.005484,0.656896),(0.001795,0.517516),(0.000004,0.543241),(0.004959,0.517489),(0.003476,0.543043),(0.007215,0.517421),(0.005983,0.542508),(0.007961,0.517332),(0.006847,0.541792),(0.007047,0.517247),(0.005879,0.541093),(0.004764,0.517187),(0.003377,0.540592),(0.001713,0.517166),(0.953099,0.663700),(0.951142,0.667842),(0.951404,0.666211),(0.956439,0.670395),(0.950464,0.671457),(0.951915,0.669790),(0.959756,0.666034),(0.963498,0.660835),(0.960695,0.666437),(0.952206,0.661249),(0.956341,0.658012),(0.955639,0.659686),(0.960877,0.656980),(0.959641,0.658894),(0.955013,0.656482),(0.958166,0.654140),(0.961914,0.655089),(0.965325,0.658387),(0.962191,0.669854),(0.959288,0.673000),(0.964078,0.663909),(0.958375,0.674762),(0.955023,0.676190),(0.953554,0.678707),(0.949649,0.675654),(0.958059,0.678653),(0.960597,0.676731),(0.964878,0.671641),(0.966521,0.664206),(0.967263,0.657913),(0.967135,0.655091),(0.961650,0.652121),(0.957610,0.652268),(0.954275,0.654346),(0.953245,0.659366),(0.952759,0.659449),(0.969931,0.657008),(0.970495,0.660852),(0.969071,0.652031),(0.963737,0.650129),(0.958415,0.649493),(0.955873,0.651250),(0.953009,0.657071),(0.968775,0.665387),(0.967765,0.670650),(0.962926,0.677858),(0.959114,0.680328),(0.950924,0.676351),(0.955263,0.679903),(0.950512,0.666847),(0.953525,0.661702),(0.955681,0.684227),(0.962604,0.684353),(0.967820,0.681780),(0.974069,0.674612),(0.977061,0.667320),(0.975826,0.660594),(0.974534,0.655175),(0.951344,0.667315),(0.977769,0.686639),(0.970370,0.691780),(0.982961,0.675594),(0.984510,0.666613),(0.984561,0.659247),(0.979153,0.651985),(0.975628,0.645789),(0.968162,0.640991),(0.961775,0.636777),(0.955142,0.640008),(0.959855,0.637285),(0.953128,0.644341),(0.952455,0.656445),(0.951198,0.678444),(0.951874,0.671349),(0.951329,0.680910),(0.961274,0.693277),(0.954296,0.688433),(0.991283,0.658459),(0.985729,0.648649),(0.979971,0.638915),(0.974133,0.626748),(0.952271,0.641294),(0.950819,0.655976),(0.950496,0.648776),(0.953040,0.667586),(0.949067,0.664218),(0.950105,0.678047),(0.951309,0.686967),(0.988447,0.700123),(0.978580,0.703257),(0.961966,0.703279),(0.958540,0.698934),(0.972293,0.622626),(0.969726,0.615760),(0.961705,0.620566),(0.954675,0.633932),(0.991625,0.645388),(0.991537,0.636457),(0.982933,0.629279),(0.986021,0.633629),(0.976812,0.621913),(0.974847,0.617905),(0.975062,0.610209),(0.972662,0.606527),(0.962113,0.614833),(0.952666,0.625575),(0.949212,0.632038),(0.945735,0.643290),(0.944914,0.655663),(0.949598,0.670725),(0.947864,0.672915),(0.947812,0.679631),(0.992502,0.624102),(0.987321,0.622246),(0.983225,0.619696),(0.978754,0.615325),(0.977468,0.611499),(0.976160,0.606598),(0.975763,0.603417),(0.986525,0.615032),(0.991996,0.616436),(0.992821,0.619632),(0.983167,0.614432),(0.978973,0.610744),(0.981308,0.611132),(0.978370,0.607180),(0.977020,0.600495),(0.978937,0.606858),(0.999949,0.620397),(0.987767,0.616952),(0.976784,0.602830),(0.975402,0.601045),(0.989269,0.609080),(0.991527,0.608355),(0.991788,0.612324),(0.992334,0.604025),(0.988977,0.604998),(0.987667,0.612198),(0.981929,0.608558),(0.983604,0.605641),(0.986695,0.599754),(0.993459,0.598535),(0.995247,0.589693),(0.990537,0.588158),(0.994456,0.592421),(0.985180,0.587556),(0.984464,0.590853),(0.979790,0.593169),(0.989199,0.590972),(0.988515,0.595014),(0.984259,0.593561),(0.980832,0.596153),(0.979453,0.602146),(0.980337,0.605411),(0.976947,0.593857),(0.978422,0.592831),(0.976023,0.595916),(0.974509,0.597706),(0.975951,0.594990),(0.977817,0.591218),(0.975355,0.595227),(0.977214,0.592005),(0.976862,0.592337),(0.977433,0.593274),(0.976578,0.597518),(0.978635,0.590632),(0.975862,0.599029),(0.985551,0.589167),(0.976665,0.595104),(0.988067,0.585362),(0.983547,0.587966),(0.989299,0.583163),(0.985441,0.585700),(0.991727,0.581329),(0.986878,0.584862),(0.972696,0.601469),(0.981709,0.592035),(0.974140,0.597597),(0.995416,0.581741),(0.999931,0.585009),(0.993393,0.583770),(0.995259,0.582651),(0.992923,0.585473),(0.992274,0.589192),(0.990391,0.587325),(0.987122,0.589293),(0.978258,0.594847),(0.989432,0.589698),(0.989101,0.591314),(0.984136,0.589788),(0.978856,0.591408),(0.973102,0.594557),(0.974067,0.597878),(0.967435,0.601905),(0.965667,0.608133),(0.969681,0.600294),(0.955093,0.613871),(0.960812,0.606454),(0.946573,0.624680),(0.950811,0.617991),(0.965710,0.608216),(0.960090,0.612981),(0.957174,0.617580),(0.984618,0.593327),(0.985205,0.597880),(0.973901,0.601163),(0.962620,0.613551),(0.944461,0.636108),(0.959725,0.615680),(0.953108,0.628048),(0.950328,0.628689),(0.943120,0.652109),(0.948102,0.651401),(0.944665,0.629423),(0.941119,0.651438),(0.941416,0.654288),(0.946414,0.665130),(0.943011,0.669792),(0.945460,0.677880),(0.948822,0.684824),(0.946840,0.678664),(0.945653,0.672122),(0.944686,0.673082),(0.948710,0.672760),(0.946363,0.681811),(0.949562,0.684306),(0.987482,0.723531),(0.988727,0.715848),(0.982569,0.724146),(0.976659,0.715308),(0.976915,0.723956),(0.987331,0.731003),(0.979673,0.730010),(0.975587,0.730179),(0.968805,0.729863),(0.973327,0.714836),(0.969282,0.722632),(0.969272,0.715702),(0.968996,0.708649),(0.954793,0.725071),(0.956660,0.730116),(0.966906,0.731868),(0.961191,0.725751),(0.971221,0.732224),(0.979040,0.734617),(0.974607,0.732900),(0.971128,0.732979),(0.963530,0.732224),(0.975645,0.734425),(0.969169,0.730393),(0.966535,0.727164),(0.999903,0.735592),(0.962225,0.729040),(0.962728,0.727662),(0.960760,0.725091),(0.951182,0.718877),(0.946867,0.722455),(0.946684,0.719669),(0.948306,0.723435),(0.950203,0.718731),(0.939516,0.719072),(0.943775,0.715540),(0.938612,0.720302),(0.939100,0.717736),(0.928741,0.715431),(0.934141,0.712626),(0.931809,0.713213),(0.930732,0.715383),(0.946144,0.712117),(0.952545,0.706485),(0.942642,0.710515),(0.928228,0.712236),(0.938754,0.709108),(0.920276,0.713363),(0.921829,0.711698),(0.919766,0.711910),(0.931690,0.708498),(0.914547,0.713371),(0.915915,0.709709),(0.900518,0.714019),(0.904773,0.712195),(0.890395,0.707879),(0.908678,0.714557),(0.922491,0.709123),(0.906578,0.711745),(0.901937,0.713450),(0.888358,0.715077),(0.874454,0.714219),(0.886260,0.713079),(0.866960,0.710231),(0.876782,0.709026),(0.904224,0.709363),(0.925596,0.709718),(0.913620,0.706900),(0.904613,0.706846),(0.898849,0.696133),(0.886675,0.701615),(0.868388,0.699468),(0.876180,0.692020),(0.889204,0.681778),(0.912469,0.696861),(0.955545,0.722121),(0.951458,0.706343),(0.945731,0.703561),(0.945060,0.692510),(0.937315,0.703179),(0.929335,0.701287),(0.915528,0.682598),(0.899875,0.681935),(0.954205,0.696070),(0.951741,0.698833),(0.951724,0.694323),(0.876629,0.710085),(0.877122,0.705461),(0.884851,0.706168),(0.878526,0.707789),(0.883054,0.705616),(0.888616,0.710441),(0.888252,0.707889),(0.894790,0.706459),(0.938977,0.704011),(0.944502,0.699123),(0.927210,0.697582),(0.908363,0.706320),(0.898846,0.708936),(0.898000,0.709019),(0.918173,0.702153),(0.920066,0.702312),(0.923689,0.699088),(0.907509,0.705905),(0.929768,0.692916),(0.906510,0.706478),(0.914154,0.703970),(0.928736,0.696057),(0.921841,0.702350),(0.925989,0.700124),(0.917949,0.700344),(0.909417,0.702028),(0.897295,0.702385),(0.889878,0.703827),(0.914664,0.697649),(0.903223,0.697339),(0.892832,0.698875),(0.885764,0.700516),(0.902680,0.689251),(0.890925,0.691363),(0.882482,0.695185),(0.876234,0.700811),(0.873520,0.702581),(0.873943,0.706010),(0.951173,0.687810),(0.951535,0.690464),(0.929697,0.693190),(0.931790,0.690815),(0.930244,0.691942),(0.915202,0.690331),(0.955471,0.668340),(0.952082,0.673846),(0.870077,0.706710),(0.954740,0.692918),(0.975710,0.735347),(0.054606,0.394585),(0.060824,0.444819),(0.955639,0.659686),(0.968805,0.729863),(0.980366,0.589616),(0.102973,0.429266),(0.105544,0.430520),(0.095826,0.414615),(0.100281,0.411004),(0.102570,0.408901),(0.109514,0.404766),(0.110302,0.401526),(0.086247,0.396760),(0.090750,0.392069),(0.090860,0.383978),(0.101808,0.383152),(0.093908,0.374450),(0.108031,0.386177),(0.108313,0.382722),(0.097419,0.363499),(0.099612,0.370231),(0.083604,0.347045),(0.079385,0.359994),(0.068498,0.348080),(0.048095,0.345228),(0.000000,0.344011),(0.000000,0.349807),(0.050521,0.348474),(0.075048,0.359249),(0.068836,0.384142),(0.068192,0.372806),(0.073000,0.365623),(0.047706,0.348059),(0.056772,0.351215),(0.062238,0.357315),(0.054610,0.356333),(0.047697,0.357393),(0.048051,0.363094),(0.048430,0.366416),(0.055427,0.370477),(0.057711,0.375431),(0.054718,0.377657),(0.051741,0.378668),(0.046138,0.376373),(0.040925,0.374440),(0.000000,0.388331),(0.037840,0.370877),(0.000000,0.375602),(0.041633,0.366808),(0.000000,0.363321),(0.039268,0.353132),(0.034327,0.350827),(0.000000,0.355409),(0.040038,0.346713),(0.035129,0.400345),(0.034076,0.412500),(0.030571,0.423010),(0.027694,0.435959),(0.041726,0.435596),(0.024017,0.449995),(0.036358,0.448842),(0.022811,0.463414),(0.033165,0.462685),(0.023599,0.479290),(0.031875,0.478967),(0.024479,0.506377),(0.030950,0.506685),(0.025203,0.527569),(0.032211,0.527341),(0.024938,0.546050),(0.000000,0.548040),(0.000000,0.565780),(0.000000,0.528136),(0.000000,0.479844),(0.000000,0.465259),(0.000000,0.449813),(0.000000,0.432317),(0.000000,0.421499),(0.000000,0.410376),(0.000000,0.400720),(0.037714,0.389939),(0.000000,0.505941),(0.041256,0.508882),(0.047215,0.478784),(0.049283,0.460497),(0.051176,0.445912),(0.054459,0.478981),(0.058369,0.460025),(0.000000,0.578658),(0.051114,0.335995),(0.057402,0.338331),(0.061253,0.342777),(0.055829,0.342409),(0.050865,0.343252),(0.044880,0.340171),(0.041510,0.338295),(0.045707,0.335223),(0.048651,0.356867),(0.053545,0.359687),(0.055190,0.363260),(0.053112,0.365028),(0.051003,0.365850),(0.047003,0.364265),(0.043299,0.362846),(0.041153,0.360218),(0.043886,0.357222),(0.041071,0.330720),(0.045144,0.327606),(0.044365,0.332660),(0.050205,0.335652),(0.055037,0.334776),(0.060303,0.334959),(0.056530,0.330560),(0.050397,0.328230),(0.043198,0.350627),(0.047821,0.350219),(0.040555,0.353624),(0.042651,0.356227),(0.046260,0.357621),(0.050152,0.359130),(0.052197,0.358281),(0.054200,0.356463),(0.052583,0.352943),(0.050377,0.327139),(0.047737,0.350244),(0.102973,0.429266),(0.105544,0.430520),(0.095826,0.414615),(0.100281,0.411004),(0.102570,0.408901),(0.110302,0.401526),(0.109514,0.404766),(0.086247,0.396760),(0.090750,0.392069),(0.101808,0.383152),(0.090860,0.383978),(0.108031,0.386177),(0.097419,0.363499),(0.108313,0.382722),(0.099612,0.370231),(0.093908,0.374450),(0.083604,0.347045),(0.079385,0.359994),(0.068498,0.348080),(0.048095,0.345228),(0.075048,0.359249),(0.050521,0.348474),(0.068836,0.384142),(0.068192,0.372806),(0.073000,0.365623),(0.047706,0.348059),(0.062238,0.357315),(0.056772,0.351215),(0.054610,0.356333),(0.047697,0.357393),(0.055427,0.370477),(0.048430,0.366416),(0.048051,0.363094),(0.057711,0.375431),(0.054718,0.377657),(0.051741,0.378668),(0.040925,0.374440),(0.046138,0.376373),(0.037714,0.389939),(0.037840,0.370877),(0.041633,0.366808),(0.039268,0.353132),(0.034327,0.350827),(0.040038,0.346713),(0.034076,0.412500),(0.035129,0.400345),(0.030571,0.423010),(0.027694,0.435959),(0.024017,0.449995),(0.041726,0.435596),(0.022811,0.463414),(0.036358,0.448842),(0.023599,0.479290),(0.033165,0.462685),(0.024479,0.506377),(0.031875,0.478967),(0.025203,0.527569),(0.030950,0.506685),(0.024938,0.546050),(0.032211,0.527341),(0.041256,0.508882),(0.047215,0.478784),(0.049283,0.460497),(0.051176,0.445912),(0.054459,0.478981),(0.058369,0.460025),(0.057402,0.338331),(0.051114,0.335995),(0.061253,0.342777),(0.055829,0.342409),(0.050865,0.343252),(0.044880,0.340171),(0.041510,0.338295),(0.045707,0.335223),(0.053545,0.359687),(0.048651,0.356867),(0.055190,0.363260),(0.053112,0.365028),(0.051003,0.365850),(0.047003,0.364265),(0.043299,0.362846),(0.041153,0.360218),(0.043886,0.357222),(0.045144,0.327606),(0.041071,0.330720),(0.044365,0.332660),(0.050205,0.335652),(0.055037,0.334776),(0.060303,0.334959),(0.056530,0.330560),(0.050397,0.328230),(0.047821,0.350219),(0.043198,0.350627),(0.040555,0.353624),(0.042651,0.356227),(0.046260,0.357621),(0.050152,0.359130),(0.052197,0.358281),(0.054200,0.356463),(0.052583,0.352943),(0.050377,0.327139),(0.047737,0.350244),(0.007027,0.463648),(0.005545,0.491949),(0.006304,0.477198),(0.784977,0.179139),(0.788358,0.178216),(0.769350,0.170811),(0.791930,0.180860),(0.768247,0.175951),(0.792599,0.181709),(0.778444,0.176417),(0.755771,0.161674),(0.753273,0.162936),(0.757985,0.161726),(0.759292,0.161135),(0.768120,0.170118),(0.805835,0.177574),(0.805120,0.179363),(0.824080,0.177380),(0.755052,0.152664),(0.754574,0.153366),(0.757800,0.153685),(0.781628,0.141892),(0.804760,0.149202),(0.779331,0.138815),(0.787546,0.140986),(0.828511,0.139842),(0.827540,0.135631),(0.837271,0.136165),(0.847590,0.144791),(0.814612,0.157921),(0.852611,0.154662),(0.835810,0.171052),(0.825449,0.175560),(0.807037,0.179319),(0.804411,0.183907),(0.823832,0.177965),(0.825048,0.180197),(0.846674,0.170892),(0.852498,0.169181),(0.836436,0.171489),(0.845859,0.152479),(0.850305,0.150323),(0.101583,0.302309),(0.103286,0.296827),(0.102624,0.300192),(0.110394,0.286888),(0.113773,0.289854),(0.119045,0.275267),(0.119154,0.277588),(0.109551,0.286365),(0.106443,0.293547),(0.098454,0.302452),(0.093973,0.308571),(0.097462,0.308200),(0.098445,0.293317),(0.096122,0.299480),(0.090058,0.295194),(0.094012,0.301059),(0.099552,0.292871),(0.090469,0.307089),(0.079082,0.303387),(0.088772,0.279250),(0.080611,0.297741),(0.084915,0.287206),(0.067490,0.297874),(0.068637,0.290480),(0.068767,0.283308),(0.072326,0.276657),(0.093443,0.274315),(0.077619,0.271797),(0.081947,0.295228),(0.090824,0.290891),(0.104628,0.284512),(0.115751,0.274725),(0.098931,0.280570),(0.107703,0.268068),(0.085100,0.279796),(0.086809,0.269348),(0.085123,0.288880),(0.068806,0.295895),(0.069955,0.286724),(0.788358,0.178216),(0.784977,0.179139),(0.768120,0.170118),(0.791930,0.180860),(0.769350,0.170811),(0.792599,0.181709),(0.768247,0.175951),(0.753273,0.162936),(0.755771,0.161674),(0.778444,0.176417),(0.757985,0.161726),(0.759292,0.161135),(0.807037,0.179319),(0.805835,0.177574),(0.805120,0.179363),(0.757800,0.153685),(0.755052,0.152664),(0.754574,0.153366),(0.787546,0.140986),(0.781628,0.141892),(0.779331,0.138815),(0.828511,0.139842),(0.827540,0.135631),(0.804760,0.149202),(0.837271,0.136165),(0.814612,0.157921),(0.847590,0.144791),(0.824080,0.177380),(0.825449,0.175560),(0.804411,0.183907),(0.823832,0.177965),(0.846674,0.170892),(0.825048,0.180197),(0.836436,0.171489),(0.845859,0.152479),(0.835810,0.171052),(0.850305,0.150323),(0.852611,0.154662),(0.852498,0.169181),(0.103286,0.296827),(0.101583,0.302309),(0.097462,0.308200),(0.110394,0.286888),(0.102624,0.300192),(0.119045,0.275267),(0.113773,0.289854),(0.106443,0.293547),(0.109551,0.286365),(0.119154,0.277588),(0.098454,0.302452),(0.093973,0.308571),(0.104628,0.284512),(0.098445,0.293317),(0.096122,0.299480),(0.090469,0.307089),(0.094012,0.301059),(0.099552,0.292871),(0.084915,0.287206),(0.079082,0.303387),(0.080611,0.297741),(0.067490,0.297874),(0.068637,0.290480),(0.088772,0.279250),(0.068767,0.283308),(0.093443,0.274315),(0.072326,0.276657),(0.090058,0.295194),(0.090824,0.290891),(0.115751,0.274725),(0.098931,0.280570),(0.085100,0.279796),(0.107703,0.268068),(0.085123,0.288880),(0.068806,0.295895),(0.081947,0.295228),(0.069955,0.286724),(0.077619,0.271797),(0.086809,0.269348),(0.955172,0.664119),(0.954172,0.661508),(0.953282,0.662930),(0.955827,0.661939),(0.951866,0.665423),(0.952873,0.665058),(0.999931,0.588825),(0.994992,0.587692),(0.991999,0.586669),(0.986542,0.586933),(0.985199,0.587878),(0.989764,0.597578),(0.988244,0.600789),(0.986711,0.603680),(0.988646,0.599010),(0.983833,0.589730),(0.955827,0.661939),(0.952873,0.665058),(0.951866,0.665423),(0.954172,0.661508),(0.953282,0.662930),(0.955172,0.664119),(0.994992,0.587692),(0.991999,0.586669),(0.986542,0.586933),(0.989764,0.597578),(0.988646,0.599010),(0.988244,0.600789),(0.986711,0.603680),(0.985199,0.587878),(0.983833,0.589730),(0.958226,0.722456),(0.957594,0.716834),(0.954899,0.729591),(0.947467,0.722545),(0.947793,0.717011),(0.946736,0.728011),(0.938343,0.721913),(0.941122,0.716521),(0.936916,0.725127),(0.935556,0.720927),(0.937441,0.715965),(0.932646,0.723204),(0.933145,0.717950),(0.935503,0.715093),(0.957262,0.710952),(0.945868,0.712382),(0.939880,0.712323),(0.936054,0.711702),(0.934993,0.709251),(0.934949,0.707448),(0.935308,0.712293),(0.931183,0.719817),(0.933366,0.714864),(0.935864,0.705772),(0.936731,0.709000),(0.930481,0.716019),(0.933917,0.711332),(0.938636,0.703294),(0.938466,0.706750),(0.936540,0.708726),(0.933083,0.709818),(0.943516,0.700457),(0.954034,0.704992),(0.945881,0.707472),(0.936159,0.708750),(0.948495,0.709307),(0.939443,0.711332),(0.930611,0.710392),(0.935204,0.708564),(0.926662,0.709554),(0.934841,0.706999),(0.929518,0.707208),(0.934002,0.704747),(0.928976,0.704116),(0.931000,0.702402),(0.934234,0.703187),(0.933347,0.700094),(0.936326,0.700731),(0.921437,0.710474),(0.924408,0.704643),(0.927116,0.702780),(0.922322,0.715565),(0.926621,0.718226),(0.938540,0.718398),(0.943176,0.716486),(0.931836,0.699937),(0.924968,0.706349),(0.929065,0.702984),(0.920610,0.709959),(0.919110,0.715599),(0.921909,0.719287),(0.926823,0.722436),(0.939921,0.724399),(0.927345,0.727142),(0.920961,0.722985),(0.919683,0.719322),(0.919901,0.713206),(0.938974,0.728785),(0.946286,0.724885),(0.948479,0.730191),(0.923600,0.708173),(0.928298,0.705592),(0.953682,0.730546),(0.923645,0.716009),(0.925189,0.721437),(0.927737,0.725703),(0.932437,0.728551),(0.942732,0.731492),(0.931185,0.712851),(0.925777,0.711525),(0.930044,0.708696),(0.954899,0.729591),(0.958226,0.722456),(0.946736,0.728011),(0.957594,0.716834),(0.947467,0.722545),(0.936916,0.725127),(0.947793,0.717011),(0.938343,0.721913),(0.932646,0.723204),(0.937441,0.715965),(0.941122,0.716521),(0.935556,0.720927),(0.931183,0.719817),(0.935503,0.715093),(0.957262,0.710952),(0.945868,0.712382),(0.939880,0.712323),(0.936054,0.711702),(0.934993,0.709251),(0.935308,0.712293),(0.933145,0.717950),(0.933366,0.714864),(0.930481,0.716019),(0.934949,0.707448),(0.936731,0.709000),(0.933917,0.711332),(0.931185,0.712851),(0.935864,0.705772),(0.938466,0.706750),(0.936540,0.708726),(0.933083,0.709818),(0.943516,0.700457),(0.938636,0.703294),(0.954034,0.704992),(0.945881,0.707472),(0.948495,0.709307),(0.939443,0.711332),(0.936159,0.708750),(0.930611,0.710392),(0.935204,0.708564),(0.926662,0.709554),(0.934841,0.706999),(0.929518,0.707208),(0.934002,0.704747),(0.928976,0.704116),(0.934234,0.703187),(0.931000,0.702402),(0.936326,0.700731),(0.924408,0.704643),(0.927116,0.702780),(0.933347,0.700094),(0.931836,0.699937),(0.922322,0.715565),(0.926621,0.718226),(0.938540,0.718398),(0.943176,0.716486),(0.929065,0.702984),(0.924968,0.706349),(0.920610,0.709959),(0.919110,0.715599),(0.921437,0.710474),(0.921909,0.719287),(0.926823,0.722436),(0.939921,0.724399),(0.946286,0.724885),(0.920961,0.722985),(0.927345,0.727142),(0.919683,0.719322),(0.919901,0.713206),(0.938974,0.728785),(0.948479,0.730191),(0.923600,0.708173),(0.928298,0.705592),(0.953682,0.730546),(0.925189,0.721437),(0.923645,0.716009),(0.927737,0.725703),(0.932437,0.728551),(0.942732,0.731492),(0.925777,0.711525),(0.930044,0.708696),(0.006023,0.491581),(0.006848,0.469671),(0.007843,0.450775),(0.005607,0.450143),(0.007108,0.435520),(0.004122,0.442699),(0.005641,0.424059),(0.007622,0.429940),(0.008224,0.419464),(0.001201,0.412795),(0.007886,0.409380),(0.004490,0.492782),(0.006893,0.475027),(0.008011,0.462784),(0.010126,0.444406),(0.010119,0.430045),(0.008656,0.420586),(0.007830,0.411282),(0.003850,0.494180),(0.006232,0.476755),(0.009481,0.464790),(0.011000,0.451434),(0.010230,0.436208),(0.010703,0.421665),(0.009903,0.407910),(0.005305,0.487030),(0.006646,0.474299),(0.009026,0.460181),(0.007834,0.449181),(0.009699,0.426943),(0.011144,0.411376),(0.002525,0.492031),(0.007259,0.466704),(0.004446,0.450208),(0.007093,0.435144),(0.009406,0.420071),(0.011850,0.411339),(0.000965,0.492210),(0.001063,0.471614),(0.001402,0.454076),(0.003547,0.431941),(0.008007,0.416710),(0.011558,0.406732),(0.009842,0.493240),(0.011157,0.471161),(0.006632,0.454281),(0.009215,0.437592),(0.002717,0.423370),(0.002811,0.408352),(0.011077,0.488936),(0.014932,0.465160),(0.017380,0.442473),(0.013730,0.422970),(0.006296,0.416253),(0.001553,0.408898),(0.013490,0.478122),(0.019584,0.456670),(0.019008,0.438459),(0.015635,0.422202),(0.009039,0.414144),(0.001565,0.407479),(0.010517,0.479560),(0.016795,0.457484),(0.018663,0.445209),(0.018331,0.426241),(0.012375,0.414333),(0.002711,0.406604),(0.001109,0.405783),(0.002629,0.476385)])
-        self.registerUVTriangles([(0,1,2),(1,3,4),(4,3,5),(6,7,4),(7,8,2),(8,9,10),(8,11,12),(11,13,14),(14,13,15),(13,16,17),(17,16,18),(18,16,19),(16,20,21),(16,13,11),(8,7,20),(7,6,21),(6,5,22),(21,23,24),(24,19,21),(25,26,19),(25,24,23),(19,26,27),(27,28,18),(28,29,17),(17,29,30),(30,31,15),(31,32,14),(33,34,25),(34,35,26),(35,36,27),(36,37,28),(37,38,29),(38,39,30),(39,40,31),(40,41,32),(42,43,34),(43,44,35),(44,45,36),(45,46,37),(46,47,38),(47,48,39),(48,49,40),(49,50,41),(51,52,53),(53,54,51),(51,54,55),(55,56,51),(51,56,57),(5,3,58),(58,3,59),(59,57,58),(56,55,22),(22,55,23),(23,55,60),(61,33,23),(61,62,42),(61,63,64),(23,21,6),(22,23,6),(58,57,56),(5,58,56),(65,60,55),(65,63,61),(66,67,68),(68,67,69),(66,70,71),(66,72,73),(73,72,74),(72,75,76),(76,75,77),(77,75,78),(75,79,80),(80,81,82),(82,77,78),(77,82,76),(82,83,74),(70,66,73),(70,83,84),(84,85,71),(71,69,67),(69,71,86),(87,88,85),(87,85,89),(83,82,90),(82,81,91),(81,92,93),(94,95,91),(95,96,90),(96,97,89),(97,98,87),(70,73,83),(74,83,73),(99,100,101),(102,103,104),(103,105,106),(107,101,108),(108,109,110),(110,109,111),(106,112,113),(114,115,102),(100,115,114),(108,110,116),(110,111,117),(116,117,118),(116,119,120),(121,122,123),(113,124,125),(126,114,125),(126,127,101),(109,127,111),(101,127,109),(108,123,107),(106,128,129),(119,118,130),(119,130,120),(131,132,130),(129,128,132),(132,133,134),(132,128,135),(130,134,121),(136,137,138),(137,139,140),(139,141,142),(141,143,144),(143,145,146),(147,148,149),(150,151,152),(153,154,155),(154,156,157),(156,143,141),(154,158,156),(158,145,143),(159,160,154),(160,161,158),(161,162,145),(163,164,160),(164,165,161),(165,147,162),(166,155,167),(155,157,168),(157,141,139),(169,139,137),(169,170,168),(170,171,167),(171,172,173),(174,175,170),(170,175,171),(175,176,177),(178,176,175),(179,180,176),(180,181,177),(181,182,183),(149,148,184),(179,185,186),(184,187,180),(187,188,181),(188,189,182),(148,190,187),(190,191,188),(191,192,189),(165,164,191),(164,163,192),(147,165,190),(147,152,193),(194,195,196),(195,197,198),(197,199,200),(199,201,202),(203,100,99),(204,203,205),(206,204,207),(208,206,209),(210,208,211),(207,205,212),(209,207,213),(211,209,214),(215,211,216),(213,212,217),(214,213,218),(216,214,219),(220,216,221),(218,217,222),(219,218,223),(221,219,224),(225,221,226),(227,105,103),(194,103,102),(228,201,199),(229,199,197),(195,194,230),(231,197,195),(203,232,115),(230,102,115),(210,233,234),(208,234,235),(206,235,236),(204,236,232),(233,228,229),(234,229,231),(235,231,237),(236,237,230),(222,217,121),(238,239,226),(240,226,224),(241,224,223),(212,122,121),(105,135,128),(133,135,242),(243,242,244),(222,134,133),(245,223,222),(242,135,105),(246,238,240),(247,240,241),(202,246,247),(200,247,248),(198,248,244),(196,244,242),(249,12,14),(250,249,251),(252,250,253),(254,252,255),(256,254,257),(258,256,259),(260,258,261),(262,260,263),(264,9,12),(265,264,249),(266,265,250),(267,266,252),(268,267,254),(269,268,256),(270,269,258),(271,270,260),(32,41,246),(210,259,257),(233,257,255),(228,255,253),(201,253,251),(251,14,32),(264,272,10),(268,273,274),(267,274,275),(266,275,276),(265,276,272),(263,220,225),(277,270,271),(259,210,215),(261,215,220),(273,268,269),(278,269,270),(279,280,281),(282,279,283),(284,282,285),(286,284,287),(288,286,289),(290,288,291),(292,290,293),(294,292,295),(296,294,297),(298,296,299),(300,298,301),(302,300,303),(304,302,305),(306,304,307),(308,309,310),(311,312,313),(314,313,315),(314,315,316),(317,316,318),(319,318,320),(321,320,322),(323,322,324),(325,324,326),(327,326,328),(329,328,330),(331,330,332),(333,332,309),(63,334,335),(336,337,338),(339,338,340),(341,340,342),(343,342,344),(345,344,346),(347,346,348),(349,348,350),(351,352,350),(351,350,353),(354,353,355),(356,355,357),(54,357,358),(65,358,334),(309,283,281),(334,304,306),(337,280,279),(337,279,282),(338,282,284),(340,284,286),(342,286,288),(344,288,290),(346,290,292),(348,292,294),(350,294,296),(353,296,298),(355,298,300),(357,300,302),(358,302,304),(312,359,307),(313,307,305),(315,305,303),(316,303,301),(316,301,299),(318,299,297),(320,297,295),(322,295,293),(324,293,291),(326,291,289),(328,289,287),(330,287,285),(332,285,283),(54,53,356),(360,349,352),(361,352,351),(362,351,354),(53,52,363),(354,356,53),(363,364,354),(365,366,367),(3,1,368),(59,368,369),(370,369,371),(372,371,373),(374,373,375),(376,375,377),(378,377,379),(380,379,366),(370,52,57),(365,367,381),(365,381,360),(380,360,361),(378,361,362),(376,362,364),(374,364,363),(372,363,52),(381,347,349),(382,336,339),(383,339,341),(384,341,343),(385,343,345),(367,345,347),(386,387,1),(388,383,384),(389,384,385),(390,385,367),(391,367,366),(392,366,379),(393,379,377),(394,377,375),(395,375,373),(396,373,371),(397,371,369),(398,369,368),(399,368,1),(10,272,386),(387,386,400),(387,400,401),(388,402,403),(399,401,404),(397,398,404),(397,404,405),(396,405,406),(395,406,407),(394,407,408),(393,408,409),(392,409,410),(391,410,411),(390,411,412),(389,412,402),(413,414,415),(416,413,417),(418,416,419),(420,418,421),(422,420,423),(424,422,425),(426,424,427),(428,426,429),(430,428,431),(432,430,433),(434,432,435),(436,434,437),(438,436,439),(440,438,441),(442,440,443),(444,442,445),(92,444,446),(93,92,447),(94,93,448),(449,450,451),(452,449,453),(454,452,455),(456,454,457),(458,456,459),(460,458,461),(462,460,463),(464,462,465),(466,464,467),(468,466,469),(470,468,471),(472,470,473),(474,472,475),(476,474,477),(478,476,479),(75,478,480),(481,482,483),(484,481,485),(486,484,487),(488,486,489),(490,488,491),(492,490,493),(494,492,495),(496,494,497),(498,496,499),(500,498,501),(502,500,503),(504,502,505),(506,504,507),(508,506,509),(510,508,511),(512,513,400),(514,403,402),(515,402,412),(516,412,411),(517,411,410),(518,410,409),(519,409,408),(520,521,408),(520,408,407),(522,407,406),(523,406,405),(524,405,404),(525,404,401),(526,401,400),(276,275,400),(386,272,400),(273,512,400),(274,273,400),(275,274,400),(238,246,50),(527,528,225),(529,225,239),(246,41,50),(530,531,239),(532,239,238),(533,262,528),(534,535,536),(534,536,271),(537,271,262),(512,273,278),(512,278,277),(535,526,513),(535,513,277),(514,515,415),(530,538,448),(531,448,447),(529,447,446),(527,446,445),(533,445,443),(537,443,441),(534,441,439),(535,439,437),(535,437,435),(526,435,433),(525,433,431),(524,431,429),(523,429,427),(522,427,425),(520,425,423),(521,423,421),(521,421,419),(519,419,417),(517,518,417),(517,417,415),(515,516,415),(453,451,414),(455,453,413),(457,455,416),(459,457,418),(461,459,420),(463,461,422),(465,463,424),(467,465,426),(469,467,428),(471,469,430),(473,471,432),(475,473,434),(477,475,436),(479,477,438),(480,479,440),(79,480,442),(80,79,444),(92,81,80),(485,483,450),(487,485,449),(489,487,452),(491,489,454),(493,491,456),(495,493,458),(497,495,460),(499,497,462),(501,499,464),(503,501,466),(505,503,468),(507,505,470),(509,507,472),(511,509,474),(539,511,476),(72,539,478),(57,52,51),(28,27,36),(535,277,536),(540,541,482),(542,540,481),(543,542,484),(544,543,486),(545,544,488),(546,545,490),(547,546,492),(548,547,494),(549,548,496),(550,549,498),(551,550,500),(552,551,502),(553,552,504),(554,553,506),(555,554,508),(556,557,541),(558,556,540),(559,558,542),(560,559,543),(561,560,544),(562,561,545),(563,562,546),(564,563,547),(565,564,548),(566,565,549),(567,566,550),(568,567,551),(569,568,552),(570,569,553),(571,570,554),(572,571,555),(510,539,72),(573,555,510),(574,575,510),(576,574,510),(577,578,557),(579,577,556),(580,579,558),(581,580,559),(582,581,560),(583,582,561),(584,583,562),(585,584,563),(586,585,564),(587,586,565),(588,587,566),(589,588,567),(590,589,568),(591,590,569),(592,591,570),(593,592,571),(594,595,578),(596,594,577),(597,596,579),(598,597,580),(599,598,581),(600,599,582),(601,600,583),(602,601,584),(603,602,585),(604,603,586),(605,604,587),(606,605,588),(607,606,589),(608,607,590),(609,608,591),(610,611,595),(612,610,594),(613,612,596),(614,613,597),(615,614,598),(616,615,599),(617,616,600),(618,617,601),(619,618,602),(620,619,603),(621,620,604),(622,621,605),(623,622,606),(624,623,607),(625,624,608),(142,625,609),(626,627,628),(629,626,630),(631,629,632),(633,631,634),(635,633,636),(637,635,638),(639,637,640),(641,639,642),(643,641,644),(645,643,646),(647,645,648),(649,647,650),(651,649,652),(653,651,654),(655,656,627),(657,655,626),(658,657,629),(659,658,631),(660,659,633),(661,660,635),(662,661,637),(663,662,639),(664,663,641),(665,664,643),(666,665,645),(667,666,647),(668,667,649),(151,668,651),(669,670,656),(671,669,655),(672,671,657),(673,672,658),(674,673,659),(675,674,660),(676,675,661),(677,676,662),(678,677,663),(679,678,664),(680,679,665),(625,654,652),(624,652,650),(623,650,648),(622,648,646),(621,646,644),(620,644,642),(619,642,640),(618,640,638),(617,638,636),(616,636,634),(615,634,632),(614,632,630),(140,609,138),(592,593,681),(681,682,138),(248,241,245),(683,382,383),(144,625,142),(162,653,146),(146,654,625),(152,151,653),(162,193,653),(136,684,174),(169,137,136),(177,183,172),(685,686,687),(688,689,690),(689,691,692),(693,687,694),(694,695,696),(696,695,697),(692,698,699),(700,701,688),(686,701,700),(694,696,702),(696,697,703),(702,703,704),(702,705,706),(707,708,709),(699,710,711),(712,700,711),(712,713,687),(695,713,697),(687,713,695),(694,709,693),(685,693,709),(692,714,715),(705,704,716),(705,716,706),(717,718,716),(715,714,718),(718,719,720),(718,714,721),(716,720,707),(691,721,714),(688,153,166),(708,192,163),(685,163,159),(686,159,153),(688,701,153),(173,691,689),(192,708,707),(189,707,720),(182,720,719),(183,719,721),(172,721,691),(668,151,150),(680,666,667),(722,667,668),(723,679,680),(724,674,675),(725,675,676),(726,676,677),(727,677,678),(728,678,679),(674,724,729),(730,670,669),(730,669,671),(730,671,672),(731,672,673),(732,673,674),(733,734,735),(736,733,737),(738,736,739),(740,738,741),(742,740,743),(744,745,734),(746,744,733),(747,746,736),(748,747,738),(749,748,740),(750,751,745),(752,750,744),(753,752,746),(754,753,747),(749,754,748),(755,756,751),(757,755,750),(758,757,752),(759,758,753),(760,761,756),(762,760,755),(763,762,757),(764,763,758),(765,766,761),(767,765,760),(627,767,762),(768,627,763),(749,612,754),(769,611,610),(749,742,610),(749,610,612),(612,630,754),(612,613,630),(770,771,772),(773,774,775),(776,777,778),(779,772,771),(780,781,779),(779,782,783),(781,784,782),(781,785,784),(781,786,785),(787,776,774),(787,788,776),(776,788,786),(789,790,774),(773,791,792),(793,789,792),(794,790,789),(795,796,790),(797,787,796),(798,788,787),(799,786,788),(799,800,786),(800,801,785),(801,802,784),(784,802,803),(782,803,804),(791,783,804),(799,805,806),(806,807,800),(807,808,801),(808,809,802),(802,809,810),(803,810,811),(804,811,812),(813,814,798),(813,797,795),(815,795,794),(794,793,816),(793,817,818),(818,817,791),(819,791,812),(816,818,820),(821,822,816),(823,815,822),(824,813,815),(825,814,813),(826,805,814),(826,827,806),(806,827,807),(828,819,812),(829,830,823),(831,824,823),(832,825,824),(833,826,825),(834,827,826),(834,835,807),(835,836,808),(836,837,809),(809,837,838),(810,838,839),(810,839,840),(811,840,841),(812,841,842),(820,828,842),(843,820,844),(845,820,846),(846,820,843),(847,832,831),(848,833,832),(849,834,833),(850,835,834),(835,850,851),(835,851,836),(840,852,853),(841,853,854),(841,854,855),(842,855,856),(843,844,856),(846,843,857),(858,830,829),(859,829,860),(861,862,860),(860,846,863),(863,846,864),(851,865,837),(865,866,838),(866,867,839),(867,868,840),(840,868,852),(869,849,848),(870,871,869),(872,873,869),(869,873,874),(874,875,850),(875,876,851),(876,877,865),(877,878,866),(866,878,879),(879,880,867),(867,880,881),(868,881,882),(852,882,883),(853,883,884),(854,884,885),(856,855,885),(857,856,886),(887,888,873),(888,889,874),(889,890,875),(890,891,876),(891,892,877),(892,893,878),(893,894,879),(895,896,897),(898,899,900),(898,901,902),(901,903,904),(905,888,887),(905,897,889),(900,890,889),(900,899,891),(899,902,892),(902,904,893),(904,906,894),(907,908,909),(910,911,907),(911,912,908),(913,914,895),(914,909,896),(909,915,898),(908,916,915),(912,917,916),(911,918,912),(919,918,911),(912,918,917),(919,920,921),(922,923,921),(923,924,925),(926,927,928),(929,925,930),(925,924,926),(931,932,930),(933,931,934),(935,933,903),(915,935,901),(936,928,937),(934,928,936),(903,936,938),(904,938,906),(906,938,939),(936,937,940),(937,941,942),(940,939,938),(942,943,939),(906,939,944),(944,939,945),(939,943,945),(943,946,945),(894,944,947),(944,945,948),(945,946,949),(948,945,949),(950,951,949),(952,953,951),(954,955,953),(894,947,956),(947,948,957),(948,949,958),(948,958,959),(960,961,962),(961,955,954),(961,960,963),(963,964,955),(963,965,964),(964,966,953),(967,968,969),(966,970,951),(970,971,949),(972,967,973),(965,974,966),(974,972,973),(970,966,973),(970,973,971),(958,949,971),(958,971,975),(973,969,975),(968,976,977),(969,977,978),(978,977,979),(976,980,979),(959,975,978),(981,978,982),(956,957,983),(959,981,983),(880,984,985),(984,983,986),(983,981,987),(881,985,988),(985,986,989),(986,987,990),(990,991,992),(980,993,994),(979,994,995),(991,982,995),(995,996,992),(990,987,982),(988,989,997),(998,992,996),(999,1000,992),(1001,999,998),(1000,989,990),(997,989,1000),(1002,997,999),(1003,1004,997),(884,883,1004),(885,884,1003),(886,885,1005),(1006,886,1007),(1007,1005,1008),(1005,1003,1002),(1008,1002,1001),(1009,1001,1010),(1011,1008,1009),(1012,1009,1013),(1014,831,830),(847,870,848),(1015,895,905),(1016,907,914),(1017,1018,1019),(1020,1019,1021),(1022,1021,1023),(1024,1017,1020),(1025,1020,1022),(1026,1022,1027),(1028,1027,1029),(1027,1023,1030),(1031,858,859),(1031,859,862),(1021,1019,862),(1023,1021,862),(1032,1030,1023),(1032,1023,862),(1032,862,861),(1033,1034,1035),(1036,1035,1037),(1038,1039,1024),(1040,1038,1025),(1041,1040,1026),(1042,1041,1028),(1043,1044,1045),(1044,1043,1046),(1039,1038,1044),(1038,1040,1045),(1040,1041,1036),(1041,1042,1033),(1046,1043,1047),(1048,1049,1047),(1037,1035,1050),(1043,1050,1048),(1050,1051,1052),(1048,1052,1053),(1053,1054,1055),(1035,1034,1056),(1056,1051,1050),(1057,1058,1052),(1058,1059,1053),(1059,1060,1054),(1061,1062,1058),(1058,1062,1063),(1063,1064,1060),(1056,1065,1066),(1056,1066,1057),(1067,1061,1057),(1068,1069,1061),(1069,1070,1062),(1070,1071,1063),(1072,1073,1069),(1073,1074,1070),(1074,1075,1071),(1076,1077,1078),(1073,1079,1076),(1076,1079,1077),(1073,1072,1080),(1080,1081,1079),(1081,1082,1077),(1082,1083,1078),(1083,1084,1085),(1085,1084,1086),(1074,1076,1087),(1087,1076,1088),(1063,1071,1089),(1071,1075,1090),(1075,1087,1091),(1091,1087,1088),(1088,1078,1085),(1091,1088,1092),(1092,1088,1085),(1085,1086,1093),(1092,1085,1093),(1094,1095,1096),(1096,1095,1097),(1090,1091,1096),(1055,1054,1098),(1054,1060,1099),(1098,1100,1101),(1098,1099,1100),(1090,1102,1103),(1103,1064,1089),(1060,1064,1103),(1099,1103,1100),(1103,1104,1100),(1102,1097,1104),(1065,861,863),(1105,863,1106),(1105,1106,1107),(1105,1065,863),(1106,863,864),(1107,1106,864),(1084,1108,1109),(1110,1111,1112),(1110,1113,1111),(1083,1114,1108),(1114,1115,1116),(1117,1110,1116),(1065,1105,1118),(1119,1118,1120),(1066,1065,1067),(1067,1065,1068),(1068,1065,1119),(1072,1068,1119),(1072,1119,1080),(1118,1105,1107),(1119,1121,1122),(1081,1080,1122),(1082,1081,1123),(1114,1083,1082),(1114,1124,1125),(1124,1123,1126),(1122,1127,1126),(1121,1128,1127),(1117,1115,1125),(1125,1126,1129),(1118,1107,1130),(1121,1120,1131),(1126,1127,1132),(1127,1128,1133),(1128,1131,1134),(1135,1133,1134),(1132,1133,1135),(1129,1132,1136),(1117,1129,1137),(1110,1117,1138),(1139,1135,1134),(1136,1135,1139),(1137,1136,1140),(1138,1137,1141),(1142,1113,1138),(1140,1139,1143),(1141,1140,1144),(1142,1141,1145),(1113,1142,1146),(1111,1113,1147),(1148,1112,1111),(1130,1149,1150),(1150,1149,1007),(1130,1107,1006),(1107,864,857),(1100,1150,1011),(1131,1120,1151),(1120,1152,1151),(1151,1152,1153),(1134,1131,1151),(1134,1151,1143),(1152,1120,1130),(1130,1150,1153),(1143,1151,1153),(921,925,929),(937,928,927),(897,896,898),(956,984,880),(1004,883,882),(820,818,819),(1154,770,791),(791,772,783),(774,776,778),(817,792,791),(777,786,781),(776,786,777),(790,796,774),(829,821,845),(814,805,799),(1093,1086,1109),(1109,1112,1148),(1153,1100,1104),(1143,1104,1097),(1144,1097,1095),(1145,1095,1094),(1146,1094,1093),(1148,1147,1093),(1100,1012,1155),(314,994,993),(327,1101,1155),(327,1155,1013),(325,1013,1010),(323,1010,998),(321,998,996),(319,996,995),(317,995,994),(1047,1049,331),(1156,1157,1047),(333,308,1047),(1158,1101,327),(1158,327,329),(1055,1158,329),(1055,329,331),(1049,1055,331),(1153,1150,1100),(205,99,122),(107,123,122),(84,83,89),(86,71,85),(628,754,630),(759,754,628),(1112,1109,1108),(1159,178,174),(185,179,178),(1160,1161,1162),(1163,1160,1164),(1165,1163,1166),(1167,1168,1165),(1169,1167,1166),(1170,1169,1164),(1171,1169,1170),(1172,1171,1173),(1174,1172,1175),(1176,1172,1174),(1177,1176,1178),(1179,1176,1177),(1180,1176,1179),(1172,1176,1180),(1167,1169,1171),(1168,1167,1180),(1181,1165,1168),(1182,1183,1184),(1184,1179,1182),(1185,1186,1182),(1183,1182,1186),(1187,1185,1179),(1188,1187,1179),(1189,1188,1177),(1190,1189,1178),(1191,1190,1178),(1192,1191,1174),(1193,1194,1183),(1195,1193,1186),(1196,1195,1185),(1188,1197,1196),(1198,1197,1188),(1199,1198,1189),(1200,1199,1190),(1201,1200,1191),(43,42,1194),(44,43,1193),(45,44,1195),(46,45,1196),(47,46,1197),(48,47,1198),(49,48,1199),(50,49,1200),(1202,1203,1204),(1204,1205,1202),(1206,1205,1204),(1204,1207,1206),(1208,1207,1204),(1209,1163,1165),(1210,1163,1209),(1209,1208,1210),(1206,1207,1165),(1183,1206,1181),(1211,1206,1183),(1194,1212,1211),(62,1212,1194),(1213,1212,62),(1168,1184,1183),(1168,1183,1181),(1207,1208,1209),(1207,1209,1165),(1211,1214,1205),(1213,1214,1211),(1215,1216,1217),(1218,1215,1219),(1220,1216,1215),(1221,1217,1216),(1222,1217,1221),(1223,1217,1222),(1224,1223,1225),(1226,1223,1224),(1227,1223,1226),(1228,1229,1226),(1226,1224,1230),(1225,1230,1224),(1231,1230,1225),(1221,1216,1220),(1231,1220,1232),(1232,1233,1234),(1215,1218,1232),(1235,1232,1218),(1233,1236,1237),(1238,1233,1237),(1230,1231,1238),(1228,1230,1239),(1240,1228,1241),(95,94,1242),(96,95,1241),(97,96,1239),(98,97,1238),(1231,1221,1220),(1221,1231,1222),(1243,1244,1245),(1246,1247,1248),(1249,1246,1250),(1251,1252,1245),(1253,1254,1251),(1255,1254,1253),(1256,1257,1250),(1258,1259,1248),(1258,1243,1252),(1253,1251,1260),(1255,1253,1261),(1262,1261,1263),(1263,1261,1260),(1264,1265,1266),(1267,1268,1250),(1259,1269,1267),(1270,1269,1259),(1255,1270,1254),(1270,1252,1251),(1245,1260,1251),(1271,1257,1256),(1272,1273,1263),(1266,1272,1263),(1274,1275,1273),(1271,1276,1275),(1277,1274,1272),(1271,1274,1277),(1278,1272,1266),(1279,1280,1281),(1282,1279,1283),(1284,1282,1285),(1286,1284,1287),(1288,1286,1289),(1290,1291,1292),(1293,1294,1295),(1296,1297,1298),(1299,1296,1300),(1286,1299,1301),(1299,1302,1296),(1288,1302,1299),(1303,1304,1297),(1305,1303,1296),(1306,1305,1302),(1307,1308,1304),(1309,1307,1303),(1291,1309,1305),(1300,1298,1310),(1301,1300,1311),(1284,1301,1312),(1279,1282,1313),(1314,1313,1282),(1315,1314,1312),(1316,1315,1311),(1317,1318,1313),(1315,1317,1314),(1319,1317,1315),(1319,1320,1318),(1321,1322,1320),(1323,1321,1319),(1324,1323,1325),(1290,1295,1326),(1327,1322,1328),(1329,1328,1322),(1330,1329,1321),(1331,1330,1323),(1332,1290,1328),(1333,1332,1329),(1334,1333,1330),(1307,1309,1332),(1308,1307,1333),(1309,1291,1290),(1292,1291,1306),(1335,1336,1337),(1338,1335,1339),(1340,1338,1341),(1342,1340,1343),(1243,1344,1345),(1344,1346,1347),(1346,1348,1349),(1348,1350,1351),(1350,1352,1353),(1345,1347,1354),(1347,1349,1355),(1349,1351,1356),(1351,1353,1357),(1358,1354,1359),(1354,1355,1360),(1355,1356,1361),(1356,1357,1362),(1363,1359,1364),(1359,1360,1365),(1360,1361,1366),(1361,1362,1367),(1249,1337,1336),(1246,1336,1368),(1342,1369,1370),(1340,1370,1371),(1336,1335,1372),(1338,1371,1372),(1373,1344,1243),(1247,1368,1373),(1374,1352,1350),(1375,1350,1348),(1376,1348,1346),(1377,1346,1344),(1369,1374,1375),(1370,1375,1376),(1371,1376,1377),(1372,1377,1373),(1363,1378,1278),(1367,1379,1380),(1366,1380,1381),(1365,1381,1382),(1264,1358,1363),(1383,1249,1257),(1383,1277,1384),(1385,1384,1382),(1278,1378,1384),(1364,1382,1384),(1383,1385,1337),(1379,1386,1387),(1380,1387,1388),(1386,1389,1343),(1387,1343,1341),(1388,1341,1339),(1390,1339,1337),(1173,1391,1392),(1391,1393,1394),(1393,1395,1396),(1395,1397,1398),(1397,1399,1400),(1399,1401,1402),(1401,1403,1404),(1403,1405,1406),(1170,1407,1391),(1407,1408,1393),(1408,1409,1395),(1409,1410,1397),(1410,1411,1399),(1411,1412,1401),(1412,1413,1403),(1413,1414,1405),(1201,1192,1389),(1400,1352,1374),(1398,1374,1369),(1396,1369,1342),(1394,1342,1389),(1175,1392,1389),(1415,1407,1170),(1416,1411,1410),(1417,1410,1409),(1418,1409,1408),(1419,1408,1407),(1357,1404,1406),(1413,1420,1421),(1352,1400,1402),(1353,1402,1404),(1411,1416,1422),(1412,1422,1420),(280,1423,1424),(1423,1425,1426),(1425,1427,1428),(1427,1429,1430),(1429,1431,1432),(1431,1433,1434),(1433,1435,1436),(1435,1437,1438),(1437,1439,1440),(1439,1441,1442),(1441,1443,1444),(1443,1445,1446),(1445,1447,1448),(1447,306,359),(1449,1450,1156),(312,311,1451),(1452,1453,1451),(1452,1451,1454),(1455,1454,1456),(1457,1456,1458),(1459,1458,1460),(1461,1460,1462),(1463,1462,1464),(1465,1464,1466),(1467,1466,1468),(1469,1468,1470),(1471,1470,1450),(1472,1213,64),(337,336,1473),(1474,1473,1475),(1476,1475,1477),(1478,1477,1479),(1480,1479,1481),(1482,1481,1483),(1484,1483,1485),(1486,1485,1487),(1486,1487,1488),(1489,1488,1490),(1491,1490,1205),(1492,1205,1214),(1493,1214,1213),(1424,1449,310),(1447,1472,335),(1423,280,337),(1423,337,1474),(1425,1474,1476),(1427,1476,1478),(1429,1478,1480),(1431,1480,1482),(1433,1482,1484),(1435,1484,1486),(1437,1486,1489),(1439,1489,1491),(1441,1491,1492),(1443,1492,1493),(1445,1493,1472),(359,312,1453),(1448,1453,1452),(1446,1452,1455),(1442,1444,1455),(1442,1455,1457),(1440,1457,1459),(1438,1459,1461),(1436,1461,1463),(1434,1463,1465),(1432,1465,1467),(1430,1467,1469),(1428,1469,1471),(1426,1471,1449),(1490,1202,1205),(1483,1494,1495),(1485,1495,1496),(1487,1496,1497),(1498,1203,1202),(1490,1488,1498),(1488,1497,1498),(1499,1500,1501),(1160,1163,1210),(1502,1210,1503),(1504,1503,1505),(1506,1505,1507),(1508,1507,1509),(1510,1509,1511),(1512,1511,1513),(1514,1513,1501),(1203,1503,1210),(1515,1499,1501),(1515,1501,1513),(1494,1513,1511),(1495,1511,1509),(1496,1509,1507),(1497,1507,1505),(1498,1505,1503),(1481,1515,1494),(336,382,1516),(1473,1516,1517),(1475,1517,1518),(1477,1518,1499),(1479,1499,1515),(1519,1520,1161),(1516,1521,1522),(1517,1522,1523),(1518,1523,1524),(1499,1524,1525),(1500,1525,1526),(1514,1526,1527),(1512,1527,1528),(1510,1528,1529),(1508,1529,1530),(1506,1530,1531),(1504,1531,1532),(1502,1532,1519),(1415,1162,1161),(1533,1520,1519),(1533,1519,1532),(1534,1521,683),(1535,1532,1531),(1536,1531,1530),(1536,1530,1529),(1537,1529,1528),(1538,1528,1527),(1539,1527,1526),(1540,1526,1525),(1541,1525,1524),(1542,1524,1523),(1543,1523,1522),(1544,1522,1521),(414,1545,1546),(1545,1547,1548),(1547,1549,1550),(1549,1551,1552),(1551,1553,1554),(1553,1555,1556),(1555,1557,1558),(1557,1559,1560),(1559,1561,1562),(1561,1563,1564),(1563,1565,1566),(1565,1567,1568),(1567,1569,1570),(1569,1571,1572),(1571,1573,1574),(1573,1575,1576),(1575,1240,1577),(1240,1242,1578),(1242,94,538),(450,1579,1580),(1579,1581,1582),(1581,1583,1584),(1583,1585,1586),(1585,1587,1588),(1587,1589,1590),(1589,1591,1592),(1591,1593,1594),(1593,1595,1596),(1595,1597,1598),(1597,1599,1600),(1599,1601,1602),(1601,1603,1604),(1603,1605,1606),(1605,1607,1608),(1607,1223,1227),(482,1609,1610),(1609,1611,1612),(1611,1613,1614),(1613,1615,1616),(1615,1617,1618),(1617,1619,1620),(1619,1621,1622),(1621,1623,1624),(1623,1625,1626),(1625,1627,1628),(1627,1629,1630),(1629,1631,1632),(1631,1633,1634),(1633,1635,1636),(1635,1637,1638),(1533,1639,1640),(403,514,1641),(1534,1641,1642),(1544,1642,1643),(1543,1643,1644),(1542,1644,1645),(1541,1645,1646),(1540,1646,1647),(1540,1647,1648),(1539,1648,1649),(1538,1649,1650),(1537,1650,1651),(1536,1651,1652),(1535,1652,1639),(1418,1419,1415),(1533,1415,1520),(1533,1640,1416),(1533,1416,1417),(1533,1417,1418),(1386,1379,532),(1406,1653,1654),(1362,1654,1655),(50,1201,1386),(1655,530,532),(1379,1367,532),(1405,1656,1653),(1421,1657,1658),(1421,1658,1659),(1414,1659,1656),(1422,1416,1640),(1422,1640,1639),(1639,1652,1657),(1420,1639,1657),(415,1641,514),(538,530,1655),(1578,1655,1654),(1577,1654,1653),(1576,1653,1656),(1574,1656,1659),(1572,1659,1658),(1570,1658,1657),(1566,1568,1657),(1566,1657,1652),(1564,1652,1651),(1562,1651,1650),(1560,1650,1649),(1558,1649,1648),(1556,1648,1647),(1554,1647,1646),(1550,1552,1646),(1550,1646,1645),(1548,1645,1644),(1546,1644,1643),(1546,1643,1642),(415,1642,1641),(451,1580,1545),(1580,1582,1547),(1582,1584,1549),(1584,1586,1551),(1586,1588,1553),(1588,1590,1555),(1590,1592,1557),(1592,1594,1559),(1594,1596,1561),(1596,1598,1563),(1598,1600,1565),(1600,1602,1567),(1602,1604,1569),(1604,1606,1571),(1606,1608,1573),(1608,1227,1575),(1227,1229,1240),(1229,1228,1240),(483,1610,1579),(1610,1612,1581),(1612,1614,1583),(1614,1616,1585),(1616,1618,1587),(1618,1620,1589),(1620,1622,1591),(1622,1624,1593),(1624,1626,1595),(1626,1628,1597),(1628,1630,1599),(1630,1632,1601),(1632,1634,1603),(1634,1636,1605),(1636,1638,1607),(1638,1217,1223),(1204,1203,1208),(1196,1187,1188),(1421,1420,1657),(541,1660,1609),(1660,1661,1611),(1661,1662,1613),(1662,1663,1615),(1663,1664,1617),(1664,1665,1619),(1665,1666,1621),(1666,1667,1623),(1667,1668,1625),(1668,1669,1627),(1669,1670,1629),(1670,1671,1631),(1671,1672,1633),(1672,1673,1635),(1673,1674,1637),(557,1675,1660),(1675,1676,1661),(1676,1677,1662),(1677,1678,1663),(1678,1679,1664),(1679,1680,1665),(1680,1681,1666),(1681,1682,1667),(1682,1683,1668),(1683,1684,1669),(1684,1685,1670),(1685,1686,1671),(1686,1687,1672),(1687,1688,1673),(1688,1689,1674),(1689,1690,1691),(1638,1637,1692),(1674,1691,1693),(1637,1693,1694),(1637,1694,1692),(578,1695,1675),(1695,1696,1676),(1696,1697,1677),(1697,1698,1678),(1698,1699,1679),(1699,1700,1680),(1700,1701,1681),(1701,1702,1682),(1702,1703,1683),(1703,1704,1684),(1704,1705,1685),(1705,1706,1686),(1706,1707,1687),(1707,1708,1688),(1708,1709,1689),(1709,1710,1690),(595,1711,1695),(1711,1712,1696),(1712,1713,1697),(1713,1714,1698),(1714,1715,1699),(1715,1716,1700),(1716,1717,1701),(1717,1718,1702),(1718,1719,1703),(1719,1720,1704),(1720,1721,1705),(1721,1722,1706),(1722,1723,1707),(1723,1724,1708),(1724,1725,1709),(611,1726,1711),(1726,1727,1712),(1727,1728,1713),(1728,1729,1714),(1729,1730,1715),(1730,1731,1716),(1731,1732,1717),(1732,1733,1718),(1733,1734,1719),(1734,1735,1720),(1735,1736,1721),(1736,1737,1722),(1737,1738,1723),(1738,1739,1724),(1739,1740,1725),(1740,1287,1285),(627,1741,1742),(1741,1743,1744),(1743,1745,1746),(1745,1747,1748),(1747,1749,1750),(1749,1751,1752),(1751,1753,1754),(1753,1755,1756),(1755,1757,1758),(1757,1759,1760),(1759,1761,1762),(1761,1763,1764),(1763,1765,1766),(1765,1767,1768),(656,1769,1741),(1769,1770,1743),(1770,1771,1745),(1771,1772,1747),(1772,1773,1749),(1773,1774,1751),(1774,1775,1753),(1775,1776,1755),(1776,1777,1757),(1777,1778,1759),(1778,1779,1761),(1779,1780,1763),(1780,1781,1765),(1781,1293,1767),(670,1782,1769),(1782,1783,1770),(1783,1784,1771),(1784,1785,1772),(1785,1786,1773),(1786,1787,1774),(1787,1788,1775),(1788,1789,1776),(1789,1790,1777),(1790,1791,1778),(1791,1792,1779),(1766,1740,1739),(1764,1739,1738),(1762,1738,1737),(1760,1737,1736),(1758,1736,1735),(1756,1735,1734),(1754,1734,1733),(1752,1733,1732),(1750,1732,1731),(1748,1731,1730),(1746,1730,1729),(1744,1729,1728),(1283,1725,1285),(1710,1709,1725),(1281,1793,1725),(1381,1388,1390),(382,683,1521),(1287,1740,1289),(1767,1306,1288),(1766,1768,1289),(1293,1292,1794),(1767,1794,1306),(1795,1280,1313),(1280,1279,1313),(1796,1325,1315),(1797,1798,1799),(1800,1801,1802),(1803,1800,1804),(1805,1806,1799),(1807,1808,1805),(1809,1808,1807),(1810,1811,1804),(1812,1813,1802),(1812,1797,1806),(1807,1805,1814),(1809,1807,1815),(1816,1815,1817),(1817,1815,1814),(1818,1819,1820),(1821,1822,1804),(1813,1823,1821),(1824,1823,1813),(1809,1824,1808),(1824,1806,1805),(1799,1814,1805),(1799,1798,1818),(1825,1811,1810),(1826,1827,1817),(1820,1826,1817),(1828,1829,1827),(1825,1830,1829),(1831,1828,1826),(1825,1828,1831),(1832,1826,1820),(1833,1803,1811),(1297,1801,1800),(1334,1818,1798),(1308,1798,1797),(1304,1797,1812),(1297,1812,1801),(1803,1310,1298),(1818,1334,1331),(1819,1331,1324),(1832,1324,1796),(1831,1796,1316),(1833,1316,1310),(1293,1781,1834),(1779,1792,1835),(1780,1835,1834),(1792,1791,1836),(1786,1837,1838),(1787,1838,1839),(1788,1839,1840),(1789,1840,1841),(1790,1841,1836),(1837,1786,1842),(1782,670,730),(1783,1782,730),(1783,730,731),(1784,731,732),(1785,732,1842),(1843,1844,1845),(1844,1846,735),(1846,1847,737),(1847,1848,739),(1848,1849,741),(1849,1850,743),(1850,1851,769),(1852,1853,1844),(1853,1854,1846),(1854,1855,1847),(1855,1856,1848),(1856,1857,1849),(1857,1858,1850),(1858,1859,1851),(1860,1861,1853),(1861,1862,1854),(1862,1863,1855),(1863,1864,1856),(1864,1865,1857),(1865,1866,1858),(1858,1866,1859),(1867,1868,1861),(1868,1869,1862),(1869,1870,1863),(1870,1871,1864),(1871,1872,1865),(1872,1873,1866),(1874,1875,1868),(1875,1876,1869),(1876,1877,1870),(1877,1878,1871),(1878,1879,1872),(1879,1880,1873),(1881,1882,1875),(1882,766,1876),(766,765,1877),(765,767,1878),(767,627,1879),(627,768,1880),(1883,1884,1882),(1884,761,766),(1885,1886,1884),(1886,756,761),(1887,1888,1886),(1888,751,756),(1889,1890,1888),(1890,745,751),(1891,1892,1890),(1892,734,745),(1893,1845,1892),(1845,735,734),(1866,1727,1859),(611,769,1851),(1726,1851,1859),(1727,1726,1859),(1866,1742,1727),(1742,1728,1727),(1894,1895,1896),(1897,1898,1899),(1900,1901,1902),(1903,1904,1905),(1906,1907,1905),(1908,1904,1903),(1909,1906,1904),(1909,1910,1906),(1910,1911,1906),(1902,1912,1913),(1902,1914,1912),(1911,1914,1902),(1915,1916,1898),(1896,1898,1916),(1916,1917,1918),(1915,1919,1917),(1913,1920,1919),(1912,1921,1920),(1914,1922,1921),(1911,1923,1922),(1911,1924,1923),(1925,1924,1911),(1926,1925,1910),(1926,1909,1908),(1927,1908,1928),(1929,1928,1896),(1930,1931,1923),(1932,1930,1923),(1933,1932,1924),(1934,1933,1925),(1934,1926,1927),(1935,1927,1929),(1936,1929,1896),(1937,1938,1921),(1921,1938,1939),(1920,1939,1940),(1917,1919,1940),(1941,1917,1942),(1918,1941,1943),(1944,1896,1943),(1941,1942,1945),(1940,1946,1945),(1939,1947,1946),(1938,1948,1947),(1937,1949,1948),(1931,1950,1949),(1951,1950,1931),(1932,1951,1930),(1944,1943,1952),(1953,1954,1946),(1948,1955,1953),(1949,1956,1955),(1950,1957,1956),(1951,1958,1957),(1959,1958,1951),(1960,1959,1932),(1961,1960,1933),(1961,1934,1935),(1962,1963,1935),(1962,1935,1936),(1964,1936,1944),(1965,1944,1952),(1952,1966,1967),(1967,1966,1968),(1966,1945,1969),(1968,1966,1970),(1956,847,1014),(1957,1971,847),(1958,1972,1971),(1959,1973,1972),(1974,1973,1959),(1960,1974,1959),(1975,1964,1965),(1976,1977,1965),(1976,1965,1978),(1979,1978,1967),(1967,1968,1980),(1968,1970,1981),(1953,858,1982),(1954,1982,1983),(1969,1983,1984),(1970,1969,1984),(1981,1970,1985),(1986,1974,1960),(1987,1986,1961),(1988,1987,1963),(1989,1988,1962),(1975,1989,1964),(1972,1990,870),(1990,871,870),(1991,872,871),(1991,1990,1972),(1992,1993,1972),(1994,1992,1973),(1995,1994,1974),(1996,1995,1986),(1997,1996,1987),(1998,1997,1987),(1998,1988,1989),(1999,1989,1975),(2000,1975,1977),(2001,1977,1976),(2002,1976,1979),(1979,2003,2004),(2003,1980,2005),(2006,887,872),(2007,2006,1991),(2008,2007,1993),(2009,2008,1992),(2010,2009,1994),(2011,2010,1995),(2012,2011,1996),(2013,2014,2015),(2016,2017,2018),(2019,2018,2017),(2020,2019,2021),(2006,2015,2022),(2023,2015,2006),(2008,2016,2023),(2017,2016,2008),(2021,2017,2009),(2024,2021,2010),(2025,2024,2011),(2026,2027,2028),(2029,910,1016),(2030,2029,2027),(2028,913,1015),(2031,2028,2014),(2032,2031,2013),(2033,2026,2031),(2034,2030,2026),(2030,2035,2029),(2035,919,910),(2034,2035,2030),(920,919,2035),(2036,922,920),(2037,2036,2038),(2039,2040,2041),(2042,2043,2044),(2037,2042,2040),(2044,2045,2041),(2045,2046,2020),(2046,2047,2019),(2047,2032,2018),(2048,2049,2050),(2049,2041,2020),(2050,2020,2024),(2025,2051,2024),(2052,2051,2025),(2048,2050,2051),(2053,2048,2054),(2051,2052,2054),(2055,2056,2054),(2052,2025,2012),(2057,2052,2058),(2057,2055,2052),(2057,2059,2055),(2060,2058,2012),(2057,2058,2060),(2061,2059,2057),(2061,2057,2062),(2063,2064,2059),(2065,2066,2064),(2067,2068,2066),(2060,2012,1997),(2062,2060,2069),(2070,2061,2062),(2070,2062,2071),(2072,960,2073),(2067,2072,2074),(963,960,2072),(2075,963,2072),(2075,965,963),(2076,2075,2067),(968,967,2077),(2078,2076,2065),(2079,2078,2063),(2077,967,972),(974,965,2075),(972,974,2076),(2077,2076,2078),(2079,2077,2078),(2079,2061,2070),(2079,2070,2080),(2081,2077,2079),(976,968,2081),(2082,2081,2083),(2082,2084,2085),(980,976,2082),(2083,2080,2086),(2084,2086,2087),(2071,2069,2088),(2086,2080,2071),(2088,1998,1999),(2089,2088,2090),(2086,2089,2091),(2090,1999,2000),(2091,2090,2092),(2087,2091,2093),(2094,2095,2096),(993,980,2097),(2098,2097,2085),(2099,2085,2094),(2100,2099,2094),(2087,2095,2094),(2093,2092,2101),(2100,2102,2103),(2096,2104,2103),(2104,2105,2106),(2095,2093,2096),(2093,2107,2104),(2107,2108,2105),(2101,2109,2108),(2001,2002,2109),(2002,2110,2111),(2110,2004,2112),(2004,2005,2113),(2111,2112,2114),(2109,2111,2115),(2108,2115,2116),(2105,2116,2117),(2115,2114,2118),(2116,2118,2119),(1955,1014,858),(1971,870,847),(2014,1015,2022),(2027,1016,913),(1018,1017,2120),(2121,2120,2122),(2123,2122,2124),(1017,1024,2125),(2120,2125,2126),(2122,2126,2127),(2124,2127,2128),(2129,2124,2130),(1982,858,1031),(1031,1018,2121),(1983,2121,2123),(1983,2123,2129),(2129,2131,2132),(1983,2129,2132),(1984,1983,2132),(2133,2134,2135),(2136,2135,2137),(1039,2138,2125),(2138,2139,2126),(2139,2140,2127),(2140,2141,2128),(2142,2143,2144),(2143,2142,2145),(2138,1039,2145),(2139,2138,2142),(2140,2139,2137),(2141,2140,2135),(2143,1046,1157),(2146,2147,2143),(2136,2144,2143),(2147,2148,2143),(2149,2148,2147),(2150,2147,2146),(2151,2152,2146),(2153,2133,2136),(2149,2153,2136),(2154,2155,2149),(2156,2154,2150),(2157,2156,2152),(2158,2159,2155),(2158,2154,2156),(2160,2161,2156),(2162,2163,2153),(2162,2153,2149),(2159,2164,2162),(2165,2166,2164),(2167,2165,2159),(2168,2167,2158),(2169,2170,2166),(2171,2169,2165),(2172,2171,2167),(2173,2174,2175),(2176,2169,2171),(2173,2176,2174),(2177,2170,2169),(2178,2177,2169),(2179,2178,2176),(2180,2179,2173),(2181,2180,2182),(2183,2181,2184),(2174,2171,2172),(2175,2174,2185),(2168,2161,2160),(2172,2168,2186),(2185,2172,2187),(2175,2185,2188),(2184,2182,2175),(2175,2188,2189),(2184,2175,2190),(2191,2183,2184),(2184,2190,2192),(2193,2192,2190),(2193,2189,2194),(2188,2187,2194),(2151,2195,2196),(2157,2151,2197),(2198,2197,2196),(2198,2199,2197),(2194,2187,2186),(2186,2160,2200),(2160,2157,2199),(2198,2200,2199),(2198,2201,2200),(2202,2194,2200),(1985,1984,2163),(2203,1985,2204),(2205,2203,2204),(1985,2163,2204),(1981,1985,2203),(1981,2203,2205),(2206,2181,2183),(2207,2208,2209),(2207,2210,2208),(2211,2180,2181),(2212,2211,2206),(2208,2213,2212),(2204,2163,2214),(2215,2214,2216),(2164,2163,2162),(2166,2163,2164),(2214,2163,2166),(2214,2166,2170),(2177,2214,2170),(2205,2204,2215),(2216,2214,2177),(2177,2178,2217),(2178,2179,2218),(2180,2211,2218),(2218,2211,2212),(2217,2218,2219),(2220,2221,2217),(2222,2216,2221),(2219,2212,2213),(2223,2219,2213),(2205,2215,2224),(2224,2216,2222),(2220,2223,2225),(2222,2220,2226),(2227,2222,2228),(2229,2228,2230),(2228,2226,2231),(2226,2225,2232),(2225,2213,2233),(2213,2208,2210),(2229,2230,2234),(2230,2231,2235),(2231,2232,2236),(2232,2233,2237),(2233,2210,2237),(2234,2235,2238),(2235,2236,2239),(2236,2237,2240),(2237,2210,2241),(2210,2207,2242),(2207,2243,2242),(2244,2113,2245),(2113,2244,2114),(2205,2245,2113),(1981,2205,2005),(2244,2198,2118),(2246,2224,2227),(2246,2247,2224),(2248,2247,2246),(2246,2227,2229),(2246,2229,2234),(2245,2224,2247),(2244,2245,2247),(2248,2246,2249),(2042,2038,2035),(2049,2048,2053),(2013,2023,2016),(2088,2069,1997),(2001,2101,2092),(1941,1966,1952),(1895,1899,1898),(1928,1903,1896),(1902,1897,2250),(1896,2251,1918),(1911,1901,1907),(1901,1911,1902),(1897,1913,1915),(1946,1954,1969),(1931,1937,1922),(2252,2183,2191),(2243,2252,2191),(2198,2248,2249),(2201,2249,2238),(2202,2238,2239),(2193,2239,2240),(2192,2240,2241),(2191,2241,2242),(2118,2198,2253),(2098,1451,311),(2119,2253,1464),(2119,1464,1462),(2117,1462,1460),(2106,1460,1458),(2103,1458,1456),(2100,1456,1454),(2099,1454,1451),(2146,2254,1470),(1157,1156,1450),(2254,1450,1470),(1464,2253,2196),(1466,1464,2196),(1466,2196,2195),(1468,1466,2195),(1468,2195,2146),(2198,2244,2248),(1244,1345,1358),(1260,1245,1244),(1231,1234,1233),(1232,1235,1236),(1742,1866,628),(1866,1873,768),(2252,2243,2209),(1320,2255,1795),(1322,1327,2255),(1873,1880,768),(764,759,768),(2,10,0),(4,2,1),(4,5,6),(2,4,7),(10,2,8),(12,9,8),(14,12,11),(17,15,13),(21,19,16),(11,20,16),(20,11,8),(21,20,7),(19,24,25),(18,19,27),(17,18,28),(15,17,30),(14,15,31),(25,23,33),(26,25,34),(27,26,35),(29,28,37),(30,29,38),(31,30,39),(32,31,40),(34,33,42),(35,34,43),(36,35,44),(37,36,45),(38,37,46),(39,38,47),(40,39,48),(41,40,49),(22,5,56),(23,60,61),(42,33,61),(64,62,61),(55,54,65),(61,60,65),(68,72,66),(71,67,66),(76,74,72),(80,78,75),(82,78,80),(74,76,82),(84,71,70),(90,89,83),(91,90,82),(93,91,81),(91,93,94),(90,91,95),(89,90,96),(87,89,97),(101,107,99),(104,125,102),(106,104,103),(113,104,106),(102,125,114),(114,101,100),(116,123,108),(117,116,110),(118,119,116),(120,123,116),(123,120,121),(125,104,113),(125,124,126),(101,114,126),(109,108,101),(129,112,106),(130,118,131),(132,131,129),(134,130,132),(135,133,132),(121,120,130),(138,682,136),(140,138,137),(142,140,139),(144,142,141),(146,144,143),(149,152,147),(152,149,150),(155,166,153),(157,155,154),(141,157,156),(143,156,158),(154,153,159),(158,154,160),(145,158,161),(160,159,163),(161,160,164),(162,161,165),(167,173,166),(168,167,155),(139,168,157),(168,139,169),(167,168,170),(173,167,171),(170,169,174),(177,171,175),(175,174,178),(176,178,179),(177,176,180),(183,177,181),(184,186,149),(186,184,179),(180,179,184),(181,180,187),(182,181,188),(187,184,148),(188,187,190),(189,188,191),(191,190,165),(192,191,164),(190,148,147),(193,162,147),(196,227,194),(198,196,195),(200,198,197),(202,200,199),(99,205,203),(205,207,204),(207,209,206),(209,211,208),(211,215,210),(212,213,207),(213,214,209),(214,216,211),(216,220,215),(217,218,213),(218,219,214),(219,221,216),(221,225,220),(222,223,218),(223,224,219),(224,226,221),(226,239,225),(103,194,227),(102,230,194),(199,229,228),(197,231,229),(230,237,195),(195,237,231),(115,100,203),(115,232,230),(234,208,210),(235,206,208),(236,204,206),(232,203,204),(229,234,233),(231,235,234),(237,236,235),(230,232,236),(121,134,222),(226,240,238),(224,241,240),(223,245,241),(121,217,212),(128,106,105),(242,243,133),(244,245,243),(133,243,222),(222,243,245),(105,227,242),(240,247,246),(241,248,247),(247,200,202),(248,198,200),(244,196,198),(242,227,196),(14,251,249),(251,253,250),(253,255,252),(255,257,254),(257,259,256),(259,261,258),(261,263,260),(263,528,262),(12,249,264),(249,250,265),(250,252,266),(252,254,267),(254,256,268),(256,258,269),(258,260,270),(260,262,271),(246,202,32),(257,233,210),(255,228,233),(253,201,228),(251,202,201),(32,202,251),(10,9,264),(274,267,268),(275,266,267),(276,265,266),(272,264,265),(225,528,263),(271,536,277),(215,261,259),(220,263,261),(269,278,273),(270,277,278),(281,283,279),(283,285,282),(285,287,284),(287,289,286),(289,291,288),(291,293,290),(293,295,292),(295,297,294),(297,299,296),(299,301,298),(301,303,300),(303,305,302),(305,307,304),(307,359,306),(310,1156,308),(313,314,311),(316,317,314),(318,319,317),(320,321,319),(322,323,321),(324,325,323),(326,327,325),(328,329,327),(330,331,329),(332,333,331),(309,308,333),(335,64,63),(338,339,336),(340,341,339),(342,343,341),(344,345,343),(346,347,345),(348,349,347),(350,352,349),(353,354,351),(355,356,354),(357,54,356),(358,65,54),(334,63,65),(281,310,309),(306,335,334),(282,338,337),(284,340,338),(286,342,340),(288,344,342),(290,346,344),(292,348,346),(294,350,348),(296,353,350),(298,355,353),(300,357,355),(302,358,357),(304,334,358),(307,313,312),(305,315,313),(303,316,315),(299,318,316),(297,320,318),(295,322,320),(293,324,322),(291,326,324),(289,328,326),(287,330,328),(285,332,330),(283,309,332),(352,361,360),(351,362,361),(354,364,362),(53,363,354),(368,59,3),(369,370,59),(371,372,370),(373,374,372),(375,376,374),(377,378,376),(379,380,378),(366,365,380),(57,59,370),(360,380,365),(361,378,380),(362,376,378),(364,374,376),(363,372,374),(52,370,372),(349,360,381),(339,383,382),(341,384,383),(343,385,384),(345,367,385),(347,381,367),(1,0,386),(384,389,388),(385,390,389),(367,391,390),(366,392,391),(379,393,392),(377,394,393),(375,395,394),(373,396,395),(371,397,396),(369,398,397),(368,399,398),(1,387,399),(386,0,10),(401,399,387),(403,683,388),(404,398,399),(405,396,397),(406,395,396),(407,394,395),(408,393,394),(409,392,393),(410,391,392),(411,390,391),(412,389,390),(402,388,389),(415,417,413),(417,419,416),(419,421,418),(421,423,420),(423,425,422),(425,427,424),(427,429,426),(429,431,428),(431,433,430),(433,435,432),(435,437,434),(437,439,436),(439,441,438),(441,443,440),(443,445,442),(445,446,444),(446,447,92),(447,448,93),(448,538,94),(451,453,449),(453,455,452),(455,457,454),(457,459,456),(459,461,458),(461,463,460),(463,465,462),(465,467,464),(467,469,466),(469,471,468),(471,473,470),(473,475,472),(475,477,474),(477,479,476),(479,480,478),(480,79,75),(483,485,481),(485,487,484),(487,489,486),(489,491,488),(491,493,490),(493,495,492),(495,497,494),(497,499,496),(499,501,498),(501,503,500),(503,505,502),(505,507,504),(507,509,506),(509,511,508),(511,539,510),(402,515,514),(412,516,515),(411,517,516),(410,518,517),(409,519,518),(408,521,519),(407,522,520),(406,523,522),(405,524,523),(404,525,524),(401,526,525),(400,513,526),(400,272,276),(50,532,238),(225,529,527),(239,531,529),(239,532,530),(528,527,533),(271,537,534),(262,533,537),(277,513,512),(448,531,530),(447,529,531),(446,527,529),(445,533,527),(443,537,533),(441,534,537),(439,535,534),(435,526,535),(433,525,526),(431,524,525),(429,523,524),(427,522,523),(425,520,522),(423,521,520),(419,519,521),(417,518,519),(415,516,517),(414,413,453),(413,416,455),(416,418,457),(418,420,459),(420,422,461),(422,424,463),(424,426,465),(426,428,467),(428,430,469),(430,432,471),(432,434,473),(434,436,475),(436,438,477),(438,440,479),(440,442,480),(442,444,79),(444,92,80),(450,449,485),(449,452,487),(452,454,489),(454,456,491),(456,458,493),(458,460,495),(460,462,497),(462,464,499),(464,466,501),(466,468,503),(468,470,505),(470,472,507),(472,474,509),(474,476,511),(476,478,539),(478,75,72),(482,481,540),(481,484,542),(484,486,543),(486,488,544),(488,490,545),(490,492,546),(492,494,547),(494,496,548),(496,498,549),(498,500,550),(500,502,551),(502,504,552),(504,506,553),(506,508,554),(508,510,555),(541,540,556),(540,542,558),(542,543,559),(543,544,560),(544,545,561),(545,546,562),(546,547,563),(547,548,564),(548,549,565),(549,550,566),(550,551,567),(551,552,568),(552,553,569),(553,554,570),(554,555,571),(555,573,572),(72,576,510),(510,575,573),(557,556,577),(556,558,579),(558,559,580),(559,560,581),(560,561,582),(561,562,583),(562,563,584),(563,564,585),(564,565,586),(565,566,587),(566,567,588),(567,568,589),(568,569,590),(569,570,591),(570,571,592),(571,572,593),(578,577,594),(577,579,596),(579,580,597),(580,581,598),(581,582,599),(582,583,600),(583,584,601),(584,585,602),(585,586,603),(586,587,604),(587,588,605),(588,589,606),(589,590,607),(590,591,608),(591,592,609),(595,594,610),(594,596,612),(596,597,613),(597,598,614),(598,599,615),(599,600,616),(600,601,617),(601,602,618),(602,603,619),(603,604,620),(604,605,621),(605,606,622),(606,607,623),(607,608,624),(608,609,625),(609,140,142),(628,630,626),(630,632,629),(632,634,631),(634,636,633),(636,638,635),(638,640,637),(640,642,639),(642,644,641),(644,646,643),(646,648,645),(648,650,647),(650,652,649),(652,654,651),(654,146,653),(627,626,655),(626,629,657),(629,631,658),(631,633,659),(633,635,660),(635,637,661),(637,639,662),(639,641,663),(641,643,664),(643,645,665),(645,647,666),(647,649,667),(649,651,668),(651,653,151),(656,655,669),(655,657,671),(657,658,672),(658,659,673),(659,660,674),(660,661,675),(661,662,676),(662,663,677),(663,664,678),(664,665,679),(665,666,680),(652,624,625),(650,623,624),(648,622,623),(646,621,622),(644,620,621),(642,619,620),(640,618,619),(638,617,618),(636,616,617),(634,615,616),(632,614,615),(630,613,614),(681,609,592),(138,609,681),(245,244,248),(383,388,683),(146,145,162),(625,144,146),(653,193,152),(174,169,136),(172,171,177),(687,693,685),(690,711,688),(692,690,689),(699,690,692),(688,711,700),(700,687,686),(702,709,694),(703,702,696),(704,705,702),(706,709,702),(709,706,707),(711,690,699),(711,710,712),(687,700,712),(695,694,687),(709,708,685),(715,698,692),(716,704,717),(718,717,715),(720,716,718),(721,719,718),(707,706,716),(714,692,691),(166,689,688),(163,685,708),(159,686,685),(153,701,686),(689,166,173),(707,189,192),(720,182,189),(719,183,182),(721,172,183),(691,173,172),(150,2256,668),(667,722,680),(668,2256,722),(675,725,724),(676,726,725),(677,727,726),(678,728,727),(679,723,728),(729,1842,674),(672,731,730),(673,732,731),(674,1842,732),(735,737,733),(737,739,736),(739,741,738),(741,743,740),(743,769,742),(734,733,744),(733,736,746),(736,738,747),(738,740,748),(740,742,749),(745,744,750),(744,746,752),(746,747,753),(747,748,754),(751,750,755),(750,752,757),(752,753,758),(753,754,759),(756,755,760),(755,757,762),(757,758,763),(758,759,764),(761,760,765),(760,762,767),(762,763,627),(763,764,768),(610,742,769),(772,791,770),(775,1154,773),(771,2257,779),(779,2257,780),(783,772,779),(782,779,781),(774,796,787),(774,773,789),(792,789,773),(792,817,793),(789,793,794),(790,794,795),(796,795,797),(787,797,798),(788,798,799),(785,786,800),(784,785,801),(803,782,784),(804,783,782),(800,799,806),(801,800,807),(802,801,808),(810,803,802),(811,804,803),(812,791,804),(798,797,813),(795,815,813),(794,822,815),(816,822,794),(818,816,793),(791,819,818),(820,845,816),(816,845,821),(822,821,823),(815,823,824),(813,824,825),(814,825,826),(806,805,826),(823,821,829),(823,830,831),(824,831,832),(825,832,833),(826,833,834),(807,827,834),(808,807,835),(809,808,836),(838,810,809),(840,811,810),(841,812,811),(842,828,812),(842,844,820),(846,860,845),(831,1014,847),(832,847,848),(833,848,849),(834,849,850),(853,841,840),(855,842,841),(856,844,842),(856,857,843),(857,864,846),(829,859,858),(860,862,859),(863,861,860),(837,836,851),(838,837,865),(839,838,866),(840,839,867),(848,870,869),(869,871,872),(874,849,869),(850,849,874),(851,850,875),(865,851,876),(866,865,877),(867,866,879),(881,868,867),(882,852,868),(883,853,852),(884,854,853),(885,855,854),(885,886,856),(886,1006,857),(873,872,887),(874,873,888),(875,874,889),(876,875,890),(877,876,891),(878,877,892),(879,878,893),(897,905,895),(902,899,898),(904,902,901),(887,2022,905),(889,888,905),(889,897,900),(891,890,900),(892,891,899),(893,892,902),(894,893,904),(909,914,907),(907,1016,910),(908,907,911),(895,1015,913),(896,895,914),(898,896,909),(915,909,908),(916,908,912),(911,910,919),(921,918,919),(921,920,922),(925,921,923),(928,934,930),(928,930,926),(930,932,929),(926,930,925),(930,934,931),(934,903,933),(903,901,935),(901,898,915),(936,903,934),(938,904,903),(940,938,936),(942,940,937),(939,940,942),(944,894,906),(948,947,944),(949,946,950),(951,950,952),(953,952,954),(956,879,894),(957,956,947),(959,957,948),(962,2073,960),(954,962,961),(955,961,963),(953,955,964),(969,973,967),(951,953,966),(949,951,970),(966,964,965),(973,966,974),(975,959,958),(975,971,973),(977,969,968),(978,975,969),(979,982,978),(979,977,976),(978,981,959),(982,987,981),(983,984,956),(983,957,959),(985,881,880),(986,985,984),(987,986,983),(988,882,881),(989,988,985),(990,989,986),(992,1000,990),(994,979,980),(995,982,979),(992,991,995),(982,991,990),(997,1004,988),(992,998,999),(998,1010,1001),(1000,999,997),(999,1001,1002),(997,1002,1003),(1004,1003,884),(1003,1005,885),(1005,1007,886),(1007,1149,1006),(1008,1011,1007),(1002,1008,1005),(1001,1009,1008),(1010,1013,1009),(1009,1012,1011),(1013,1155,1012),(830,858,1014),(905,2022,1015),(914,913,1016),(1019,1020,1017),(1021,1022,1020),(1023,1027,1022),(1020,1025,1024),(1022,1026,1025),(1027,1028,1026),(1029,2258,1028),(1030,1029,1027),(862,1019,1018),(862,1018,1031),(1035,1036,1033),(1037,1045,1036),(1024,1025,1038),(1025,1026,1040),(1026,1028,1041),(1028,2258,1042),(1045,1037,1043),(1046,2145,1044),(1044,2145,1039),(1045,1044,1038),(1036,1045,1040),(1033,1036,1041),(1047,1157,1046),(1047,1043,1048),(1050,1043,1037),(1052,1048,1050),(1053,1049,1048),(1055,1049,1053),(1050,1035,1056),(1052,1051,1057),(1053,1052,1058),(1054,1053,1059),(1058,1057,1061),(1063,1059,1058),(1060,1059,1063),(1057,1051,1056),(1057,1066,1067),(1061,1067,1068),(1062,1061,1069),(1063,1062,1070),(1069,1068,1072),(1070,1069,1073),(1071,1070,1074),(1078,1088,1076),(1076,1074,1073),(1079,1073,1080),(1077,1079,1081),(1078,1077,1082),(1085,1078,1083),(1087,1075,1074),(1089,1064,1063),(1090,1089,1071),(1091,1090,1075),(1092,1096,1091),(1093,1094,1092),(1096,1092,1094),(1097,1102,1096),(1096,1102,1090),(1098,1158,1055),(1099,1098,1054),(1101,1158,1098),(1103,1089,1090),(1103,1099,1060),(1104,1103,1102),(1109,1086,1084),(1112,1116,1110),(1108,1084,1083),(1116,1108,1114),(1116,1115,1117),(1118,1119,1065),(1120,1121,1119),(1122,1080,1119),(1122,1123,1081),(1123,1124,1082),(1082,1124,1114),(1125,1115,1114),(1126,1125,1124),(1126,1123,1122),(1127,1122,1121),(1129,1117,1125),(1130,1120,1118),(1131,1128,1121),(1132,1129,1126),(1133,1132,1127),(1134,1133,1128),(1135,1136,1132),(1136,1137,1129),(1137,1138,1117),(1138,1113,1110),(1139,1140,1136),(1140,1141,1137),(1141,1142,1138),(1143,1144,1140),(1144,1145,1141),(1145,1146,1142),(1146,1147,1113),(1147,1148,1111),(1007,1011,1150),(1006,1149,1130),(857,1006,1107),(1011,1012,1100),(1143,1139,1134),(1153,1152,1130),(929,918,921),(927,941,937),(898,900,897),(880,879,956),(882,988,1004),(819,828,820),(791,773,1154),(778,775,774),(781,780,777),(845,860,829),(799,798,814),(1148,1093,1109),(1104,1143,1153),(1097,1144,1143),(1095,1145,1144),(1094,1146,1145),(1093,1147,1146),(1155,1101,1100),(993,311,314),(1013,325,327),(1010,323,325),(998,321,323),(996,319,321),(995,317,319),(994,314,317),(331,333,1047),(1047,308,1156),(122,212,205),(122,99,107),(89,85,84),(85,88,86),(628,768,759),(1108,1116,1112),(174,684,1159),(178,1159,185),(1162,1164,1160),(1164,1166,1163),(1165,1166,1167),(1166,1164,1169),(1164,1162,1170),(1170,1173,1171),(1173,1175,1172),(1174,1178,1176),(1179,1184,1180),(1180,1171,1172),(1171,1180,1167),(1180,1184,1168),(1182,1179,1185),(1179,1177,1188),(1177,1178,1189),(1178,1174,1191),(1174,1175,1192),(1183,1186,1193),(1186,1185,1195),(1185,1187,1196),(1188,1189,1198),(1189,1190,1199),(1190,1191,1200),(1191,1192,1201),(1194,1193,43),(1193,1195,44),(1195,1196,45),(1196,1197,46),(1197,1198,47),(1198,1199,48),(1199,1200,49),(1200,1201,50),(1165,1181,1206),(1211,1183,1194),(1194,42,62),(62,64,1213),(1205,1206,1211),(1211,1212,1213),(1217,1219,1215),(1215,1232,1220),(1222,1225,1223),(1226,1229,1227),(1226,1230,1228),(1225,1222,1231),(1232,1234,1231),(1238,1239,1230),(1239,1241,1228),(1241,1242,1240),(1242,1241,95),(1241,1239,96),(1239,1238,97),(1238,1237,98),(1245,1252,1243),(1248,1250,1246),(1250,1257,1249),(1250,1268,1256),(1248,1247,1258),(1252,1259,1258),(1260,1261,1253),(1261,1262,1255),(1263,1273,1262),(1260,1266,1263),(1266,1260,1264),(1250,1248,1267),(1267,1248,1259),(1259,1252,1270),(1251,1254,1270),(1256,1276,1271),(1273,1272,1274),(1275,1274,1271),(1272,1278,1277),(1277,1383,1271),(1266,1265,1278),(1281,1283,1279),(1283,1285,1282),(1285,1287,1284),(1287,1289,1286),(1289,1768,1288),(1292,1295,1290),(1295,1292,1293),(1298,1300,1296),(1300,1301,1299),(1301,1284,1286),(1299,1286,1288),(1297,1296,1303),(1296,1302,1305),(1302,1288,1306),(1304,1303,1307),(1303,1305,1309),(1305,1306,1291),(1310,1311,1300),(1311,1312,1301),(1312,1282,1284),(1282,1312,1314),(1312,1311,1315),(1311,1310,1316),(1313,1314,1317),(1315,1325,1319),(1318,1317,1319),(1320,1319,1321),(1319,1325,1323),(1325,1796,1324),(1326,1328,1290),(1328,1326,1327),(1322,1321,1329),(1321,1323,1330),(1323,1324,1331),(1328,1329,1332),(1329,1330,1333),(1330,1331,1334),(1332,1333,1307),(1333,1334,1308),(1290,1332,1309),(1306,1794,1292),(1337,1339,1335),(1339,1341,1338),(1341,1343,1340),(1343,1389,1342),(1345,1244,1243),(1347,1345,1344),(1349,1347,1346),(1351,1349,1348),(1353,1351,1350),(1354,1358,1345),(1355,1354,1347),(1356,1355,1349),(1357,1356,1351),(1359,1363,1358),(1360,1359,1354),(1361,1360,1355),(1362,1361,1356),(1364,1378,1363),(1365,1364,1359),(1366,1365,1360),(1367,1366,1361),(1336,1246,1249),(1368,1247,1246),(1370,1340,1342),(1371,1338,1340),(1372,1368,1336),(1372,1335,1338),(1243,1258,1373),(1373,1258,1247),(1350,1375,1374),(1348,1376,1375),(1346,1377,1376),(1344,1373,1377),(1375,1370,1369),(1376,1371,1370),(1377,1372,1371),(1373,1368,1372),(1278,1265,1363),(1380,1366,1367),(1381,1365,1366),(1382,1364,1365),(1363,1265,1264),(1257,1271,1383),(1384,1385,1383),(1382,1390,1385),(1384,1277,1278),(1384,1378,1364),(1337,1249,1383),(1387,1380,1379),(1388,1381,1380),(1343,1387,1386),(1341,1388,1387),(1339,1390,1388),(1337,1385,1390),(1392,1175,1173),(1394,1392,1391),(1396,1394,1393),(1398,1396,1395),(1400,1398,1397),(1402,1400,1399),(1404,1402,1401),(1406,1404,1403),(1391,1173,1170),(1393,1391,1407),(1395,1393,1408),(1397,1395,1409),(1399,1397,1410),(1401,1399,1411),(1403,1401,1412),(1405,1403,1413),(1389,1386,1201),(1374,1398,1400),(1369,1396,1398),(1342,1394,1396),(1389,1392,1394),(1389,1192,1175),(1170,1162,1415),(1410,1417,1416),(1409,1418,1417),(1408,1419,1418),(1407,1415,1419),(1406,1362,1357),(1421,1414,1413),(1402,1353,1352),(1404,1357,1353),(1422,1412,1411),(1420,1413,1412),(1424,281,280),(1426,1424,1423),(1428,1426,1425),(1430,1428,1427),(1432,1430,1429),(1434,1432,1431),(1436,1434,1433),(1438,1436,1435),(1440,1438,1437),(1442,1440,1439),(1444,1442,1441),(1446,1444,1443),(1448,1446,1445),(359,1448,1447),(1156,310,1449),(1451,1453,312),(1454,1455,1452),(1456,1457,1455),(1458,1459,1457),(1460,1461,1459),(1462,1463,1461),(1464,1465,1463),(1466,1467,1465),(1468,1469,1467),(1470,1471,1469),(1450,1449,1471),(64,335,1472),(1473,1474,337),(1475,1476,1474),(1477,1478,1476),(1479,1480,1478),(1481,1482,1480),(1483,1484,1482),(1485,1486,1484),(1488,1489,1486),(1490,1491,1489),(1205,1492,1491),(1214,1493,1492),(1213,1472,1493),(310,281,1424),(335,306,1447),(1474,1425,1423),(1476,1427,1425),(1478,1429,1427),(1480,1431,1429),(1482,1433,1431),(1484,1435,1433),(1486,1437,1435),(1489,1439,1437),(1491,1441,1439),(1492,1443,1441),(1493,1445,1443),(1472,1447,1445),(1453,1448,359),(1452,1446,1448),(1455,1444,1446),(1457,1440,1442),(1459,1438,1440),(1461,1436,1438),(1463,1434,1436),(1465,1432,1434),(1467,1430,1432),(1469,1428,1430),(1471,1426,1428),(1449,1424,1426),(1495,1485,1483),(1496,1487,1485),(1497,1488,1487),(1498,1202,1490),(1210,1502,1160),(1503,1504,1502),(1505,1506,1504),(1507,1508,1506),(1509,1510,1508),(1511,1512,1510),(1513,1514,1512),(1501,1500,1514),(1210,1208,1203),(1513,1494,1515),(1511,1495,1494),(1509,1496,1495),(1507,1497,1496),(1505,1498,1497),(1503,1203,1498),(1494,1483,1481),(1516,1473,336),(1517,1475,1473),(1518,1477,1475),(1499,1479,1477),(1515,1481,1479),(1161,1160,1519),(1522,1517,1516),(1523,1518,1517),(1524,1499,1518),(1525,1500,1499),(1526,1514,1500),(1527,1512,1514),(1528,1510,1512),(1529,1508,1510),(1530,1506,1508),(1531,1504,1506),(1532,1502,1504),(1519,1160,1502),(1161,1520,1415),(1532,1535,1533),(683,403,1534),(1531,1536,1535),(1529,1537,1536),(1528,1538,1537),(1527,1539,1538),(1526,1540,1539),(1525,1541,1540),(1524,1542,1541),(1523,1543,1542),(1522,1544,1543),(1521,1534,1544),(1546,415,414),(1548,1546,1545),(1550,1548,1547),(1552,1550,1549),(1554,1552,1551),(1556,1554,1553),(1558,1556,1555),(1560,1558,1557),(1562,1560,1559),(1564,1562,1561),(1566,1564,1563),(1568,1566,1565),(1570,1568,1567),(1572,1570,1569),(1574,1572,1571),(1576,1574,1573),(1577,1576,1575),(1578,1577,1240),(538,1578,1242),(1580,451,450),(1582,1580,1579),(1584,1582,1581),(1586,1584,1583),(1588,1586,1585),(1590,1588,1587),(1592,1590,1589),(1594,1592,1591),(1596,1594,1593),(1598,1596,1595),(1600,1598,1597),(1602,1600,1599),(1604,1602,1601),(1606,1604,1603),(1608,1606,1605),(1227,1608,1607),(1610,483,482),(1612,1610,1609),(1614,1612,1611),(1616,1614,1613),(1618,1616,1615),(1620,1618,1617),(1622,1620,1619),(1624,1622,1621),(1626,1624,1623),(1628,1626,1625),(1630,1628,1627),(1632,1630,1629),(1634,1632,1631),(1636,1634,1633),(1638,1636,1635),(1641,1534,403),(1642,1544,1534),(1643,1543,1544),(1644,1542,1543),(1645,1541,1542),(1646,1540,1541),(1648,1539,1540),(1649,1538,1539),(1650,1537,1538),(1651,1536,1537),(1652,1535,1536),(1639,1533,1535),(1415,1533,1418),(532,50,1386),(1654,1362,1406),(1655,1367,1362),(532,1367,1655),(1653,1406,1405),(1659,1414,1421),(1656,1405,1414),(1639,1420,1422),(1655,1578,538),(1654,1577,1578),(1653,1576,1577),(1656,1574,1576),(1659,1572,1574),(1658,1570,1572),(1657,1568,1570),(1652,1564,1566),(1651,1562,1564),(1650,1560,1562),(1649,1558,1560),(1648,1556,1558),(1647,1554,1556),(1646,1552,1554),(1645,1548,1550),(1644,1546,1548),(1642,415,1546),(1545,414,451),(1547,1545,1580),(1549,1547,1582),(1551,1549,1584),(1553,1551,1586),(1555,1553,1588),(1557,1555,1590),(1559,1557,1592),(1561,1559,1594),(1563,1561,1596),(1565,1563,1598),(1567,1565,1600),(1569,1567,1602),(1571,1569,1604),(1573,1571,1606),(1575,1573,1608),(1240,1575,1227),(1579,450,483),(1581,1579,1610),(1583,1581,1612),(1585,1583,1614),(1587,1585,1616),(1589,1587,1618),(1591,1589,1620),(1593,1591,1622),(1595,1593,1624),(1597,1595,1626),(1599,1597,1628),(1601,1599,1630),(1603,1601,1632),(1605,1603,1634),(1607,1605,1636),(1223,1607,1638),(1609,482,541),(1611,1609,1660),(1613,1611,1661),(1615,1613,1662),(1617,1615,1663),(1619,1617,1664),(1621,1619,1665),(1623,1621,1666),(1625,1623,1667),(1627,1625,1668),(1629,1627,1669),(1631,1629,1670),(1633,1631,1671),(1635,1633,1672),(1637,1635,1673),(1660,541,557),(1661,1660,1675),(1662,1661,1676),(1663,1662,1677),(1664,1663,1678),(1665,1664,1679),(1666,1665,1680),(1667,1666,1681),(1668,1667,1682),(1669,1668,1683),(1670,1669,1684),(1671,1670,1685),(1672,1671,1686),(1673,1672,1687),(1674,1673,1688),(1691,1674,1689),(1692,1217,1638),(1693,1637,1674),(1675,557,578),(1676,1675,1695),(1677,1676,1696),(1678,1677,1697),(1679,1678,1698),(1680,1679,1699),(1681,1680,1700),(1682,1681,1701),(1683,1682,1702),(1684,1683,1703),(1685,1684,1704),(1686,1685,1705),(1687,1686,1706),(1688,1687,1707),(1689,1688,1708),(1690,1689,1709),(1695,578,595),(1696,1695,1711),(1697,1696,1712),(1698,1697,1713),(1699,1698,1714),(1700,1699,1715),(1701,1700,1716),(1702,1701,1717),(1703,1702,1718),(1704,1703,1719),(1705,1704,1720),(1706,1705,1721),(1707,1706,1722),(1708,1707,1723),(1709,1708,1724),(1711,595,611),(1712,1711,1726),(1713,1712,1727),(1714,1713,1728),(1715,1714,1729),(1716,1715,1730),(1717,1716,1731),(1718,1717,1732),(1719,1718,1733),(1720,1719,1734),(1721,1720,1735),(1722,1721,1736),(1723,1722,1737),(1724,1723,1738),(1725,1724,1739),(1285,1725,1740),(1742,628,627),(1744,1742,1741),(1746,1744,1743),(1748,1746,1745),(1750,1748,1747),(1752,1750,1749),(1754,1752,1751),(1756,1754,1753),(1758,1756,1755),(1760,1758,1757),(1762,1760,1759),(1764,1762,1761),(1766,1764,1763),(1768,1766,1765),(1741,627,656),(1743,1741,1769),(1745,1743,1770),(1747,1745,1771),(1749,1747,1772),(1751,1749,1773),(1753,1751,1774),(1755,1753,1775),(1757,1755,1776),(1759,1757,1777),(1761,1759,1778),(1763,1761,1779),(1765,1763,1780),(1767,1765,1781),(1769,656,670),(1770,1769,1782),(1771,1770,1783),(1772,1771,1784),(1773,1772,1785),(1774,1773,1786),(1775,1774,1787),(1776,1775,1788),(1777,1776,1789),(1778,1777,1790),(1779,1778,1791),(1739,1764,1766),(1738,1762,1764),(1737,1760,1762),(1736,1758,1760),(1735,1756,1758),(1734,1754,1756),(1733,1752,1754),(1732,1750,1752),(1731,1748,1750),(1730,1746,1748),(1729,1744,1746),(1728,1742,1744),(1725,1793,1710),(1725,1283,1281),(1390,1382,1381),(1521,1516,382),(1288,1768,1767),(1289,1740,1766),(1794,1767,1293),(1313,1318,1795),(1315,1316,1796),(1799,1806,1797),(1802,1804,1800),(1804,1811,1803),(1804,1822,1810),(1802,1801,1812),(1806,1813,1812),(1814,1815,1807),(1815,1816,1809),(1817,1827,1816),(1814,1820,1817),(1820,1814,1818),(1804,1802,1821),(1821,1802,1813),(1813,1806,1824),(1805,1808,1824),(1818,1814,1799),(1810,1830,1825),(1827,1826,1828),(1829,1828,1825),(1826,1832,1831),(1831,1833,1825),(1820,1819,1832),(1811,1825,1833),(1800,1298,1297),(1798,1308,1334),(1797,1304,1308),(1812,1297,1304),(1298,1800,1803),(1331,1819,1818),(1324,1832,1819),(1796,1831,1832),(1316,1833,1831),(1310,1803,1833),(1834,1294,1293),(1835,1780,1779),(1834,1781,1780),(1838,1787,1786),(1839,1788,1787),(1840,1789,1788),(1841,1790,1789),(1836,1791,1790),(1842,729,1837),(731,1784,1783),(732,1785,1784),(1842,1786,1785),(1845,1893,1843),(735,1845,1844),(737,735,1846),(739,737,1847),(741,739,1848),(743,741,1849),(769,743,1850),(1844,1843,1852),(1846,1844,1853),(1847,1846,1854),(1848,1847,1855),(1849,1848,1856),(1850,1849,1857),(1851,1850,1858),(1853,1852,1860),(1854,1853,1861),(1855,1854,1862),(1856,1855,1863),(1857,1856,1864),(1858,1857,1865),(1861,1860,1867),(1862,1861,1868),(1863,1862,1869),(1864,1863,1870),(1865,1864,1871),(1866,1865,1872),(1868,1867,1874),(1869,1868,1875),(1870,1869,1876),(1871,1870,1877),(1872,1871,1878),(1873,1872,1879),(1875,1874,1881),(1876,1875,1882),(1877,1876,766),(1878,1877,765),(1879,1878,767),(1880,1879,627),(1882,1881,1883),(766,1882,1884),(1884,1883,1885),(761,1884,1886),(1886,1885,1887),(756,1886,1888),(1888,1887,1889),(751,1888,1890),(1890,1889,1891),(745,1890,1892),(1892,1891,1893),(734,1892,1845),(1851,1726,611),(1896,1903,1894),(1899,2250,1897),(1905,1894,1903),(1905,1904,1906),(1903,1928,1908),(1904,1908,1909),(1913,1897,1902),(1898,1897,1915),(1916,2251,1896),(1918,2251,1916),(1917,1916,1915),(1919,1915,1913),(1920,1913,1912),(1921,1912,1914),(1922,1914,1911),(1911,1910,1925),(1910,1909,1926),(1908,1927,1926),(1928,1929,1927),(1923,1924,1932),(1924,1925,1933),(1925,1926,1934),(1927,1935,1934),(1929,1936,1935),(1896,1944,1936),(1921,1922,1937),(1939,1920,1921),(1940,1919,1920),(1940,1942,1917),(1941,1918,1917),(1943,1896,1918),(1945,1966,1941),(1945,1942,1940),(1946,1940,1939),(1947,1939,1938),(1948,1938,1937),(1949,1937,1931),(1931,1930,1951),(1946,1947,1953),(1953,1947,1948),(1955,1948,1949),(1956,1949,1950),(1957,1950,1951),(1951,1932,1959),(1932,1933,1960),(1933,1934,1961),(1935,1963,1961),(1936,1964,1962),(1944,1965,1964),(1952,1978,1965),(1967,1978,1952),(1969,1970,1966),(1014,1955,1956),(847,1956,1957),(1971,1957,1958),(1972,1958,1959),(1965,1977,1975),(1978,1979,1976),(1967,2003,1979),(1980,2003,1967),(1981,1980,1968),(1982,1954,1953),(1983,1969,1954),(1984,1985,1970),(1960,1961,1986),(1961,1963,1987),(1963,1962,1988),(1962,1964,1989),(870,1971,1972),(871,1990,1991),(1972,1993,1991),(1972,1973,1992),(1973,1974,1994),(1974,1986,1995),(1986,1987,1996),(1987,1988,1998),(1989,1999,1998),(1975,2000,1999),(1977,2001,2000),(1976,2002,2001),(1979,2110,2002),(2004,2110,1979),(2005,2004,2003),(872,1991,2006),(1991,1993,2007),(1993,1992,2008),(1992,1994,2009),(1994,1995,2010),(1995,1996,2011),(1996,1997,2012),(2015,2023,2013),(2017,2021,2019),(2021,2024,2020),(2022,887,2006),(2006,2007,2023),(2023,2007,2008),(2008,2009,2017),(2009,2010,2021),(2010,2011,2024),(2011,2012,2025),(2028,2031,2026),(1016,2027,2029),(2027,2026,2030),(1015,2014,2028),(2014,2013,2031),(2013,2018,2032),(2031,2032,2033),(2026,2033,2034),(910,2029,2035),(2035,2038,920),(920,2038,2036),(2038,2042,2037),(2041,2049,2259),(2041,2259,2039),(2044,2040,2042),(2040,2039,2037),(2041,2040,2044),(2020,2041,2045),(2019,2020,2046),(2018,2019,2047),(2020,2050,2049),(2024,2051,2050),(2051,2054,2048),(2054,2056,2053),(2054,2052,2055),(2012,2058,2052),(2060,2062,2057),(2059,2061,2063),(2064,2063,2065),(2066,2065,2067),(1997,2069,2060),(2069,2071,2062),(2071,2080,2070),(2073,2074,2072),(2074,2068,2067),(2072,2067,2075),(2067,2065,2076),(2077,2081,968),(2065,2063,2078),(2063,2061,2079),(2075,2076,974),(2076,2077,972),(2080,2083,2079),(2079,2083,2081),(2081,2082,976),(2083,2084,2082),(2085,2097,2082),(2082,2097,980),(2086,2084,2083),(2087,2085,2084),(2088,2089,2071),(2071,2089,2086),(1999,2090,2088),(2090,2091,2089),(2091,2087,2086),(2000,2092,2090),(2092,2093,2091),(2093,2095,2087),(2096,2102,2094),(2097,2098,993),(2085,2099,2098),(2094,2102,2100),(2094,2085,2087),(2101,2107,2093),(2103,2102,2096),(2106,2103,2104),(2104,2096,2093),(2105,2104,2107),(2108,2107,2101),(2109,2101,2001),(2111,2109,2002),(2112,2111,2110),(2113,2112,2004),(2114,2115,2111),(2115,2108,2109),(2116,2105,2108),(2117,2106,2105),(2118,2116,2115),(2119,2117,2116),(858,1953,1955),(2022,2015,2014),(913,2028,2027),(2120,2121,1018),(2122,2123,2121),(2124,2129,2123),(2125,2120,1017),(2126,2122,2120),(2127,2124,2122),(2128,2130,2124),(2130,2131,2129),(2121,1983,1982),(2121,1982,1031),(2135,2136,2133),(2137,2144,2136),(2125,1024,1039),(2126,2125,2138),(2127,2126,2139),(2128,2127,2140),(2144,2137,2142),(2145,1046,2143),(2145,2142,2138),(2142,2137,2139),(2137,2135,2140),(2135,2134,2141),(1157,2254,2143),(2143,2254,2146),(2143,2148,2136),(2147,2150,2149),(2146,2152,2150),(2146,2195,2151),(2136,2148,2149),(2149,2150,2154),(2150,2152,2156),(2152,2151,2157),(2155,2154,2158),(2156,2161,2158),(2156,2157,2160),(2149,2155,2162),(2162,2155,2159),(2164,2159,2165),(2159,2158,2167),(2158,2161,2168),(2166,2165,2169),(2165,2167,2171),(2167,2168,2172),(2175,2182,2173),(2171,2174,2176),(2169,2176,2178),(2176,2173,2179),(2173,2182,2180),(2182,2184,2181),(2172,2185,2174),(2160,2186,2168),(2186,2187,2172),(2187,2188,2185),(2189,2190,2175),(2192,2191,2184),(2190,2189,2193),(2194,2202,2193),(2194,2189,2188),(2196,2197,2151),(2197,2199,2157),(2196,2253,2198),(2186,2200,2194),(2199,2200,2160),(2200,2201,2202),(2183,2252,2206),(2209,2243,2207),(2181,2206,2211),(2206,2209,2212),(2212,2209,2208),(2214,2215,2204),(2216,2224,2215),(2177,2221,2216),(2217,2221,2177),(2218,2217,2178),(2218,2179,2180),(2212,2219,2218),(2219,2223,2217),(2217,2223,2220),(2221,2220,2222),(2213,2225,2223),(2224,2245,2205),(2222,2227,2224),(2225,2226,2220),(2226,2228,2222),(2228,2229,2227),(2231,2230,2228),(2232,2231,2226),(2233,2232,2225),(2210,2233,2213),(2235,2234,2230),(2236,2235,2231),(2237,2236,2232),(2238,2249,2234),(2239,2238,2235),(2240,2239,2236),(2241,2240,2237),(2242,2241,2210),(2114,2112,2113),(2113,2005,2205),(2005,1980,1981),(2118,2114,2244),(2234,2249,2246),(2247,2248,2244),(2035,2043,2042),(2053,2259,2049),(2016,2018,2013),(1997,1998,2088),(2092,2000,2001),(1952,1943,1941),(1898,1896,1895),(2250,1900,1902),(1907,1906,1911),(1969,1945,1946),(1922,1923,1931),(2191,2242,2243),(2249,2201,2198),(2238,2202,2201),(2239,2193,2202),(2240,2192,2193),(2241,2191,2192),(2253,2119,2118),(311,993,2098),(1462,2117,2119),(1460,2106,2117),(1458,2103,2106),(1456,2100,2103),(1454,2099,2100),(1451,2098,2099),(1470,1468,2146),(1450,2254,1157),(1358,1264,1244),(1244,1264,1260),(1233,1238,1231),(1236,1233,1232),(768,628,1866),(2209,2206,2252),(1795,1318,1320),(2255,1320,1322),(572,2260,593),(2260,572,2261),(2261,572,573),(681,593,2262),(593,2260,2263),(2260,2261,2264),(2261,573,2265),(2265,573,2266),(2266,573,575),(681,2262,2267),(2262,2263,2268),(2263,2264,2269),(2264,2270,2271),(2270,2264,2265),(2265,2266,2272),(2266,575,2273),(2273,575,2274),(2274,2275,2273),(2273,2275,2272),(2275,2271,2270),(575,574,69),(574,576,68),(68,576,72),(86,2276,69),(69,2276,2274),(2274,2276,2277),(2277,2276,2278),(2276,86,88),(2277,2278,2279),(2278,88,87),(98,2280,2279),(2280,2281,2282),(2283,2277,2279),(2277,2283,2271),(2271,2275,2277),(2277,2275,2274),(682,2267,2284),(2267,2268,2285),(2268,2269,2286),(2269,2271,2283),(2282,2287,2288),(2289,2286,2283),(2289,2290,2285),(2290,2291,2292),(2293,2294,2285),(2294,2295,2284),(2295,2296,136),(2296,2297,684),(2298,2299,2300),(2299,2301,2302),(2301,2303,2304),(2303,2293,2292),(2291,2305,2304),(2305,2306,2307),(2306,2308,2281),(2308,2287,2282),(2309,2310,186),(2310,2311,149),(2311,2312,2313),(2312,2314,2315),(2314,2316,2317),(2316,2318,2319),(2318,2320,2321),(2320,2322,2323),(2322,2324,727),(727,2324,726),(2324,2325,2326),(2324,2322,2327),(2320,2318,2328),(2318,2316,2329),(2316,2314,2330),(2314,2312,2331),(2312,2311,2332),(2311,2310,2333),(2310,2309,2334),(2309,2335,2300),(2322,2320,2336),(727,728,2323),(728,2337,2321),(2337,2338,2319),(2338,2339,2317),(2339,2340,2315),(2340,150,2313),(2313,150,149),(723,680,2341),(728,723,2337),(723,2341,2338),(2341,2342,2339),(2342,2256,2340),(2340,2256,150),(2256,2342,722),(2326,2343,725),(2343,729,724),(2342,2341,680),(2344,2345,2288),(2345,2346,2289),(2346,2347,2290),(2347,2348,2291),(2348,2349,2305),(2349,2350,2306),(2350,2351,2308),(2351,2344,2287),(2352,2353,2294),(2353,2354,2295),(2354,2355,2296),(2355,2356,2297),(2356,2357,2298),(2357,2358,2299),(2358,2359,2301),(2359,2360,2303),(2360,2352,2293),(2361,2362,2351),(2363,2361,2350),(2364,2363,2349),(2365,2364,2348),(2366,2365,2347),(2367,2366,2346),(2368,2367,2345),(2362,2368,2344),(2369,2370,2352),(2371,2369,2360),(2372,2371,2359),(2373,2372,2358),(2374,2373,2357),(2375,2374,2356),(2376,2375,2355),(2377,2376,2354),(2370,2377,2353),(2367,2368,2378),(2366,2367,2378),(2365,2366,2378),(2364,2365,2378),(2363,2364,2378),(2361,2363,2378),(2362,2361,2378),(2368,2362,2378),(2377,2370,2379),(2376,2377,2379),(2375,2376,2379),(2374,2375,2379),(2373,2374,2379),(2372,2373,2379),(2371,2372,2379),(2369,2371,2379),(2370,2369,2379),(1159,2335,2309),(1159,2298,2335),(684,2297,2298),(1710,2380,1690),(2381,1690,2380),(1691,1690,2381),(2382,1710,1793),(2380,1710,2382),(2381,2380,2383),(1691,2381,2384),(2385,1691,2386),(1693,1691,2385),(2382,1793,1281),(2383,2382,2387),(2384,2383,2388),(2389,2384,2390),(2386,2384,2389),(2385,2386,2389),(1693,2385,2391),(2392,1693,2393),(2393,2394,2392),(2391,2394,2393),(2395,2394,2391),(1694,1693,2392),(1692,1694,1218),(1217,1692,1219),(1218,2396,1235),(2392,2396,1218),(2397,2396,2392),(2398,2396,2397),(1235,2396,2398),(2399,2398,2397),(1236,2398,2399),(2280,98,1237),(2281,2280,2399),(2397,2400,2401),(2395,2400,2397),(2397,2394,2395),(2392,2394,2397),(2387,1281,1280),(2388,2387,2402),(2390,2388,2403),(2395,2390,2404),(2405,2401,2400),(2404,2406,2407),(2408,2406,2404),(2409,2408,2403),(2410,2411,2412),(2413,2410,2403),(2414,2413,2402),(2415,2414,1280),(2416,2417,2418),(2419,2416,2300),(2420,2419,2302),(2411,2420,2304),(2421,2409,2412),(2422,2421,2304),(2423,2422,2307),(2405,2423,2281),(2424,2425,1327),(2426,2424,1326),(2427,2426,1295),(2428,2427,2429),(2430,2428,2431),(2432,2430,2433),(2434,2432,2435),(2436,2434,2437),(2438,2436,2439),(1839,2438,1840),(2325,2438,1839),(2436,2438,2325),(2432,2434,2336),(2430,2432,2328),(2428,2430,2329),(2427,2428,2330),(2426,2427,2331),(2424,2426,2332),(2425,2424,2333),(2418,2425,2334),(2434,2436,2327),(2439,1841,1840),(2440,1841,2439),(2441,2440,2437),(2442,2441,2435),(2443,2442,2433),(1294,2443,2431),(1295,1294,2429),(2444,1792,1836),(2440,1836,1841),(2444,1836,2440),(2445,2444,2441),(1834,2445,2442),(1294,1834,2443),(1835,2445,1834),(2343,2326,1839),(729,2343,1838),(2444,2445,1835),(2446,2447,2405),(2448,2446,2407),(2449,2448,2406),(2450,2449,2408),(2451,2450,2409),(2452,2451,2421),(2453,2452,2422),(2447,2453,2423),(2454,2455,2411),(2456,2454,2410),(2457,2456,2413),(2458,2457,2414),(2459,2458,2415),(2460,2459,2417),(2461,2460,2416),(2462,2461,2419),(2455,2462,2420),(2463,2464,2452),(2464,2465,2451),(2465,2466,2450),(2466,2467,2449),(2467,2468,2448),(2468,2469,2446),(2469,2470,2447),(2470,2463,2453),(2471,2472,2462),(2472,2473,2461),(2473,2474,2460),(2474,2475,2459),(2475,2476,2458),(2476,2477,2457),(2477,2478,2456),(2478,2479,2454),(2479,2471,2455),(2480,2470,2469),(2480,2469,2468),(2480,2468,2467),(2480,2467,2466),(2480,2466,2465),(2480,2465,2464),(2480,2464,2463),(2480,2463,2470),(2481,2471,2479),(2481,2479,2478),(2481,2478,2477),(2481,2477,2476),(2481,2476,2475),(2481,2475,2474),(2481,2474,2473),(2481,2473,2472),(2481,2472,2471),(2418,2255,1327),(2418,2417,2255),(2415,1795,2255),(2482,2483,2484),(2263,2262,593),(2264,2263,2260),(2265,2264,2261),(2267,682,681),(2268,2267,2262),(2269,2268,2263),(2271,2269,2264),(2272,2270,2265),(2273,2272,2266),(2270,2272,2275),(69,2274,575),(68,69,574),(88,2278,2276),(87,2279,2278),(2279,87,98),(2282,2279,2280),(2279,2282,2283),(2284,136,682),(2285,2284,2267),(2286,2285,2268),(2283,2286,2269),(2288,2283,2282),(2283,2288,2289),(2285,2286,2289),(2292,2285,2290),(2285,2292,2293),(2284,2285,2294),(136,2284,2295),(684,136,2296),(2300,2335,2298),(2302,2300,2299),(2304,2302,2301),(2292,2304,2303),(2304,2292,2291),(2307,2304,2305),(2281,2307,2306),(2282,2281,2308),(186,185,2309),(149,186,2310),(2313,149,2311),(2315,2313,2312),(2317,2315,2314),(2319,2317,2316),(2321,2319,2318),(2323,2321,2320),(727,2323,2322),(2326,726,2324),(2327,2325,2324),(2328,2336,2320),(2329,2328,2318),(2330,2329,2316),(2331,2330,2314),(2332,2331,2312),(2333,2332,2311),(2334,2333,2310),(2300,2334,2309),(2336,2327,2322),(2321,2323,728),(2319,2321,2337),(2317,2319,2338),(2315,2317,2339),(2313,2315,2340),(2338,2337,723),(2339,2338,2341),(2340,2339,2342),(725,726,2326),(724,725,2343),(680,722,2342),(2288,2287,2344),(2289,2288,2345),(2290,2289,2346),(2291,2290,2347),(2305,2291,2348),(2306,2305,2349),(2308,2306,2350),(2287,2308,2351),(2294,2293,2352),(2295,2294,2353),(2296,2295,2354),(2297,2296,2355),(2298,2297,2356),(2299,2298,2357),(2301,2299,2358),(2303,2301,2359),(2293,2303,2360),(2351,2350,2361),(2350,2349,2363),(2349,2348,2364),(2348,2347,2365),(2347,2346,2366),(2346,2345,2367),(2345,2344,2368),(2344,2351,2362),(2352,2360,2369),(2360,2359,2371),(2359,2358,2372),(2358,2357,2373),(2357,2356,2374),(2356,2355,2375),(2355,2354,2376),(2354,2353,2377),(2353,2352,2370),(2309,185,1159),(2298,1159,684),(2382,2383,2380),(2383,2384,2381),(2384,2386,1691),(1281,2387,2382),(2387,2388,2383),(2388,2390,2384),(2390,2395,2389),(2389,2391,2385),(2391,2393,1693),(2391,2389,2395),(2392,1218,1694),(1218,1219,1692),(2398,1236,1235),(2399,1237,1236),(1237,2399,2280),(2399,2401,2281),(2401,2399,2397),(1280,2402,2387),(2402,2403,2388),(2403,2404,2390),(2404,2400,2395),(2400,2407,2405),(2407,2400,2404),(2404,2403,2408),(2403,2412,2409),(2412,2403,2410),(2403,2402,2413),(2402,1280,2414),(1280,1795,2415),(2418,2300,2416),(2300,2302,2419),(2302,2304,2420),(2304,2412,2411),(2412,2304,2421),(2304,2307,2422),(2307,2281,2423),(2281,2401,2405),(1327,1326,2424),(1326,1295,2426),(1295,2429,2427),(2429,2431,2428),(2431,2433,2430),(2433,2435,2432),(2435,2437,2434),(2437,2439,2436),(2439,1840,2438),(1839,2326,2325),(2325,2327,2436),(2336,2328,2432),(2328,2329,2430),(2329,2330,2428),(2330,2331,2427),(2331,2332,2426),(2332,2333,2424),(2333,2334,2425),(2334,2300,2418),(2327,2336,2434),(2439,2437,2440),(2437,2435,2441),(2435,2433,2442),(2433,2431,2443),(2431,2429,1294),(2440,2441,2444),(2441,2442,2445),(2442,2443,1834),(1839,1838,2343),(1838,1837,729),(1835,1792,2444),(2405,2407,2446),(2407,2406,2448),(2406,2408,2449),(2408,2409,2450),(2409,2421,2451),(2421,2422,2452),(2422,2423,2453),(2423,2405,2447),(2411,2410,2454),(2410,2413,2456),(2413,2414,2457),(2414,2415,2458),(2415,2417,2459),(2417,2416,2460),(2416,2419,2461),(2419,2420,2462),(2420,2411,2455),(2452,2453,2463),(2451,2452,2464),(2450,2451,2465),(2449,2450,2466),(2448,2449,2467),(2446,2448,2468),(2447,2446,2469),(2453,2447,2470),(2462,2455,2471),(2461,2462,2472),(2460,2461,2473),(2459,2460,2474),(2458,2459,2475),(2457,2458,2476),(2456,2457,2477),(2454,2456,2478),(2455,2454,2479),(1327,2425,2418),(2255,2417,2415),(2485,2486,2487),(2486,2488,2489),(2488,2490,2491),(2492,2493,2489),(2493,2494,2487),(2494,2495,2496),(2488,2486,2497),(2486,2485,2498),(113,112,2499),(2495,2494,2500),(2500,2494,2493),(2493,2492,2501),(124,2498,2485),(111,2502,2503),(2501,2492,2504),(2502,2500,2505),(2500,2501,2506),(2507,118,117),(2505,2508,2507),(2505,2506,2509),(2506,2504,2510),(2504,2511,2512),(124,2485,2496),(126,2496,2495),(127,2495,2502),(112,129,2513),(2499,2514,2497),(2515,2516,2490),(2515,2517,2518),(2515,2497,2514),(2517,2519,2520),(2517,2514,2521),(2514,2499,2513),(2507,2522,131),(2522,2513,129),(2508,2523,2522),(2523,2521,2513),(2523,2508,2509),(2510,2523,2509),(2521,2523,2519),(2510,2512,2523),(2519,2523,2512),(2520,2512,2511),(2492,2491,2511),(124,113,2498),(2490,2516,2518),(2524,2525,2526),(2525,2527,2528),(2527,2529,2530),(2531,2532,2528),(2532,2533,2526),(2533,2534,2535),(2527,2525,2536),(2525,2524,2537),(699,698,2538),(2534,2533,2539),(2539,2533,2532),(2532,2531,2540),(710,2537,2524),(697,2541,2542),(2540,2531,2543),(2541,2539,2544),(2539,2540,2545),(2546,704,703),(2544,2547,2546),(2544,2545,2548),(2545,2543,2549),(2543,2550,2551),(710,2524,2535),(712,2535,2534),(713,2534,2541),(698,715,2552),(2538,2553,2536),(2554,2555,2529),(2554,2556,2557),(2554,2536,2553),(2556,2558,2559),(2556,2553,2560),(2553,2538,2552),(2546,2561,717),(2561,2552,715),(2547,2562,2561),(2562,2560,2552),(2562,2547,2548),(2549,2562,2548),(2560,2562,2558),(2549,2551,2562),(2558,2562,2551),(2559,2551,2550),(2531,2530,2550),(710,699,2537),(2529,2555,2557),(2563,2564,2565),(2566,2563,2567),(2568,2566,2569),(2570,2571,2572),(2573,2570,2569),(2574,2573,2567),(2563,2566,2575),(2564,2563,2576),(1256,1268,2577),(2573,2574,2578),(2573,2579,2580),(2580,2571,2570),(2564,2577,1267),(2578,1255,1262),(2571,2580,2581),(2579,2578,2582),(2580,2579,2583),(1273,2584,2582),(2585,2583,2582),(2581,2583,2585),(2586,2581,2587),(2588,2586,2589),(2564,1267,1269),(2565,1269,1270),(2574,1270,1255),(1276,1256,2590),(2591,2590,2577),(2592,2575,2566),(2593,2575,2592),(2576,2575,2593),(2594,2593,2595),(2591,2593,2594),(2590,2591,2596),(2597,2584,1273),(2598,2597,1275),(2599,2585,2584),(2596,2599,2597),(2587,2585,2599),(2587,2599,2589),(2594,2599,2596),(2599,2600,2589),(2599,2594,2601),(2600,2601,2595),(2572,2571,2586),(2577,1268,1267),(2568,2572,2588),(2602,2603,2604),(2605,2602,2606),(2607,2605,2608),(2609,2610,2611),(2612,2609,2608),(2613,2612,2606),(2602,2605,2614),(2603,2602,2615),(1810,1822,2616),(2612,2613,2617),(2612,2618,2619),(2619,2610,2609),(2603,2616,1821),(2617,1809,1816),(2610,2619,2620),(2618,2617,2621),(2619,2618,2622),(1827,2623,2621),(2624,2622,2621),(2620,2622,2624),(2625,2620,2626),(2627,2625,2628),(2603,1821,1823),(2604,1823,1824),(2613,1824,1809),(1830,1810,2629),(2630,2629,2616),(2631,2614,2605),(2632,2614,2631),(2615,2614,2632),(2633,2632,2634),(2630,2632,2633),(2629,2630,2635),(2636,2623,1827),(2637,2636,1829),(2638,2624,2623),(2635,2638,2636),(2626,2624,2638),(2626,2638,2628),(2633,2638,2635),(2638,2639,2628),(2638,2633,2640),(2639,2640,2634),(2611,2610,2625),(2616,1822,1821),(2607,2611,2627),(2487,2496,2485),(2489,2487,2486),(2491,2489,2488),(2489,2491,2492),(2487,2489,2493),(2496,2487,2494),(2497,2515,2488),(2498,2497,2486),(2499,2498,113),(2500,2502,2495),(2493,2501,2500),(2503,117,111),(2504,2506,2501),(2505,2503,2502),(2506,2505,2500),(117,2503,2507),(2507,2503,2505),(2509,2508,2505),(2510,2509,2506),(2512,2510,2504),(2496,126,124),(2495,127,126),(2502,111,127),(2513,2499,112),(2497,2498,2499),(2490,2488,2515),(2518,2516,2515),(2514,2517,2515),(2520,2518,2517),(2521,2519,2517),(2513,2521,2514),(131,118,2507),(129,131,2522),(2522,2507,2508),(2513,2522,2523),(2512,2520,2519),(2511,2518,2520),(2511,2504,2492),(2518,2511,2491),(2518,2491,2490),(2526,2535,2524),(2528,2526,2525),(2530,2528,2527),(2528,2530,2531),(2526,2528,2532),(2535,2526,2533),(2536,2554,2527),(2537,2536,2525),(2538,2537,699),(2539,2541,2534),(2532,2540,2539),(2542,703,697),(2543,2545,2540),(2544,2542,2541),(2545,2544,2539),(703,2542,2546),(2546,2542,2544),(2548,2547,2544),(2549,2548,2545),(2551,2549,2543),(2535,712,710),(2534,713,712),(2541,697,713),(2552,2538,698),(2536,2537,2538),(2529,2527,2554),(2557,2555,2554),(2553,2556,2554),(2559,2557,2556),(2560,2558,2556),(2552,2560,2553),(717,704,2546),(715,717,2561),(2561,2546,2547),(2552,2561,2562),(2551,2559,2558),(2550,2557,2559),(2550,2543,2531),(2557,2550,2530),(2557,2530,2529),(2565,2567,2563),(2567,2569,2566),(2569,2572,2568),(2572,2569,2570),(2569,2567,2573),(2567,2565,2574),(2575,2576,2563),(2576,2577,2564),(2577,2590,1256),(2578,2579,2573),(2580,2570,2573),(1262,2582,2578),(2581,2586,2571),(2582,2583,2579),(2583,2581,2580),(2582,1262,1273),(2582,2584,2585),(2585,2587,2581),(2587,2589,2586),(2589,2600,2588),(1269,2565,2564),(1270,2574,2565),(1255,2578,2574),(2590,2598,1276),(2577,2576,2591),(2566,2568,2592),(2592,2595,2593),(2593,2591,2576),(2595,2601,2594),(2594,2596,2591),(2596,2598,2590),(1273,1275,2597),(1275,1276,2598),(2584,2597,2599),(2597,2598,2596),(2601,2600,2599),(2595,2588,2600),(2586,2588,2572),(2588,2595,2592),(2588,2592,2568),(2604,2606,2602),(2606,2608,2605),(2608,2611,2607),(2611,2608,2609),(2608,2606,2612),(2606,2604,2613),(2614,2615,2602),(2615,2616,2603),(2616,2629,1810),(2617,2618,2612),(2619,2609,2612),(1816,2621,2617),(2620,2625,2610),(2621,2622,2618),(2622,2620,2619),(2621,1816,1827),(2621,2623,2624),(2624,2626,2620),(2626,2628,2625),(2628,2639,2627),(1823,2604,2603),(1824,2613,2604),(1809,2617,2613),(2629,2637,1830),(2616,2615,2630),(2605,2607,2631),(2631,2634,2632),(2632,2630,2615),(2634,2640,2633),(2633,2635,2630),(2635,2637,2629),(1827,1829,2636),(1829,1830,2637),(2623,2636,2638),(2636,2637,2635),(2640,2639,2638),(2634,2627,2639),(2625,2627,2611),(2627,2634,2631),(2627,2631,2607),(2641,2642,2643),(777,2644,2641),(777,780,2642),(2642,780,2257),(2642,2257,771),(2643,771,770),(2645,770,1154),(778,2641,2646),(2647,2648,923),(2648,2649,924),(2649,2650,926),(926,2650,2651),(2652,929,932),(2652,932,931),(2653,933,935),(2654,935,915),(2654,915,916),(916,917,2653),(2653,917,2655),(918,2652,2655),(927,2651,2656),(942,941,2656),(942,2656,943),(2651,952,950),(2650,954,952),(962,954,2650),(2647,2073,2648),(2073,962,2649),(918,929,2652),(933,2653,2655),(2656,950,946),(1154,775,2646),(2657,2658,2659),(2657,1901,1900),(1907,1901,2657),(1905,1907,2660),(1905,2660,2661),(1894,2661,2659),(1899,1895,2659),(2662,1900,2250),(2663,2647,922),(2664,2663,2036),(2665,2664,2037),(2665,2039,2259),(2044,2043,2666),(2044,2666,2667),(2046,2668,2669),(2032,2047,2669),(2033,2032,2669),(2034,2033,2669),(2667,2034,2668),(2666,2035,2034),(2670,2259,2053),(2671,2053,2056),(2055,2671,2056),(2066,2670,2671),(2068,2665,2670),(2068,2074,2664),(2663,2073,2647),(2074,2073,2663),(2666,2043,2035),(2668,2046,2045),(2064,2671,2055),(2250,1899,2659),(2643,2645,2646),(2643,2646,2641),(2641,2644,2642),(2641,778,777),(2642,2644,777),(771,2643,2642),(770,2645,2643),(2646,775,778),(923,922,2647),(924,923,2648),(926,924,2649),(2651,927,926),(931,2655,2652),(935,2654,2653),(2653,2654,916),(2655,917,918),(2656,941,927),(950,2656,2651),(952,2651,2650),(2650,2649,962),(2649,2648,2073),(2655,931,933),(946,943,2656),(2646,2645,1154),(2659,2661,2660),(2659,2660,2657),(2657,2662,2658),(1900,2662,2657),(2657,2660,1907),(2661,1894,1905),(2659,1895,1894),(2250,2658,2662),(922,2036,2663),(2036,2037,2664),(2037,2039,2665),(2259,2670,2665),(2667,2045,2044),(2669,2047,2046),(2669,2668,2034),(2034,2667,2666),(2053,2671,2670),(2671,2064,2066),(2670,2066,2068),(2664,2665,2068),(2663,2664,2074),(2045,2667,2668),(2055,2059,2064),(2659,2658,2250),(2258,1029,2672),(1029,1030,2673),(2674,2672,2675),(2672,2673,2676),(2677,2675,2678),(2675,2676,2679),(2680,2678,2681),(2679,2682,2681),(2683,2681,2684),(2682,2685,2684),(1030,1032,2686),(2673,2686,2687),(2676,2687,2688),(2679,2688,2689),(2682,2689,2690),(2685,2690,2691),(2684,2685,2692),(2693,2684,2694),(2692,2691,2695),(2694,2692,2696),(2697,2694,2698),(2696,2695,2699),(2698,2696,2700),(2698,2701,2702),(2703,2702,2701),(2703,2701,2700),(2703,2700,2699),(2686,1032,861),(2687,2686,2704),(2687,2705,2706),(2704,2707,2708),(2704,861,1065),(2705,2708,2709),(2688,2706,2710),(2706,2709,2711),(2689,2710,2712),(2710,2711,2713),(2690,2712,2714),(2712,2713,2715),(2714,2715,2716),(2717,2716,2718),(2691,2714,2717),(2695,2717,2719),(2715,2713,2720),(2721,2722,2716),(2718,2716,2722),(2711,2723,2720),(2711,2709,2724),(2709,2708,2725),(2708,2707,2726),(2726,2707,1065),(2727,2703,2718),(2728,2729,2727),(2730,2728,2722),(2731,2730,2721),(2732,2731,2720),(2733,2732,2723),(2734,2733,2724),(2727,2729,2703),(2734,2725,2726),(2726,1056,1034),(2735,2736,2732),(2736,2737,2731),(2737,2738,2730),(2739,2735,2733),(2739,2734,2740),(2741,2740,1034),(2742,2728,2730),(2742,2743,2729),(2744,1042,2258),(2745,2746,2693),(2746,2747,2683),(2747,2748,2680),(2674,2677,2749),(1042,2744,2741),(2677,2680,2748),(2744,2749,2739),(2749,2748,2735),(2748,2747,2736),(2747,2746,2737),(2750,2751,2745),(2752,2751,2750),(2752,2702,2703),(2745,2738,2737),(2751,2742,2738),(2742,2751,2752),(2743,2752,2703),(2729,2743,2703),(2699,2719,2703),(2719,2718,2703),(2130,2128,2753),(2131,2130,2754),(2754,2753,2755),(2756,2754,2757),(2757,2755,2758),(2759,2757,2760),(2760,2758,2761),(2762,2763,2760),(2764,2761,2765),(2766,2762,2764),(2132,2131,2756),(2767,2756,2759),(2768,2759,2763),(2769,2763,2762),(2770,2762,2766),(2771,2766,2772),(2766,2773,2774),(2773,2765,2775),(2776,2772,2777),(2772,2774,2778),(2774,2775,2779),(2780,2777,2781),(2777,2778,2782),(2782,2778,2779),(2782,2783,2784),(2781,2782,2784),(2785,2781,2784),(2132,2767,2786),(2767,2768,2787),(2787,2768,2769),(2788,2786,2787),(1984,2786,2788),(2789,2787,2790),(2790,2769,2770),(2791,2790,2792),(2792,2770,2771),(2793,2792,2794),(2794,2771,2776),(2795,2794,2796),(2797,2796,2798),(2799,2798,2800),(2796,2776,2780),(2798,2780,2785),(2795,2797,2801),(2802,2801,2797),(2799,2803,2804),(2805,2793,2795),(2791,2793,2805),(2789,2791,2806),(2788,2789,2807),(2788,2808,2153),(2803,2784,2804),(2809,2810,2802),(2810,2811,2801),(2811,2812,2813),(2812,2814,2805),(2814,2815,2806),(2815,2816,2807),(2784,2809,2804),(2807,2816,2817),(2153,2808,2817),(2818,2819,2815),(2820,2818,2814),(2821,2820,2812),(2819,2822,2816),(2816,2822,2823),(2817,2823,2134),(2810,2824,2821),(2825,2824,2810),(2141,2826,2753),(2827,2828,2775),(2829,2827,2765),(2830,2829,2761),(2755,2753,2826),(2826,2141,2134),(2758,2755,2831),(2831,2826,2823),(2830,2831,2822),(2829,2830,2819),(2827,2829,2818),(2832,2779,2775),(2832,2833,2783),(2784,2783,2833),(2821,2828,2827),(2824,2832,2828),(2832,2824,2825),(2784,2833,2825),(2784,2825,2809),(2784,2800,2785),(2784,2803,2800),(2672,2674,2258),(2673,2672,1029),(2675,2677,2674),(2676,2675,2672),(2678,2680,2677),(2679,2678,2675),(2681,2683,2680),(2681,2678,2679),(2684,2693,2683),(2684,2681,2682),(2686,2673,1030),(2687,2676,2673),(2688,2679,2676),(2689,2682,2679),(2690,2685,2682),(2691,2692,2685),(2692,2694,2684),(2694,2697,2693),(2695,2696,2692),(2696,2698,2694),(2698,2750,2697),(2699,2700,2696),(2700,2701,2698),(2702,2750,2698),(861,2704,2686),(2704,2705,2687),(2706,2688,2687),(2708,2705,2704),(1065,2707,2704),(2709,2706,2705),(2710,2689,2688),(2711,2710,2706),(2712,2690,2689),(2713,2712,2710),(2714,2691,2690),(2715,2714,2712),(2716,2717,2714),(2718,2719,2717),(2717,2695,2691),(2719,2699,2695),(2720,2721,2715),(2716,2715,2721),(2722,2727,2718),(2720,2713,2711),(2724,2723,2711),(2725,2724,2709),(2726,2725,2708),(1065,1056,2726),(2727,2722,2728),(2722,2721,2730),(2721,2720,2731),(2720,2723,2732),(2723,2724,2733),(2724,2725,2734),(2726,2740,2734),(1034,2740,2726),(2732,2733,2735),(2731,2732,2736),(2730,2731,2737),(2733,2734,2739),(2740,2741,2739),(1034,1033,2741),(2730,2738,2742),(2729,2728,2742),(2258,2674,2744),(2693,2697,2745),(2683,2693,2746),(2680,2683,2747),(2749,2744,2674),(2741,1033,1042),(2748,2749,2677),(2739,2741,2744),(2735,2739,2749),(2736,2735,2748),(2737,2736,2747),(2745,2697,2750),(2750,2702,2752),(2737,2746,2745),(2738,2745,2751),(2752,2743,2742),(2753,2754,2130),(2754,2756,2131),(2755,2757,2754),(2757,2759,2756),(2758,2760,2757),(2760,2763,2759),(2761,2764,2760),(2760,2764,2762),(2765,2773,2764),(2764,2773,2766),(2756,2767,2132),(2759,2768,2767),(2763,2769,2768),(2762,2770,2769),(2766,2771,2770),(2772,2776,2771),(2774,2772,2766),(2775,2774,2773),(2777,2780,2776),(2778,2777,2772),(2779,2778,2774),(2781,2785,2780),(2782,2781,2777),(2779,2783,2782),(2786,1984,2132),(2787,2786,2767),(2769,2790,2787),(2787,2789,2788),(2788,2163,1984),(2790,2791,2789),(2770,2792,2790),(2792,2793,2791),(2771,2794,2792),(2794,2795,2793),(2776,2796,2794),(2796,2797,2795),(2798,2799,2797),(2800,2803,2799),(2780,2798,2796),(2785,2800,2798),(2801,2813,2795),(2797,2799,2802),(2804,2802,2799),(2795,2813,2805),(2805,2806,2791),(2806,2807,2789),(2807,2808,2788),(2153,2163,2788),(2802,2804,2809),(2801,2802,2810),(2813,2801,2811),(2805,2813,2812),(2806,2805,2814),(2807,2806,2815),(2817,2808,2807),(2817,2133,2153),(2815,2814,2818),(2814,2812,2820),(2812,2811,2821),(2816,2815,2819),(2823,2817,2816),(2134,2133,2817),(2821,2811,2810),(2810,2809,2825),(2753,2128,2141),(2775,2765,2827),(2765,2761,2829),(2761,2758,2830),(2826,2831,2755),(2134,2823,2826),(2831,2830,2758),(2823,2822,2831),(2822,2819,2830),(2819,2818,2829),(2818,2820,2827),(2775,2828,2832),(2783,2779,2832),(2827,2820,2821),(2828,2821,2824),(2825,2833,2832),(2483,2834,2835),(2483,2835,2484),(2484,2835,2482),(2482,2835,2836),(2482,2836,2837),(2837,2836,2838),(2837,2838,2839),(2839,2838,2840),(2839,2840,2841),(2841,2840,2842),(2842,2840,2843),(2842,2843,2844),(2834,2845,2835),(2845,2846,2835),(2835,2846,2836),(2846,2847,2836),(2847,2848,2836),(2836,2848,2838),(2848,2849,2838),(2838,2849,2840),(2849,2850,2840),(2840,2850,2843),(2850,2851,2843),(2845,2852,2853),(2845,2853,2846),(2846,2853,2854),(2846,2854,2847),(2847,2854,2855),(2847,2855,2848),(2848,2855,2856),(2848,2856,2849),(2849,2856,2857),(2849,2857,2850),(2850,2857,2858),(2850,2858,2851),(2852,2859,2860),(2852,2860,2853),(2853,2860,2861),(2853,2861,2854),(2854,2861,2855),(2855,2861,2862),(2855,2862,2856),(2856,2862,2863),(2856,2863,2857),(2857,2863,2864),(2857,2864,2858),(2859,2865,2866),(2859,2866,2860),(2860,2866,2867),(2860,2867,2861),(2861,2867,2868),(2861,2868,2862),(2862,2868,2869),(2862,2869,2863),(2863,2869,2870),(2863,2870,2864),(2865,2871,2872),(2865,2872,2866),(2866,2872,2873),(2866,2873,2867),(2867,2873,2874),(2867,2874,2868),(2868,2874,2875),(2868,2875,2869),(2869,2875,2876),(2869,2876,2870),(2871,2877,2878),(2871,2878,2872),(2872,2878,2879),(2872,2879,2873),(2873,2879,2880),(2873,2880,2874),(2874,2880,2881),(2874,2881,2875),(2875,2881,2882),(2875,2882,2876),(2877,2883,2884),(2877,2884,2878),(2878,2884,2885),(2878,2885,2879),(2879,2885,2886),(2879,2886,2880),(2880,2886,2887),(2880,2887,2881),(2881,2887,2888),(2881,2888,2882),(2883,2889,2890),(2883,2890,2884),(2884,2890,2891),(2884,2891,2885),(2885,2891,2892),(2885,2892,2886),(2886,2892,2893),(2886,2893,2887),(2887,2893,2894),(2887,2894,2888),(2889,2895,2890),(2895,2896,2890),(2890,2896,2891),(2896,2897,2891),(2897,2898,2891),(2891,2898,2892),(2898,2899,2892),(2892,2899,2893),(2899,2900,2893),(2893,2900,2894),(2900,2901,2894),(1867,2834,2483),(1852,2871,2865),(1852,2865,2859),(1852,2859,2852),(1860,1852,2852),(1860,2852,2845),(1867,2845,2834),(1843,1893,2871),(1885,2895,2889),(1887,1885,2889),(1889,1887,2889),(1889,2889,2883),(1889,2883,2877),(1891,1889,2877),(1893,2877,2871),(2895,1883,1881),(2895,1885,1883),(1874,2483,2902),(2902,2895,1881),(2483,2482,2837),(2897,2896,2841),(2902,2483,2837),(2902,2837,2839),(2902,2839,2841),(2895,2902,2841),(2896,2895,2841),(2899,2843,2900),(2899,2898,2897),(2897,2841,2842),(2897,2842,2844),(2897,2844,2843),(2899,2897,2843),(2843,2851,2900),(2851,2858,2900),(2870,2882,2864),(2901,2900,2858),(2901,2858,2864),(2894,2901,2864),(2888,2894,2864),(2882,2888,2864),(2870,2876,2882),(1867,1860,2845),(1852,1843,2871),(1893,1891,2877),(2902,1881,1874),(2483,1874,1867)])
+        self.load(os.path.join(os.path.dirname(__file__),'cow.mesh'),mapped=True)
         self.translate(-0.000000,0.319838,-0.000000).scale(95.749489,95.749489,95.749489).xyMirror()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# Project Ambrosia (c) 2013-19 duane a. bailey
+"""Compare the rendering of examples with and without CSG bounds.
+
+Each example is run twice, in a fresh interpreter, with
+environment.boundCSG off and on; every shot it takes is written to one
+.pov file (films are skipped).  The number of bounded intersections and
+differences is reported and, if povray can be found, the time it takes
+to render each file.  By default, the examples built from heavily nested
+differences are used.
+    python3 benchmarks/csg_bounds.py [--size WxH] [example...]
+"""
+import os
+import random
+import runpy
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from ambrosia import *
+from ambrosia.cameras import Camera
+
+examples = os.path.join(os.path.dirname(os.path.abspath(__file__)),"..","ambrosia","examples")
+
+def run(example,filename,bound):
+    """Run example, writing the POV of each of its shots to filename."""
+    environment.boundCSG(bound)
+    out = open(filename,"wt")
+    def shoot(camera,subject=None,*args):
+        if subject is not None:
+            camera.subject(subject)
+        pov.open(filename+".tmp")
+        camera._POV_proof(*args)
+        pov.close()
+        with open(filename+".tmp") as f:
+            out.write(f.read())
+    Camera.shoot = shoot
+    Camera.film = lambda *args,**kwargs: None
+    Camera.buildMovie = lambda camera: None
+    random.seed(0)
+    sys.path.insert(0,examples)
+    os.chdir(examples)
+    try:
+        runpy.run_path(example+".py",run_name="__main__")
+    finally:
+        out.close()
+        if os.path.exists(filename+".tmp"):
+            os.remove(filename+".tmp")
+
+def write(example,filename,bound):
+    """Write example's POV to filename (in a new process); return the number of bounds."""
+    subprocess.run([sys.executable,__file__,"--run",example,filename,str(int(bound))],
+                   stdout=subprocess.DEVNULL)
+    with open(filename) as f:
+        return f.read().count("bounded_by")
+
+def renderTime(filename,size):
+    """Time povray rendering filename (every shot in it) at size."""
+    (w,h) = size.split("x")
+    start = time.perf_counter()
+    subprocess.run(["povray","+I"+filename,"+W"+w,"+H"+h,"-D","-V","-GA","-F"],
+                   stdout=subprocess.DEVNULL,stderr=subprocess.DEVNULL)
+    return time.perf_counter()-start
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--run"]:
+        run(sys.argv[2],os.path.abspath(sys.argv[3]),bool(int(sys.argv[4])))
+        sys.exit(0)
+    args = sys.argv[1:]
+    size = "320x240"
+    if args[:1] == ["--size"]:
+        size = args[1]
+        args = args[2:]
+    names = args or ["stone_work","penknife","hex_wrench"]
+    povray = shutil.which("povray")
+    work = tempfile.mkdtemp()
+    print("{:>16} {:>8}{}".format("example","bounds",
+                                  "   render (s): plain bounded" if povray else ""))
+    for name in names:
+        times = []
+        for bound in (False,True):
+            filename = os.path.join(work,"{}-{}.pov".format(name,int(bound)))
+            count = write(name,filename,bound)
+            if povray:
+                times.append(renderTime(filename,size))
+        render = "{:19.2f} {:7.2f}".format(*times) if povray else ""
+        print("{:>16} {:>8}{}".format(name,count,render))
+    shutil.rmtree(work)
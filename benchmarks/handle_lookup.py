@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+# Project Ambrosia (c) 2013-19 duane a. bailey
+"""Time handle lookups made while a model is being built.
+
+A model holds a growing group of parts and, after it, a stand with a
+'mount' handle.  Each of n parts is placed relative to the mount, looked
+up (with getHandle and with getHandles) on the whole model; the model
+is changed by every placement.
+    python3 benchmarks/handle_lookup.py [n...]
+"""
+import sys
+import time
+from ambrosia import *
+
+def build(n,lookup):
+    """Place n parts relative to the model's mount, found by lookup."""
+    parts = Group().name("parts")
+    stand = Group().name("stand")
+    stand.add(Cube().name("base").handle('mount',(0,50,0)),translate(0,-50,0))
+    model = Group().name("model").add(parts).add(stand,yRot(15))
+    for i in range(n):
+        (x,y,z) = lookup(model)
+        parts.add(Sphere(),translate(x+i,y,z))
+    return model
+
+if __name__ == "__main__":
+    counts = [int(a) for a in sys.argv[1:]] or [1000,2000,4000,8000]
+    print("{:>8} {:>14} {:>14}".format("n","getHandle (s)","getHandles (s)"))
+    for n in counts:
+        times = []
+        for lookup in (lambda m: m.getHandle('mount'),lambda m: m.getHandles('mount')[0][1]):
+            start = time.perf_counter()
+            build(n,lookup)
+            times.append(time.perf_counter()-start)
+        print("{:>8} {:14.3f} {:14.3f}".format(n,*times))
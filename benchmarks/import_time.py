@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+# Project Ambrosia (c) 2013-19 duane a. bailey
+"""Time `import ambrosia` in fresh interpreters, against a budget.
+
+Each run starts a new interpreter, as a batch worker would; the time of
+an interpreter that imports nothing is subtracted.  The import should
+not run the tools (povray, ffmpeg, ...) or start any threads: the
+modules that do so are checked to be left unimported.
+    python3 benchmarks/import_time.py [runs] [budget (ms)]
+"""
+import statistics
+import subprocess
+import sys
+import time
+
+# modules that `import ambrosia` should leave to be imported when needed
+_lazy = ('ambrosia.archives', 'ambrosia.scripting', 'concurrent.futures', 'pickle')
+
+def launch(code):
+    """Run code in a fresh interpreter; return (seconds,output)."""
+    start = time.perf_counter()
+    out = subprocess.run([sys.executable,"-c",code],stdout=subprocess.PIPE,
+                         check=True,universal_newlines=True).stdout
+    return (time.perf_counter()-start,out)
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    budget = float(sys.argv[2]) if len(sys.argv) > 2 else 40
+    launch("import ambrosia") # compile, and warm the file cache
+    bare = [launch("pass")[0] for i in range(runs)]
+    full = [launch("import ambrosia")[0] for i in range(runs)]
+    (best,median) = [1000*(f(full)-f(bare)) for f in (min,statistics.median)]
+    print("import ambrosia: best {:.1f}ms, median {:.1f}ms (budget {:.0f}ms)".format(best,median,budget))
+    (_,out) = launch("import sys, ambrosia; print(*[m for m in {!r} if m in sys.modules])".format(_lazy))
+    assert not out.split(), "imported eagerly: {}".format(out.strip())
+    assert median <= budget, "import ambrosia is over budget"
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+# Project Ambrosia (c) 2013-19 duane a. bailey
+"""Time the construction of triangle meshes with shared vertices.
+
+A square grid of n x n cells is added to a Mesh, two triangles per cell,
+so every interior vertex is registered six times.
+    python3 benchmarks/mesh_build.py [triangles...]
+"""
+import sys
+import time
+from ambrosia import *
+
+def grid(triangles):
+    """Build a mesh of (approximately) the requested number of triangles."""
+    n = max(1,int((triangles/2)**0.5))
+    m = Mesh()
+    for i in range(n):
+        for j in range(n):
+            a,b = (i,j,0),(i+1,j,0)
+            c,d = (i+1,j+1,0),(i,j+1,0)
+            m.addTri([a,b,c]).addTri([a,c,d])
+    return m
+
+if __name__ == "__main__":
+    sizes = [int(a) for a in sys.argv[1:]] or [1000,10000,100000]
+    for size in sizes:
+        start = time.perf_counter()
+        m = grid(size)
+        elapsed = time.perf_counter()-start
+        print("{:>8} triangles {:>8} vertices {:8.3f}s".format(
+            len(m.get('mesh.triangles')),len(m.get('mesh.vertices')),elapsed))
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# Project Ambrosia (c) 2013-19 duane a. bailey
+"""Time the smoothing of swept meshes, and compare a coarse smoothed torus
+with the finer flat ones that look as round.
+
+The normals of sweeps of several sizes are computed with and without a
+crease angle; the error of each normal (the angle it makes with the true
+normal of the torus) is reported with the time taken.  Then a coarse
+smoothed torus and a fine flat one are written, as a shot would be, and
+a large smoothed torus is written several times.
+    python3 benchmarks/mesh_normals.py [n...]
+"""
+import math
+import os
+import sys
+import tempfile
+import time
+import numpy
+from ambrosia import *
+from ambrosia.cameras import Camera
+from ambrosia.meshes import sweep
+
+def torus(n):
+    """A torus swept from an n-gon in n steps."""
+    profile = [(10+3*math.cos(a),3*math.sin(a),0) for a in [2*i*math.pi/n for i in range(n)]]
+    return sweep(profile,n)
+
+def error(mesh,normals,indices):
+    """The greatest angle (in degrees) between a normal and the torus's
+    (either way: normals face the way the triangles are wound)."""
+    v = numpy.array(list(mesh.get('mesh.vertices')))[numpy.array(mesh.get('mesh.triangles'))]
+    ring = numpy.hypot(v[...,0],v[...,2])[...,None]
+    truth = (v-10*v*[1,0,1]/ring)/3
+    return math.degrees(numpy.arccos(numpy.clip(abs((normals[indices]*truth).sum(axis=2)),0,1)).max())
+
+def write(mesh,filename):
+    """Write a shot of mesh; return the time taken."""
+    camera = Camera().subject(Group().add(mesh).add(Light().pos((0,100,-100)))).pos((0,30,-60))
+    start = time.perf_counter()
+    pov.open(filename)
+    camera._POV_proof()
+    pov.close()
+    return time.perf_counter()-start
+
+if __name__ == "__main__":
+    sizes = [int(a) for a in sys.argv[1:]] or [16,64,256]
+    print("{:>6} {:>10} {:>12} {:>12} {:>10}".format("n","triangles","crease","time (s)","error (deg)"))
+    for n in sizes:
+        mesh = torus(n)
+        for crease in (180,60):
+            start = time.perf_counter()
+            (normals,indices) = mesh.vertexNormals(crease)
+            elapsed = time.perf_counter()-start
+            print("{:>6} {:>10} {:>12} {:12.3f} {:10.3f}".format(n,len(indices),crease,elapsed,error(mesh,normals,indices)))
+    with tempfile.TemporaryDirectory() as work:
+        filename = os.path.join(work,"shot.pov")
+        for (n,smooth) in [(24,True),(24,None),(96,None)]:
+            mesh = torus(n).smooth(smooth)
+            elapsed = write(mesh,filename)
+            print("torus {:>3}, {:>6}: {:6} triangles, {:9} bytes, {:.3f}s".format(
+                n,"smooth" if smooth else "flat",len(mesh.get('mesh.triangles')),os.path.getsize(filename),elapsed))
+        # the normals are kept from shot to shot
+        mesh = torus(sizes[-1]).smooth(60)
+        times = [write(mesh,filename) for i in range(3)]
+        print("torus {:>3}, crease 60: shots {}".format(sizes[-1],", ".join(["{:.3f}s".format(t) for t in times])))
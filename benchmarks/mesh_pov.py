@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# Project Ambrosia (c) 2013-19 duane a. bailey
+"""Time the POV emission of the zoo meshes.
+
+Each model is written twice: once element-by-element, the way Mesh._POV_
+used to write its vertex and index lists, and once with the bulk
+serializer.  The two files must be identical.
+    python3 benchmarks/mesh_pov.py [model...]
+"""
+import filecmp
+import importlib
+import os
+import sys
+import tempfile
+import time
+from ambrosia import *
+
+def elementwise(mesh):
+    """Write a mesh one point at a time (the reference output)."""
+    prt('mesh2 {\n')
+    for (name,key) in [('vertex_vectors','mesh.vertices'),('uv_vectors','mesh.uvvertices'),
+                       ('face_indices','mesh.triangles'),('uv_indices','mesh.uvtriangles')]:
+        l = mesh.get(key)
+        if len(l) > 0 or key == 'mesh.vertices' or key == 'mesh.triangles':
+            prt('{} {{ {}'.format(name,len(l)))
+            for p in l:
+                prt(',')
+                pov.writePoint(p)
+            prt('}\n')
+    prt('inside_vector <0,0,1>\n')
+    POV(super(Mesh,mesh),Context())
+    prt('}\n')
+
+def timed(f,filename):
+    """Return the time taken by f to write filename."""
+    start = time.perf_counter()
+    pov.open(filename)
+    f()
+    pov.close()
+    return time.perf_counter()-start
+
+if __name__ == "__main__":
+    models = sys.argv[1:] or ['cow','hand','bunny','dragon','buddha','horse']
+    folder = tempfile.mkdtemp()
+    for model in models:
+        module = importlib.import_module('ambrosia.zoo.'+model)
+        mesh = getattr(module,model.capitalize())()
+        old = os.path.join(folder,model+'-old.pov')
+        new = os.path.join(folder,model+'-new.pov')
+        told = timed(lambda: elementwise(mesh),old)
+        tnew = timed(lambda: POV(mesh),new)
+        same = filecmp.cmp(old,new,shallow=False)
+        print("{:>8}: {:9d} bytes, elementwise {:6.3f}s, bulk {:6.3f}s, {}".format(
+            model,os.path.getsize(new),told,tnew,"identical" if same else "DIFFERENT"))
+        os.unlink(old)
+        os.unlink(new)
+    os.rmdir(folder)
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+# Project Ambrosia (c) 2013-19 duane a. bailey
+"""Measure the memory used by common scene objects.
+
+Builds many Spheres, References, and Groups (and a small procedural
+scene of translated spheres, as in examples/snowstorm.py) and reports the
+number of bytes allocated per object.
+    python3 benchmarks/object_memory.py [count]
+"""
+import sys
+import tracemalloc
+from ambrosia import *
+
+def perObject(make,n):
+    """Return the bytes allocated per object by n calls to make."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [make(i) for i in range(n)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after-before)/n
+
+def flake(i):
+    """A translated sphere, added to a group (as in a snowstorm)."""
+    g = Group()
+    g.add(Sphere().radius(2),translate(i%100,i//100,0))
+    return g
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    sphere = Sphere()
+    for (name,make) in [("Sphere",lambda i: Sphere()),
+                        ("Reference",lambda i: Reference(sphere)),
+                        ("Group",lambda i: Group()),
+                        ("snowflake",flake)]:
+        print("{:>10} {:8.0f} bytes".format(name,perObject(make,n)))
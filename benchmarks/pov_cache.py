@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# Project Ambrosia (c) 2013-19 duane a. bailey
+"""Time the writing of a series of shots, with and without a POVCache.
+
+The scene is a grid of swept meshes, each with its own material, lit by
+one light.  A camera takes several shots as it moves, and then several
+as the light moves; every shot is written (not rendered) with caching
+off and on, and the two files are checked to be identical.  The cache's
+statistics are reported at the end.
+    python3 benchmarks/pov_cache.py [grid] [shots]
+"""
+import math
+import os
+import sys
+import tempfile
+import time
+from ambrosia import *
+from ambrosia.cameras import Camera
+from ambrosia.meshes import sweep
+
+def build(n):
+    """A scene of n*n meshes and a light; return (scene,light)."""
+    scene = Group()
+    profile = [(10+3*math.cos(a),3*math.sin(a),0) for a in [i*math.pi/8 for i in range(16)]]
+    for i in range(n):
+        for j in range(n):
+            ring = sweep(profile,24+(i+j)%8)
+            scene.add(ring,translate(30*i,0,30*j),Material().color(blend((i*n+j)/(n*n),red,blue)))
+    light = Light().pos((0,500,-500))
+    scene.add(light)
+    return (scene,light)
+
+def shoot(camera,filename):
+    """Write camera's shot to filename; return the time taken."""
+    start = time.perf_counter()
+    pov.open(filename)
+    camera._POV_proof()
+    pov.close()
+    return time.perf_counter()-start
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    shots = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    (scene,light) = build(n)
+    camera = Camera().subject(scene).COI((15*n,0,15*n))
+    cache = POVCache()
+    work = tempfile.mkdtemp()
+    plainFile = os.path.join(work,"plain.pov")
+    cachedFile = os.path.join(work,"cached.pov")
+    print("{:>14} {:>10} {:>10}".format("shot","plain (s)","cached (s)"))
+    totals = [0,0]
+    for (what,k) in [("camera",i) for i in range(shots)]+[("light",i) for i in range(shots)]:
+        if what == "camera":
+            camera.pos(yRot(10*k).mapPoint((15*n,300,-30*n)))
+        else:
+            light.pos((100*k,500,-500))
+        environment.set('environment.povCache',None)
+        plain = shoot(camera,plainFile)
+        environment.set('environment.povCache',cache)
+        cached = shoot(camera,cachedFile)
+        with open(plainFile) as f, open(cachedFile) as g:
+            assert f.read() == g.read(), "cached shot differs"
+        totals = [totals[0]+plain,totals[1]+cached]
+        print("{:>14} {:10.3f} {:10.3f}".format("{} {}".format(what,k),plain,cached))
+    print("{:>14} {:10.3f} {:10.3f}".format("total",*totals))
+    print("fragments copied {}, written {}; {} characters held".format(*cache.getStats(),cache.getSize()))
+    os.remove(plainFile)
+    os.remove(cachedFile)
+    os.rmdir(work)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# Project Ambrosia (c) 2013-19 duane a. bailey
+"""Compare the POV files written with and without #declares.
+
+Each bundled example is run twice, in a fresh interpreter, with
+environment.declareShared off and on; every shot it takes is written to
+one .pov file (nothing is rendered, and films are skipped).  The sizes
+of the two files are reported and, if povray can be found, the time it
+takes to parse each of them.
+    python3 benchmarks/pov_declarations.py [example...]
+"""
+import os
+import random
+import runpy
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from ambrosia import *
+from ambrosia.cameras import Camera
+
+examples = os.path.join(os.path.dirname(os.path.abspath(__file__)),"..","ambrosia","examples")
+
+def run(example,filename,declare):
+    """Run example, writing the POV of each of its shots to filename."""
+    environment.declareShared(declare)
+    out = open(filename,"wt")
+    def shoot(camera,subject=None,*args):
+        if subject is not None:
+            camera.subject(subject)
+        pov.open(filename+".tmp")
+        camera._POV_proof(*args)
+        pov.close()
+        with open(filename+".tmp") as f:
+            out.write(f.read())
+    Camera.shoot = shoot
+    Camera.film = lambda *args,**kwargs: None
+    Camera.buildMovie = lambda camera: None
+    random.seed(0)
+    sys.path.insert(0,examples)
+    os.chdir(examples)
+    try:
+        runpy.run_path(example+".py",run_name="__main__")
+    finally:
+        out.close()
+        if os.path.exists(filename+".tmp"):
+            os.remove(filename+".tmp")
+
+def write(example,filename,declare):
+    """Write example's POV to filename (in a new process); return its size."""
+    subprocess.run([sys.executable,__file__,"--run",example,filename,str(int(declare))],
+                   stdout=subprocess.DEVNULL)
+    return os.path.getsize(filename)
+
+def parseTime(filename):
+    """Time povray parsing (and rendering a single pixel of) filename."""
+    start = time.perf_counter()
+    subprocess.run(["povray","+I"+filename,"+W1","+H1","-D","-V","-GA","-F"],
+                   stdout=subprocess.DEVNULL,stderr=subprocess.DEVNULL)
+    return time.perf_counter()-start
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--run"]:
+        run(sys.argv[2],os.path.abspath(sys.argv[3]),bool(int(sys.argv[4])))
+        sys.exit(0)
+    names = sys.argv[1:] or sorted([f[:-3] for f in os.listdir(examples)
+                                    if f.endswith(".py") and f != "utils.py"])
+    povray = shutil.which("povray")
+    work = tempfile.mkdtemp()
+    totals = [0,0]
+    print("{:>16} {:>10} {:>10}{}".format("example","inline","declared",
+                                          "   parse (s)" if povray else ""))
+    for name in names:
+        sizes = []
+        times = []
+        for declare in (False,True):
+            filename = os.path.join(work,"{}-{}.pov".format(name,int(declare)))
+            sizes.append(write(name,filename,declare))
+            if povray:
+                times.append(parseTime(filename))
+        totals = [t+s for (t,s) in zip(totals,sizes)]
+        parse = " {:6.2f} {:6.2f}".format(*times) if povray else ""
+        print("{:>16} {:>10} {:>10}{}".format(name,sizes[0],sizes[1],parse))
+    print("{:>16} {:>10} {:>10}".format("total",*totals))
+    shutil.rmtree(work)
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# Project Ambrosia (c) 2013-19 duane a. bailey
+"""Time the writing of a shot with and without a POVProfile, and report
+the profile.
+
+The scene is the grid of swept meshes and groups of parts used by
+scene_archive.py; each of its rows is named.  The shot is written several
+times without profiling and then with it, and the best times are
+compared.
+    python3 benchmarks/pov_profile.py [n] [shots]
+"""
+import os
+import sys
+import tempfile
+import time
+from ambrosia import *
+from ambrosia.cameras import Camera
+from scene_archive import build
+
+def shoot(camera,filename):
+    """Write camera's shot to filename; return the time taken."""
+    start = time.perf_counter()
+    pov.open(filename)
+    camera._POV_proof()
+    pov.close()
+    return time.perf_counter()-start
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    shots = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    refs = build(n).getReferences()
+    scene = Group()
+    for i in range(n):
+        row = Group().name("row {}".format(i))
+        for r in refs[2*n*i:2*n*(i+1)]:
+            row.add(r)
+        scene.add(row)
+    for r in refs[2*n*n:]:
+        scene.add(r)
+    camera = Camera().subject(scene).pos((0,300,-1000))
+    filename = os.path.join(tempfile.mkdtemp(),"shot.pov")
+    plain = min([shoot(camera,filename) for i in range(shots)])
+    environment.povProfile()
+    profiled = min([shoot(camera,filename) for i in range(shots)])
+    print("plain {:.3f}s, profiled {:.3f}s".format(plain,profiled))
+    environment.getPOVProfile().report(limit=10)
+    os.remove(filename)
+    os.rmdir(os.path.dirname(filename))
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# Project Ambrosia (c) 2013-19 duane a. bailey
+"""Compare building a scene with loading it from a scene file.
+
+The scene is a grid of swept meshes and of groups of parts, built n x n
+times, each with its own material.  It is built, saved with saveScene,
+and then loaded (with loadScene) in a fresh interpreter, as a render
+worker would.  The POV written for the loaded scene is checked against
+that of the built scene (numbers are compared as numbers: mesh vertices
+are saved as doubles).
+    python3 benchmarks/scene_archive.py [n]
+"""
+import math
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from ambrosia import *
+from ambrosia.cameras import Camera
+from ambrosia.meshes import sweep
+
+def build(n):
+    """A scene of n*n meshes and n*n groups of parts, with a light."""
+    scene = Group()
+    profile = [(10+3*math.cos(a),3*math.sin(a),0) for a in [i*math.pi/8 for i in range(16)]]
+    post = Group().add(Cylinder(),scale(0.1,1,0.1)).add(Sphere(),scale(0.2),translate(0,50,0))
+    for i in range(n):
+        for j in range(n):
+            m = Material().color(blend((i*n+j)/(n*n),red,blue))
+            scene.add(sweep(profile,24+(i+j)%8),translate(30*i,0,30*j),m)
+            posts = Group()
+            for k in range(8):
+                posts.add(post,translate(12,0,0),yRot(45*k))
+            scene.add(posts,translate(30*i,0,30*j),m)
+    scene.add(Light().pos((0,500,-500)))
+    return scene
+
+def write(scene,filename):
+    """Write the POV of a shot of scene to filename."""
+    camera = Camera().subject(scene).pos((0,300,-1000))
+    pov.open(filename)
+    camera._POV_proof()
+    pov.close()
+
+_number = re.compile(r'-?\d+\.?\d*(?:e[-+]?\d+)?')
+
+def same(a,b):
+    """Are POV files a and b the same, comparing numbers as numbers?"""
+    with open(a) as f, open(b) as g:
+        (s,t) = (f.read(),g.read())
+    return (_number.split(s) == _number.split(t) and
+            [float(x) for x in _number.findall(s)] == [float(x) for x in _number.findall(t)])
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--load"]:
+        start = time.perf_counter()
+        scene = loadScene(sys.argv[2])
+        print(time.perf_counter()-start)
+        write(scene,sys.argv[3])
+        sys.exit(0)
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    work = tempfile.mkdtemp()
+    sceneFile = os.path.join(work,"scene.amb")
+    (built,loaded) = (os.path.join(work,"built.pov"),os.path.join(work,"loaded.pov"))
+    start = time.perf_counter()
+    scene = build(n)
+    print("build {:10.3f}s".format(time.perf_counter()-start))
+    start = time.perf_counter()
+    saveScene(scene,sceneFile)
+    print("save  {:10.3f}s {:>12} bytes".format(time.perf_counter()-start,os.path.getsize(sceneFile)))
+    out = subprocess.run([sys.executable,__file__,"--load",sceneFile,loaded],
+                         stdout=subprocess.PIPE,check=True,universal_newlines=True).stdout
+    print("load  {:10.3f}s (in a new process)".format(float(out)))
+    write(scene,built)
+    assert same(built,loaded), "loaded scene differs"
+    for filename in (sceneFile,built,loaded):
+        os.remove(filename)
+    os.rmdir(work)
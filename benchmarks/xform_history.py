@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# Project Ambrosia (c) 2013-19 duane a. bailey
+"""Measure the cost of recording transform histories.
+
+Builds a chess-sized scene (a board of 64 squares and 32 multi-level
+pieces), moves the pieces incrementally over many frames, and emits it to
+POV, with transform histories unlimited, capped, and turned off.
+    python3 benchmarks/xform_history.py
+"""
+import os
+import time
+import tracemalloc
+from ambrosia import *
+
+def piece(levels):
+    """Build a piece as a stack of transformed, nested groups."""
+    g = Group()
+    for i in range(levels):
+        g = Group().add(g,yRot(15)*translate(0,10,0)*scale(0.95))
+        g.add(Cylinder(),scale(0.2,0.05,0.2)*translate(0,5*i,0))
+        g.add(Sphere(),scale(0.1)*xRot(i)*zRot(i)*translate(0,5*i+3,0))
+    return g
+
+def chess(frames):
+    """Build a board and pieces, as in examples/chess.py, and animate it."""
+    board = Group()
+    for r in range(8):
+        for c in range(8):
+            board.add(Cube(),scale(0.5,0.1,0.5)*translate(50*c,0,50*r))
+    pieces = [piece(8) for i in range(32)]
+    for (i,p) in enumerate(pieces):
+        board.add(p,translate(50*(i%8),10,50*(i//8 if i < 16 else i//8+4)))
+    for f in range(frames):
+        for p in pieces:
+            p.yRot(1).translate(0.1,0,0.1)
+    return board
+
+def measure(limit):
+    """Return seconds and peak bytes to build and emit the scene."""
+    environment.historyLimit(limit)
+    tracemalloc.start()
+    start = time.perf_counter()
+    scene = chess(500)
+    pov.open(os.devnull)
+    POV(scene)
+    pov.close()
+    elapsed = time.perf_counter()-start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed,peak
+
+if __name__ == "__main__":
+    for limit in [None,4,0]:
+        elapsed,peak = measure(limit)
+        print("historyLimit {!s:>4}: {:7.3f}s {:8.1f}KB peak".format(limit,elapsed,peak/1024))
@@ -60,6 +60,7 @@ setup(
     # installed, specify them here.
     package_data={
         'structure': ['Makefile',],
+        'ambrosia/zoo': ['*.mesh',],
     },
 
     # Although 'package_data' is the preferred approach, in some case you may
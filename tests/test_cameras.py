@@ -0,0 +1,33 @@
+"""Tests of ambrosia.cameras."""
+import os
+import re
+import pytest
+from ambrosia import *
+from ambrosia.cameras import Camera
+
+class _FakeRenderCamera(Camera):
+    """A camera whose renders make an empty image rather than run povray."""
+    def _POV_render(self,model):
+        with open(model+".png","w"):
+            pass
+        return model+".png"
+
+@pytest.fixture
+def project(tmp_path):
+    old = environment.getProjectFolder()
+    environment.projectFolder(str(tmp_path))
+    yield tmp_path
+    environment.projectFolder(old)
+
+@pytest.mark.parametrize("workers",[1,2])
+def test_film_frame_names(project,workers):
+    camera = _FakeRenderCamera().subject(Group().add(Sphere()))
+    camera.getImage().frameNumber(3)
+    results = camera.film(2,lambda x: None,(0,1),workers=workers)
+    base = re.escape(camera.getImage().getFileName())
+    names = sorted(os.listdir(str(project)))
+    assert len(names) == 3
+    for (frame,name) in zip((3,4,5),names):
+        assert re.match(r"{}\+{:05d}-.+\.png$".format(base,frame),name)
+    assert sorted([os.path.basename(r) for r in results]) == names
+    assert camera.getImage().getFrameNumber() == 6
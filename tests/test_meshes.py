@@ -0,0 +1,12 @@
+"""Tests of ambrosia.meshes."""
+from ambrosia.meshes import FuzzList
+
+def test_fuzzlist_str():
+    f = FuzzList([(0,0,0),(1,2,3)])
+    assert "A fuzzy list." in str(f)
+
+def test_fuzzlist_copy():
+    f = FuzzList([(0,0,0),(1,2,3)]).description("points")
+    c = f.copy()
+    assert isinstance(c,FuzzList)
+    assert c.getDescription() == "points"